@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Programa: bitacora_mensaje.py
+# Autor: Nicolás Cubero Torres
+# Descripción: Banco de pruebas que mide el coste por mensaje de grupo de
+#				las entradas de depuración del log con el nivel INFO activo.
+#				Compara las entradas construidas antes del mensaje, formateando
+#				el texto con str(update) y str(chat_data), con las mismas
+#				entradas a través de Bitacora, que sólo se construyen si su
+#				nivel está activo
+# Uso: python3 benchmarks/bitacora_mensaje.py [--raiz <directorio>]
+#				[--mensajes <n>]
+# Opciones:
+#		--raiz: Directorio del que se importa el paquete cprofessorbot
+#		--mensajes: Número de mensajes simulados en cada medición
+###############################################################################
+
+""" Módulos importados """
+import argparse
+import io
+import logging
+import os
+import sys
+import timeit
+
+import telegram
+
+""" Entrada de datos """
+parser = argparse.ArgumentParser(description='Coste por mensaje de las '\
+								'entradas de depuración con el nivel INFO')
+
+parser.add_argument('--raiz', type=str, default=os.path.dirname(
+								os.path.dirname(os.path.abspath(__file__))),
+					help='Directorio del que se importa cprofessorbot')
+parser.add_argument('--mensajes', type=int, default=20000,
+					help='Número de mensajes simulados en cada medición')
+
+args = parser.parse_args(sys.argv[1:])
+
+sys.path.insert(0, os.path.abspath(args.raiz))
+
+from cprofessorbot.utils.bitacora import Bitacora
+
+""" Cuerpo del programa """
+
+#	Log del sistema con el nivel INFO, el de funcionamiento normal
+log = logging.getLogger('cprofessorbot_log')
+log.setLevel(logging.INFO)
+log.propagate = False
+log.addHandler(logging.StreamHandler(io.StringIO()))
+
+bitacora = Bitacora()
+
+#	Actualización típica de un mensaje de grupo que responde a otro mensaje,
+#	de unos 2 KB al convertirse en texto
+chat = {'id': -100123456789, 'type': 'supergroup',
+		'title': 'Programación I - Grupo A',
+		'all_members_are_administrators': False}
+
+update = telegram.Update.de_json({
+	'update_id': 123456789,
+	'message': {
+		'message_id': 4321, 'date': 1700000000, 'chat': chat,
+		'from': {'id': 987654321, 'is_bot': False, 'first_name': 'Nombre',
+				'last_name': 'Apellido Apellido', 'username': 'usuario_x',
+				'language_code': 'es'},
+		'text': '¿Alguien sabe cómo se declara un puntero a función en C? '*3,
+		'entities': [{'type': 'bold', 'offset': 0, 'length': 10}],
+		'reply_to_message': {
+			'message_id': 4320, 'date': 1699999990, 'chat': chat,
+			'from': {'id': 111, 'is_bot': False, 'first_name': 'Otro'},
+			'text': 'Duda sobre punteros'}
+	}}, None)
+
+chat_data = {'foro': {'id_chat': chat['id'], 'nombre': 'Programación I',
+						'tipo': 'supergroup', 'valido': True},
+			'usuarios': {i: {'tipo': 'alumno', 'ban': False, 'n_avisos': 0}
+														for i in range(40)},
+			'ultima_actualizacion': '2024-01-01'}
+
+usuario = update.message.from_user
+foro = chat_data['foro']
+
+def antes():
+
+	"""Entradas de depuración de un mensaje de grupo construidas siempre"""
+
+	log.debug('Iniciada función manejadora "__message_group_callback" de '\
+				'"BotServer" con parámetros:\nupdate:%s\\chat_data:%s' % (
+											str(update), str(chat_data)))
+	log.debug('Mensaje recibido del usuario {} con id {} en el grupo "{}" '\
+				'con id {} con certeza de pertenencia al tema tratado en el '\
+				'foro de {}'.format(usuario.first_name, usuario.id,
+								foro['nombre'], foro['id_chat'], 0.7))
+
+	for _ in range(3):
+		log.debug('Encontrado usuario id=%d en caché' % usuario.id)
+
+	log.debug('Añadido mensaje con los siguientes datos:\n%s' % str(foro))
+
+def despues():
+
+	"""Entradas de depuración de un mensaje de grupo con Bitacora"""
+
+	bitacora.debug('Iniciada función manejadora "__message_group_callback" '\
+					'de "BotServer" con parámetros:\nupdate:%s\\chat_data:%s',
+														update, chat_data)
+	bitacora.debug('Mensaje recibido del usuario %s con id %s en el grupo '\
+					'"%s" con id %s con certeza de pertenencia al tema '\
+					'tratado en el foro de %s', usuario.first_name, usuario.id,
+					foro['nombre'], foro['id_chat'], 0.7)
+
+	for _ in range(3):
+		bitacora.debug('Encontrado usuario id=%d en caché', usuario.id)
+
+	bitacora.debug('Añadido mensaje con los siguientes datos:\n%s', foro)
+
+print('Tamaño de la actualización: %d caracteres' % len(str(update)))
+
+for nombre, funcion in (('Texto construido siempre', antes),
+						('Bitacora', despues)):
+	tiempo = min(timeit.repeat(funcion, number=args.mensajes,
+										repeat=5))/args.mensajes*1e6
+	print('%-26s %7.2f us/mensaje' % (nombre, tiempo))
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Programa: escrituras_concurrentes.py
+# Autor: Nicolás Cubero Torres
+# Descripción: Banco de pruebas que mide el rendimiento de BotServerDAO con
+#				un hilo que registra mensajes en un foro mientras varios hilos
+#				cuentan los mensajes de otro foro con countMensajesForo
+# Uso: python3 benchmarks/escrituras_concurrentes.py [--raiz <directorio>]
+#				[--base <fichero>] [--mensajes <n>] [--lectores <n>]
+#				[--duracion <segundos>]
+# Opciones:
+#		--raiz: Directorio del que se importa el paquete cprofessorbot. Permite
+#				medir otra versión del repositorio, p. ej. una copia de
+#				trabajo creada con "git worktree add <directorio> <commit>"
+#		--base: Fichero de la base de datos poblada inicial. Si no existe, se
+#				crea y puebla con la versión medida y se reutiliza en las
+#				siguientes ejecuciones, que trabajan sobre una copia
+#		--mensajes: Número de mensajes con los que se puebla la base de datos
+#		--lectores: Número de hilos lectores
+#		--duracion: Duración de la medición en segundos
+###############################################################################
+
+""" Módulos importados """
+import argparse
+import datetime
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+""" Entrada de datos """
+parser = argparse.ArgumentParser(description='Rendimiento de las escrituras '\
+								'de BotServerDAO con lecturas concurrentes')
+
+parser.add_argument('--raiz', type=str, default=os.path.dirname(
+								os.path.dirname(os.path.abspath(__file__))),
+					help='Directorio del que se importa cprofessorbot')
+parser.add_argument('--base', type=str, default=None,
+					help='Fichero de la base de datos poblada inicial')
+parser.add_argument('--mensajes', type=int, default=30000,
+					help='Número de mensajes de la base de datos inicial')
+parser.add_argument('--lectores', type=int, default=3,
+					help='Número de hilos lectores')
+parser.add_argument('--duracion', type=float, default=10.0,
+					help='Duración de la medición en segundos')
+
+args = parser.parse_args(sys.argv[1:])
+
+sys.path.insert(0, os.path.abspath(args.raiz))
+
+from cprofessorbot.botServerDAO import BotServerDAO
+
+""" Cuerpo del programa """
+FECHA_INICIAL = datetime.datetime(2023, 1, 1)
+FOROS = (-5, -6, -7)
+
+def poblar(bd_file: str, n_mensajes: int):
+
+	"""Crea una base de datos con 40 usuarios y 3 foros en los que se
+	reparten "n_mensajes" mensajes de forma aleatoria
+	"""
+
+	bd = BotServerDAO(bd_file)
+
+	for i in range(1, 41):
+		bd.addUsuario(i, 'Nombre', 'Apellidos', 'usuario%d' % i, 100+i,
+												FECHA_INICIAL, 'alumno')
+
+	for id_chat in FOROS:
+		bd.addForo(id_chat, 'Foro%d' % id_chat, 'group', True, FECHA_INICIAL)
+
+	random.seed(1)
+
+	for i in range(n_mensajes):
+		bd.addMensaje(i % 4 != 0, i,
+					id_usuario_emisor_receptor=random.randint(1, 40),
+					id_chat=random.choice(FOROS), texto='texto %d' % i,
+					fecha=FECHA_INICIAL+datetime.timedelta(minutes=3*i))
+
+	#	Las versiones anteriores del DAO no disponen de close
+	getattr(bd, 'close', lambda: None)()
+
+directorio = tempfile.TemporaryDirectory()
+base = args.base or os.path.join(directorio.name, 'base.db')
+
+if not os.path.exists(base):
+	print('Poblando %s con %d mensajes...' % (base, args.mensajes))
+	poblar(base, args.mensajes)
+
+bd_file = os.path.join(directorio.name, 'cprofessorbot.db')
+shutil.copy(base, bd_file)
+
+bd = BotServerDAO(bd_file)
+
+fin = time.monotonic() + args.duracion
+latencias = []
+lecturas = [0]*args.lectores
+
+def escritor():
+
+	id_mensaje_chat = 10**6
+
+	while time.monotonic() < fin:
+		inicio = time.perf_counter()
+		bd.addMensaje(True, id_mensaje_chat, id_usuario_emisor_receptor=1,
+							id_chat=FOROS[0], texto='nuevo',
+							fecha=datetime.datetime(2024, 1, 1))
+		latencias.append(time.perf_counter() - inicio)
+		id_mensaje_chat += 1
+
+def lector(i: int):
+
+	while time.monotonic() < fin:
+		bd.countMensajesForo(FOROS[1], FECHA_INICIAL,
+										datetime.datetime(2024, 1, 1))
+		lecturas[i] += 1
+
+hilos = [threading.Thread(target=escritor)] + [threading.Thread(
+						target=lector, args=(i,)) for i in range(args.lectores)]
+
+for hilo in hilos:
+	hilo.start()
+
+for hilo in hilos:
+	hilo.join()
+
+getattr(bd, 'close', lambda: None)()
+directorio.cleanup()
+
+latencias.sort()
+
+print('Escrituras por segundo: %.0f' % (len(latencias)/args.duracion))
+print('Lecturas por segundo: %.1f' % (sum(lecturas)/args.duracion))
+print('Latencia de escritura: p50 %.2f ms, p99 %.1f ms, máxima %.1f ms' % (
+					latencias[len(latencias)//2]*1e3,
+					latencias[int(len(latencias)*0.99)]*1e3, latencias[-1]*1e3))
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Programa: registros_memoria.py
+# Autor: Nicolás Cubero Torres
+# Descripción: Banco de pruebas que compara la memoria ocupada y el coste de
+#				decodificación de las filas de BotServerDAO como registros
+#				ligeros (cprofessorbot.registros) frente a los diccionarios y
+#				objetos telegram.User que se construían antes por cada fila
+# Uso: python3 benchmarks/registros_memoria.py [--raiz <directorio>]
+#				[--miembros <n>] [--mensajes <n>]
+# Opciones:
+#		--raiz: Directorio del que se importa el paquete cprofessorbot
+#		--miembros: Número de miembros del foro guardados en caché
+#		--mensajes: Número de mensajes decodificados
+###############################################################################
+
+""" Módulos importados """
+import argparse
+import datetime
+import gc
+import os
+import sqlite3
+import sys
+import time
+import tracemalloc
+from collections import OrderedDict
+
+import telegram
+
+""" Entrada de datos """
+parser = argparse.ArgumentParser(description='Memoria y decodificación de '\
+											'las filas de BotServerDAO')
+
+parser.add_argument('--raiz', type=str, default=os.path.dirname(
+								os.path.dirname(os.path.abspath(__file__))),
+					help='Directorio del que se importa cprofessorbot')
+parser.add_argument('--miembros', type=int, default=5000,
+					help='Número de miembros del foro')
+parser.add_argument('--mensajes', type=int, default=20000,
+					help='Número de mensajes decodificados')
+
+args = parser.parse_args(sys.argv[1:])
+
+sys.path.insert(0, os.path.abspath(args.raiz))
+
+from cprofessorbot.registros import RegistroUsuario, RegistroMensaje,\
+																RegistroDato
+
+""" Cuerpo del programa """
+AHORA = datetime.datetime.now()
+
+#	Columnas de la consulta de mensajes de getMensajesForo
+COLUMNAS_MENSAJE = ('id_mensaje', 'nombre_usuario', 'tipo_usuario', 'fecha',
+				'academico', 'evento_mensaje', 'id_dato', 'tipo_dato',
+				'contenido', 'file_id', 'mime_type', 'sticker_emoji',
+				'sticker_conjunto', 'tipo_sticker', 'telefono', 'nombre',
+				'apellidos', 'id_usuario', 'vcard', 'longitud', 'latitud',
+				'titulo', 'direccion', 'id_cuadrante', 'tipo_cuadrante')
+
+def tipo_usuario(valor):
+
+	return 'alumno' if valor == 0 else 'docente'
+
+def miembro_dict(fila):
+
+	"""Miembro de un foro tal y como lo construía listUsuarios_in_Foro y
+	se guardaba en chat_data['foros'][id]['miembros']
+	"""
+
+	usuario = {}
+	usuario['telegram_user'] = telegram.User(id=fila[0], first_name=fila[1],
+									is_bot=False, last_name=fila[2],
+									username=fila[3])
+	usuario['id_chat'] = fila[4]
+	usuario['fecha_registro'] = fila[5]
+	usuario['tipo'] = fila[6]
+	usuario['valido'] = fila[7]
+	usuario['ban'] = fila[8]
+	usuario['n_avisos'] = fila[9]
+	usuario['ultima_actualizacion'] = AHORA
+
+	return usuario
+
+def miembro_registro(fila):
+
+	usuario = RegistroUsuario(*fila)
+	usuario['ultima_actualizacion'] = AHORA
+
+	return usuario
+
+def mensajes_dict(filas):
+
+	"""Decodificación de los mensajes de getMensajesForo con diccionarios
+	"""
+
+	mensajes = OrderedDict()
+
+	for m in filas:
+		if m[0] not in mensajes:
+			mensajes[m[0]] = dict(zip(m.keys()[1:5], m[1:5]))
+			mensajes[m[0]]['tipo_usuario'] = tipo_usuario(
+											mensajes[m[0]]['tipo_usuario'])
+			mensajes[m[0]]['datos'] = OrderedDict()
+
+		mensajes[m[0]]['datos'][m[6]] = dict(zip(m.keys()[7:9], m[7:9]))
+
+	return mensajes
+
+def mensajes_registro(filas):
+
+	"""Decodificación de los mensajes de getMensajesForo con registros"""
+
+	mensajes = OrderedDict()
+
+	for m in filas:
+		if m[0] not in mensajes:
+			mensajes[m[0]] = RegistroMensaje(m[1], m[3], tipo_usuario(m[2]),
+														m[4], OrderedDict())
+
+		mensajes[m[0]].datos[m[6]] = RegistroDato(*m[7:9])
+
+	return mensajes
+
+def medir(funcion, n: int):
+
+	"""Devuelve la memoria retenida en bytes por elemento del resultado de
+	"funcion" y el menor tiempo en microsegundos por elemento de tres
+	ejecuciones
+	"""
+
+	gc.collect()
+	tracemalloc.start()
+	resultado = funcion()
+	memoria = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+	del resultado
+
+	tiempo = float('inf')
+
+	for _ in range(3):
+		inicio = time.perf_counter()
+		funcion()
+		tiempo = min(tiempo, time.perf_counter() - inicio)
+
+	return memoria/n, tiempo/n*1e6
+
+#	Filas de los miembros de un foro, tal y como las devuelve la consulta de
+#	listUsuarios_in_Foro
+filas_miembros = [(i, 'Nombre%d' % i, 'Apellidos %d' % i, 'usuario%d' % i, i,
+					AHORA, 'alumno', True, False, 0)
+					for i in range(args.miembros)]
+
+#	Filas de la consulta de mensajes de getMensajesForo, con un dato de texto
+#	por mensaje
+con = sqlite3.connect(':memory:')
+con.row_factory = sqlite3.Row
+consulta = 'SELECT ' + ', '.join('? AS %s' % c for c in COLUMNAS_MENSAJE)
+filas_mensajes = [con.execute(consulta, (i, 'Nombre Apellidos', 0, float(i),
+									1, None, i, 'texto', 'mensaje %d' % i) +
+									(None,)*16).fetchone()
+					for i in range(args.mensajes)]
+con.close()
+
+casos = (
+	('Miembro (dict y telegram.User)', 'miembro', args.miembros,
+		lambda: {f[0]: miembro_dict(f) for f in filas_miembros}),
+	('Miembro (RegistroUsuario)', 'miembro', args.miembros,
+		lambda: {f[0]: miembro_registro(f) for f in filas_miembros}),
+	('Mensaje (dict)', 'mensaje', args.mensajes,
+		lambda: mensajes_dict(filas_mensajes)),
+	('Mensaje (RegistroMensaje)', 'mensaje', args.mensajes,
+		lambda: mensajes_registro(filas_mensajes))
+)
+
+for nombre, unidad, n, funcion in casos:
+	memoria, tiempo = medir(funcion, n)
+	print('%-32s %6.0f bytes/%s  %5.2f us/fila' % (nombre, memoria, unidad,
+																	tiempo))
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Programa: sentencias_preparadas.py
+# Autor: Nicolás Cubero Torres
+# Descripción: Banco de pruebas que mide el coste de preparación de las
+#				sentencias SQL de BotServerDAO. Compara cada consulta con texto
+#				fijo y parámetros enlazados, que reutiliza la sentencia
+#				preparada de la caché de sqlite3, con la misma consulta con
+#				los valores formateados en el texto, que debe de prepararse en
+#				cada llamada
+# Uso: python3 benchmarks/sentencias_preparadas.py [--raiz <directorio>]
+#				[--llamadas <n>]
+# Opciones:
+#		--raiz: Directorio del que se importa el paquete cprofessorbot
+#		--llamadas: Número de ejecuciones de cada consulta
+###############################################################################
+
+""" Módulos importados """
+import argparse
+import datetime
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+""" Entrada de datos """
+parser = argparse.ArgumentParser(description='Coste de preparación de las '\
+											'sentencias SQL de BotServerDAO')
+
+parser.add_argument('--raiz', type=str, default=os.path.dirname(
+								os.path.dirname(os.path.abspath(__file__))),
+					help='Directorio del que se importa cprofessorbot')
+parser.add_argument('--llamadas', type=int, default=20000,
+					help='Número de ejecuciones de cada consulta')
+
+args = parser.parse_args(sys.argv[1:])
+
+sys.path.insert(0, os.path.abspath(args.raiz))
+
+from cprofessorbot.botServerDAO import BotServerDAO
+
+""" Cuerpo del programa """
+
+#	Se registran más foros que sentencias guarda la caché de sqlite3 (128),
+#	de forma que los textos formateados con el id del foro no se reutilicen
+N_FOROS = 300
+N_MENSAJES = 5000
+TAM_PAGINA = 50
+
+#	Usuarios de un foro con los filtros de listUsuarios_in_Foro
+USUARIOS_FORO_FIJA = '''SELECT Usuario.id, Usuario.nombre, Usuario.apellidos,
+		Usuario.username, Usuario.id_chat, Usuario.fecha_registro, Usuario.tipo,
+		Usuario.valido, Foro_Usuario.ban, Foro_Usuario.n_avisos
+	FROM Usuario, Foro_Usuario
+	WHERE (Usuario.valido=1 OR ?=0) AND (Usuario.tipo=0 OR ?=0) AND
+		Usuario.id = Foro_Usuario.id_usuario AND Foro_Usuario.id_chat_foro=?;'''
+
+USUARIOS_FORO_FORMATEADA = '''SELECT Usuario.id, Usuario.nombre,
+		Usuario.apellidos, Usuario.username, Usuario.id_chat,
+		Usuario.fecha_registro, Usuario.tipo, Usuario.valido, Foro_Usuario.ban,
+		Foro_Usuario.n_avisos
+	FROM Usuario, Foro_Usuario
+	WHERE Usuario.valido=1 AND Usuario.tipo=0 AND
+		Usuario.id = Foro_Usuario.id_usuario AND Foro_Usuario.id_chat_foro=%d;'''
+
+#	Datos de una página de mensajes, como en iterMensajesForo
+DATOS_MENSAJES_FIJA = '''SELECT Dato_Mensaje.id_mensaje, Dato_Mensaje.id_dato,
+		DatoTexto.texto
+	FROM Dato_Mensaje
+	LEFT JOIN DatoTexto ON DatoTexto.id=Dato_Mensaje.id_dato
+	WHERE Dato_Mensaje.id_mensaje IN (SELECT value FROM json_each(?))
+	ORDER BY Dato_Mensaje.id_mensaje, Dato_Mensaje.id_dato;'''
+
+DATOS_MENSAJES_FORMATEADA = '''SELECT Dato_Mensaje.id_mensaje,
+		Dato_Mensaje.id_dato, DatoTexto.texto
+	FROM Dato_Mensaje
+	LEFT JOIN DatoTexto ON DatoTexto.id=Dato_Mensaje.id_dato
+	WHERE Dato_Mensaje.id_mensaje IN %s
+	ORDER BY Dato_Mensaje.id_mensaje, Dato_Mensaje.id_dato;'''
+
+def poblar(bd_file: str):
+
+	"""Crea una base de datos con 30 usuarios, repartidos en N_FOROS foros,
+	y N_MENSAJES mensajes de texto en el primero de ellos
+	"""
+
+	fecha = datetime.datetime(2023, 1, 1)
+	bd = BotServerDAO(bd_file)
+
+	for i in range(1, 31):
+		bd.addUsuario(i, 'Nombre', 'Apellidos', 'usuario%d' % i, 100+i, fecha,
+										'alumno' if i > 2 else 'docente')
+
+	for i in range(N_FOROS):
+		bd.addForo(-1-i, 'Foro%d' % i, 'group', True, fecha)
+		bd.addUsuarioForo(-1-i, list(range(1, 31)))
+
+	with bd.asynchronous():
+		for i in range(N_MENSAJES):
+			bd.addMensaje(True, i, id_usuario_emisor_receptor=1+i % 30,
+							id_chat=-1, texto='mensaje %d' % i,
+							fecha=fecha+datetime.timedelta(minutes=i))
+
+	bd.close()
+
+def medir(con, consultas):
+
+	"""Devuelve el tiempo medio en microsegundos de ejecutar y leer las
+	consultas dadas por el iterable de pares (sentencia, parámetros)
+	"""
+
+	inicio = time.perf_counter()
+	n = 0
+
+	for sentencia, parametros in consultas:
+		con.execute(sentencia, parametros).fetchall()
+		n += 1
+
+	return (time.perf_counter() - inicio)/n*1e6
+
+directorio = tempfile.TemporaryDirectory()
+bd_file = os.path.join(directorio.name, 'cprofessorbot.db')
+poblar(bd_file)
+
+con = sqlite3.connect(bd_file)
+ids_mensajes = [fila[0] for fila in con.execute(
+							'SELECT DISTINCT id_mensaje FROM Dato_Mensaje;')]
+
+def paginas():
+
+	"""Genera páginas de TAM_PAGINA ids de mensajes consecutivos, cada una
+	desplazada un mensaje respecto de la anterior
+	"""
+
+	for i in range(args.llamadas):
+		inicio = i % (len(ids_mensajes) - TAM_PAGINA)
+		yield ids_mensajes[inicio:inicio+TAM_PAGINA]
+
+casos = (
+	('Usuarios de un foro',
+		lambda: ((USUARIOS_FORO_FIJA, (1, 1, -1-i % N_FOROS))
+										for i in range(args.llamadas)),
+		lambda: ((USUARIOS_FORO_FORMATEADA % (-1-i % N_FOROS), ())
+										for i in range(args.llamadas))),
+	('Datos de una página de mensajes',
+		lambda: ((DATOS_MENSAJES_FIJA, (json.dumps(p),)) for p in paginas()),
+		lambda: ((DATOS_MENSAJES_FORMATEADA % str(tuple(p)), ())
+														for p in paginas()))
+)
+
+for nombre, fija, formateada in casos:
+
+	#	Calentar la caché de páginas de la base de datos
+	medir(con, fija())
+
+	t_fija = min(medir(con, fija()) for _ in range(3))
+	t_formateada = min(medir(con, formateada()) for _ in range(3))
+
+	print('%-32s fija %7.1f us  formateada %7.1f us  ahorro %6.1f us' % (
+						nombre, t_fija, t_formateada, t_formateada - t_fija))
+
+con.close()
+directorio.cleanup()
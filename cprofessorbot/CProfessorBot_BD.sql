@@ -3,6 +3,10 @@
  * 	por el sistema cprofessorbot para el almacenamiento de toda la
  * 	información pertinente
  * Creado por: Nicolás Cubero Torres
+ *
+ * Nota: este script crea la versión 0 del esquema. Los índices secundarios
+ *	y el resto de cambios posteriores son aplicados por las migraciones de
+ *	BotServerDAO según el valor de "PRAGMA user_version"
  ******************************************************************************/
 
 -- Eliminación de Relaciones que pudieran existir
@@ -94,7 +98,7 @@ DROP TABLE IF EXISTS Usuario;
 
 -- Relación: Usuario
 CREATE TABLE Usuario (
-	id INTEGER PRIMARY_KEY NOT NULL UNIQUE,
+	id INTEGER PRIMARY KEY NOT NULL UNIQUE,
 	nombre TEXT NOT NULL,
 	apellidos TEXT,
 	username TEXT,
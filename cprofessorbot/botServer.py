@@ -15,7 +15,10 @@ import time
 import re
 import datetime
 import mimetypes
+import hashlib
 import urllib
+import threading
+import queue
 from collections import OrderedDict
 import telegram
 import telegram.ext
@@ -30,9 +33,11 @@ from cprofessorbot.utils import EnteringGroupHandler
 from cprofessorbot.utils import MemberEnteringGroupHandler
 from cprofessorbot.utils import MemberLefteringGroupHandler
 from cprofessorbot.utils import LefteringGroupHandler
+from cprofessorbot.utils import IdentidadBot
 from cprofessorbot.utils import ConversationCompiler
 from cprofessorbot.utils import emojis
 from cprofessorbot.utils import copyFile
+from cprofessorbot.utils import Bitacora, FormateadorTexto, FormateadorJSON
 from cprofessorbot.nlu import (SpeechHandler, parseSpeechDate, parseSpeechTime,
 														replaceSpeechNumber)
 
@@ -73,6 +78,59 @@ class BotServer:
 		considerado como perteneciente al ámbito académico
 	- avisos_ban: integer
 		Número de avisos requeridos para efectuar el baneo de un usuario
+
+	Además, admite los siguientes parámetros opcionales:
+	- intervalo_actualizacion_conceptos: integer (por defecto 0)
+		Número de segundos entre dos recargas consecutivas de las fuentes de
+		Conceptos Teóricos. Con 0 los conceptos sólo se cargan al iniciar
+	- sincronizacion_bd: string (por defecto "NORMAL")
+		Nivel de sincronización con disco de la base de datos: "OFF",
+		"NORMAL", "FULL" o "EXTRA"
+	- almacenamiento_bd: string (por defecto "disco")
+		Dónde se mantiene la base de datos: "disco" o "memoria". En memoria,
+		la base de datos se restaura al iniciar a partir del fichero
+		"cprofessorbot_BD.db" y se vuelca en él periódicamente y al detener
+		el sistema. Las escrituras son más rápidas, pero ante una caída del
+		sistema se pierden todos los cambios posteriores al último volcado
+	- intervalo_instantanea_minutos: integer (por defecto 5)
+		Número de minutos entre dos volcados consecutivos de la base de datos
+		en memoria a su fichero. Sólo se usa con "almacenamiento_bd" igual
+		a "memoria"
+	- horizonte_archivo_dias: integer (por defecto 0)
+		Antigüedad en días a partir de la cual los mensajes se trasladan
+		diariamente, por periodos semestrales completos, a los ficheros de
+		archivo del directorio "archivo/". Con 0 no se archiva ningún mensaje
+	- retencion_mensajes_privados_dias: integer (por defecto 0)
+	- retencion_mensajes_foros_dias: integer (por defecto 0)
+		Antigüedad en días a partir de la cual se eliminan definitivamente
+		los mensajes de los chats privados y los mensajes y eventos de los
+		foros, respectivamente, junto con sus datos, incluidos los
+		trasladados a los ficheros de archivo. Con 0 no se eliminan
+	- retencion_resumen_foros_dias: integer (por defecto 0)
+		Antigüedad en días a partir de la cual se eliminan los recuentos
+		diarios de mensajes de los foros. Con 0 no se eliminan
+		Si alguno de los periodos de retención es mayor que 0, la base de
+		datos se depura diariamente: se eliminan los datos caducados y los
+		archivos multimedia que ya no referencia ningún dato, se devuelve
+		al sistema de ficheros el espacio liberado y se registra un informe
+		por línea en el fichero "depuracion_bd.json" del directorio base
+	- intervalo_copia_seguridad_horas: integer (por defecto 0)
+		Número de horas entre dos copias de seguridad consecutivas de la base
+		de datos, realizadas en el directorio "copias_seguridad/" sin
+		detener el sistema. Con 0 no se realiza ninguna copia
+	- max_copias_seguridad: integer (por defecto 7)
+		Número máximo de copias de seguridad conservadas. Al superarse, se
+		eliminan las más antiguas
+	- instrumentacion_bd: boolean (por defecto false)
+		Registrar o no las llamadas, filas devueltas y latencias de cada
+		función de acceso a la base de datos y de cada sentencia SQL. Las
+		métricas se almacenan cada hora en el fichero
+		"instrumentacion_bd.json" del directorio base
+	- log_json: boolean (por defecto false)
+		Escribir o no, además del fichero de log "server_log.txt", cada
+		entrada del log como un objeto JSON por línea en el fichero
+		"server_log.json" del directorio base, junto con sus campos
+		estructurados
 	"""
 
 	def __init__(self, config_filename: str, debug_mode: bool=False):
@@ -93,11 +151,47 @@ class BotServer:
 		self.__quest_manager = None		# Administrador de preguntas teóricas
 		self.__speech_handler = None	# Evaluador del tema de la conversación
 		self.__bot_interface = None		# Interfaz del bot
+		self.__identidad_bot = None		# Identidad del bot
 		self.__bot_updater = None		# Actualizador de la interfaz
 		self.__debug_mode = debug_mode	# Modo de depuración
 
+		#	Cerrojo que evita dos recargas simultáneas de los conceptos
+		self.__act_conceptos_lock = threading.Lock()
+
+		#	Cerrojo que evita dos archivos de mensajes simultáneos
+		self.__archivo_lock = threading.Lock()
+
+		#	Cerrojo que evita dos copias de seguridad simultáneas
+		self.__copia_lock = threading.Lock()
+
+		#	Cerrojo que evita dos depuraciones simultáneas
+		self.__depuracion_lock = threading.Lock()
+
+		#	Cerrojo que evita dos reanudaciones de descargas simultáneas
+		self.__reanudar_descargas_lock = threading.Lock()
+
+		#	Cola de mensajes pendientes de registrar en la base de datos e
+		#	hilo encargado de registrarlos por lotes
+		self.__cola_registro = queue.Queue(
+								maxsize=BotServer.__TAM_COLA_REGISTRO)
+		self.__hilo_registro = None
+
+		#	Cola de archivos multimedia pendientes de descargar e hilos
+		#	encargados de descargarlos
+		self.__cola_descarga = queue.Queue(
+								maxsize=BotServer.__TAM_COLA_DESCARGA)
+		self.__hilos_descarga = []
+
+		#	Datos pendientes de cada descarga en curso: par ruta pendiente -
+		#	lista de identificadores de los datos que comparten el archivo
+		self.__descargas_en_curso = {}
+		self.__descargas_lock = threading.Lock()
+
+		#	Base de datos de tipos MIME compartida por todas las descargas
+		self.__mime_types = mimetypes.MimeTypes()
+
 		#	Configurar el logging del sistema
-		self.__log = logging.getLogger('cprofessorbot_log')
+		self.__log = Bitacora()
 		logging.basicConfig(format='%(levelname)s - %(asctime)s - %(message)s',
 							datefmt='%d-%b-%y %H:%M:%S')
 
@@ -130,6 +224,7 @@ class BotServer:
 		[KeyboardButton(u'Comunicados %s' % emojis.MEGAFONO)],
 		[KeyboardButton((u'Descargar conversaciones del alumnado %s' %
 														emojis.MEMORIA_PAPEL))],
+		[KeyboardButton(u'Buscar en las conversaciones %s' % emojis.LUPA)],
 		[KeyboardButton(u'Dar de baja como profesor/ra %s' % emojis.BOMBA)],
 		[KeyboardButton(u'Salir %s' % emojis.MANO_ADIOS)]
 	]
@@ -145,7 +240,7 @@ class BotServer:
 	__SELECT_OP_GEST_COMUNICADO, __SELECT_OP_ELIM_COMUNICADO,
 	_PROG_COMUNICADO_CONF_FECHA, __PROG_COMUNICADO_CONF_HORA,
 	__PROG_COMUNICADO_SELECT_GRUPO, __PROG_COMUNICADO_ANCLAR,
-	__PROG_COMUNICADO_CONTENIDO) = range(25)
+	__PROG_COMUNICADO_CONTENIDO, __BUSQ_MENSAJES_TEXTO) = range(26)
 
 	#	Plantilla del fichero de configuración
 	__CONFIG_FILE_TEMP = {
@@ -154,18 +249,130 @@ class BotServer:
 							'usuario_docente_password':'',
 							'fuentes_conceptos': [],
 							'umbral_eval_conv': 0.6,
-							'avisos_ban': 3
+							'avisos_ban': 3,
+							'intervalo_actualizacion_conceptos': 0,
+							'sincronizacion_bd': 'NORMAL',
+							'almacenamiento_bd': 'disco',
+							'intervalo_instantanea_minutos': 5,
+							'horizonte_archivo_dias': 0,
+							'retencion_mensajes_privados_dias': 0,
+							'retencion_mensajes_foros_dias': 0,
+							'retencion_resumen_foros_dias': 0,
+							'intervalo_copia_seguridad_horas': 0,
+							'max_copias_seguridad': 7,
+							'instrumentacion_bd': False,
+							'log_json': False
 						}
 
-	#	Tamaño de las particiones en las que se dividirán los mensajes
-	#	a recopilar para las descarga de conversaciones
-	__DESC_CONV_PART = 10000
+	#	Campos del fichero de configuración que pueden omitirse, en cuyo caso
+	#	toman el valor de la plantilla
+	__CONFIG_CAMPOS_OPCIONALES = ('intervalo_actualizacion_conceptos',
+									'sincronizacion_bd',
+									'almacenamiento_bd',
+									'intervalo_instantanea_minutos',
+									'horizonte_archivo_dias',
+									'retencion_mensajes_privados_dias',
+									'retencion_mensajes_foros_dias',
+									'retencion_resumen_foros_dias',
+									'intervalo_copia_seguridad_horas',
+									'max_copias_seguridad',
+									'instrumentacion_bd',
+									'log_json')
+
+	#	Número de mensajes leídos en cada consulta de los mensajes a recopilar
+	#	para la descarga de conversaciones
+	__DESC_CONV_PART = 1000
+
+	#	Número máximo de mensajes mostrados en una búsqueda de mensajes y
+	#	número máximo de caracteres mostrados de cada mensaje
+	__BUSQ_MAX_RESULTADOS = 20
+	__BUSQ_MAX_CARACTERES = 200
 
 	#	Números de minutos a esperar antes de comprobar si los datos
 	#	de un chat grupal que constituye el foro docente han sido actualizados
 	#	y actualizar la información que se tiene de él en la bd
 	__MIN_ACT = 5
 
+	#	Número máximo de mensajes pendientes de registrar en la base de datos.
+	#	Alcanzado este número, los manejadores esperan a que se libere espacio
+	__TAM_COLA_REGISTRO = 1000
+
+	#	Número máximo de mensajes que se registran en una misma transacción
+	__LOTE_REGISTRO = 100
+
+	#	Número de hilos que descargan los archivos multimedia de los mensajes
+	#	y comunicados registrados
+	__HILOS_DESCARGA = 4
+
+	#	Número máximo de archivos multimedia pendientes de descargar.
+	#	Alcanzado este número, el registro espera a que se libere espacio
+	__TAM_COLA_DESCARGA = 200
+
+	#	Sufijo de la ruta de los archivos multimedia cuya descarga no ha
+	#	finalizado. Es la ruta registrada en la base de datos y la del fichero
+	#	parcial hasta que el archivo se descarga por completo
+	__SUFIJO_DESCARGA = '.pendiente'
+
+	#	Prefijo de los nombres de los archivos multimedia almacenados según
+	#	el resumen SHA-256 de su contenido, cuando Telegram no proporciona el
+	#	identificador único del archivo
+	__PREFIJO_RESUMEN = 'sha256-'
+
+	#	Subdirectorio del directorio base en el que se descarga cada tipo de
+	#	contenido multimedia
+	__DIRECTORIOS_CONTENIDO = (
+								(telegram.PhotoSize, 'imagenes/'),
+								(telegram.Document, 'documentos/'),
+								(telegram.Video, 'videos/'),
+								(telegram.Audio, 'audios/'),
+								(telegram.VideoNote, 'notas_video/'),
+								(telegram.Voice, 'notas_voz/'),
+								(telegram.Sticker, 'stickers/'),
+								(telegram.Animation, 'animaciones/')
+							)
+
+	#	Número de segundos entre dos ejecuciones consecutivas del archivo de
+	#	mensajes antiguos
+	__INTERVALO_ARCHIVO = 24*60*60
+
+	#	Número de segundos entre dos depuraciones consecutivas de la base de
+	#	datos
+	__INTERVALO_DEPURACION = 24*60*60
+
+	#	Número de segundos desde el inicio del sistema hasta la primera
+	#	depuración, de forma que no coincida con el archivo de mensajes
+	__RETRASO_DEPURACION = 60*60
+
+	#	Número de segundos entre dos reanudaciones consecutivas de las
+	#	descargas de archivos multimedia que no llegaron a completarse
+	__INTERVALO_REANUDAR_DESCARGAS = 24*60*60
+
+	#	Periodos de retención de cada clase de datos de la base de datos
+	__CLASES_RETENCION = {
+							'privados': 'retencion_mensajes_privados_dias',
+							'foros': 'retencion_mensajes_foros_dias',
+							'resumen_foros': 'retencion_resumen_foros_dias'
+						}
+
+	#	Subdirectorios del directorio base en los que se descargan los
+	#	archivos multimedia
+	__SUBDIRS_MULTIMEDIA = ('imagenes', 'documentos', 'videos', 'audios',
+							'notas_voz', 'notas_video', 'stickers',
+							'animaciones')
+
+	#	Antigüedad mínima en segundos de los archivos multimedia no
+	#	referenciados que se eliminan. Los más recientes pueden estar aún
+	#	pendientes de registrar en la base de datos
+	__ANTIGUEDAD_MULTIMEDIA_HUERFANA = 24*60*60
+
+	#	Patrón de los nombres de fichero de las copias de seguridad, que
+	#	ordenados alfabéticamente quedan ordenados por fecha
+	__PATRON_COPIA = re.compile(r'^cprofessorbot_BD_\d{8}_\d{6}\.db$')
+
+	#	Número de segundos entre dos almacenamientos consecutivos de las
+	#	métricas de la instrumentación de la base de datos
+	__INTERVALO_INSTRUMENTACION = 60*60
+
 	### Métodos privados ###
 	def __initialize_interface(self):
 
@@ -180,6 +387,11 @@ class BotServer:
 		updater = telegram.ext.Updater(token=self.__token)
 		dispatcher = updater.dispatcher
 
+		#	Consultar la identidad del bot una única vez, para que ni los
+		#	manejadores ni las funciones callback la consulten a Telegram
+		#	por cada actualización
+		self.__identidad_bot = IdentidadBot(interface)
+
 		###	Declaración de todos los manejadores ###
 
 		#	Manejador del comando /start en chats privados
@@ -266,6 +478,11 @@ class BotServer:
 									self.__descargar_conversaciones_callback,
 									pass_user_data=True),
 
+						RegexHandler(u'Buscar en las conversaciones %s' %
+										emojis.LUPA,
+									self.__buscar_mensajes_callback,
+									pass_user_data=True),
+
 						RegexHandler((u'Dar de baja como profesor/ra %s' %
 										emojis.BOMBA),
 									self.__baja__callback,
@@ -381,6 +598,11 @@ class BotServer:
 							self.__desc_convers_conf_grupo_callback,
 							pass_user_data=True)
 						],
+				BotServer.__BUSQ_MENSAJES_TEXTO: [
+						MessageHandler(Filters.text,
+							self.__busq_mensajes_texto_callback,
+							pass_user_data=True)
+						],
 				BotServer.__SELECT_OP_BAJA: [
 						CallbackQueryHandler(self.__select_op_baja_callback,
 												pass_user_data=True)
@@ -400,10 +622,12 @@ class BotServer:
 		# Manejador del evento de entrada del sistema a un grupo
 		entering_group_handler = EnteringGroupHandler(
 									self.__entrada_grupo_callback,
+									self.__identidad_bot,
 									pass_chat_data=True)
 
 		exiting_group_handler = LefteringGroupHandler(
 									self.__exit_group_callback,
+									self.__identidad_bot,
 									pass_chat_data=True)
 
 		#	Manejador de los eventos producidos cuando un usuario se agrega
@@ -416,6 +640,7 @@ class BotServer:
 		#	a un grupo existente
 		exit_member_group_handler = MemberLefteringGroupHandler(
 										self.__exit_member_group_callback,
+										self.__identidad_bot,
 										pass_chat_data = True
 									)
 
@@ -457,9 +682,17 @@ class BotServer:
 		requeridos y con el tipo de datos y valores correctos
 		"""
 
-		#	Se comprueba que no falte ningún campo
-		if len(self.__config) != len(BotServer.__CONFIG_FILE_TEMP):
-			raise ValueError('Los campos proporcionados en el fichero de'\
+		#	Se comprueba que no falte ningún campo obligatorio
+		for campo in BotServer.__CONFIG_FILE_TEMP:
+
+			if campo in self.__config:
+				continue
+
+			elif campo in BotServer.__CONFIG_CAMPOS_OPCIONALES:
+				self.__config[campo] = BotServer.__CONFIG_FILE_TEMP[campo]
+
+			else:
+				raise ValueError('Los campos proporcionados en el fichero de'\
 								' configuración no son válidos')
 
 		#	Se comprueba que los campos son válidos
@@ -489,6 +722,12 @@ class BotServer:
 					raise ValueError('El valor del campo "%s" no es un número'\
 										' válido' % campo)
 
+			elif type(BotServer.__CONFIG_FILE_TEMP[campo]) is bool:
+
+				if type(self.__config[campo]) is not bool:
+					raise ValueError('El valor del campo "%s" no es un valor'\
+										' lógico válido' % campo)
+
 			elif type(BotServer.__CONFIG_FILE_TEMP[campo]) is int:
 
 				if type(self.__config[campo]) is not int:
@@ -506,6 +745,45 @@ class BotServer:
 			raise ValueError('El campo "avisos_ban" del fichero de'\
 								' configuración debe ser mayor o igual que 1')
 
+		if self.__config['intervalo_actualizacion_conceptos'] < 0:
+			raise ValueError('El campo "intervalo_actualizacion_conceptos" del'\
+								' fichero de configuración no puede ser'\
+								' negativo')
+
+		if self.__config['horizonte_archivo_dias'] < 0:
+			raise ValueError('El campo "horizonte_archivo_dias" del fichero'\
+								' de configuración no puede ser negativo')
+
+		for campo in BotServer.__CLASES_RETENCION.values():
+			if self.__config[campo] < 0:
+				raise ValueError('El campo "%s" del fichero de configuración'\
+										' no puede ser negativo' % campo)
+
+		if self.__config['intervalo_copia_seguridad_horas'] < 0:
+			raise ValueError('El campo "intervalo_copia_seguridad_horas" del'\
+								' fichero de configuración no puede ser'\
+								' negativo')
+
+		if self.__config['max_copias_seguridad'] < 1:
+			raise ValueError('El campo "max_copias_seguridad" del fichero de'\
+								' configuración debe ser mayor o igual que 1')
+
+		if self.__config['sincronizacion_bd'].upper() not in ('OFF', 'NORMAL',
+															'FULL', 'EXTRA'):
+			raise ValueError('El campo "sincronizacion_bd" del fichero de'\
+								' configuración debe ser "OFF", "NORMAL",'\
+								' "FULL" o "EXTRA"')
+
+		if self.__config['almacenamiento_bd'].lower() not in ('disco',
+																'memoria'):
+			raise ValueError('El campo "almacenamiento_bd" del fichero de'\
+								' configuración debe ser "disco" o "memoria"')
+
+		if self.__config['intervalo_instantanea_minutos'] < 1:
+			raise ValueError('El campo "intervalo_instantanea_minutos" del'\
+								' fichero de configuración debe ser mayor o'\
+								' igual que 1')
+
 		#	Arreglar la ruta del directorio base
 		if not self.__config['directorio_base'].endswith('/'):
 			self.__config['directorio_base'] += '/'
@@ -546,8 +824,7 @@ class BotServer:
 			pregunta = m.group(2)
 		else:
 			#	Tomar la pregunta si se llama al profesor
-			m = re.search(('^(profe(s{1,2}or)?|@%s),?( )*(.*)' %
-											bot.get_me().username),mensaje)
+			m = self.__identidad_bot.patron_mencion.search(mensaje)
 
 			if m:
 				pregunta = m.group(4)
@@ -600,18 +877,13 @@ class BotServer:
 
 
 		#	Registrar al ususario que envía el mensaje si no estaba
-		#	registrado
-		self.__registrar_usuario_grupo_handler(bot, update.effective_user,
-												update.effective_chat,
-												chat_data)
-
-		#	Registrar cada uno de los usuarios que pudieran haberse unido al
-		#	grupo en este momento
+		#	registrado y a cada uno de los usuarios que pudieran haberse unido
+		#	al grupo en este momento
 		mensaje_dato = update.message or update.edited_message
-		for usuario in mensaje_dato.new_chat_members:
-			self.__registrar_usuario_grupo_handler(bot, usuario,
-													update.effective_chat,
-													chat_data)
+		self.__registrar_usuarios_grupo_handler(bot,
+								[update.effective_user] +
+								list(mensaje_dato.new_chat_members),
+								update.effective_chat, chat_data)
 
 		#	Realizar actualizaciones de los datos del grupo si hubiera
 		#	pasado el tiempo mínimo requerido
@@ -655,8 +927,7 @@ class BotServer:
 			pregunta = m.group(2)
 		else:
 			#	Tomar la pregunta si se llama al profesor
-			m = re.search(('^(profe(s{1,2}or)?|@%s),?( )*(.*)' %
-												bot.get_me().username), mensaje)
+			m = self.__identidad_bot.patron_mencion.search(mensaje)
 
 			if m:
 				pregunta = m.group(4)
@@ -734,7 +1005,7 @@ class BotServer:
 		if self.__debug_mode:
 			tiempo = time.time() - t_inicio
 			self.__log.debug('Finalizada función "__answer_question_callback"'\
-							' de "BotServer" en %f s' % tiempo)
+							' de "BotServer" en %f s', tiempo, tiempo=tiempo)
 
 	def __message_private_callback(self, bot, update, user_data):
 
@@ -742,10 +1013,10 @@ class BotServer:
 			privado
 		"""
 
-		self.__log.debug(('Iniciada función manejadora'\
+		self.__log.debug('Iniciada función manejadora'\
 							' "__message_private_callback" de "BotServer" con'\
-							' parámetros:\nupdate:%s\nuser_data:%s' %
-							(str(update), str(user_data))))
+							' parámetros:\nupdate:%s\nuser_data:%s', update,
+							user_data)
 
 		###	Para chats privados ###
 
@@ -775,8 +1046,8 @@ class BotServer:
 
 		self.__log.debug('Iniciada función manejadora'\
 						' "__message_group_callback" de "BotServer" con'\
-						' parámetros:\nupdate:%s\chat_data:%s' % (str(update),
-																str(chat_data)))
+						' parámetros:\nupdate:%s\chat_data:%s', update,
+																chat_data)
 
 		#	Cargar los datos del grupo y de sus participantes,
 		self.__load_datos_grupo_callback(bot, update, chat_data)
@@ -786,17 +1057,13 @@ class BotServer:
 
 
 		#	Registrar al ususario que envía el mensaje si no estaba registrado
-		self.__registrar_usuario_grupo_handler(bot, update.effective_user,
-												update.effective_chat,
-												chat_data)
-
-		#	Registrar cada uno de los usuarios que pudieran haberse unido al
-		#	grupo en este momento
+		#	y a cada uno de los usuarios que pudieran haberse unido al grupo
+		#	en este momento
 		mensaje = update.message or update.edited_message
-		for usuario in mensaje.new_chat_members:
-			self.__registrar_usuario_grupo_handler(bot, usuario,
-													update.effective_chat,
-													chat_data)
+		self.__registrar_usuarios_grupo_handler(bot,
+								[update.effective_user] +
+								list(mensaje.new_chat_members),
+								update.effective_chat, chat_data)
 
 		#	Realizar actualizaciones de los datos del grupo si hubiera
 		#	pasado el tiempo mínimo requerido
@@ -915,7 +1182,7 @@ class BotServer:
 		#	y tuviera los permisos innecesarios, en caso contrario,
 		#	se considera el grupo inválido
 		if not chat_data['foros'][update.effective_chat.id]['valido']:
-			if (update.effective_chat.get_member(bot.get_me().id) in
+			if (update.effective_chat.get_member(self.__identidad_bot.id) in
 									update.effective_chat.get_administrators()):
 				chat_data['foros'][update.effective_chat.id]['valido'] = True
 
@@ -933,105 +1200,73 @@ class BotServer:
 				chat_data['foros'][update.effective_chat.id]['valido'] = False
 
 
-	def __registrar_usuario_grupo_handler(self, bot, usuario, chat, chat_data):
+	def __registrar_usuarios_grupo_handler(self, bot, usuarios, chat,
+																	chat_data):
 
-		"""Permite efectuar el registro de un usuario y de su inscripción
-			a un grupo.
+		"""Permite efectuar el registro de uno o más usuarios y de su
+			inscripción a un grupo. Todos los usuarios que no se hallen en
+			los datos de contexto se registran en una única escritura.
 			Nota: Se requiere haber usado previamente la función
 			"__load_datos_grupo_callback"
 		"""
 
-		#	El usuario no está registrado en los datos de contexto y se
-		#		asegura su registro en el sistema, su registro en el foro
-		#		y su registro en los datos de contexto
-		if (not 'miembros' in chat_data['foros'][chat.id] or
-			not isinstance(
-				chat_data['foros'][chat.id]['miembros'], dict)
-				or usuario.id not in
-					chat_data['foros'][chat.id]['miembros']):
+		miembros = chat_data['foros'][chat.id].get('miembros')
 
+		if not isinstance(miembros, dict):
+			miembros = {}
 
-			#	Comprobar que el usuario existe y registrarlo o hacerlo
-			#	válido si fuera neecsario
-			usuario_datos = self.__bd_interface.getUsuario(user_id=
-													usuario.id)
-
-			if not usuario_datos:
-				try:
-					self.__bd_interface.addUsuario(
-									id_usuario=usuario.id,
-									nombre=usuario.first_name,
-									apellidos=usuario.last_name,
-									username=usuario.username,
-									id_chat=usuario.id,
-									fecha_registro=datetime.datetime.now(),
-									tipo='alumno')
+		#	Los usuarios que no están registrados en los datos de contexto
+		#	se registran en el sistema, en el foro y en los datos de contexto
+		nuevos = OrderedDict()
 
-				except Exception as e:
-					self.__log.error('Error al tratar de registrar al usuario'\
-									' "%s" con id %d. Valor de excepción: %s'% (
-									usuario.full_name,
-									usuario.id, str(e)))
-					return
-			elif not usuario_datos['valido']:
-				try:
-					self.__bd_interface.editUsuario(
-											id_usuario=usuario.id,
-											valido=True)
-					usuario_datos['valido'] = True
-				except Exception as e:
-					self.__log.error('Error al editar al usuario "%s" con id %d'\
-									' para hacerlo válido, valor de'\
-									'excepción %s' % (
-									usuario.full_name,
-									usuario.id, str(e)))
-					return
+		for usuario in usuarios:
+			if usuario.id not in miembros:
+				nuevos[usuario.id] = usuario
 
+		if not nuevos:
+			return
 
-			#	Registrar al usuario en el foro
-			try:
-				self.__bd_interface.addUsuarioForo(
+		#	Registrar a los usuarios o hacerlos válidos si fuera necesario e
+		#	inscribirlos en el foro
+		try:
+			inscritos = self.__bd_interface.registerUsuariosForo(
 						id_chat=chat.id,
-						usuarios=usuario.id)
+						usuarios=[(usuario.id, usuario.first_name,
+									usuario.last_name, usuario.username)
+												for usuario in nuevos.values()],
+						fecha=datetime.datetime.now())
 
-				self.__log.info('Usuario %s con id %d ha sido registrado'\
-								' en foro %s con id %d' % (usuario.full_name,
-								usuario.id, chat.title, chat.id))
-
-			except:
-				self.__log.error('Error al insertar al usuario %s con id %d'\
-									' en el foro %s con id %d' % (
-										usuario.full_name,usuario.id,
-										chat.title, chat.id))
-				return
+		except Exception as e:
+			self.__log.error('Error al registrar a los usuarios con id en %s'\
+								' en el foro %s con id %d. Valor de excepción:'\
+								' %s' % (list(nuevos), chat.title, chat.id,
+																		str(e)))
+			return
 
-			(chat_data['foros'][chat.id]
-					['miembros']) = self.__bd_interface.listUsuarios_in_Foro(
-													chat.id)
+		for id_usuario in inscritos:
+			self.__log.info('Usuario %s con id %d ha sido registrado'\
+							' en foro %s con id %d' % (
+							nuevos[id_usuario].full_name, id_usuario,
+							chat.title, chat.id))
 
-			#	Añadir fecha de última actualización a los usuarios
-			fecha_actual = datetime.datetime.now()
+		(chat_data['foros'][chat.id]
+				['miembros']) = self.__bd_interface.listUsuarios_in_Foro(
+												chat.id) or {}
 
-			for m in chat_data['foros'][chat.id]['miembros']:
-				(chat_data['foros'][chat.id]['miembros']
-									[m]['ultima_actualizacion']) = fecha_actual
+		#	Añadir fecha de última actualización a los usuarios
+		fecha_actual = datetime.datetime.now()
 
-			#	Hacer administradores a los docentes por ende
-			if ((chat_data['foros'][chat.id]['miembros']
-				[usuario.id]['tipo']) == 'docente' and
-				chat.get_member(user_id=usuario.id) not
-												in chat.get_administrators()):
-				bot.promote_chat_member(user_id=usuario.id, chat_id=chat.id)
+		for m in chat_data['foros'][chat.id]['miembros']:
+			(chat_data['foros'][chat.id]['miembros']
+								[m]['ultima_actualizacion']) = fecha_actual
 
-			try:
-				self.__bd_interface.addEventoChatGrupal(
-											tipo='registro',
-											id_usuario=usuario.id,
-											id_chat=chat.id,
-											fecha=datetime.datetime.now())
-			except Exception as e:
-				self.__log.error('Error al tratar de registrar el "registro"'\
-								' del usuario. Valor de excepción: %s' % str(e))
+		#	Hacer administradores a los docentes por ende
+		for id_usuario in nuevos:
+			if ((chat_data['foros'][chat.id]['miembros'].get(id_usuario, {})
+											.get('tipo')) == 'docente' and
+				chat.get_member(user_id=id_usuario) not
+											in chat.get_administrators()):
+				bot.promote_chat_member(user_id=id_usuario, chat_id=chat.id)
 
 	def __actualizar_datos_grupo_handler(self, bot, update, chat_data):
 
@@ -1062,7 +1297,7 @@ class BotServer:
 
 		#	Si alguien eliminara los permisos de Administración al sistema,
 		#	este deja de ser considerado válido
-		if (update.effective_chat.get_member(bot.get_me().id) not in
+		if (update.effective_chat.get_member(self.__identidad_bot.id) not in
 								update.effective_chat.get_administrators()):
 
 			try:
@@ -1117,12 +1352,13 @@ class BotServer:
 			Requiere haber usado previamente "__load_data_group_handler"
 		"""
 
-		if (usuario.first_name != (chat_data['foros'][chat.id]['miembros']
-								[usuario.id]['telegram_user'].first_name) or
-			usuario.last_name != (chat_data['foros'][chat.id]['miembros']
-								[usuario.id]['telegram_user'].last_name) or
-			usuario.username != (chat_data['foros'][chat.id]['miembros']
-									[usuario.id]['telegram_user'].username)):
+		#	Comparar directamente con los datos del registro del miembro, sin
+		#	construir su telegram.User
+		miembro = chat_data['foros'][chat.id]['miembros'][usuario.id]
+
+		if (usuario.first_name != miembro.nombre or
+			usuario.last_name != miembro.apellidos or
+			usuario.username != miembro.username):
 			try:
 				self.__bd_interface.editUsuario(
 										id_usuario=usuario.id,
@@ -1172,13 +1408,13 @@ class BotServer:
 		#	Evaluar el mensaje para conocer si es académico
 		score = self.__speech_handler.evaluate(mensaje.text)
 
-		self.__log.debug(('Mensaje recibido del usuario %s con id {} en el'\
-							'grupo "{}" con id {} con certeza de pertenenencia'\
-							' al tema tratado en el foro de {}'.format(
-							update.effective_user.full_name,
+		self.__log.debug('Mensaje recibido del usuario %s con id %s en el'\
+							'grupo "%s" con id %s con certeza de pertenenencia'\
+							' al tema tratado en el foro de %s',
+								update.effective_user.full_name,
 								update.effective_user.id,
 								update.effective_chat.title,
-								update.effective_chat.id, score)))
+								update.effective_chat.id, score)
 
 		if score is not None and score < self.__config['umbral_eval_conv']:
 
@@ -1400,18 +1636,13 @@ class BotServer:
 
 
 		#	Registrar al ususario que envía el mensaje si no estaba
-		#	registrado
-		self.__registrar_usuario_grupo_handler(bot, update.effective_user,
-												update.effective_chat,
-												chat_data)
-
-		#	Registrar cada uno de los usuarios que pudieran haberse unido al
-		#	grupo en este momento
+		#	registrado y a cada uno de los usuarios que pudieran haberse unido
+		#	al grupo en este momento
 		mensaje = update.message or update.edited_message
-		for usuario in mensaje.new_chat_members:
-			self.__registrar_usuario_grupo_handler(bot, usuario,
-													update.effective_chat,
-													chat_data)
+		self.__registrar_usuarios_grupo_handler(bot,
+								[update.effective_user] +
+								list(mensaje.new_chat_members),
+								update.effective_chat, chat_data)
 
 		#	Realizar actualizaciones de los datos del grupo si hubiera
 		#	pasado el tiempo mínimo requerido
@@ -1442,8 +1673,8 @@ class BotServer:
 						chat_id=update.message.chat_id,
 						text='Bienvenid@, soy %s (@%s) tu bot y profesor en '\
 								'este grupo de alumn@s.' % (
-														bot.get_me().first_name,
-														bot.get_me().username))
+												self.__identidad_bot.first_name,
+												self.__identidad_bot.username))
 				self.__registrar_mensaje(mensaje=bot_men, recibido=False)
 
 				bot_men = bot.sendMessage(
@@ -1497,8 +1728,8 @@ class BotServer:
 				bot.sendMessage(chat_id=update.message.chat_id,
 								text='Bienvenid@, soy %s (@%s) tu bot y'\
 									' profesor en este grupo de alumn@s.' % (
-														bot.get_me().first_name,
-														bot.get_me().username))
+												self.__identidad_bot.first_name,
+												self.__identidad_bot.username))
 				bot.sendMessage(chat_id=update.message.chat_id,
 								text='Tómate la libertad de preguntar '\
 										'cualquier duda de teoría que tengas'\
@@ -1567,8 +1798,8 @@ class BotServer:
 							chat_id=update.message.chat_id,
 							text='Bienvenid@, soy %s (@%s) tu bot y profesor'\
 									' en este grupo de alumn@s.' % (
-														bot.get_me().first_name,
-														bot.get_me().username))
+												self.__identidad_bot.first_name,
+												self.__identidad_bot.username))
 				bot.sendMessage(
 							chat_id=update.message.chat_id,
 							text='Tómate la libertad de preguntar cualquier'\
@@ -1767,8 +1998,8 @@ class BotServer:
 									['contenidos'][i]) = update.edited_message
 					break
 
-		self.__log.debug('Añadido mensaje con los siguientes datos:\n%s'
-							% str(mensaje))
+		self.__log.debug('Añadido mensaje con los siguientes datos:\n%s',
+																	mensaje)
 
 	def __comunicado_conf_contenido(self, bot, update, user_data):
 
@@ -2060,12 +2291,14 @@ class BotServer:
 								contenido,
 								multimedia_filename='Comunicado=%d-' % id_com)
 
-				#	Alamcenar todos los datos en el comunicado
+				#	Alamcenar todos los datos en el comunicado y descargar
+				#	sus archivos multimedia
 				for d in datos:
-					self.__bd_interface.addDato(
+					id_dato = self.__bd_interface.addDato(
 										dato=d,
 										fecha_creacion=datetime.datetime.now(),
 										id_comunicado=id_com)
+					self.__programar_descarga(id_dato, d)
 			except Exception as e:
 				self.__log.error('Se produjo un error en la extracción y/o'\
 								' almacenamiento de un contenido del '\
@@ -2659,6 +2892,12 @@ class BotServer:
 														[int(grupo)]['nombre'])
 
 			try:
+				#	Número de mensajes que abarcará la recopilación
+				resumen = self.__bd_interface.getResumenMensajesForo(
+												id_chat=int(grupo),
+												fecha_inicio=fecha_hora_inicio,
+												fecha_fin=fecha_hora_fin)
+
 				bot.sendMessage(chat_id=update.callback_query.message.chat_id,
 							text='Ok. Se realizará una recopilación para "%s" '\
 									'que abarcará desde el día %s a las %s '\
@@ -2667,6 +2906,14 @@ class BotServer:
 									fecha_hora_inicio.strftime('%H:%M'),
 									fecha_hora_fin.strftime('%d/%m/%Y'),
 									fecha_hora_fin.strftime('%H:%M')))
+				bot.sendMessage(chat_id=update.callback_query.message.chat_id,
+							text='En ese periodo hay %d mensajes: %d recibidos'\
+									' (%d académicos y %d no académicos) y %d '\
+									'enviados por mí' % (resumen['recibidos']+
+									resumen['enviados'], resumen['recibidos'],
+									resumen['academicos'],
+									resumen['no_academicos'],
+									resumen['enviados']))
 				bot.sendMessage(chat_id=update.callback_query.message.chat_id,
 							text='¿Es correcto?',
 							reply_markup=InlineKeyboardMarkup(
@@ -2769,7 +3016,6 @@ class BotServer:
 		fecha_hora_fin = job.context['fecha_hora_fin']
 		nombre_docente_solicitante = (job.context['usuario_docente_solicitante']
 													['telegram_user'].full_name)
-		n_mensajes = job.context['n_mensajes']
 		id_chat_docente = job.context['usuario_docente_solicitante']['id_chat']
 
 		nombre_foro = self.__bd_interface.getForo(foro_id=id_foro)['nombre']
@@ -2797,22 +3043,13 @@ class BotServer:
 				# 	Comienza la recopilación
 				recopilador.start()
 
-				#	Se recopilan los mensajes dividiéndolos en particiones
-				particiones = ((n_mensajes//BotServer.__DESC_CONV_PART) +
-									bool(n_mensajes%BotServer.__DESC_CONV_PART))
-
-				for i in range(particiones):
-
-					mensajes_part = self.__bd_interface.getMensajesForo(
-						id_chat=id_foro,
-						fecha_inicio=fecha_hora_inicio,
-						fecha_fin=fecha_hora_fin,
-						division=BotServer.__DESC_CONV_PART,
-						particion=i)
-
-
-					#	Añadir mensajes a la recopilación
-					recopilador.addMensaje(mensajes_part)
+				#	Se recopilan los mensajes a medida que se leen de la base
+				#	de datos, en páginas de __DESC_CONV_PART mensajes
+				recopilador.addMensaje(self.__bd_interface.iterMensajesForo(
+										id_chat=id_foro,
+										fecha_inicio=fecha_hora_inicio,
+										fecha_fin=fecha_hora_fin,
+										tam_pagina=BotServer.__DESC_CONV_PART))
 
 				#	Fin de recopilación
 				fichero = recopilador.close()
@@ -2854,6 +3091,88 @@ class BotServer:
 		self.__log.debug('Finalizada función "__desc_convers_recop_callback"'\
 							' de "BotServer"')
 
+	def __buscar_mensajes_callback(self, bot, update, user_data):
+
+		"""Función manejadora encargada de solicitar al usuario docente las
+			palabras que desea buscar en las conversaciones de los foros
+		"""
+
+		try:
+			bot.sendMessage(chat_id=update.message.chat_id,
+							text='Ok. Escríbeme las palabras que quieres buscar'\
+								' en las conversaciones de tus grupos',
+							reply_markup=ReplyKeyboardRemove())
+
+			return BotServer.__BUSQ_MENSAJES_TEXTO
+
+		except Exception as e:
+			self.__log.error('Se produjo un error en el envío del mensaje'\
+							' que solicita las palabras de una búsqueda de'\
+							' mensajes:\n{}'.format(str(e)))
+			return ConversationHandler.END
+
+	def __busq_mensajes_texto_callback(self, bot, update, user_data):
+
+		"""Función manejadora encargada de buscar los mensajes de los foros
+			que contienen las palabras introducidas por el usuario docente y
+			de enviarle los mensajes encontrados
+		"""
+
+		self.__log.debug('Iniciada función "__busq_mensajes_texto_callback"'\
+							' de "BotServer"')
+
+		chat_id = update.message.chat_id
+
+		try:
+			coincidencias = self.__bd_interface.searchMensajesForo(
+										texto=update.message.text,
+										limite=BotServer.__BUSQ_MAX_RESULTADOS)
+
+		except Exception as e:
+			self.__log.error('Se produjo un error al buscar los mensajes '\
+							'con el texto "{}":\n{}'.format(update.message.text,
+																	str(e)))
+			coincidencias = []
+
+		try:
+			if not coincidencias:
+				bot.sendMessage(chat_id=chat_id,
+							text='No he encontrado ningún mensaje con esas '\
+									'palabras %s' % emojis.CARA_GOTA)
+
+			else:
+				#	Agrupar los mensajes encontrados en el menor número de
+				#	mensajes sin superar la longitud máxima de Telegram
+				lineas = ['%s - %s\n%s: %s' % (
+								coincidencia['fecha'].strftime('%d/%m/%Y %H:%M'),
+								coincidencia['nombre_foro'],
+								coincidencia['nombre_usuario'],
+								coincidencia['texto']
+											[:BotServer.__BUSQ_MAX_CARACTERES])
+								for coincidencia in coincidencias]
+
+				bloques = ['He encontrado estos mensajes, del más reciente '\
+								'al más antiguo:']
+
+				for linea in lineas:
+					if (len(bloques[-1]) + len(linea) + 2 >
+										telegram.constants.MAX_MESSAGE_LENGTH):
+						bloques.append(linea)
+					else:
+						bloques[-1] += '\n\n' + linea
+
+				for bloque in bloques:
+					bot.sendMessage(chat_id=chat_id, text=bloque)
+
+		except Exception as e:
+			self.__log.error('Se produjo un error al enviar los resultados'\
+							' de una búsqueda de mensajes:\n{}'.format(str(e)))
+
+		self.__log.debug('Finalizada función "__busq_mensajes_texto_callback"'\
+							' de "BotServer"')
+
+		return self.__mostrar_menu_docente_callback(bot, update, user_data)
+
 	def __baja__callback(self, bot, update, user_data):
 
 		"""Función manejadora encargada de enviar el mensaje de confirmación
@@ -3839,7 +4158,7 @@ class BotServer:
 		self.__log.debug('Iniciada función manejadora '\
 							'"__registro_usuario_docente" de "BotServer" con'\
 							' los siguientes parámetros:\nupdate: '\
-							'%s\nuser_data: %s' % (str(update), str(user_data)))
+							'%s\nuser_data: %s', update, user_data)
 
 		#	Sólo se permite el registro en chats privados
 		if update.message.chat.type != 'private':
@@ -3920,7 +4239,7 @@ class BotServer:
 		self.__log.debug('Iniciada función manejadora'\
 							'"__entrada_grupo_callback" de "BotServer" con los'\
 							' siguientes parámetros:\nupdate: '\
-							'%s\nchat_data: %s' % (str(update), str(chat_data)))
+							'%s\nchat_data: %s', update, chat_data)
 
 		#	Se descarta la ejecución en grupos privados
 		if update.message.chat.type in ('private', 'channel'):
@@ -3943,7 +4262,7 @@ class BotServer:
 		self.__log.debug('Finalizada función manejadora'\
 							'"__entrada_grupo_callback" de "BotServer" con los'\
 							' siguientes parámetros:\nupdate: '\
-							'%s\nchat_data: %s' % (str(update), str(chat_data)))
+							'%s\nchat_data: %s', update, chat_data)
 
 
 	def __enter_member_group_callback(self, bot, update, chat_data):
@@ -3955,37 +4274,48 @@ class BotServer:
 		self.__log.debug('Iniciada función manejadora'\
 							' "__enter_member_group_handler" de "BotServer"'\
 							'con los siguientes parámetros:\nupdate: '\
-							'%s\nchat_data: %s' % (str(update), str(chat_data)))
+							'%s\nchat_data: %s', update, chat_data)
 
 		#	Cargar los datos del grupo en contexto
 		self.__load_datos_grupo_callback(bot, update, chat_data)
 
-		#	Tomar la lista de usuarios que ingresan en el foro
+		#	Tomar la lista de usuarios que ingresan en el foro. La entrada del
+		#	propio bot la atiende el manejador EnteringGroupHandler, que se
+		#	registra antes y consume la actualización
 		usuarios_foro = update.message.new_chat_members
 
-		if update.effective_chat.get_member(bot.get_me().id) in usuarios_foro:
-			self.__entrada_grupo_callback(bot, update, chat_data)
-
-		for usuario in usuarios_foro:
+		try:
+			#	Actualizar a los usuarios ya registrados en el foro y
+			#	registrar al resto en una única escritura
+			miembros = (chat_data['foros'][update.effective_chat.id]
+													.get('miembros') or {})
 
-			try:
-				#	Registrar a cada usuario o actualizarlo según proceda
-				if usuario.id not in (chat_data['foros']
-													[update.effective_chat.id]
-																['miembros']):
-					self.__registrar_usuario_grupo_handler(bot, usuario,
-											update.effective_chat, chat_data)
-				else:
+			for usuario in usuarios_foro:
+				if usuario.id in miembros:
 					self.__actualizar_datos_usuario_handler(bot, usuario,
 											update.effective_chat, chat_data)
 
-				#	Registrar este evento
-				self.__bd_interface.addEventoChatGrupal(
-											tipo='entrada',
-											id_usuario=usuario.id,
-											id_chat=update.effective_chat.id,
-											fecha=update.message.date)
+			self.__registrar_usuarios_grupo_handler(bot, usuarios_foro,
+											update.effective_chat, chat_data)
 
+			#	Registrar la entrada de todos los usuarios
+			self.__bd_interface.addEventoChatGrupal(
+									tipo='entrada',
+									id_usuario=[u.id for u in usuarios_foro],
+									id_chat=update.effective_chat.id,
+									fecha=update.message.date)
+
+		except Exception as e:
+			self.__log.error('Grupo id=%d, nombre grupo=%s - Error al '\
+							'registrar la entrada de los usuarios con id en'\
+							' %s\nValor de excepción: %s' % (
+							update.effective_chat.id,
+							update.effective_chat.title,
+							[u.id for u in usuarios_foro], str(e)))
+
+		for usuario in usuarios_foro:
+
+			try:
 				if chat_data['foros'][update.effective_chat.id]['valido']:
 					try:
 						#	Saludar al nuevo usuario que se acaba de registrar
@@ -3996,8 +4326,8 @@ class BotServer:
 											usuario.full_name, emojis.MANO_ADIOS,
 											update.message.chat.title,
 											emojis.CARA_ALEGRE,
-											bot.get_me().first_name,
-											bot.get_me().username))
+											self.__identidad_bot.first_name,
+											self.__identidad_bot.username))
 						self.__registrar_mensaje(mensaje=bot_men, recibido=False)
 
 						bot_men = bot.sendMessage(
@@ -4052,7 +4382,7 @@ class BotServer:
 		self.__log.debug('Iniciada función manejadora '\
 							'"__exit_member_group_callback" de "BotServer" '\
 							'con los siguientes parámetros:\nupdate: '\
-							'%s\nuser_data: %s' % (str(update), str(chat_data)))
+							'%s\nuser_data: %s', update, chat_data)
 
 		usuario_saliente = (update.message or
 										update.edited_message).left_chat_member
@@ -4137,7 +4467,7 @@ class BotServer:
 		self.__log.debug('Iniciada función manejadora '\
 							'"__exit_group_callback" de "BotServer" '\
 							'con los siguientes parámetros:\nupdate: '\
-							'%s\chat_data: %s' % (str(update), str(chat_data)))
+							'%s\chat_data: %s', update, chat_data)
 
 		#	Tomar los datos del foro de contexto
 		self.__load_datos_grupo_callback(bot, update, chat_data)
@@ -4193,7 +4523,9 @@ class BotServer:
 
 		"""Función manejadora encargada de registrar todos los datos del mensaje
 			en la base de datos y/o en el directorio base del servidor si fuera
-			necesario
+			necesario. El registro se delega en el hilo de registro, que lo
+			realiza por lotes; si la cola está llena, se espera a que haya
+			espacio en ella
 		"""
 
 		try:
@@ -4209,133 +4541,345 @@ class BotServer:
 			if not mensaje.effective_attachment and not mensaje.text:
 				return
 
-			#	Tomar el mensaje respondido si lo hubiera
-			id_mensaje_respondido = mensaje.reply_to_message.message_id if mensaje.reply_to_message else None
+			#	Los mensajes de chats privados no se registran
+			if mensaje.chat.type == 'private':
+				return
+
+			registro = (mensaje, editado, academico, recibido,
+												datetime.datetime.now())
+
+			if self.__hilo_registro and self.__hilo_registro.is_alive():
+				self.__cola_registro.put(registro)
+			else:
+				self.__registrar_lote([registro])
+
+		except Exception as e:
+			self.__log.error('Error al registrar el mensaje:\n%s' % str(e))
 
-			if mensaje.chat.type != 'private':
+	def __registrar_lote(self, lote: list):
 
-				if recibido:
-					#	Registrar el mensaje recibido en la base de datos
-					id_mensaje = self.__bd_interface.addMensaje(
+		"""Registra en la base de datos un lote de mensajes tomados de la cola
+			de registro. Los contenidos de cada mensaje se extraen antes de
+			registrarlo y se insertan en la misma operación que el mensaje,
+			de forma que ambos se confirman en la misma transacción. Los
+			mensajes del lote se confirman de forma conjunta
+		"""
+
+		#	Extraer el contenido de los mensajes antes de registrarlos
+		registros = []
+
+		for mensaje, editado, academico, recibido, fecha in lote:
+			try:
+				multimedia_filename = 'id_grupo=%d-id_mensaje_chat=%s-'\
+										'fecha=%d' % (mensaje.chat.id,
+										mensaje.message_id, fecha.timestamp())
+
+				contenidos = (self.__extract_contenido_mensaje(mensaje,
+											multimedia_filename) or [])
+
+			except Exception as e:
+				contenidos = []
+				self.__log.error('Error al extraer el contenido del mensaje:'\
+														'\n%s' % str(e))
+
+			registros.append((mensaje, editado, academico, recibido, fecha,
+																contenidos))
+
+		#	Registrar los mensajes junto con sus contenidos sin esperar a
+		#	cada uno de ellos
+		futuros = []
+
+		with self.__bd_interface.asynchronous():
+			for (mensaje, editado, academico, recibido, fecha,
+												contenidos) in registros:
+
+				#	Tomar el mensaje respondido si lo hubiera
+				id_mensaje_respondido = (mensaje.reply_to_message.message_id
+									if mensaje.reply_to_message else None)
+				try:
+					if recibido:
+						#	Registrar el mensaje recibido en la base de datos
+						futuros.append((contenidos, self.__bd_interface.addMensaje(
 							recibido=True,
 							id_mensaje_chat=mensaje.message_id,
 							id_usuario_emisor_receptor=mensaje.from_user.id,
 							id_chat=mensaje.chat.id,
 							editado=editado,
 							id_mensaje_chat_respondido=id_mensaje_respondido,
-							fecha=datetime.datetime.now(),
-							academico=academico)
+							fecha=fecha,
+							academico=academico,
+							datos=contenidos)))
+					else:
+						#	Registrar el mensaje enviado en la base de datos
+						futuros.append((contenidos, self.__bd_interface.addMensaje(
+							recibido=False,
+							id_mensaje_chat=mensaje.message_id,
+							id_chat=mensaje.chat.id,
+							editado=editado,
+							id_mensaje_chat_respondido=id_mensaje_respondido,
+							fecha=fecha,
+							datos=contenidos)))
 
-					multimedia_filename = 'mensaje=%d-id_grupo=%d-'\
-											'id_mensaje_chat=%s' % (id_mensaje,
-											mensaje.chat.id, mensaje.message_id)
-				else:
-					#	Registrar el mensaje enviado en la base de datos
-					id_mensaje = self.__bd_interface.addMensaje(
-									recibido=False,
-									id_mensaje_chat=mensaje.message_id,
-									id_chat=mensaje.chat.id,
-									editado=editado,
-									id_mensaje_chat_respondido=id_mensaje_respondido,
-									fecha=datetime.datetime.now())
-
-					multimedia_filename = 'mensaje=%d-id_grupo=%d-'\
-											'id_mensaje_chat=%s' % (id_mensaje,
-											mensaje.chat.id, mensaje.message_id)
+				except Exception as e:
+					self.__log.error('Error al registrar el mensaje:\n%s' %
+																		str(e))
 
-			else:
+		#	Descargar los archivos multimedia de los contenidos registrados
+		for contenidos, futuro in futuros:
+			try:
+				_, ids_datos = futuro.result()
+
+				for c, id_dato in zip(contenidos, ids_datos):
+					if id_dato is not None:
+						self.__programar_descarga(id_dato, c)
+
+			except Exception as e:
+				self.__log.error('Error al registrar el mensaje:\n%s' % str(e))
+
+	def __registrar_mensajes(self):
+
+		"""Bucle del hilo de registro: toma los mensajes pendientes de la cola
+			de registro y los registra por lotes hasta encontrar la marca de
+			fin (None)
+		"""
+
+		fin = False
+
+		while not fin:
+
+			registro = self.__cola_registro.get()
+
+			if registro is None:
+				break
+
+			#	Agrupar los mensajes que ya estén en espera
+			lote = [registro]
+
+			while len(lote) < BotServer.__LOTE_REGISTRO:
+				try:
+					registro = self.__cola_registro.get_nowait()
+				except queue.Empty:
+					break
+
+				if registro is None:
+					fin = True
+					break
+
+				lote.append(registro)
+
+			try:
+				self.__registrar_lote(lote)
+			except Exception as e:
+				self.__log.error('Error al registrar un lote de %d mensajes:'\
+										'\n%s' % (len(lote), str(e)))
+
+		self.__log.debug('Finalizado hilo de registro de mensajes')
+
+	def __save_contenido_file(self, filename, contenido):
+
+		"""Determina la ruta del directorio base en la que se almacena el
+			archivo asociado a un contenido multimedia. Los archivos se
+			almacenan una única vez, con su identificador único en Telegram
+			como nombre, y son compartidos por todos los datos que los
+			contienen. Si el archivo ya está almacenado se devuelve su ruta
+			y no se descarga de nuevo; en caso contrario, el archivo se
+			registra con su ruta pendiente y se descarga con
+			__programar_descarga una vez registrado su dato
+
+			Devuelve:
+			---------
+				tuple: Ruta o ruta pendiente, tipo MIME y file_id del archivo,
+					o None si el contenido no es multimedia
+		"""
+
+		for tipo, subdirectorio in BotServer.__DIRECTORIOS_CONTENIDO:
+			if isinstance(contenido, tipo):
+				break
+		else:
+			return None
+
+		file_unique_id = getattr(contenido, 'file_unique_id', None)
+
+		if file_unique_id:
+			ruta_archivo = (self.__config['directorio_base']+subdirectorio+
+															file_unique_id)
+		else:
+			#	Sin identificador único, el archivo se descarga con el nombre
+			#	indicado y se almacena según el resumen de su contenido
+			if isinstance(contenido, telegram.Sticker):
+				filename = contenido.set_name+'-'+filename
+
+			ruta_archivo = (self.__config['directorio_base']+subdirectorio+
+																	filename)
+
+		mime_type = (getattr(contenido, 'mime_type', None) or
+							self.__mime_types.guess_type(ruta_archivo)[0])
+
+		#	Se actualiza la fecha de modificación del archivo almacenado para
+		#	que no se considere huérfano mientras se registra el nuevo dato
+		if file_unique_id and os.path.isfile(ruta_archivo):
+			os.utime(ruta_archivo)
+			return ruta_archivo, mime_type, contenido.file_id
+
+		return (ruta_archivo+BotServer.__SUFIJO_DESCARGA, mime_type,
+															contenido.file_id)
+
+	def __programar_descarga(self, id_dato: int, dato: dict):
+
+		"""Programa la descarga del archivo de un dato multimedia registrado
+			con su ruta pendiente. Los datos registrados con la misma ruta
+			pendiente mientras su archivo se descarga comparten una única
+			descarga. Si los hilos de descarga no están en ejecución, el
+			archivo se descarga en el hilo actual; si la cola de descargas
+			está llena, se espera a que haya espacio en ella
+		"""
+
+		if ('file_id' not in dato or
+					not dato['contenido'].endswith(BotServer.__SUFIJO_DESCARGA)):
+			return
+
+		ruta_pendiente = dato['contenido']
+
+		with self.__descargas_lock:
+			if ruta_pendiente in self.__descargas_en_curso:
+				if id_dato not in self.__descargas_en_curso[ruta_pendiente]:
+					self.__descargas_en_curso[ruta_pendiente].append(id_dato)
 				return
 
-			#	Extraer todo el contenido del mensaje
-			contenidos = self.__extract_contenido_mensaje(mensaje,
-															multimedia_filename)
-			#	Registrar todos los contenidos en la base de datos
-			if contenidos:
-				for c in contenidos:
-					self.__bd_interface.addDato(dato=c,
-												fecha_creacion=mensaje.date,
-												id_mensaje=id_mensaje)
+			self.__descargas_en_curso[ruta_pendiente] = [id_dato]
+
+		descarga = (dato['file_id'], ruta_pendiente)
+
+		if any(hilo.is_alive() for hilo in self.__hilos_descarga):
+			self.__cola_descarga.put(descarga)
+		else:
+			self.__descargar_archivo(*descarga)
+
+	def __resumen_archivo(ruta_archivo: str) -> str:
+
+		"""Calcula el resumen SHA-256 en hexadecimal del contenido de un
+			archivo
+		"""
+
+		resumen = hashlib.sha256()
+
+		with open(ruta_archivo, 'rb') as fichero:
+			for bloque in iter(lambda: fichero.read(1 << 20), b''):
+				resumen.update(bloque)
+
+		return resumen.hexdigest()
+
+	def __descargar_archivo(self, file_id: str, ruta_pendiente: str):
+
+		"""Descarga un archivo multimedia en su ruta pendiente y, completada
+			la descarga, lo traslada a su ruta definitiva y la registra en
+			la base de datos en todos los datos que lo comparten. Los
+			archivos sin identificador único se almacenan según el resumen
+			de su contenido, de modo que los archivos repetidos se descartan.
+			Si la descarga falla, los datos conservan la ruta pendiente y su
+			file_id, y la descarga se reintenta en la siguiente reanudación
+			de las descargas (ver __reanudar_descargas)
+		"""
+
+		ruta_archivo = ruta_pendiente[:-len(BotServer.__SUFIJO_DESCARGA)]
+
+		try:
+			#	El archivo pudo almacenarse con una descarga anterior tras
+			#	registrar el dato
+			if not os.path.isfile(ruta_archivo):
+
+				#	Una única consulta a Telegram por archivo
+				archivo = self.__bot_interface.get_file(file_id)
+				archivo.download(ruta_pendiente)
+
+				if not getattr(archivo, 'file_unique_id', None):
+					ruta_archivo = (os.path.dirname(ruta_archivo)+'/'+
+									BotServer.__PREFIJO_RESUMEN+
+									BotServer.__resumen_archivo(ruta_pendiente))
+
+				if os.path.isfile(ruta_archivo):
+					os.remove(ruta_pendiente)
+					os.utime(ruta_archivo)
+				else:
+					os.replace(ruta_pendiente, ruta_archivo)
 
 		except Exception as e:
-			self.__log.error('Error al registrar el mensaje:\n%s' % str(e))
+			self.__log.error('Error al descargar el archivo con file_id %s:'\
+										'\n%s', file_id, str(e))
+			ruta_archivo = None
 
-	def __save_contenido_file(self, filename, contenido):
+		with self.__descargas_lock:
+			ids_datos = self.__descargas_en_curso.pop(ruta_pendiente, [])
+
+		if ruta_archivo is None:
+			return
+
+		for id_dato in ids_datos:
+			try:
+				self.__bd_interface.editDatoArchivo(id_dato=id_dato,
+												ruta_archivo=ruta_archivo)
+			except Exception as e:
+				self.__log.error('Error al registrar el archivo del dato con '\
+									'id %d:\n%s', id_dato, str(e))
+
+	def __descargar_archivos(self):
+
+		"""Bucle de los hilos de descarga: toma los archivos pendientes de la
+			cola de descargas y los descarga hasta encontrar la marca de fin
+			(None)
+		"""
+
+		while True:
+
+			descarga = self.__cola_descarga.get()
+
+			if descarga is None:
+				break
+
+			self.__descargar_archivo(*descarga)
+
+	def __reanudar_descargas_callback(self, bot, job):
+
+		"""Tarea periódica que lanza la reanudación de las descargas de
+		archivos multimedia en un hilo independiente para no retrasar el
+		resto de tareas programadas
+		"""
+
+		if self.__reanudar_descargas_lock.locked():
+			self.__log.info('Reanudación de las descargas aún en curso, se '\
+																	'omite')
+			return
+
+		threading.Thread(target=self.__reanudar_descargas,
+							name='Reanudar-Descargas', daemon=True).start()
 
-		"""Se ocupa de almacenar el archivo asociado a los ficheros multimedia
-			en el directorio base
+	def __reanudar_descargas(self):
+
+		"""Vuelve a programar la descarga de los archivos de los datos
+		multimedia que conservan su ruta pendiente, ya sea porque su descarga
+		falló o porque el sistema se detuvo antes de completarla. Los datos
+		cuya descarga sigue en curso no se descargan de nuevo
 		"""
 
-		#	Descargar archivo e introducirlo en la ruta correspondiente
-
-		if isinstance(contenido, telegram.PhotoSize):
-			ruta_archivo = contenido.get_file().download(
-						self.__config['directorio_base']+'imagenes/'+filename)
-			mime_type = mimetypes.MimeTypes().guess_type(ruta_archivo)[0]
-			file_id = contenido.get_file().file_id
-
-			return ruta_archivo, mime_type, file_id
-		elif isinstance(contenido, telegram.Document):
-			ruta_archivo = contenido.get_file().download(
-						self.__config['directorio_base']+'documentos/'+filename)
-			mime_type = (contenido.mime_type or
-							mimetypes.MimeTypes().guess_type(ruta_archivo)[0])
-			file_id = contenido.get_file().file_id
-
-			return ruta_archivo, mime_type, file_id
-		elif isinstance(contenido, telegram.Video):
-			ruta_archivo = contenido.get_file().download(
-							self.__config['directorio_base']+'videos/'+filename)
-			mime_type = (contenido.mime_type or
-							mimetypes.MimeTypes().guess_type(ruta_archivo)[0])
-			file_id = contenido.get_file().file_id
-
-			return ruta_archivo, mime_type, file_id
-		elif isinstance(contenido, telegram.Audio):
-			ruta_archivo = contenido.get_file().download(
-							self.__config['directorio_base']+'audios/'+filename)
-			mime_type = (contenido.mime_type or
-							(mimetypes.MimeTypes().guess_type(ruta_archivo)[0]))
-			file_id = contenido.get_file().file_id
-
-			return ruta_archivo, mime_type, file_id
-		elif isinstance(contenido, telegram.VideoNote):
-			ruta_archivo = contenido.get_file().download(
-					self.__config['directorio_base']+'notas_video/'+filename)
-			mime_type = mimetypes.MimeTypes().guess_type(ruta_archivo)[0]
-			file_id = contenido.get_file().file_id
-
-			return ruta_archivo, mime_type, file_id
-		elif isinstance(contenido, telegram.Voice):
-			ruta_archivo = contenido.get_file().download(
-						self.__config['directorio_base']+'notas_voz/'+filename)
-			mime_type = (contenido.mime_type or
-							mimetypes.MimeTypes().guess_type(ruta_archivo)[0])
-			file_id = contenido.get_file().file_id
-
-			return ruta_archivo, mime_type, file_id
-		elif isinstance(contenido, telegram.Sticker):
-			ruta_archivo = contenido.get_file().download(
-										(self.__config['directorio_base']+
-											'stickers/'+contenido.set_name+'-'+
-											filename))
-			mime_type = mimetypes.MimeTypes().guess_type(ruta_archivo)[0]
-			file_id = contenido.get_file().file_id
-
-			return ruta_archivo, mime_type, file_id
-
-		elif isinstance(contenido, telegram.Animation):
-			ruta_archivo = self.__bot_interface.get_file(
-												contenido.file_id).download(
-										(self.__config['directorio_base']+
-										'animaciones/'+filename))
-
-			mime_type = contenido.mime_type or (mimetypes.MimeTypes().guess_type(
-															ruta_archivo)[0])
-			file_id = contenido.file_id
-
-			return ruta_archivo, mime_type, file_id
-
-		return None
+		if not self.__reanudar_descargas_lock.acquire(blocking=False):
+			return
+
+		try:
+			datos = self.__bd_interface.listDatosArchivoPendientes(
+												BotServer.__SUFIJO_DESCARGA)
+
+			if datos:
+				self.__log.info('Reanudando la descarga de los archivos '\
+								'multimedia de %d datos' % len(datos))
+
+			for dato in datos:
+				self.__programar_descarga(dato['id_dato'], dato)
+
+		except Exception as e:
+			self.__log.error('Se produjo un error al reanudar las descargas '\
+							'de los archivos multimedia:\n{}'.format(str(e)))
+		finally:
+			self.__reanudar_descargas_lock.release()
 
 	def __extract_contenido_mensaje(self, mensaje: telegram.Message,
 										multimedia_filename=None,
@@ -4593,9 +5137,9 @@ class BotServer:
 						try:
 							self.__bot_interface.get_file(file_id)
 						except:
-							self.__log.debug(('Archivo %s no encontrado en los'\
-													' servidores de Telegram' %
-													contenidos[c]['contenido']))
+							self.__log.debug('Archivo %s no encontrado en los'\
+													' servidores de Telegram',
+													contenidos[c]['contenido'])
 							file_id = None
 					else:
 						file_id = None
@@ -4765,7 +5309,7 @@ class BotServer:
 		#	Crear cada uno de los subdirectorios
 		subdir_list = ['imagenes', 'documentos', 'videos', 'audios', 'notas_voz',
 						'notas_video', 'stickers', 'conversaciones_recopiladas',
-						'animaciones']
+						'animaciones', 'archivo', 'copias_seguridad']
 
 		for subdir in subdir_list:
 			self.__log.info(('Accediendo al directorio "%s"' %
@@ -4781,6 +5325,390 @@ class BotServer:
 		self.__log.debug('Finalizada función "__install_directorio_base" '\
 															'de "BotServer"')
 
+	def __read_fuentes_conceptos(self):
+
+		"""Lee los Conceptos Teóricos de todas las fuentes de conceptos
+		configuradas sin modificar la base de datos. Si alguna de las fuentes
+		no puede leerse o no proporciona ningún concepto, se lanza una
+		excepción, de modo que nunca se reemplazan los conceptos almacenados
+		por un conjunto incompleto
+
+		Devuelve:
+			list de dict con los conceptos leídos
+		"""
+
+		self.__log.debug('Iniciada función "__read_fuentes_conceptos" de '\
+																'"BotServer"')
+
+		conceptos = []
+
+		for fuente in self.__config['fuentes_conceptos']:
+
+			if not fuente:
+				continue
+
+			elif fuente.startswith('http'):
+				#	Cargar de url
+				self.__log.info('Leyendo conceptos teóricos del '\
+												'sitio web: {}'.format(fuente))
+
+				extr = self.__quest_manager.read_from_url(fuente)
+
+				if not extr:
+					raise ValueError('No se ha obtenido ningún concepto '\
+										'teórico del sitio web "%s"' % fuente)
+
+				#	Almacenar los conceptos extraídos en un fichero JSON
+				extr_filename = (self.__config['directorio_base']+
+							'/concepto_web%d.json' %
+							self.__config['fuentes_conceptos'].index(fuente))
+
+				with open(extr_filename, 'w') as f:
+					f.write(json.dumps(extr, indent=2))
+
+				self.__log.info('Se han almacenado los conceptos teóricos'\
+								' de "{}" en el fichero JSON "{}"'.format(
+													fuente, extr_filename))
+
+				conceptos += extr
+
+			else:
+				#	Cargar de fichero
+				self.__log.info(('Leyendo conceptos teóricos del fichero: "%s"'%
+																		fuente))
+				try:
+					extr = self.__quest_manager.read_from_file(fuente)
+				except Exception as e:
+					raise ValueError('Se produjo el siguiente error al tratar'\
+								' de abrir "{}":\n{}'.format(fuente, str(e)))
+
+				if not extr:
+					raise ValueError('No se ha obtenido ningún concepto '\
+										'teórico del fichero "%s"' % fuente)
+
+				conceptos += extr
+
+		self.__log.debug('Finalizada función "__read_fuentes_conceptos" de '\
+																'"BotServer"')
+
+		return conceptos
+
+	def __train_speech_handler(self):
+
+		"""Construye y entrena un nuevo analizador de discurso con la lista de
+		palabras, los nombres y las preguntas y respuestas de texto de los
+		Conceptos Teóricos almacenados, tal y como se han almacenado
+
+		Devuelve:
+			SpeechHandler entrenado
+		"""
+
+		speech_handler = SpeechHandler()
+
+		#	Entrenar el analizador con la lista de palabras
+		#	recogidas y los nombres
+		with open(os.path.dirname(__file__)+'/palabras_validas.txt', 'r') as f:
+			speech_handler.fit(f)
+
+		with open(os.path.dirname(__file__)+'/lista_nombres.txt', 'r') as f:
+			speech_handler.fit(f)
+
+		#	Entrenar el analizador con los conceptos y las respuestas de texto
+		lista_conceptos = self.__bd_interface.listAllConcepts()
+
+		if lista_conceptos:
+			speech_handler.fit(lista_conceptos)
+
+		lista_respuestas = self.__bd_interface.listAllConceptsTextAnswers()
+
+		if lista_respuestas:
+			speech_handler.fit(lista_respuestas)
+
+		return speech_handler
+
+	def __load_conceptos(self):
+
+		"""Lee las fuentes de Conceptos Teóricos y reemplaza los conceptos
+		almacenados por los leídos sin interrumpir la atención de las
+		consultas. Posteriormente, reemplaza el analizador de discurso en uso
+		por uno nuevo entrenado con los conceptos almacenados. Si alguna
+		fuente falla, se mantienen los conceptos y el analizador anteriores
+		"""
+
+		self.__log.debug('Iniciada función "__load_conceptos" de "BotServer"')
+
+		#	Reemplazar los conceptos almacenados
+		conceptos = self.__read_fuentes_conceptos()
+		self.__quest_manager.replaceAllConcepts(conceptos)
+
+		#	Reemplazar el analizador en uso
+		self.__log.info('Entrenando analizador de discurso')
+		self.__speech_handler = self.__train_speech_handler()
+
+		self.__log.debug('Finalizada función "__load_conceptos" de "BotServer"')
+
+	def __actualizar_conceptos_callback(self, bot, job):
+
+		"""Tarea periódica que lanza la recarga de los Conceptos Teóricos en
+		un hilo independiente para no retrasar el resto de tareas programadas
+		"""
+
+		if self.__act_conceptos_lock.locked():
+			self.__log.info('Recarga de Conceptos Teóricos aún en curso, se'\
+																' omite')
+			return
+
+		threading.Thread(target=self.__actualizar_conceptos,
+							name='Actualizar-Conceptos', daemon=True).start()
+
+	def __actualizar_conceptos(self):
+
+		"""Recarga los Conceptos Teóricos desde sus fuentes
+		"""
+
+		if not self.__act_conceptos_lock.acquire(blocking=False):
+			return
+
+		try:
+			self.__log.info('Recargando Conceptos Teóricos')
+			self.__load_conceptos()
+			self.__log.info('Conceptos Teóricos recargados')
+
+		except Exception as e:
+			self.__log.error('Se produjo un error al recargar los Conceptos'\
+						' Teóricos, se mantienen los anteriores:\n{}'.format(
+																		str(e)))
+		finally:
+			self.__act_conceptos_lock.release()
+
+	def __archivar_mensajes_callback(self, bot, job):
+
+		"""Tarea periódica que lanza el archivo de los mensajes antiguos en
+		un hilo independiente para no retrasar el resto de tareas programadas
+		"""
+
+		if self.__archivo_lock.locked():
+			self.__log.info('Archivo de mensajes aún en curso, se omite')
+			return
+
+		threading.Thread(target=self.__archivar_mensajes,
+							name='Archivar-Mensajes', daemon=True).start()
+
+	def __archivar_mensajes(self):
+
+		"""Traslada a los ficheros de archivo los mensajes de los periodos
+		anteriores al horizonte de archivo configurado
+		"""
+
+		if not self.__archivo_lock.acquire(blocking=False):
+			return
+
+		try:
+			fecha_limite = datetime.datetime.now() - datetime.timedelta(
+								days=self.__config['horizonte_archivo_dias'])
+
+			informe = self.__bd_interface.archiveMensajes(fecha_limite)
+
+			if informe:
+				self.__log.info('Archivados %d eventos de los periodos %s' % (
+								sum(periodo['eventos'] for periodo in informe),
+								', '.join(periodo['periodo']
+												for periodo in informe)))
+
+		except Exception as e:
+			self.__log.error('Se produjo un error al archivar los mensajes'\
+										' antiguos:\n{}'.format(str(e)))
+		finally:
+			self.__archivo_lock.release()
+
+	def __depurar_bd_callback(self, bot, job):
+
+		"""Tarea periódica que lanza la depuración de la base de datos en un
+		hilo independiente para no retrasar el resto de tareas programadas
+		"""
+
+		if self.__depuracion_lock.locked():
+			self.__log.info('Depuración de la base de datos aún en curso, se'\
+																	' omite')
+			return
+
+		threading.Thread(target=self.__depurar_bd, name='Depurar-BD',
+													daemon=True).start()
+
+	def __depurar_bd(self):
+
+		"""Elimina los datos anteriores a los periodos de retención
+		configurados y los archivos multimedia que ya no referencia ningún
+		dato, devuelve al sistema de ficheros el espacio liberado por la base
+		de datos y registra el informe de la depuración en el fichero
+		"depuracion_bd.json" del directorio base
+		"""
+
+		if not self.__depuracion_lock.acquire(blocking=False):
+			return
+
+		try:
+			#	No se depura mientras se archivan los mensajes
+			with self.__archivo_lock:
+				ahora = datetime.datetime.now()
+				limites = {clase: ahora - datetime.timedelta(
+													days=self.__config[campo])
+							for clase, campo in
+											BotServer.__CLASES_RETENCION.items()
+							if self.__config[campo] > 0}
+
+				informe = self.__bd_interface.pruneMensajes(limites)
+
+				#	Eliminar los archivos multimedia no referenciados
+				rutas = {os.path.realpath(ruta) for ruta in
+									self.__bd_interface.listRutasArchivos()}
+
+			informe['ficheros_multimedia'] = 0
+			informe['bytes_multimedia_liberados'] = 0
+			limite = time.time() - BotServer.__ANTIGUEDAD_MULTIMEDIA_HUERFANA
+
+			for subdir in BotServer.__SUBDIRS_MULTIMEDIA:
+				directorio = self.__config['directorio_base'] + subdir + '/'
+
+				if not os.path.isdir(directorio):
+					continue
+
+				for entrada in os.scandir(directorio):
+					if not entrada.is_file():
+						continue
+
+					estado = entrada.stat()
+
+					if (estado.st_mtime < limite and
+								os.path.realpath(entrada.path) not in rutas):
+						os.remove(entrada.path)
+						informe['ficheros_multimedia'] += 1
+						informe['bytes_multimedia_liberados'] += estado.st_size
+
+			#	Devolver el espacio liberado al sistema de ficheros
+			compactacion = self.__bd_interface.incrementalVacuum()
+			informe['bytes_bd_liberados'] = compactacion['bytes']
+			informe['duracion'] += compactacion['duracion']
+
+			self.__log.info('Depuración de la base de datos realizada: %d '\
+							'eventos, %d datos y %d archivos multimedia '\
+							'eliminados y %d bytes liberados',
+							informe['eventos'], informe['datos'],
+							informe['ficheros_multimedia'],
+							informe['bytes_bd_liberados'] +
+							informe['bytes_archivo_liberados'] +
+							informe['bytes_multimedia_liberados'],
+							duracion=informe['duracion'])
+
+			#	Registrar el informe de la depuración, uno por línea
+			informe['fecha'] = ahora.isoformat(timespec='seconds')
+
+			with open(self.__config['directorio_base'] + 'depuracion_bd.json',
+												'a') as fichero_informes:
+				fichero_informes.write(json.dumps(informe) + '\n')
+
+		except Exception as e:
+			self.__log.error('Se produjo un error al depurar la base de'\
+								' datos:\n{}'.format(str(e)))
+		finally:
+			self.__depuracion_lock.release()
+
+	def __copia_seguridad_callback(self, bot, job):
+
+		"""Tarea periódica que lanza la copia de seguridad de la base de
+		datos en un hilo independiente para no retrasar el resto de tareas
+		programadas
+		"""
+
+		if self.__copia_lock.locked():
+			self.__log.info('Copia de seguridad aún en curso, se omite')
+			return
+
+		threading.Thread(target=self.__copia_seguridad,
+							name='Copia-Seguridad', daemon=True).start()
+
+	def __copia_seguridad(self):
+
+		"""Realiza una copia de seguridad de la base de datos en el
+		directorio "copias_seguridad/", registra sus métricas y elimina las
+		copias más antiguas que superan el máximo configurado
+		"""
+
+		if not self.__copia_lock.acquire(blocking=False):
+			return
+
+		directorio = self.__config['directorio_base'] + 'copias_seguridad/'
+
+		try:
+			metricas = self.__bd_interface.backup(directorio +
+						datetime.datetime.now().strftime(
+									'cprofessorbot_BD_%Y%m%d_%H%M%S.db'))
+
+			self.__log.info('Copia de seguridad "%s" realizada en %.2f '\
+							'segundos: %d bytes en %d pasos',
+							os.path.basename(metricas['fichero']),
+							metricas['duracion'], metricas['tamano'],
+							metricas['pasos'], duracion=metricas['duracion'],
+							tamano=metricas['tamano'])
+
+			#	Registrar las métricas de la copia, una por línea
+			metricas['fecha'] = datetime.datetime.now().isoformat(
+														timespec='seconds')
+			metricas['fichero'] = os.path.basename(metricas['fichero'])
+
+			with open(directorio + 'metricas.json', 'a') as fichero_metricas:
+				fichero_metricas.write(json.dumps(metricas) + '\n')
+
+			#	Eliminar las copias más antiguas
+			copias = sorted(fichero for fichero in os.listdir(directorio)
+							if BotServer.__PATRON_COPIA.match(fichero))
+
+			for fichero in copias[:-self.__config['max_copias_seguridad']]:
+				os.remove(directorio + fichero)
+				self.__log.info('Eliminada la copia de seguridad antigua "%s"'
+																	% fichero)
+
+		except Exception as e:
+			self.__log.error('Se produjo un error al realizar la copia de'\
+								' seguridad de la base de datos:\n{}'.format(
+																	str(e)))
+		finally:
+			self.__copia_lock.release()
+
+	def __instantanea_callback(self, bot, job):
+
+		"""Tarea periódica que vuelca la base de datos en memoria a su
+		fichero
+		"""
+
+		try:
+			metricas = self.__bd_interface.snapshot()
+
+			self.__log.debug('Base de datos en memoria volcada en %.3f '\
+							'segundos: %d bytes', metricas['duracion'],
+							metricas['tamano'], duracion=metricas['duracion'],
+							tamano=metricas['tamano'])
+
+		except Exception as e:
+			self.__log.error('Se produjo un error al volcar la base de datos'\
+								' en memoria:\n{}'.format(str(e)))
+
+	def __exportar_instrumentacion_callback(self, bot, job):
+
+		"""Tarea periódica que almacena las métricas de la instrumentación
+		de la base de datos en el fichero "instrumentacion_bd.json" del
+		directorio base
+		"""
+
+		try:
+			self.__bd_interface.exportEstadisticasInstrumentacion(
+						self.__config['directorio_base']+'instrumentacion_bd.json')
+
+		except Exception as e:
+			self.__log.error('Se produjo un error al almacenar las métricas de'\
+							' la instrumentación de la base de datos:\n{}'.format(
+																		str(e)))
+
 	def __error_handler(self, bot, update, error):
 		self.__log.error(error)	# Se imprime una entrada de log de error
 
@@ -4819,14 +5747,19 @@ class BotServer:
 		#	Conectar con la base de datos e iniciar la interfaz de acceso
 		self.__bd_interface = BotServerDAO(
 					self.__config['directorio_base']+'cprofessorbot_BD.db',
-					debug=self.__debug_mode)
+					debug=self.__debug_mode,
+					synchronous=self.__config['sincronizacion_bd'],
+					directorio_archivo=(self.__config['directorio_base']+
+																'archivo/'),
+					instrumentacion=self.__config['instrumentacion_bd'],
+					memoria=(self.__config['almacenamiento_bd'].lower() ==
+																'memoria'))
 
 		#	Iniciar el administrador de preguntas
 		self.__quest_manager = QuestionManager(self.__bd_interface,
 											self.__config['directorio_base'])
 
 		self.__log.info('Cargando preguntas y respuestas en la base de datos:')
-		self.__quest_manager.removeAllConcepts()
 
 		if not isinstance(self.__config['fuentes_conceptos'], list):
 			self.__config['fuentes_conceptos'] = [
@@ -4838,67 +5771,20 @@ class BotServer:
 			self.__log.warning('No se ha especificado ningún fichero JSON o '\
 							'direccion URL como fuentes de Conceptos Teóricos')
 
-		for fuente in self.__config['fuentes_conceptos']:
-
-			if not fuente:
-				continue
-
-			elif fuente.startswith('http'):
-				#	Cargar de url
-				self.__log.info('Leyendo conceptos teóricos del '\
-												'sitio web: {}'.format(fuente))
-
-				extr = self.__quest_manager.load_from_url(fuente)
-
-				#	Almacenar los conceptos extraídos en un fichero JSON
-				extr_filename = (self.__config['directorio_base']+
-							'/concepto_web%d.json' %
-							self.__config['fuentes_conceptos'].index(fuente))
-
-				with open(extr_filename, 'w') as f:
-					f.write(json.dumps(extr, indent=2))
-
-				self.__log.info('Se han almacenado los conceptos teóricos'\
-								' de "{}" en el fichero JSON "{}"'.format(
-													fuente, extr_filename))
-
-			else:
-				#	Cargar de fichero
-				self.__log.info(('Leyendo conceptos teóricos del fichero: "%s"'%
-																		fuente))
-				try:
-					self.__quest_manager.load_from_file(fuente)
-				except Exception as e:
-					self.__log.error('Se produjo el siguiente error'\
-						' al tratar de abrir "{}":\n{}'.format(fuente, str(e)))
-					continue
-
-		#	Iniciar el analizador de discurso
-		self.__log.info('Entrenando analizador de discurso')
-		self.__speech_handler = SpeechHandler()
-
-		#	Entrenar el analizador con la lista de palabras
-		#	recogidas y los nombres
-		with open(os.path.dirname(__file__)+'/palabras_validas.txt', 'r') as f:
-			self.__speech_handler.fit(f)
-
-		with open(os.path.dirname(__file__)+'/lista_nombres.txt', 'r') as f:
-			self.__speech_handler.fit(f)
-
-		#	Entrenar el analizador con los conceptos y las respuestas de texto
-		lista_conceptos = self.__bd_interface.listAllConcepts()
-
-		if lista_conceptos:
-			self.__speech_handler.fit(lista_conceptos)
-
-		del lista_conceptos
-
-		lista_respuestas = self.__bd_interface.listAllConceptsTextAnswers()
+		try:
+			self.__load_conceptos()
+		except Exception as e:
+			self.__log.error('No se han podido cargar los Conceptos Teóricos,'\
+							' se mantienen los almacenados:\n%s', str(e))
 
-		if lista_respuestas:
-			self.__speech_handler.fit(lista_respuestas)
+			self.__log.info('Entrenando analizador de discurso')
+			self.__speech_handler = self.__train_speech_handler()
 
-		del lista_respuestas
+		#	Iniciar el hilo de registro de mensajes
+		self.__hilo_registro = threading.Thread(
+										target=self.__registrar_mensajes,
+										name='Registro-Mensajes', daemon=True)
+		self.__hilo_registro.start()
 
 		#	Inicializar la interfaz del bot
 		self.__log.info('Iniciando Actualizadores, Despachadores y Manejadores'\
@@ -4910,23 +5796,117 @@ class BotServer:
 		except:
 			raise
 
+		#	Iniciar los hilos de descarga de los archivos multimedia
+		for i in range(BotServer.__HILOS_DESCARGA):
+			hilo = threading.Thread(target=self.__descargar_archivos,
+									name='Descarga-Multimedia-%d' % i,
+									daemon=True)
+			hilo.start()
+			self.__hilos_descarga.append(hilo)
+
+		#	Programar la reanudación diaria de las descargas incompletas,
+		#	incluidas las interrumpidas en la anterior ejecución
+		self.__bot_updater.job_queue.run_repeating(
+				callback=self.__reanudar_descargas_callback,
+				interval=BotServer.__INTERVALO_REANUDAR_DESCARGAS,
+				first=0,
+				name='Reanudar-Descargas')
+
+		#	Programar la recarga periódica de los Conceptos Teóricos
+		if self.__config['intervalo_actualizacion_conceptos'] > 0:
+			self.__bot_updater.job_queue.run_repeating(
+					callback=self.__actualizar_conceptos_callback,
+					interval=self.__config['intervalo_actualizacion_conceptos'],
+					first=self.__config['intervalo_actualizacion_conceptos'],
+					name='Actualizar-Conceptos')
+
+		#	Programar el archivo diario de los mensajes antiguos
+		if self.__config['horizonte_archivo_dias'] > 0:
+			self.__bot_updater.job_queue.run_repeating(
+					callback=self.__archivar_mensajes_callback,
+					interval=BotServer.__INTERVALO_ARCHIVO,
+					first=0,
+					name='Archivar-Mensajes')
+
+		#	Programar la depuración diaria de la base de datos
+		if any(self.__config[campo] > 0
+							for campo in BotServer.__CLASES_RETENCION.values()):
+			self.__bot_updater.job_queue.run_repeating(
+					callback=self.__depurar_bd_callback,
+					interval=BotServer.__INTERVALO_DEPURACION,
+					first=BotServer.__RETRASO_DEPURACION,
+					name='Depurar-BD')
+
+		#	Programar las copias de seguridad periódicas de la base de datos
+		if self.__config['intervalo_copia_seguridad_horas'] > 0:
+			self.__bot_updater.job_queue.run_repeating(
+					callback=self.__copia_seguridad_callback,
+					interval=self.__config['intervalo_copia_seguridad_horas']*
+																	60*60,
+					first=self.__config['intervalo_copia_seguridad_horas']*
+																	60*60,
+					name='Copia-Seguridad')
+
+		#	Programar los volcados periódicos de la base de datos en memoria
+		if self.__config['almacenamiento_bd'].lower() == 'memoria':
+			self.__bot_updater.job_queue.run_repeating(
+					callback=self.__instantanea_callback,
+					interval=self.__config['intervalo_instantanea_minutos']*60,
+					first=self.__config['intervalo_instantanea_minutos']*60,
+					name='Instantanea-BD')
+
+		#	Programar el almacenamiento periódico de las métricas de la
+		#	instrumentación de la base de datos
+		if self.__config['instrumentacion_bd']:
+			self.__bot_updater.job_queue.run_repeating(
+					callback=self.__exportar_instrumentacion_callback,
+					interval=BotServer.__INTERVALO_INSTRUMENTACION,
+					first=BotServer.__INTERVALO_INSTRUMENTACION,
+					name='Exportar-Instrumentacion')
+
 		# Arrancar el funcionamiento de la interfaz
 		self.__bot_updater.start_polling()
 
 		self.__log.info('Sistema iniciado')
 
 		#	A partir de ahora se escribe en el fichero de log
-		self.__log.propagate = False
-		self.__log.addHandler( logging.FileHandler(
+		self.__log.logger.propagate = False
+		self.__log.logger.addHandler( logging.FileHandler(
 					self.__config['directorio_base']+'server_log.txt', 'a'))
-		self.__log.handlers[0].setFormatter(
-							logging.Formatter(
+		self.__log.logger.handlers[0].setFormatter(
+							FormateadorTexto(
 								fmt='%(levelname)s - %(asctime)s - %(message)s',
 								datefmt='%d-%b-%y %H:%M:%S'))
 
+		#	Escribir además las entradas en formato JSON, si se desea
+		if self.__config['log_json']:
+			self.__log.logger.addHandler( logging.FileHandler(
+					self.__config['directorio_base']+'server_log.json', 'a'))
+			self.__log.logger.handlers[-1].setFormatter(FormateadorJSON())
+
 		# Fijar la ejecución del sistema
 		self.__bot_updater.idle()
 
+		#	Registrar los mensajes pendientes de la cola de registro
+		self.__log.info('Registrando los mensajes pendientes (%d)' %
+												self.__cola_registro.qsize())
+		self.__cola_registro.put(None)
+		self.__hilo_registro.join()
+
+		#	Completar las descargas pendientes de los archivos multimedia
+		self.__log.info('Descargando los archivos multimedia pendientes (%d)' %
+												self.__cola_descarga.qsize())
+
+		for hilo in self.__hilos_descarga:
+			self.__cola_descarga.put(None)
+
+		for hilo in self.__hilos_descarga:
+			hilo.join()
+
+		#	Confirmar las escrituras pendientes y cerrar la base de datos
+		self.__log.info('Cerrando la base de datos')
+		self.__bd_interface.close()
+
 
 # https://realpython.com/documenting-python-code/
 # pip3 install python-telegram-bot --upgrade
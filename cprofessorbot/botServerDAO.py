@@ -6,14 +6,28 @@
 ################################################################################
 
 #	Módulos importados
-import logging
 import sqlite3
+import re
 import datetime
 import os.path
-import telegram
-from threading import Lock
+import time
+import queue
+import json
+import heapq
+import itertools
+import inspect
+from threading import Lock, Thread, local, current_thread
+from concurrent.futures import Future
+from contextlib import contextmanager
 from collections import OrderedDict
+from urllib.request import pathname2url
 from cprofessorbot.nlu import compare_words
+from cprofessorbot.registros import (RegistroUsuario, RegistroEstadoForo,
+										RegistroMensaje, RegistroDato,
+										RegistroCoincidencia)
+from cprofessorbot.instrumentacion import (Instrumentacion,
+											ConexionInstrumentada)
+from cprofessorbot.utils import Bitacora, Diferido
 
 #	Definición e implementación de la clase BotServerDAO
 class BotServerDAO:
@@ -29,6 +43,35 @@ class BotServerDAO:
 	debug: bool
 		Iniciar el modo de depuración o no
 
+	synchronous: str
+		Nivel de sincronización con disco de la base de datos (PRAGMA
+		synchronous): 'OFF', 'NORMAL', 'FULL' o 'EXTRA'
+
+	group_commit_ms: int
+		Tiempo máximo en milisegundos que puede permanecer abierta una
+		transacción agrupando escrituras
+
+	group_commit_ops: int
+		Número máximo de operaciones de escritura agrupadas en una misma
+		transacción
+
+	directorio_archivo: str
+		Directorio de los ficheros de archivo de mensajes
+
+	Nota
+	------
+	La base de datos se abre en modo WAL. Todas las escrituras son ejecutadas
+	por un único hilo escritor sobre una única conexión de escritura, que
+	agrupa en una misma transacción las operaciones pendientes en la cola
+	(group commit). Las funciones de escritura esperan a que su transacción
+	haya sido confirmada antes de devolver su resultado. Las consultas de
+	lectura se realizan sobre una conexión propia de cada hilo, de forma que
+	las lecturas no esperan a las escrituras en curso ni viceversa.
+
+	Los mensajes y eventos de los periodos más antiguos pueden trasladarse
+	mediante "archiveMensajes" a ficheros de archivo, uno por periodo, que
+	sólo se adjuntan (ATTACH) a las conexiones de lectura cuando una
+	consulta abarca alguno de sus periodos.
 	"""
 
 	### Definición de constantes ###
@@ -65,13 +108,418 @@ class BotServerDAO:
 								}
 				}
 
+	#	Nombre de cada tipo de dato archivo a partir de su valor numérico
+	__NOMBRES_TIPO_DATOARCHIVO = {valor: tipo for tipo, valor in
+										__BD_TIPOS['TIPO_DATOARCHIVO'].items()}
+
+	#	Niveles de sincronización admitidos
+	__NIVELES_SYNCHRONOUS = ('OFF', 'NORMAL', 'FULL', 'EXTRA')
+
+	#	Cálculo de las respuestas precalculadas de los conceptos devueltos
+	#	por la expresión o subconsulta "conceptos". Cada respuesta es un
+	#	array JSON con un array [id, tipo_dato, contenido] por cada dato del
+	#	concepto, sin orden definido
+	__INSERTAR_RESPUESTAS = '''INSERT INTO RespuestaConcepto(id_concepto, respuesta)
+					SELECT id_concepto,
+						json_group_array(json_array(id, tipo_dato, contenido))
+					FROM
+						(SELECT Dato_Concepto.id_concepto AS id_concepto,
+							DatoTexto.id AS id, 'texto' AS tipo_dato,
+							texto AS contenido
+						FROM Dato_Concepto, DatoTexto
+						WHERE Dato_Concepto.id_concepto IN (%(conceptos)s) AND
+							DatoTexto.id=Dato_Concepto.id_dato
+						UNION ALL
+						SELECT Dato_Concepto.id_concepto AS id_concepto,
+							DatoArchivo.id AS id, DatoArchivo.tipo AS tipo_dato,
+							ruta_archivo AS contenido
+						FROM Dato_Concepto, DatoArchivo
+						WHERE Dato_Concepto.id_concepto IN (%(conceptos)s) AND
+							DatoArchivo.id=Dato_Concepto.id_dato)
+					GROUP BY id_concepto;'''
+
+	#	Disparador "nombre" que recalcula tras el evento "evento" las
+	#	respuestas precalculadas de los conceptos devueltos por "conceptos"
+	__DISPARADOR_RESPUESTAS = '''CREATE TRIGGER %(nombre)s
+				AFTER %(evento)s
+			BEGIN
+				DELETE FROM RespuestaConcepto
+					WHERE id_concepto IN (%(conceptos)s);
+				''' + __INSERTAR_RESPUESTAS + '''
+			END;'''
+
+	#	Copia de la fecha de cada evento en las tablas de los mensajes y
+	#	eventos de los foros, con índices (foro, fecha), de forma que las
+	#	consultas de un foro se resuelven sobre sus propias filas sin
+	#	recorrer los eventos del resto de foros. El identificador, clave
+	#	primaria, completa el orden (fecha, id) de cada índice. Se aplica a
+	#	la base de datos principal y a los ficheros de archivo
+	__MIGRACION_FECHA_FORO = (
+		'ALTER TABLE MensajeRecibidoPublico ADD COLUMN fecha DATE;',
+		'ALTER TABLE MensajeEnviadoPublico ADD COLUMN fecha DATE;',
+		'ALTER TABLE EventoChatGrupal ADD COLUMN fecha DATE;',
+		'''UPDATE MensajeRecibidoPublico
+				SET fecha=(SELECT Evento.fecha FROM Evento
+							WHERE Evento.id=MensajeRecibidoPublico.id);''',
+		'''UPDATE MensajeEnviadoPublico
+				SET fecha=(SELECT Evento.fecha FROM Evento
+							WHERE Evento.id=MensajeEnviadoPublico.id);''',
+		'''UPDATE EventoChatGrupal
+				SET fecha=(SELECT Evento.fecha FROM Evento
+							WHERE Evento.id=EventoChatGrupal.id);''',
+		'DROP INDEX IF EXISTS MensajeRecibidoPublico_id_chat_foro;',
+		'DROP INDEX IF EXISTS MensajeEnviadoPublico_id_chat_foro_destino;',
+		'DROP INDEX IF EXISTS EventoChatGrupal_id_chat_foro;',
+		'''CREATE INDEX MensajeRecibidoPublico_id_chat_foro_fecha
+				ON MensajeRecibidoPublico(id_chat_foro, fecha);''',
+		'''CREATE INDEX MensajeEnviadoPublico_id_chat_foro_destino_fecha
+				ON MensajeEnviadoPublico(id_chat_foro_destino, fecha);''',
+		'''CREATE INDEX EventoChatGrupal_id_chat_foro_fecha
+				ON EventoChatGrupal(id_chat_foro, fecha);'''
+	)
+
+	#	Migraciones del esquema de la base de datos. La migración i-ésima
+	#	lleva la base de datos de la versión i-1 a la versión i. La versión
+	#	de la base de datos se almacena en "PRAGMA user_version", siendo 0
+	#	la versión del esquema creado por CProfessorBot_BD.sql
+	__MIGRACIONES = (
+
+		#	1: Índices secundarios para las consultas de recopilación y
+		#	recuento de mensajes de un foro y para la búsqueda de los
+		#	mensajes respondidos y editados en addMensaje
+		(
+		'''CREATE INDEX IF NOT EXISTS Evento_fecha
+				ON Evento(fecha);''',
+		'''CREATE INDEX IF NOT EXISTS Mensaje_id_mensaje_chat
+				ON Mensaje(id_mensaje_chat, existente);''',
+		'''CREATE INDEX IF NOT EXISTS MensajeRecibidoPublico_id_chat_foro
+				ON MensajeRecibidoPublico(id_chat_foro);''',
+		'''CREATE INDEX IF NOT EXISTS MensajeEnviadoPublico_id_chat_foro_destino
+				ON MensajeEnviadoPublico(id_chat_foro_destino);''',
+		'''CREATE INDEX IF NOT EXISTS MensajeRecibidoPrivado_id_usuario_emisor
+				ON MensajeRecibidoPrivado(id_usuario_emisor);''',
+		'''CREATE INDEX IF NOT EXISTS
+				MensajeEnviadoPrivado_id_usuario_destinatario
+				ON MensajeEnviadoPrivado(id_usuario_destinatario);''',
+		'''CREATE INDEX IF NOT EXISTS Dato_Mensaje_id_mensaje
+				ON Dato_Mensaje(id_mensaje, id_dato);''',
+		'''CREATE INDEX IF NOT EXISTS EventoChatGrupal_id_chat_foro
+				ON EventoChatGrupal(id_chat_foro);''',
+		'''CREATE INDEX IF NOT EXISTS Dato_Concepto_id_concepto
+				ON Dato_Concepto(id_concepto, id_dato);'''
+		),
+
+		#	2: Corrección de la declaración de la clave primaria de Usuario
+		#	("PRIMARY_KEY"), reconstruyendo la tabla
+		(
+		'''CREATE TABLE Usuario_nuevo (
+				id INTEGER PRIMARY KEY NOT NULL UNIQUE,
+				nombre TEXT NOT NULL,
+				apellidos TEXT,
+				username TEXT,
+				id_chat INTEGER NOT NULL UNIQUE,
+				fecha_registro DATE NOT NULL,
+				tipo TIPO_USUARIO NOT NULL CHECK (tipo IN (0,1)),
+				valido BOOLEAN NOT NULL DEFAULT 1
+			);''',
+		'''INSERT INTO Usuario_nuevo(id, nombre, apellidos, username, id_chat,
+								fecha_registro, tipo, valido)
+				SELECT id, nombre, apellidos, username, id_chat,
+						fecha_registro, tipo, valido
+				FROM Usuario;''',
+		'DROP TABLE Usuario;',
+		'ALTER TABLE Usuario_nuevo RENAME TO Usuario;'
+		),
+
+		#	3: Tabla de búsqueda de mensajes por chat e identificador de
+		#	mensaje en el chat, con el mensaje original y su última versión
+		(
+		'''CREATE TABLE Mensaje_Chat (
+				id_chat INTEGER NOT NULL,
+				id_mensaje_chat INTEGER NOT NULL,
+				id_mensaje_original INTEGER NOT NULL,
+				id_mensaje_actual INTEGER NOT NULL,
+
+				PRIMARY KEY(id_chat, id_mensaje_chat),
+				FOREIGN KEY(id_mensaje_original) REFERENCES Mensaje(id)
+					ON DELETE RESTRICT ON UPDATE RESTRICT,
+				FOREIGN KEY(id_mensaje_actual) REFERENCES Mensaje(id)
+					ON DELETE RESTRICT ON UPDATE RESTRICT
+			) WITHOUT ROWID;''',
+		'''INSERT INTO Mensaje_Chat
+				SELECT id_chat, id_mensaje_chat, MIN(id), MAX(id)
+				FROM
+				(SELECT Mensaje.id, id_usuario_destinatario AS id_chat,
+					id_mensaje_chat
+				FROM MensajeEnviadoPrivado, Mensaje
+				WHERE Mensaje.id=MensajeEnviadoPrivado.id
+				UNION ALL
+				SELECT Mensaje.id, id_chat_foro_destino AS id_chat,
+					id_mensaje_chat
+				FROM MensajeEnviadoPublico, Mensaje
+				WHERE Mensaje.id=MensajeEnviadoPublico.id
+				UNION ALL
+				SELECT Mensaje.id, id_usuario_emisor AS id_chat,
+					id_mensaje_chat
+				FROM MensajeRecibidoPrivado, Mensaje
+				WHERE Mensaje.id=MensajeRecibidoPrivado.id
+				UNION ALL
+				SELECT Mensaje.id, id_chat_foro AS id_chat,
+					id_mensaje_chat
+				FROM MensajeRecibidoPublico, Mensaje
+				WHERE Mensaje.id=MensajeRecibidoPublico.id)
+				GROUP BY id_chat, id_mensaje_chat;'''
+		),
+
+		#	4: Recuento de los mensajes de cada foro docente por día (fecha
+		#	local en formato AAAA-MM-DD)
+		(
+		'''CREATE TABLE ResumenMensajesForo (
+				id_chat_foro INTEGER NOT NULL,
+				dia TEXT NOT NULL,
+				recibidos INTEGER NOT NULL DEFAULT 0,
+				enviados INTEGER NOT NULL DEFAULT 0,
+				academicos INTEGER NOT NULL DEFAULT 0,
+				no_academicos INTEGER NOT NULL DEFAULT 0,
+
+				PRIMARY KEY(id_chat_foro, dia),
+				FOREIGN KEY(id_chat_foro) REFERENCES Foro(id_chat)
+					ON DELETE RESTRICT ON UPDATE RESTRICT
+			) WITHOUT ROWID;''',
+		'''INSERT INTO ResumenMensajesForo
+				SELECT id_chat_foro, dia, SUM(recibido), SUM(1-recibido),
+					SUM(recibido AND academico IS 1),
+					SUM(recibido AND academico IS NOT 1)
+				FROM
+				(SELECT id_chat_foro,
+					DATE(fecha, 'unixepoch', 'localtime') AS dia,
+					1 AS recibido, academico
+				FROM MensajeRecibidoPublico, Evento
+				WHERE Evento.id=MensajeRecibidoPublico.id
+				UNION ALL
+				SELECT id_chat_foro_destino AS id_chat_foro,
+					DATE(fecha, 'unixepoch', 'localtime') AS dia,
+					0 AS recibido, NULL AS academico
+				FROM MensajeEnviadoPublico, Evento
+				WHERE Evento.id=MensajeEnviadoPublico.id)
+				GROUP BY id_chat_foro, dia;'''
+		),
+
+		#	5: Catálogo de los periodos cuyos mensajes y eventos han sido
+		#	trasladados a un fichero de archivo
+		(
+		'''CREATE TABLE ArchivoMensajes (
+				periodo TEXT PRIMARY KEY NOT NULL,
+				fichero TEXT NOT NULL,
+				fecha_inicio DATE NOT NULL,
+				fecha_fin DATE NOT NULL,
+				n_eventos INTEGER NOT NULL DEFAULT 0,
+				n_datos INTEGER NOT NULL DEFAULT 0,
+				fecha_archivo DATE NOT NULL
+			);''',
+		),
+
+		#	6: Índice de texto completo de los textos de los mensajes,
+		#	mantenido por disparadores al vincular un texto a un mensaje y al
+		#	modificar o eliminar el texto o su vínculo
+		(
+		'''CREATE VIRTUAL TABLE TextoMensaje USING fts5(texto,
+				tokenize='unicode61 remove_diacritics 2');''',
+		'''CREATE TRIGGER Dato_Mensaje_insert_TextoMensaje
+				AFTER INSERT ON Dato_Mensaje
+			BEGIN
+				INSERT INTO TextoMensaje(rowid, texto)
+					SELECT id, texto FROM DatoTexto WHERE id=new.id_dato;
+			END;''',
+		'''CREATE TRIGGER Dato_Mensaje_delete_TextoMensaje
+				AFTER DELETE ON Dato_Mensaje
+			BEGIN
+				DELETE FROM TextoMensaje WHERE rowid=old.id_dato;
+			END;''',
+		'''CREATE TRIGGER DatoTexto_update_TextoMensaje
+				AFTER UPDATE OF texto ON DatoTexto
+			BEGIN
+				UPDATE TextoMensaje SET texto=new.texto WHERE rowid=new.id;
+			END;''',
+		'''CREATE TRIGGER DatoTexto_delete_TextoMensaje
+				AFTER DELETE ON DatoTexto
+			BEGIN
+				DELETE FROM TextoMensaje WHERE rowid=old.id;
+			END;''',
+		'''INSERT INTO TextoMensaje(rowid, texto)
+				SELECT DatoTexto.id, DatoTexto.texto
+				FROM Dato_Mensaje, DatoTexto
+				WHERE DatoTexto.id=Dato_Mensaje.id_dato;'''
+		),
+
+		#	7: Respuestas precalculadas de cada concepto, mantenidas por
+		#	disparadores al vincular o desvincular un dato de un concepto y
+		#	al modificar o eliminar el dato
+		(
+		'''CREATE TABLE RespuestaConcepto (
+				id_concepto INTEGER PRIMARY KEY NOT NULL,
+				respuesta TEXT NOT NULL,
+
+				FOREIGN KEY(id_concepto) REFERENCES Concepto(id)
+					ON DELETE CASCADE ON UPDATE RESTRICT
+			);''',
+		__DISPARADOR_RESPUESTAS % {
+				'nombre': 'Dato_Concepto_insert_RespuestaConcepto',
+				'evento': 'INSERT ON Dato_Concepto',
+				'conceptos': 'new.id_concepto'},
+		__DISPARADOR_RESPUESTAS % {
+				'nombre': 'Dato_Concepto_delete_RespuestaConcepto',
+				'evento': 'DELETE ON Dato_Concepto',
+				'conceptos': 'old.id_concepto'},
+		__DISPARADOR_RESPUESTAS % {
+				'nombre': 'DatoTexto_update_RespuestaConcepto',
+				'evento': 'UPDATE OF texto ON DatoTexto',
+				'conceptos': '''SELECT id_concepto FROM Dato_Concepto
+								WHERE id_dato=new.id'''},
+		__DISPARADOR_RESPUESTAS % {
+				'nombre': 'DatoTexto_delete_RespuestaConcepto',
+				'evento': 'DELETE ON DatoTexto',
+				'conceptos': '''SELECT id_concepto FROM Dato_Concepto
+								WHERE id_dato=old.id'''},
+		__DISPARADOR_RESPUESTAS % {
+				'nombre': 'DatoArchivo_update_RespuestaConcepto',
+				'evento': 'UPDATE OF tipo, ruta_archivo ON DatoArchivo',
+				'conceptos': '''SELECT id_concepto FROM Dato_Concepto
+								WHERE id_dato=new.id'''},
+		__DISPARADOR_RESPUESTAS % {
+				'nombre': 'DatoArchivo_delete_RespuestaConcepto',
+				'evento': 'DELETE ON DatoArchivo',
+				'conceptos': '''SELECT id_concepto FROM Dato_Concepto
+								WHERE id_dato=old.id'''},
+		__INSERTAR_RESPUESTAS % {'conceptos': 'SELECT id FROM Concepto'}
+		),
+
+		#	8: Las respuestas precalculadas dejan de recalcularse al vincular
+		#	o desvincular cada dato de un concepto, lo que reconstruía la
+		#	respuesta completa del concepto por cada uno de sus datos. Las
+		#	funciones que vinculan datos la recalculan una vez insertados
+		#	todos los datos (ver __rebuild_respuestas) y las que eliminan
+		#	conceptos eliminan directamente su respuesta
+		(
+		'DROP TRIGGER IF EXISTS Dato_Concepto_insert_RespuestaConcepto;',
+		'DROP TRIGGER IF EXISTS Dato_Concepto_delete_RespuestaConcepto;'
+		),
+
+		#	9: Fecha de los mensajes y eventos de los foros en sus propias
+		#	tablas (ver __MIGRACION_FECHA_FORO)
+		__MIGRACION_FECHA_FORO
+	)
+
+	#	Migraciones del esquema de los ficheros de archivo, creados con el
+	#	esquema de CProfessorBot_BD.sql, con el mismo criterio que las de la
+	#	base de datos principal. Las tablas archivadas deben de mantener
+	#	las mismas columnas que en la base de datos principal, ya que sus
+	#	filas se copian completas
+	__MIGRACIONES_ARCHIVO = (
+		__MIGRACIONES[0],
+		__MIGRACION_FECHA_FORO
+	)
+
+	#	Número de mensajes recientes cuya ubicación en la base de datos se
+	#	mantiene en memoria
+	__TAM_CACHE_MENSAJES = 4096
+
+	#	Número máximo de entradas de cada una de las cachés de entidades:
+	#	usuarios, foros, estado de cada usuario en cada foro y usuarios de
+	#	cada foro
+	__TAM_CACHE_ENTIDADES = {
+								'usuario': 4096,
+								'foro': 512,
+								'usuario_foro': 16384,
+								'usuarios_foro': 512
+							}
+
+	#	Número de meses de cada periodo de archivo. Los periodos comienzan
+	#	en enero y en julio
+	__MESES_PERIODO_ARCHIVO = 6
+
+	#	Número máximo de ficheros de archivo adjuntos a cada conexión de
+	#	lectura
+	__MAX_ARCHIVOS_ADJUNTOS = 4
+
+	#	Sistema de ficheros virtual de SQLite con el que se adjuntan los
+	#	ficheros de archivo a las conexiones de la base de datos en memoria.
+	#	Sin indicarlo, se adjuntarían con el de la base de datos en memoria
+	#	(memdb) como bases de datos vacías
+	__VFS_DISCO = 'win32' if os.name == 'nt' else 'unix'
+
+	#	Mayor identificador de evento posible, usado como clave final de
+	#	los recorridos por clave (fecha, id)
+	__MAX_ID = 2**63-1
+
+	#	Tablas cuyas filas se trasladan a los ficheros de archivo junto con
+	#	la columna que las relaciona con el evento archivado. Evento se
+	#	elimina en último lugar ya que el resto se seleccionan a partir de
+	#	esta
+	__TABLAS_ARCHIVO_EVENTO = (
+								('EventoChatGrupal', 'id'),
+								('Mensaje', 'id'),
+								('Mensaje_Mensaje_Respuesta',
+													'id_mensaje_respuesta'),
+								('Mensaje_Mensaje_Editado', 'id_mensaje_nuevo'),
+								('MensajeEnviadoPrivado', 'id'),
+								('MensajeEnviadoPublico', 'id'),
+								('MensajeRecibidoPrivado', 'id'),
+								('MensajeRecibidoPublico', 'id'),
+								('PreguntaEfectuadaChatPrivado',
+													'id_mensaje_privado'),
+								('PreguntaEfectuadaChatGrupal',
+													'id_mensaje_grupal'),
+								('Dato_Mensaje', 'id_mensaje'),
+								('Evento', 'id')
+							)
+
+	#	Tablas de los datos de los mensajes trasladadas a los ficheros de
+	#	archivo. Deben de eliminarse antes que Dato_Mensaje
+	__TABLAS_ARCHIVO_DATO = ('DatoTexto', 'DatoArchivo', 'DatoArchivoSticker',
+							'DatoContacto', 'DatoLocalizacion', 'Dato')
+
+	#	Tablas que identifican los eventos de cada clase de mensajes sujeta
+	#	a un periodo de retención
+	__TABLAS_CLASE_EVENTO = {
+								'privados': ('MensajeRecibidoPrivado',
+											'MensajeEnviadoPrivado'),
+								'foros': ('MensajeRecibidoPublico',
+											'MensajeEnviadoPublico',
+											'EventoChatGrupal')
+							}
+
+	#	Número de eventos eliminados en cada transacción de la depuración
+	#	de los mensajes antiguos
+	__TAM_LOTE_DEPURACION = 500
+
+	#	Número de páginas liberadas en cada paso de la compactación
+	#	incremental
+	__PAGINAS_PASO_COMPACTACION = 1024
+
+	#	Número de páginas copiadas en cada paso de una copia de seguridad y
+	#	segundos de espera entre dos pasos consecutivos
+	__PAGINAS_PASO_COPIA = 256
+	__PAUSA_PASO_COPIA = 0.01
+
+	#	Funciones públicas que no se instrumentan: las que no acceden a la
+	#	base de datos o devuelven un gestor de contexto
+	__FUNCIONES_NO_INSTRUMENTADAS = ('asynchronous', 'close',
+									'getEstadisticasCache',
+									'getEstadisticasInstrumentacion',
+									'exportEstadisticasInstrumentacion',
+									'resetEstadisticasInstrumentacion')
+
 
 	def __install_database(filename_output: str,
-				src_code_db=os.path.dirname(__file__)+'/CProfessorBot_BD.sql'):
+				src_code_db=os.path.dirname(__file__)+'/CProfessorBot_BD.sql',
+				uri: bool=False):
 
 		#	Se crea una conexión a la base de datos a crear y sobre
-		#	la misma se ejecuta el script de creación del esquema
-		con = sqlite3.connect(filename_output)
+		#	la misma se ejecuta el script de creación del esquema. La
+		#	compactación incremental debe activarse antes de crear las tablas
+		con = sqlite3.connect(filename_output, uri=uri)
+		con.execute('PRAGMA auto_vacuum = INCREMENTAL;')
 
 		#	El script de creación se toma del fichero
 		with open(src_code_db, 'r') as f:
@@ -80,7 +528,10 @@ class BotServerDAO:
 		con.commit()
 		con.close()
 
-	def __init__(self, bd_file: str, debug: bool=False):
+	def __init__(self, bd_file: str, debug: bool=False,
+					synchronous: str='NORMAL', group_commit_ms: int=10,
+					group_commit_ops: int=100, directorio_archivo: str=None,
+					instrumentacion: bool=False, memoria: bool=False):
 
 		"""
 		Parámetros:
@@ -92,16 +543,125 @@ class BotServerDAO:
 
 		debug: bool
 			Iniciar el modo de depuración o no
+
+		synchronous: str
+			Nivel de sincronización con disco. Por defecto 'NORMAL', que en
+			modo WAL garantiza la integridad de la base de datos aunque las
+			últimas transacciones pueden perderse ante un fallo del sistema
+
+		group_commit_ms: int
+			Tiempo máximo en milisegundos durante el que se agrupan
+			escrituras en una misma transacción. Por defecto 10
+
+		group_commit_ops: int
+			Número máximo de escrituras agrupadas en una misma transacción.
+			Por defecto 100
+
+		directorio_archivo: str
+			Directorio en el que se ubican los ficheros de archivo con los
+			mensajes de los periodos archivados. Por defecto, el directorio
+			"archivo/" junto a la base de datos
+
+		instrumentacion: bool
+			Registrar o no el número de llamadas, las filas devueltas y la
+			latencia de cada función pública y de cada sentencia SQL,
+			consultables mediante getEstadisticasInstrumentacion. Desactivada
+			por defecto, en cuyo caso no supone ningún coste
+
+		memoria: bool
+			Mantener o no la base de datos en memoria en lugar de en disco.
+			Al iniciarse, la base de datos en memoria se restaura a partir
+			del fichero "bd_file", si existe, y se vuelca de nuevo en este
+			fichero mediante la función snapshot y al cerrarse. Las
+			confirmaciones no acceden a disco, pero ante un fallo del sistema
+			se pierden todas las escrituras posteriores a la última
+			instantánea. Además, las lecturas esperan a que se confirme la
+			transacción en curso del hilo escritor y las escrituras esperan
+			mientras se realiza cada instantánea. Por defecto False
 		"""
 
+		if (not isinstance(synchronous, str) or
+					synchronous.upper() not in BotServerDAO.__NIVELES_SYNCHRONOUS):
+			raise ValueError('"synchronous" debe de ser uno de los siguientes'\
+						' valores: %s' % str(BotServerDAO.__NIVELES_SYNCHRONOUS))
+
+		if not isinstance(group_commit_ms, int) or group_commit_ms < 0:
+			raise ValueError('"group_commit_ms" debe de ser int no negativo')
+
+		if not isinstance(group_commit_ops, int) or group_commit_ops < 1:
+			raise ValueError('"group_commit_ops" debe de ser int mayor que 0')
+
 		self.__bd_file = bd_file
-		self.__con_bd = None
+		self.__memoria = memoria
+		self.__debug = debug
+		self.__synchronous = synchronous.upper()
+		self.__con_bd = None	#	Conexión de escritura
+		self.__group_commit_ms = group_commit_ms
+		self.__group_commit_ops = group_commit_ops
+
+		if directorio_archivo is None:
+			directorio_archivo = (os.path.dirname(os.path.abspath(bd_file))+
+																'/archivo/')
+		elif not directorio_archivo.endswith('/'):
+			directorio_archivo += '/'
+
+		self.__directorio_archivo = directorio_archivo
+
+		#	Registro de métricas de las funciones y sentencias, si se activa
+		self.__instrumentacion = Instrumentacion() if instrumentacion else None
+
+		#	Base de datos a la que se conectan todas las conexiones: el
+		#	fichero o una base de datos en memoria compartida por todas las
+		#	conexiones de esta instancia. Sin modo WAL, las lecturas esperan
+		#	a que el hilo escritor confirme su transacción en curso
+		if memoria:
+			self.__origen = 'file:/cprofessorbot_memoria_%d?vfs=memdb' % id(self)
+		else:
+			self.__origen = bd_file
+
+		#	Cola de operaciones de escritura e hilo escritor
+		self.__cola_escritura = queue.Queue()
+		self.__hilo_escritor = None
+
+		#	Hilos que han activado el modo asíncrono
+		self.__modo_asincrono = local()
+
+		#	Caché LRU de los mensajes más recientes: (chat, id_mensaje_chat)
+		#	- (id_mensaje_original, id_mensaje_actual). Sólo es accedida
+		#	desde el hilo escritor
+		self.__cache_mensajes = OrderedDict()
+
+		#	Cachés LRU de usuarios, foros y estado de los usuarios en los
+		#	foros, accedidas por las funciones de lectura desde cualquier
+		#	hilo. Las funciones de escritura registran las entradas que
+		#	modifican, que son invalidadas al confirmar su transacción
+		self.__cache_entidades = {cache: OrderedDict() for cache in
+										BotServerDAO.__TAM_CACHE_ENTIDADES}
+		self.__estadisticas_cache = {cache: {'aciertos': 0, 'fallos': 0,
+											'invalidaciones': 0}
+								for cache in BotServerDAO.__TAM_CACHE_ENTIDADES}
+		self.__generacion_cache = 0
+		self.__cache_entidades_mutex = Lock()
+
+		#	Invalidaciones pendientes de la transacción en curso. Sólo es
+		#	accedida desde el hilo escritor
+		self.__invalidaciones = []
+
+		#	Invalidaciones pendientes de todas las entradas de un foro en las
+		#	cachés cuya clave es el par (id_chat, id_usuario)
+		self.__invalidaciones_foro = []
+
+		#	Conexiones de lectura de cada hilo y lista de pares hilo -
+		#	conexión de lectura abiertas
+		self.__con_lectura = local()
+		self.__con_lectura_list = []
+		self.__con_lectura_mutex = Lock()
 
 		#	Configurar el logging del sistema
-		self.__log = logging.getLogger('cprofessorbot_log')
+		self.__log = Bitacora()
 
 		#	Comprobar que la base de datos existe
-		if os.path.isfile(bd_file) == False:
+		if not memoria and os.path.isfile(bd_file) == False:
 			BotServerDAO.__install_database(filename_output=bd_file)
 
 		#	Registrar adaptadores de objetos Python a objetos admitdos en SQLite
@@ -142,2097 +702,2879 @@ class BotServerDAO:
 		sqlite3.register_converter('TIPO_STICKER',
 										BotServerDAO.__tipo_sticker_converter)
 
-		#	Conectar con la base de datos
-		self.__con_bd = sqlite3.connect(bd_file,
+		#	Conectar con la base de datos. Esta conexión es la única que
+		#	realiza escrituras
+		self.__con_bd = self.__connect()
+
+		if memoria:
+			#	La base de datos en memoria existe mientras la conexión de
+			#	escritura siga abierta. Se restaura a partir de la última
+			#	instantánea o se crea
+			if os.path.isfile(bd_file):
+				self.__log.info('Restaurando la base de datos en memoria a '\
+								'partir de "%s"', bd_file)
+
+				con = sqlite3.connect(bd_file)
+				con.backup(self.__con_bd)
+				con.close()
+
+			else:
+				BotServerDAO.__install_database(filename_output=self.__origen,
+																	uri=True)
+
+		else:
+			#	Activar el modo WAL, que permite lecturas concurrentes con la
+			#	escritura
+			self.__con_bd.execute('PRAGMA journal_mode = WAL;')
+
+		#	Las transacciones de la conexión de escritura son controladas
+		#	explícitamente por el hilo escritor
+		self.__con_bd.isolation_level = None
+
+		#	Actualizar el esquema de la base de datos y de los ficheros de
+		#	archivo a la última versión
+		self.__migrate()
+		self.__migrate_archivos()
+
+		#	Iniciar el hilo escritor
+		self.__hilo_escritor = Thread(target=self.__writer_loop,
+								name='BotServerDAO-escritor', daemon=True)
+		self.__hilo_escritor.start()
+
+		#	Sustituir las funciones públicas de esta instancia por versiones
+		#	que registran sus llamadas. Sin instrumentación, las funciones
+		#	no se modifican
+		if self.__instrumentacion is not None:
+			for nombre, funcion in inspect.getmembers(self, inspect.ismethod):
+				if (not nombre.startswith('_') and nombre not in
+										BotServerDAO.__FUNCIONES_NO_INSTRUMENTADAS):
+					setattr(self, nombre, self.__instrumentacion.envolver(
+															nombre, funcion))
+
+	def __connect(self, solo_lectura: bool=False):
+
+		"""Abre una nueva conexión con la base de datos configurada con los
+		tipos de datos, funciones y pragmas usados por el sistema
+		"""
+
+		con = sqlite3.connect(self.__origen,
+							uri=self.__memoria,
 							check_same_thread=False,
 							detect_types=
-								sqlite3.PARSE_DECLTYPES|sqlite3.PARSE_COLNAMES)
+								sqlite3.PARSE_DECLTYPES|sqlite3.PARSE_COLNAMES,
+							factory=(ConexionInstrumentada
+										if self.__instrumentacion is not None
+										else sqlite3.Connection))
+
+		if self.__instrumentacion is not None:
+			con.instrumentacion = self.__instrumentacion
 
 		#	Establecer el tipo de dato usado para representar tuplas
-		self.__con_bd.row_factory = sqlite3.Row
+		con.row_factory = sqlite3.Row
 
 		#	Registrar función compare_words
-		self.__con_bd.create_function('compare_words', 2, compare_words)
+		con.create_function('compare_words', 2, compare_words)
+
+		#	Fijar el nivel de sincronización con disco
+		con.execute('PRAGMA synchronous = %s;' % self.__synchronous)
+
+		if solo_lectura:
+			con.execute('PRAGMA query_only = true;')
 
 		#	Activar modo de depuración
 
-		if debug:
-			self.__con_bd.execute('PRAGMA foreign_keys = true;')
-			self.__con_bd.execute('PRAGMA foreign_keys_check = 1;')
-			self.__con_bd.execute('PRAGMA integrity_check = 1;')
-			self.__con_bd.set_trace_callback(self.__log.debug)
+		if self.__debug:
+			con.execute('PRAGMA foreign_keys = true;')
+			con.execute('PRAGMA foreign_keys_check = 1;')
+			con.execute('PRAGMA integrity_check = 1;')
+			con.set_trace_callback(self.__log.debug)
 		else:
-			self.__con_bd.execute('PRAGMA foreign_keys = false;')
-			self.__con_bd.execute('PRAGMA foreign_keys_check = 0;')
-			self.__con_bd.execute('PRAGMA integrity_check = 0;')
+			con.execute('PRAGMA foreign_keys = false;')
+			con.execute('PRAGMA foreign_keys_check = 0;')
+			con.execute('PRAGMA integrity_check = 0;')
 
-	### Conversores y adaptadores de tipos de datos ###
+		return con
 
-	def __bool_adapter(bool_value):
+	def __migrate(self):
 
-		if not isinstance(bool_value, bool):
-			raise ValueError('Bool value debe ser passed')
+		"""Aplica sobre la base de datos las migraciones del esquema que aún
+		no hayan sido aplicadas según su versión (PRAGMA user_version). Cada
+		migración se aplica en su propia transacción junto con la
+		actualización de la versión
+		"""
 
-		return int(bool_value)
+		version = self.__con_bd.execute('PRAGMA user_version;').fetchone()[0]
 
-	def __datetime_adapter(time_value):
+		if version >= len(BotServerDAO.__MIGRACIONES):
+			return
 
-		if not isinstance(time_value, datetime.datetime):
-			raise ValueError('"time_value" no es un objeto datetime.datetime '\
-								'válido')
+		self.__log.info('Actualizando el esquema de la base de datos de la '\
+							'versión %d a la versión %d' % (version,
+											len(BotServerDAO.__MIGRACIONES)))
 
-		return time_value.timestamp()
+		#	Las claves foráneas se desactivan mientras se reconstruyen las
+		#	tablas. Debe de hacerse fuera de una transacción
+		self.__con_bd.execute('PRAGMA foreign_keys = false;')
 
-	def __tipo_adapter(string_value):
+		try:
+			for n_version in range(version+1,
+										len(BotServerDAO.__MIGRACIONES)+1):
 
-		if not isinstance(string_value, str):
-			raise ValueError('A str object debe ser proporcionado')
+				self.__log.debug('Aplicando migración %d', n_version)
 
-		for tipo in BotServerDAO.__BD_TIPOS:
+				cursor = self.__con_bd.cursor()
+				cursor.execute('BEGIN')
 
-			#	Buscar el valor numérico asociado al valor pasado y devolverlo
-			if string_value in BotServerDAO.__BD_TIPOS[tipo]:
-				return BotServerDAO.__BD_TIPOS[tipo][string_value]
+				try:
+					for sentencia in BotServerDAO.__MIGRACIONES[n_version-1]:
+						cursor.execute(sentencia)
 
-		raise ValueError('Valor desconocido: "%s"' % string_value)
+					cursor.execute('PRAGMA user_version = %d;' % n_version)
+					cursor.execute('COMMIT')
 
-	def __boolean_converter(int_value):
-		return bool(int(int_value))
+				except BaseException:
+					cursor.execute('ROLLBACK')
+					raise
 
-	def __datetime_converter(float_value):
+				finally:
+					cursor.close()
 
-		float_value = float(float_value)
-		return datetime.datetime.fromtimestamp(float_value)
+		finally:
+			if self.__debug:
+				self.__con_bd.execute('PRAGMA foreign_keys = true;')
 
-	def __tipo_usuario_converter(int_value):
+	def __migrate_archivo(filename: str) -> bool:
 
-		if int_value is None:
-			return None
-		else:
-			try:
-				int_value = int(int_value)
-			except:
-				#	Convertir de array de bytes a string si es necesario
-				return int_value.decode('utf-8') if hasattr(int_value,
-														'decode') else int_value
+		"""Aplica sobre un fichero de archivo las migraciones de su esquema
+		(__MIGRACIONES_ARCHIVO) que aún no hayan sido aplicadas según su
+		versión (PRAGMA user_version), todas ellas en una misma transacción
 
-		for tipo in BotServerDAO.__BD_TIPOS['TIPO_USUARIO']:
+		Devuelve:
+		---------
+			bool: Si se ha aplicado alguna migración
+		"""
 
-			#	Devolver la clave cuyo valor sea el pasado como argumento
-			if BotServerDAO.__BD_TIPOS['TIPO_USUARIO'][tipo] == int_value:
-				return tipo
+		con = sqlite3.connect(filename, isolation_level=None)
 
-		raise ValueError('"%d" not a valid value' % int_value)
+		try:
+			version = con.execute('PRAGMA user_version;').fetchone()[0]
 
-	def __tipo_foro_converter(int_value):
+			if version >= len(BotServerDAO.__MIGRACIONES_ARCHIVO):
+				return False
 
-		if not int_value:
-			return None
-		else:
-			try:
-				int_value = int(int_value)
-			except:
-				#	Convertir de array de bytes a string
-				return int_value.decode('utf-8') if hasattr(int_value,
-														'decode') else int_value
+			con.execute('BEGIN')
 
-		for tipo in BotServerDAO.__BD_TIPOS['TIPO_FORO']:
+			try:
+				for migracion in BotServerDAO.__MIGRACIONES_ARCHIVO[version:]:
+					for sentencia in migracion:
+						con.execute(sentencia)
 
-			#	Devolver la clave cuyo valor sea el pasado como argumento
-			if BotServerDAO.__BD_TIPOS['TIPO_FORO'][tipo] == int_value:
-				return tipo
+				con.execute('PRAGMA user_version = %d;' %
+									len(BotServerDAO.__MIGRACIONES_ARCHIVO))
+				con.execute('COMMIT')
 
-		raise ValueError('"%d" not a valid value' % int_value)
+			except BaseException:
+				con.execute('ROLLBACK')
+				raise
 
-	def __tipo_evento_chat_grupal_converter(int_value):
+		finally:
+			con.close()
 
-		if not int_value:
-			return None
-		else:
-			try:
-				int_value = int(int_value)
-			except:
-				#	Convertir de array de bytes a string
-				return int_value.decode('utf-8') if hasattr(int_value,
-														'decode') else int_value
+		return True
 
-		for tipo in BotServerDAO.__BD_TIPOS['TIPO_EVENTO_CHAT_GRUPAL']:
+	def __migrate_archivos(self):
 
-			#	Devolver la clave cuyo valor sea el pasado como argumento
-			if (BotServerDAO.__BD_TIPOS['TIPO_EVENTO_CHAT_GRUPAL']
-														[tipo] == int_value):
-				return tipo
+		"""Actualiza a la última versión del esquema los ficheros de archivo
+		registrados en el catálogo de archivo
+		"""
 
-		raise ValueError('"%d" not a valid value' % int_value)
+		ficheros = [fila[0] for fila in self.__con_bd.execute(
+								'SELECT fichero FROM ArchivoMensajes;')]
 
-	def __tipo_datoarchivo_converter(int_value):
+		for fichero in ficheros:
+			ruta = self.__directorio_archivo + fichero
 
-		if not int_value:
-			return None
-		else:
-			try:
-				int_value = int(int_value)
-			except:
-				#	Convertir de array de bytes a string
-				return int_value.decode('utf-8') if hasattr(int_value,
-														'decode') else int_value
+			#	La ausencia del fichero se notifica al consultarlo
+			if not os.path.isfile(ruta):
+				continue
 
-		for tipo in BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']:
+			if BotServerDAO.__migrate_archivo(ruta):
+				self.__log.info('Actualizado el esquema del fichero de '\
+												'archivo "%s"', ruta)
 
-			#	Devolver la clave cuyo valor sea el pasado como argumento
-			if BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO'][tipo] == int_value:
-				return tipo
+	def __writer_loop(self):
 
-		raise ValueError('"%d" not a valid value' % int_value)
+		"""Bucle del hilo escritor. Toma las operaciones de la cola de
+		escritura y las ejecuta agrupándolas en transacciones. Cada operación
+		se ejecuta dentro de un savepoint, de forma que un error en una
+		operación no deshace el resto de operaciones de la transacción
+		"""
 
-	def __tipo_sticker_converter(int_value):
+		cursor = self.__con_bd.cursor()
+		fin = False
+		pendiente = None	#	Operación fuera de transacción pendiente
 
-		if not int_value:
-			return None
-		else:
-			try:
-				int_value = int(int_value)
-			except:
-				#	Convertir de array de bytes a string
-				return int_value.decode('utf-8') if hasattr(int_value,
-													'decode') else int_value
+		while not fin:
 
-		for tipo in BotServerDAO.__BD_TIPOS['TIPO_STICKER']:
+			if pendiente is not None:
+				op, pendiente = pendiente, None
+			else:
+				op = self.__cola_escritura.get()
 
-			#	Devolver la clave cuyo valor sea el pasado como argumento
-			if BotServerDAO.__BD_TIPOS['TIPO_STICKER'][tipo] == int_value:
-				return tipo
+			if op is None:
+				break
 
-		raise ValueError('"%d" not a valid value' % int_value)
+			futuro, operacion, en_transaccion = op
 
+			if not en_transaccion:
+				#	Operación que se ejecuta entre dos transacciones
+				if futuro.set_running_or_notify_cancel():
+					try:
+						futuro.set_result(operacion(cursor))
+					except BaseException as e:
+						futuro.set_exception(e)
 
-	def __to_sql_tuple(tup):
+				continue
 
-		if not tup:
-			return None
+			#	Iniciar transacción
+			lote = []
+			limite = time.monotonic() + self.__group_commit_ms/1000
+			cursor.execute('BEGIN')
+
+			while True:
+				futuro, operacion, en_transaccion = op
+
+				if futuro.set_running_or_notify_cancel():
+					cursor.execute('SAVEPOINT operacion')
+
+					try:
+						resultado = operacion(cursor)
+					except BaseException as e:
+						cursor.execute('ROLLBACK TO operacion')
+						cursor.execute('RELEASE operacion')
+						futuro.set_exception(e)
+					else:
+						cursor.execute('RELEASE operacion')
+						lote.append((futuro, resultado))
+
+				#	Confirmar la transacción si se alcanza el límite de
+				#	operaciones o de tiempo o no hay más operaciones pendientes
+				if (len(lote) >= self.__group_commit_ops or
+												time.monotonic() >= limite):
+					break
 
-		#	Objeto a devolver
-		ret = list(tup)
+				try:
+					op = self.__cola_escritura.get_nowait()
+				except queue.Empty:
+					break
 
-		#	Formatear cada elemento de la tupla Python para convertirlo en
-		#	tupla admitida por SQL
-		for i in range(len(ret)):
+				if op is None:
+					fin = True
+					break
 
-			if isinstance(ret[i], (tuple, list, sqlite3.Row)):
-				#	De las tuplas y listas se toma el valor que contienen
-				ret[i] = ret[i][0]
+				if not op[2]:
+					#	Se ejecuta tras confirmar la transacción
+					pendiente = op
+					break
 
-			if isinstance(ret[i], str):
-				#	Para cadenas, es necesario rodear cada elemento
-				#	entre comillas
-				ret[i] = '"'+ret[i]+'"'
+			#	Confirmar la transacción y notificar los resultados
+			try:
+				cursor.execute('COMMIT')
+			except Exception as e:
+				self.__log.error('Error al confirmar una transacción de'\
+										' %d operaciones: %s' % (len(lote), e))
+				self.__con_bd.rollback()
+
+				#	La caché de mensajes puede contener mensajes descartados
+				self.__cache_mensajes.clear()
+				self.__apply_invalidations()
+
+				for futuro, resultado in lote:
+					futuro.set_exception(e)
 			else:
-				#	Se convierte en cadena simplemente
-				ret[i] = str(ret[i])
+				#	Invalidar las entradas modificadas antes de notificar los
+				#	resultados, de forma que quien espera a la escritura lea
+				#	los nuevos datos
+				self.__apply_invalidations()
 
-		#	Devolver tupla SQL
-		return '('+','.join(ret)+')'
+				for futuro, resultado in lote:
+					futuro.set_result(resultado)
 
-	### Interfaz de la clase ###
+		cursor.close()
 
-	def getUsuario(self, user_id: int):
+	#	Búsqueda de las versiones original y actual de un mensaje de chat, a
+	#	través de la clave primaria de Mensaje_Chat
+	__CONSULTA_MENSAJE_CHAT = '''SELECT id_mensaje_original, id_mensaje_actual
+									FROM Mensaje_Chat
+									WHERE id_chat=? AND id_mensaje_chat=?;'''
 
-		"""
-		Permite obtener al usuario de la base de datos cuyo "id" de usuario
-			coincida con el que se ha pasado como argumento.
+	def __lookup_mensaje(self, cursor, chat: int, id_mensaje_chat: int):
 
-		Argumentos:
-		-----------
-			user_id: "Id" del usuario por el cual se buscará en la base de datos
+		"""Busca el mensaje con el identificador de mensaje de chat
+		proporcionado en el chat indicado, primero en la caché de mensajes
+		recientes y después en la tabla Mensaje_Chat. Debe de ser llamada
+		desde el hilo escritor
 
 		Devuelve:
-			dict: Diccionario con los siguientes campos:
-				- telegram_user: (telegram.User) Usuario telegram con los datos
-					del usuario
-				- id_chat: (int) Id del chat del usuario
-				- fecha_registro: (datetime.datetime) Fecha de registro del
-									usuario
-				- tipo: (str) "usuario_docente" o "usuario_alumno"
-				- valido: (bool) Usuario válido (True) o no (False)
+		---------
+			tuple(int, int): Identificadores del mensaje original y de su
+				última versión o None si no se encuentra
 		"""
 
-		self.__log.debug('Ejecutada función "getUsuario" de "BotServerDAO"')
+		if chat is None:
+			return None
 
-		#	Comprobar parámetros de entrada
-		if not isinstance(user_id, int):
-			raise ValueError('"user_id" debe ser int')
+		clave = (chat, id_mensaje_chat)
 
-		#	Tomar el cursor y preparar semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
+		if clave in self.__cache_mensajes:
+			self.__cache_mensajes.move_to_end(clave)
+			return self.__cache_mensajes[clave]
 
-		#	Realizar la consulta
-		self.__log.debug('Realizando consulta con campo id=%d' % user_id)
+		fila = cursor.execute(BotServerDAO.__CONSULTA_MENSAJE_CHAT,
+															clave).fetchone()
 
-		mutex.acquire()
-		cursor.execute('SELECT * FROM Usuario WHERE id=?',(user_id,))
+		if fila is None:
+			return None
 
-		#	Tomar los datos de la consulta
-		datos = cursor.fetchone()
+		ids = (fila[0], fila[1])
+		self.__cache_mensajes[clave] = ids
 
-		#	Cerrar el cursor y semáforo
-		cursor.close()
-		mutex.release()
+		if len(self.__cache_mensajes) > BotServerDAO.__TAM_CACHE_MENSAJES:
+			self.__cache_mensajes.popitem(last=False)
 
-		if datos == None:
-			self.__log.debug('No encontrado usuario id=%d' % user_id)
-			self.__log.debug('Finaliza la ejecución de la función "getUsuario"'\
-														' de "BotServerDAO"')
-			return None
-		else:
-			self.__log.debug('Encontrado usuario id=%d' % user_id)
+		return ids
 
-			usuario = {}
+	def __register_mensaje(self, cursor, chat: int, id_mensaje_chat: int,
+							id_mensaje_original: int, id_mensaje_actual: int):
 
-			usuario['telegram_user'] = telegram.User(id=datos[0],
-													first_name=datos[1],
-													is_bot=False,
-													last_name=datos[2],
-													username=datos[3]
-										)
+		"""Registra la última versión de un mensaje de chat en la tabla
+		Mensaje_Chat y en la caché de mensajes recientes. Debe de ser llamada
+		desde el hilo escritor
+		"""
 
-			usuario['id_chat'] = datos[4]
-			usuario['fecha_registro'] = datos[5]
-			usuario['tipo'] = datos[6]
-			usuario['valido'] = datos[7]
+		cursor.execute('''INSERT INTO Mensaje_Chat VALUES(?,?,?,?)
+							ON CONFLICT(id_chat, id_mensaje_chat) DO UPDATE
+							SET id_mensaje_actual=excluded.id_mensaje_actual;''',
+						(chat, id_mensaje_chat, id_mensaje_original,
+															id_mensaje_actual))
 
-			self.__log.debug('Finaliza la ejecución de la función'\
-											' "getUsuario" de "BotServerDAO"')
-			return usuario
+		clave = (chat, id_mensaje_chat)
+		self.__cache_mensajes[clave] = (id_mensaje_original, id_mensaje_actual)
+		self.__cache_mensajes.move_to_end(clave)
 
-	def existsUsuario(self, user_id: int):
+		if len(self.__cache_mensajes) > BotServerDAO.__TAM_CACHE_MENSAJES:
+			self.__cache_mensajes.popitem(last=False)
 
-		"""
-		Permite determinar si existe un usuario de la base de datos cuyo "id"
-			de usuario coincida con el que se ha pasado como argumento.
+	def __cache_get(self, cache: str, clave):
 
-		Argumentos:
-		-----------
-			user_id: "Id" del usuario por el cual se buscará en la base de datos
+		"""Busca una entrada en una de las cachés de entidades
 
 		Devuelve:
-			bool: True si existe o False en caso contrario
+		---------
+			tuple(bool, object, int): Si la entrada se ha encontrado, su valor
+				(que puede ser None si la entidad no existe) y la generación
+				de la caché en el momento de la consulta, que debe de pasarse
+				a "__cache_put" tras consultar la base de datos
 		"""
 
-		self.__log.debug('Ejecutada función "existsUsuario" de "BotServerDAO"')
-
-		#	Comprobar parámetros de entrada
-		if not isinstance(user_id, int):
-			raise ValueError('"user_id" debe ser int')
+		with self.__cache_entidades_mutex:
+			entradas = self.__cache_entidades[cache]
 
-		#	Preparar cursor y semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
+			if clave in entradas:
+				entradas.move_to_end(clave)
+				self.__estadisticas_cache[cache]['aciertos'] += 1
+				return True, entradas[clave], self.__generacion_cache
 
-		#	Realizar la consulta
-		self.__log.debug('Realizando consulta con campo id=%d' % user_id)
-		mutex.acquire()
-		cursor.execute('SELECT * FROM Usuario WHERE id=?',(user_id,))
+			self.__estadisticas_cache[cache]['fallos'] += 1
+			return False, None, self.__generacion_cache
 
-		#	Tomar los datos de la consulta
-		datos = cursor.fetchone()
+	def __cache_put(self, cache: str, clave, valor, generacion: int):
 
-		#	Cerrar el cursor y semáforo
-		cursor.close()
-		mutex.release()
+		"""Almacena una entrada en una de las cachés de entidades. La entrada
+		se descarta si se ha producido alguna invalidación desde que se
+		consultó la caché, ya que el valor leído podría ser anterior a la
+		escritura invalidada
+		"""
 
-		if datos == None:
-			self.__log.debug('No encontrado usuario id=%d' % user_id)
-			self.__log.debug('Finaliza la ejecución de la función'\
-									' "existsUsuario" de "BotServerDAO"')
-			return False
-		else:
-			self.__log.debug('Encontrado usuario id=%d' % user_id)
-			self.__log.debug('Finaliza la ejecución de la función'\
-										' "existsUsuario" de "BotServerDAO"')
-			return True
+		with self.__cache_entidades_mutex:
 
+			if generacion != self.__generacion_cache:
+				return
 
-	def addUsuario(self, id_usuario: int, nombre: str, apellidos: str,
-					username: str, id_chat: int,
-					fecha_registro: datetime.datetime, tipo: str,
-					valido=True):
+			entradas = self.__cache_entidades[cache]
+			entradas[clave] = valor
+			entradas.move_to_end(clave)
 
-		"""Permite registrar un nuevo usuario en la base de datos:
+			if len(entradas) > BotServerDAO.__TAM_CACHE_ENTIDADES[cache]:
+				entradas.popitem(last=False)
 
-		Parámetros:
-		-----------
-		id_usuario: int
-			Identificador asociado al usuario asociado por Telegram
+	def __invalidate_cache(self, cache: str, *claves):
 
-		nombre: str
-			Primer nombre del usuario
+		"""Registra las entradas de una caché de entidades modificadas por
+		la operación de escritura en curso, que serán invalidadas al
+		confirmar la transacción. Debe de ser llamada desde el hilo escritor
+		"""
 
-		apellidos: str
-			Segundo nombre o apellidos del usuario
+		self.__invalidaciones.extend((cache, clave) for clave in claves)
 
-		username: str
-			Nombre de usuario asociado al Usuario en la plataforma
-			de mensajerı́a.
+	def __invalidate_cache_foro(self, cache: str, id_chat: int):
 
-		id chat: int
-			Identificador asociado al canal de chat privado de un Usuario
+		"""Registra la invalidación de todas las entradas de un foro en una
+		caché de entidades cuya clave es el par (id_chat, id_usuario), que
+		se eliminarán al confirmar la transacción. Debe de ser llamada desde
+		el hilo escritor
+		"""
 
-		fecha registro: datetime.datetime
-			Fecha en la que el Usuario fue registrado en su tipo actual.
+		self.__invalidaciones_foro.append((cache, id_chat))
 
-		tipo: str
-			Tipo de usuario: 'docente' o 'alumno'
+	def __apply_invalidations(self):
 
-		valido: bool
-			Indica si el usuario es válido o no. Por defecto True
+		"""Elimina de las cachés de entidades las entradas registradas por
+		las operaciones de la última transacción. Debe de ser llamada desde
+		el hilo escritor
 		"""
 
-		self.__log.debug('Ejecutada función "addUsuario" de "BotServerDAO"')
+		if not self.__invalidaciones and not self.__invalidaciones_foro:
+			return
 
-		#	Se toma un cursor para insertar datos y se prepara el semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
+		with self.__cache_entidades_mutex:
+			self.__generacion_cache += 1
 
-		#	Comprobar los datos de entrada
-		if not isinstance(nombre, str):
-			raise ValueError('"nombre" debe ser str')
+			for cache, clave in self.__invalidaciones:
+				entradas = self.__cache_entidades[cache]
 
-		if apellidos:
+				if clave in entradas:
+					del entradas[clave]
+					self.__estadisticas_cache[cache]['invalidaciones'] += 1
 
-			if not isinstance(apellidos, str):
-				raise ValueError('"apellidos" debe ser str')
+			for cache, id_chat in self.__invalidaciones_foro:
+				entradas = self.__cache_entidades[cache]
+				claves = [clave for clave in entradas if clave[0] == id_chat]
 
-		if username:
+				for clave in claves:
+					del entradas[clave]
 
-			if not isinstance(username, str):
-				raise ValueError('"username" debe ser str')
+				self.__estadisticas_cache[cache]['invalidaciones'] += len(claves)
 
+		self.__invalidaciones.clear()
+		self.__invalidaciones_foro.clear()
 
-		if not isinstance(id_chat, int):
-			raise ValueError('"id_chat" debe ser int')
+	def getEstadisticasCache(self):
 
-		if not isinstance(fecha_registro, datetime.datetime):
-			raise ValueError('"fecha_registro" debe ser un objeto de tipo'\
-														' datetime.datetime')
+		"""Permite obtener las estadísticas de uso de las cachés de usuarios
+		("usuario"), foros ("foro"), estado de los usuarios en los foros
+		("usuario_foro") y usuarios de cada foro ("usuarios_foro")
 
-		if not isinstance(tipo, str):
-			raise ValueError('"tipo" debe ser str')
-		else:
-			tipo = BotServerDAO.__BD_TIPOS['TIPO_USUARIO'][tipo]
+		Devuelve:
+		---------
+			dict: Formado por el par cache (str) - estadísticas (dict), con
+				los siguientes campos:
+				- entradas: int
+					Número de entradas almacenadas
+				- capacidad: int
+					Número máximo de entradas
+				- aciertos: int
+					Número de consultas resueltas por la caché
+				- fallos: int
+					Número de consultas resueltas por la base de datos
+				- invalidaciones: int
+					Número de entradas invalidadas por escrituras
+				- ratio_aciertos: float
+					Proporción de consultas resueltas por la caché
+		"""
 
-		if not isinstance(valido, bool):
-			raise ValueError('"valido" debe ser bool')
+		estadisticas = {}
 
-		#	Se intentan insertar los datos en la tabla
-		datos = (id_usuario, nombre, apellidos, username, id_chat,
-														fecha_registro, tipo,
-														valido)
-		self.__log.debug('Insertando los siguientes datos:'\
-						' id_usuario={}, nombre={}, apellidos={},'\
-						' username={}, id_chat={}, fecha_registro={}, tipo={},'\
-						' valido={}'.format(*datos))
+		with self.__cache_entidades_mutex:
+			for cache, entradas in self.__cache_entidades.items():
 
-		mutex.acquire()
-		insercion = cursor.execute(
-								'INSERT INTO Usuario VALUES(?,?,?,?,?,?,?,?);',
-																		datos)
+				datos = dict(self.__estadisticas_cache[cache])
+				consultas = datos['aciertos'] + datos['fallos']
 
-		#	Realiza commit
-		self.__con_bd.commit()
+				datos['entradas'] = len(entradas)
+				datos['capacidad'] = BotServerDAO.__TAM_CACHE_ENTIDADES[cache]
+				datos['ratio_aciertos'] = (datos['aciertos']/consultas
+														if consultas else 0.0)
 
-		#	Cierre del cursor y liberación del semáforo
-		mutex.release()
-		cursor.close()
+				estadisticas[cache] = datos
 
-		self.__log.debug('Inserción realizada con éxito, fin de ejecución '\
-								'de la función "addUsuario" de "BotServerDAO"')
+		return estadisticas
 
+	def getEstadisticasInstrumentacion(self):
 
+		"""Permite obtener las métricas de uso registradas por la
+		instrumentación de las funciones públicas y de las sentencias SQL.
+		Las funciones de escritura ejecutadas en modo asíncrono sólo
+		registran el tiempo de envío de la operación al hilo escritor, pero
+		sus sentencias se registran con su tiempo de ejecución real
 
-	def editUsuario(self, id_usuario: int, nombre=None, apellidos=None,
-					username=None, id_chat=None, fecha_registro=None,
-					tipo=None, valido=None):
+		Devuelve:
+		---------
+			dict o None: None si la instrumentación no está activada. En
+				caso contrario, las métricas de las funciones ("funciones") y
+				de las sentencias ("sentencias"), formadas por el par nombre
+				(str) - métricas (dict) con los siguientes campos:
+				- llamadas: int
+					Número de llamadas o ejecuciones
+				- filas: int
+					Número total de filas devueltas o modificadas
+				- tiempo_total, tiempo_medio, tiempo_maximo: float
+					Tiempos total, medio y máximo en segundos
+				- p50, p95, p99: float
+					Percentiles aproximados de la latencia en segundos
+				- histograma: list de tuple
+					Pares límite superior en segundos (None para el último
+					intervalo) - número de llamadas
+		"""
 
-		"""Permite editar los datos de un usuario. Se debe de proporcionar
-			únicamente los parámetros cuyos valores se desean editar
+		if self.__instrumentacion is None:
+			return None
 
-		Parámetros:
-		----------
-		id_usuario: int
-			Identificador asociado al usuario asociado por Telegram
+		return self.__instrumentacion.getEstadisticas()
 
-		nombre: str
-			Primer nombre del usuario
+	def exportEstadisticasInstrumentacion(self, filename: str):
 
-		apellidos: str
-			Segundo nombre o apellidos del usuario
+		"""Almacena en un fichero JSON las métricas devueltas por
+		getEstadisticasInstrumentacion
 
-		username: str
-			Nombre de usuario asociado al Usuario en la plataforma
-			de mensajerı́a.
+		Parámetros:
+		-----------
+		filename: str
+			Ruta del fichero JSON
+		"""
 
-		id chat: int
-			Identificador asociado al canal de chat privado de un Usuario
+		if not isinstance(filename, str):
+			raise ValueError('"filename" debe de ser str')
 
-		fecha registro: datetime.datetime
-				Fecha en la que el Usuario fue registrado en su tipo actual.
+		if self.__instrumentacion is None:
+			raise ValueError('La instrumentación no está activada')
 
-		tipo: str
-			Tipo de usuario: 'docente' o 'alumno'
+		self.__instrumentacion.export(filename)
 
-		valido: bool
-			Indica si el usuario es válido o no. Por defecto True
-		"""
+	def resetEstadisticasInstrumentacion(self):
 
-		self.__log.debug('Ejecutada función "editUsuario" de "BotServerDAO"')
+		"""Descarta las métricas registradas por la instrumentación"""
 
-		#	Tomar un cursor para editar datos y preparar semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
+		if self.__instrumentacion is not None:
+			self.__instrumentacion.reset()
 
-		#	Se va a construir la consulta en función de los datos proporcionados
-		datos = []
-		campos = ''
+	def __submit_write(self, operacion, en_transaccion: bool=True):
 
-		if nombre:
+		"""Encola una operación de escritura para que sea ejecutada por el
+		hilo escritor
 
-			if not isinstance(nombre, str):
-				raise ValueError('"nombre" debe ser str')
+		Parámetros:
+		-----------
+		operacion: callable
+			Función que recibe un cursor de la conexión de escritura, ejecuta
+			las sentencias de escritura sin confirmarlas y devuelve el
+			resultado de la operación
 
-			datos.append(nombre)
-			campos += 'nombre=?,'
+		en_transaccion: bool
+			Con False, la operación se ejecuta entre dos transacciones, sin
+			ninguna transacción abierta en la conexión de escritura. Por
+			defecto True
 
-		if apellidos:
+		Devuelve:
+			concurrent.futures.Future con el resultado de la operación, que
+			se resuelve cuando la transacción en la que se incluye es
+			confirmada
+		"""
 
-			if not isinstance(apellidos, str):
-				raise ValueError('"apellidos" debe ser str')
+		futuro = Future()
 
-			datos.append(apellidos)
-			campos += 'apellidos=?,'
+		if current_thread() is self.__hilo_escritor:
 
-		if username:
+			if not en_transaccion:
+				raise RuntimeError('No se puede ejecutar una operación fuera '\
+								'de transacción dentro de otra operación')
 
-			if not isinstance(username, str):
-				raise ValueError('"username" debe ser str')
+			#	Operación anidada dentro de otra operación de escritura, se
+			#	ejecuta directamente dentro de la misma transacción
+			cursor = self.__con_bd.cursor()
 
-			datos.append(username)
-			campos += 'username=?,'
+			try:
+				futuro.set_result(operacion(cursor))
+			finally:
+				cursor.close()
 
-		if id_chat is not None:
+			return futuro
 
-			if not isinstance(id_chat, int):
-				raise ValueError('"id_chat" debe ser int')
+		if self.__hilo_escritor is None or not self.__hilo_escritor.is_alive():
+			raise RuntimeError('La interfaz de acceso a la base de datos'\
+																' está cerrada')
 
-			datos.append(id_chat)
-			campos += 'id_chat=?,'
+		self.__cola_escritura.put((futuro, operacion, en_transaccion))
 
-		if fecha_registro:
+		return futuro
 
-			if not isinstance(fecha_registro, datetime.datetime):
-				raise ValueError('"fecha_registro" debe ser un objeto de'\
-								' tipo datetime.datetime')
+	def __write(self, operacion):
 
-			datos.append(fecha_registro)
-			campos += 'fecha_registro=?,'
+		"""Ejecuta una operación de escritura a través del hilo escritor y
+		espera a que sea confirmada, devolviendo su resultado. Si el hilo
+		que la llama ha activado el modo asíncrono, devuelve el Future sin
+		esperar
+		"""
 
-		if tipo:
+		futuro = self.__submit_write(operacion)
 
-			if not isinstance(tipo, str):
-				raise ValueError('"tipo" debe ser str')
+		if getattr(self.__modo_asincrono, 'activo', False):
+			return futuro
 
-			tipo = BotServerDAO.__BD_TIPOS['TIPO_USUARIO'][tipo]
+		return futuro.result()
 
-			datos.append(tipo)
-			campos  +=  'tipo=?,'
+	@contextmanager
+	def asynchronous(self):
 
-		if valido is not None:
+		"""Gestor de contexto dentro del cual las funciones de escritura
+		llamadas desde el hilo actual no esperan a que su transacción sea
+		confirmada y devuelven un concurrent.futures.Future con el resultado
+		que devolverían normalmente. Las escrituras encoladas de forma
+		consecutiva son confirmadas en una misma transacción
 
-			if not isinstance(valido, bool):
-				raise ValueError('"valido" debe ser bool')
+		Ejemplo:
+		--------
+		with bd_interface.asynchronous():
+			futuros = [bd_interface.addMensaje(**m) for m in mensajes]
 
-			datos.append(valido)
-			campos += 'valido=?,'
+		ids = [f.result() for f in futuros]
+		"""
 
-		if datos:
-			campos = campos[:-1]	#	Borrar coma sobrante
-			datos.append(id_usuario)		#	Añadir al usuario
-		else:
-			#	No se ha especificaado ningún campo a modificar
-			raise ValueError('Se debe de proporcionar al menos un parámetro')
+		anterior = getattr(self.__modo_asincrono, 'activo', False)
+		self.__modo_asincrono.activo = True
 
-		#	Se ejecuta la actualización
-		self.__log.debug('Se ejecuta la sentencia de actualización'\
-						' con datos: id_usuario={}, nombre={}, apellidos={},'\
-						' username={}, id_chat={}, fecha_registro={}, tipo={},'\
-						' valido={}'.format(id_usuario, nombre, apellidos,
-						username, id_chat, fecha_registro, tipo, valido))
-		mutex.acquire()
+		try:
+			yield self
+		finally:
+			self.__modo_asincrono.activo = anterior
 
-		cursor.execute(('UPDATE Usuario SET %s WHERE id=?' %
-													campos), tuple(datos))
+	def close(self):
 
-		self.__con_bd.commit()	#	Realiza el commit
+		"""Confirma todas las escrituras pendientes, detiene el hilo escritor
+		y cierra todas las conexiones con la base de datos
+		"""
 
-		#	Cerrar cursor y semáforo
-		cursor.close()
-		mutex.release()
+		if self.__hilo_escritor is not None:
 
-		self.__log.debug('Actualización realizada con éxito, fin de ejecución'\
-							' de la función "editUsuario" de "BotServerDAO"')
+			#	Volcar la base de datos en memoria a su fichero
+			if self.__memoria and self.__hilo_escritor.is_alive():
+				try:
+					self.snapshot()
+				except Exception as e:
+					self.__log.error('Error al volcar la base de datos en '\
+									'memoria en "%s": %s', self.__bd_file, e)
 
-	def getForo(self, foro_id: int):
+			self.__cola_escritura.put(None)
+			self.__hilo_escritor.join()
+			self.__hilo_escritor = None
 
-		"""
-		Permite obtener el foro docente de la base de datos cuyo "id" de foro
-			coincida con el que se ha pasado como argumento.
+		#	Cerrar la conexión con la BD
+		if self.__con_bd:
+			self.__con_bd.close()
+			self.__con_bd = None
 
-		Argumentos:
-		-----------
-			foro_id: "Id" del foro por el cual se buscará en la base de datos
+			self.__log.debug('Estadísticas de las cachés de entidades: %s',
+										Diferido(self.getEstadisticasCache))
 
-		Devuelve:
-			dict: Diccionario con los siguientes campos:
-				- id: id asignado al chat del foro
-				- nombre: Nombre asignado al grupo docente
-				- tipo: (str) "usuario_docente" o "usuario_alumno"
-				- valido: True: Si el foro es reconocido como un foro válido
-					(el asistente es administrador en el grupo o supergrupo),
-					False en caso contrario
-		"""
+		#	Cerrar las conexiones de lectura
+		with self.__con_lectura_mutex:
+			for _, con in self.__con_lectura_list:
+				con.close()
 
-		self.__log.debug('Ejecutada función "getForo" de "BotServerDAO"')
+			self.__con_lectura_list.clear()
 
-		#	Comprobar datos de entrada
-		if not isinstance(foro_id, int):
-			raise ValueError('"foro_id" debe ser int')
+	def __read_connection(self):
 
-		#	Tomar cursor y semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
+		"""Devuelve la conexión de lectura del hilo que realiza la llamada,
+		creándola si aún no existe
+		"""
 
-		#	Realizar la consulta
-		self.__log.debug('Realizando consulta con campo id_chat=%d' % foro_id)
-		mutex.acquire()
-		cursor.execute('SELECT * FROM Foro WHERE id_chat=?',(foro_id,))
+		con = getattr(self.__con_lectura, 'con', None)
 
-		#	Tomar los datos de la consulta
-		datos = cursor.fetchone()
+		if con is None:
+			con = self.__connect(solo_lectura=True)
+			self.__con_lectura.con = con
 
-		#	Cerrar el cursor y semáforo
-		cursor.close()
-		mutex.release()
+			#	Ficheros de archivo adjuntos a la conexión: periodo - nombre
+			#	de la base de datos adjunta
+			self.__con_lectura.archivos = OrderedDict()
 
-		if not datos:
-			self.__log.debug('No encontrado foro id=%d' % foro_id)
-			self.__log.debug('Finaliza la ejecución de la función "getForo" de'
-															' "BotServerDAO"')
-			return None
-		else:
-			self.__log.debug('Encontrado Foro id=%d' % foro_id)
+			with self.__con_lectura_mutex:
+				#	Cerrar las conexiones de los hilos que han finalizado, que
+				#	ya no pueden utilizarse, para no acumular una conexión por
+				#	cada hilo de corta duración
+				activas = []
 
-			foro = {}
+				for hilo, con_hilo in self.__con_lectura_list:
+					if hilo.is_alive():
+						activas.append((hilo, con_hilo))
+					else:
+						con_hilo.close()
 
-			foro['id'] = datos[0]
-			foro['nombre'] = datos[1]
-			foro['tipo'] = datos[2] #'group' if datos[2] == 0 else 'supergroup'
-			foro['valido'] = datos[3] #bool(datos[3])
+				activas.append((current_thread(), con))
+				self.__con_lectura_list = activas
 
-			self.__log.debug('Finaliza la ejecución de la función "getForo" de'\
-															' "BotServerDAO"')
-			return foro
+		return con
 
+	def __periodos_archivados(self, fecha_inicio: datetime.datetime,
+										fecha_fin: datetime.datetime):
 
-	def addForo(self, id_chat: int, nombre: str,
-				tipo: str, valido: bool, fecha_creacion: datetime.datetime):
+		"""Busca en el catálogo de archivo los periodos archivados que
+		solapan con el intervalo de tiempo indicado, ambos extremos incluidos
 
+		Devuelve:
+		---------
+			list de tuplas (periodo, fichero, fecha_inicio, fecha_fin)
+			ordenadas por fecha
 		"""
-		Permite añadir un nuevo foro a la base de datos
 
-		Atributos:
-		----------
-			id_chat: (int) Identificador de chat asignado univocamente al grupo
-						o supergrupo asociado al foro
-			nombre: (str) Nombre del grupo o supergrupo asignado al foro docente
-			tipo: (str) "group" si el foro lleva asociado un grupo o
-				"supergroup" si lleva asociado un foro
-			valido: (bool) True si el foro es válido (el asistente es usuario
-					administrador en dicho foro) o False en caso contrario
-		"""
+		cursor = self.__read_connection().cursor()
+		periodos = [tuple(fila) for fila in cursor.execute(
+								'''SELECT periodo, fichero, fecha_inicio, fecha_fin
+								FROM ArchivoMensajes
+								WHERE fecha_inicio <= ? AND fecha_fin > ?
+								ORDER BY fecha_inicio;''',
+								(fecha_fin, fecha_inicio))]
+		cursor.close()
 
-		self.__log.debug('Ejecutada función "addForo" de "BotServerDAO"')
+		return periodos
 
-		#	Comprobar que los datos sean válidos
-		if not isinstance(id_chat, int):
-			raise ValueError('"id_chat" debe de ser int')
+	def __attach_archivo(self, periodo: str, fichero: str):
 
-		if not isinstance(nombre, str):
-			raise ValueError('"nombre" debe de ser str')
+		"""Adjunta el fichero de archivo de un periodo a la conexión de
+		lectura del hilo que realiza la llamada, si no lo estaba ya. Si se
+		alcanza el número máximo de ficheros adjuntos, se separa el que lleva
+		más tiempo sin usarse
 
-		if not isinstance(tipo, str):
-			raise ValueError('"tipo" debe de ser str')
-		else:
-			tipo = BotServerDAO.__BD_TIPOS['TIPO_FORO'][tipo]
+		Devuelve:
+		---------
+			str: Nombre con el que se ha adjuntado la base de datos o None si
+				el fichero de archivo no existe
+		"""
 
-		if not isinstance(valido, bool):
-			raise ValueError('"valido" debe de ser bool')
+		con = self.__read_connection()
+		archivos = self.__con_lectura.archivos
 
-		if not isinstance(fecha_creacion, datetime.datetime):
-			raise ValueError('"fecha_creacion" debe de ser datetime.datetime')
+		if periodo in archivos:
+			archivos.move_to_end(periodo)
+			return archivos[periodo]
 
-		#	Se toma un cursor para insertar datos y se prepara el semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
+		ruta = self.__directorio_archivo + fichero
 
-		#	Se intentan insertar los datos en la tabla
-		datos = (id_chat, nombre, tipo, valido, fecha_creacion)
-		self.__log.debug('Insertando los siguientes datos en la tabla'\
-						' Foro: id_chat={}, nombre={}, tipo={}, valido={},'\
-						' fecha_creacion={}'.format(*datos))
+		if not os.path.isfile(ruta):
+			self.__log.error('No se encuentra el fichero de archivo "%s" del'\
+										' periodo %s' % (ruta, periodo))
+			return None
 
-		mutex.acquire()
-		insercion = cursor.execute('INSERT INTO Foro VALUES(?,?,?,?,?);', datos)
+		if len(archivos) >= BotServerDAO.__MAX_ARCHIVOS_ADJUNTOS:
+			_, esquema = archivos.popitem(last=False)
+			con.execute('DETACH DATABASE %s;' % esquema)
 
-		#	Realiza commit
-		self.__con_bd.commit()
+		esquema = 'archivo_' + periodo
 
-		#	Cerrar cursor y semáforo
-		cursor.close()
-		mutex.release()
+		if self.__memoria:
+			ruta = 'file:%s?mode=rw&vfs=%s' % (
+									pathname2url(os.path.abspath(ruta)),
+									BotServerDAO.__VFS_DISCO)
 
+		con.execute('ATTACH DATABASE ? AS %s;' % esquema, (ruta,))
 
-	def editForo(self, id_chat: int, nombre=None, tipo=None,
-								valido=None,
-								fecha_creacion: datetime.datetime=None):
+		#	Comprobar que se ha adjuntado el fichero y no una base de datos
+		#	vacía
+		if not con.execute('''SELECT count(*) FROM %s.sqlite_master
+								WHERE type = 'table' AND name = 'Evento';''' %
+														esquema).fetchone()[0]:
+			con.execute('DETACH DATABASE %s;' % esquema)
+			raise sqlite3.OperationalError('El fichero de archivo "%s" del '\
+									'periodo %s se ha adjuntado sin su '\
+									'esquema' % (ruta, periodo))
 
-		"""Permite editar los datos de un Foro existente. Únicamente se deben
-			de proporcionar los parámetros de los valores que se desean editar
-			y el "id_chat" del foro que se desea editar:
+		archivos[periodo] = esquema
 
-			Parámetros:
-			-----------
-			id_chat: (int) Identificador de chat asignado univocamente al grupo
-						o supergrupo asociado al foro
-			nombre: (str) Nombre del grupo o supergrupo asignado al foro docente
-			tipo: (str) "grupo" si el foro lleva asociado un grupo o
-				"supergrupo" si lleva asociado un supergrupo
-			valido: (bool) True si el foro es válido (el asistente es usuario
-					administrador en dicho foro) o False en caso contrario
+		return esquema
 
-		"""
+	### Conversores y adaptadores de tipos de datos ###
 
-		self.__log.debug('Ejecutada función "editForo" de "BotServerDAO"')
+	def __bool_adapter(bool_value):
 
-		#	Se toma un cursor para editar datos y semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
+		if not isinstance(bool_value, bool):
+			raise ValueError('Bool value debe ser passed')
 
-		#	Se va a construir la consulta en función de los datos proporcionados
-		datos = []
-		campos = ''
+		return int(bool_value)
 
-		if nombre:
-			if not isinstance(nombre, str):
-				raise ValueError('"nombre" debe ser str')
+	def __datetime_adapter(time_value):
 
-			datos.append(nombre)
-			campos += 'nombre=?,'
+		if not isinstance(time_value, datetime.datetime):
+			raise ValueError('"time_value" no es un objeto datetime.datetime '\
+								'válido')
 
-		if tipo:
+		return time_value.timestamp()
 
-			if not isinstance(tipo, str) and tipo not in ('grupo','supergrupo'):
-				raise ValueError('"tipo" debe ser str y debe de adoptar los'\
-											' valores "grupo" y "supergrupo"')
+	def __tipo_adapter(string_value):
 
+		if not isinstance(string_value, str):
+			raise ValueError('A str object debe ser proporcionado')
 
-			datos.append(tipo)
-			campos += 'tipo=?,'
+		for tipo in BotServerDAO.__BD_TIPOS:
 
-		if valido is not None:
+			#	Buscar el valor numérico asociado al valor pasado y devolverlo
+			if string_value in BotServerDAO.__BD_TIPOS[tipo]:
+				return BotServerDAO.__BD_TIPOS[tipo][string_value]
 
-			if not isinstance(valido, bool):
-				raise ValueError('"valido" debe ser bool')
+		raise ValueError('Valor desconocido: "%s"' % string_value)
 
-			datos.append(int(valido))
-			campos += 'valido=?,'
+	def __boolean_converter(int_value):
+		return bool(int(int_value))
 
-		if fecha_creacion:
+	def __datetime_converter(float_value):
 
-			if not isinstance(fecha_creacion, datetime.datetime):
-				raise valueError('"fecha_creacion" no es datetime.datetime')
+		float_value = float(float_value)
+		return datetime.datetime.fromtimestamp(float_value)
 
-			datos.append(fecha_creacion)
-			campos += 'fecha_creacion=?,'
+	def __tipo_usuario_converter(int_value):
 
-		if datos:
-			campos = campos[:-1]	#	Borrar coma sobrante
-			datos.append(id_chat)	#	Añadir al usuario
+		if int_value is None:
+			return None
 		else:
-			#	No se ha especificaado ningún campo a modificar
-			raise ValueError('Se debe de proporcionar al menos un parámetro')
-
-		#	Se ejecuta la actualización
-		self.__log.debug('Se ejecuta la sentencia de actualización con datos:'\
-						' id_chat={}, nombre={}, tipo={}, valido={},'\
-						' fecha_creacion={}'.format(id_chat, nombre, tipo,
-													valido, fecha_creacion))
-		mutex.acquire()
-		actualizacion = cursor.execute('UPDATE Foro SET %s WHERE'\
-										' id_chat=?' % (campos), tuple(datos))
-
-		#	Realizar el commit
-		self.__con_bd.commit()
+			try:
+				int_value = int(int_value)
+			except:
+				#	Convertir de array de bytes a string si es necesario
+				return int_value.decode('utf-8') if hasattr(int_value,
+														'decode') else int_value
 
-		#	Cerrar cursor y semáforo
-		cursor.close()
-		mutex.release()
+		for tipo in BotServerDAO.__BD_TIPOS['TIPO_USUARIO']:
 
-		return actualizacion
+			#	Devolver la clave cuyo valor sea el pasado como argumento
+			if BotServerDAO.__BD_TIPOS['TIPO_USUARIO'][tipo] == int_value:
+				return tipo
 
-	def removeForo(self, id_chat: int):
+		raise ValueError('"%d" not a valid value' % int_value)
 
-		"""Permite eliminar un Foro de la base de datos
+	def __tipo_foro_converter(int_value):
 
-		Parámetros:
-		-----------
-		id_chat: int
-			Identificador del foro que se desea eliminar
+		if not int_value:
+			return None
+		else:
+			try:
+				int_value = int(int_value)
+			except:
+				#	Convertir de array de bytes a string
+				return int_value.decode('utf-8') if hasattr(int_value,
+														'decode') else int_value
 
-		"""
-		self.__log.debug('Ejecutada función "removeForo" de "BotServerDAO"')
+		for tipo in BotServerDAO.__BD_TIPOS['TIPO_FORO']:
 
-		#	Comprobar que los datos proporcionados sean válidos y prepararlos
-		if type(id_chat) != int:
-			raise ValueError('"id_chat" debe ser int')
+			#	Devolver la clave cuyo valor sea el pasado como argumento
+			if BotServerDAO.__BD_TIPOS['TIPO_FORO'][tipo] == int_value:
+				return tipo
 
-		#	Se toma un cursor para eliminar datos y semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
+		raise ValueError('"%d" not a valid value' % int_value)
 
-		#	Se ejecuta el borrado
-		self.__log.debug('Se ejecuta la sentencia de borrado con datos'\
-							' id_chat=%d' % id_chat)
-		mutex.acquire()
-		cursor.execute('DELETE FROM Foro WHERE id_chat=?;', (id_chat,))
+	def __tipo_evento_chat_grupal_converter(int_value):
 
-		#	Realizar el commit
-		self.__con_bd.commit()
+		if not int_value:
+			return None
+		else:
+			try:
+				int_value = int(int_value)
+			except:
+				#	Convertir de array de bytes a string
+				return int_value.decode('utf-8') if hasattr(int_value,
+														'decode') else int_value
 
-		#	Cerrar el cursor y el semáforo
-		cursor.close()
-		mutex.release()
+		for tipo in BotServerDAO.__BD_TIPOS['TIPO_EVENTO_CHAT_GRUPAL']:
 
-	def listForos(self, solo_validos=True):
+			#	Devolver la clave cuyo valor sea el pasado como argumento
+			if (BotServerDAO.__BD_TIPOS['TIPO_EVENTO_CHAT_GRUPAL']
+														[tipo] == int_value):
+				return tipo
 
-		"""Permite listar todos los foros almacenados
+		raise ValueError('"%d" not a valid value' % int_value)
 
-		Argumentos:
-		-----------
-		solo_validos: bool
-			Establece si en el listado sólo deben de aparecer los foros válidos
-			(True) o todos (False)
+	def __tipo_datoarchivo_converter(int_value):
 
-		Devuelve:
-		---------
-		dict: Que consta del par id (int) - foro (dict)
-			"foro" es a su vez un diccionario con los siguientes datos:
-			- nombre: str
-				Nombre o tı́tulo de grupo asociado al Foro.
-			- tipo: str
-				Tipo de chat grupal asociado al Foro y que puede ser:
-				grupo o supergrupo.
-			- fecha_registro: datetime.datetime
-				Fecha en la que el foro fue registrado en el sistema en
-				su tipo actual
-			- valido: bool
-				Indica si el foro es válido (True) o no (False)
-		"""
+		if not int_value:
+			return None
+		else:
+			try:
+				int_value = int(int_value)
+			except:
+				#	Convertir de array de bytes a string
+				return int_value.decode('utf-8') if hasattr(int_value,
+														'decode') else int_value
 
-		self.__log.debug('Ejecutada función "listForos" de "BotServerDAO"')
+		for tipo in BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']:
 
-		#	Obtener cursor y semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
-		filtro = 'WHERE valido=1' if solo_validos else ''
+			#	Devolver la clave cuyo valor sea el pasado como argumento
+			if BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO'][tipo] == int_value:
+				return tipo
 
-		datos = {}
+		raise ValueError('"%d" not a valid value' % int_value)
 
-		#	Realizar la consulta
-		mutex.acquire()
-		for fila in cursor.execute('SELECT * FROM Foro %s;' % filtro):
+	def __tipo_sticker_converter(int_value):
 
-			#self.__log.debug('Encontrado Foro id=%d' % fila[0])
+		if not int_value:
+			return None
+		else:
+			try:
+				int_value = int(int_value)
+			except:
+				#	Convertir de array de bytes a string
+				return int_value.decode('utf-8') if hasattr(int_value,
+													'decode') else int_value
 
-			foro = {}
+		for tipo in BotServerDAO.__BD_TIPOS['TIPO_STICKER']:
 
-			foro['nombre'] = fila[1]
-			foro['tipo'] = fila[2] #'group' if fila[2] == 0 else 'supergroup'
-			foro['valido'] = fila[3]
-			foro['fecha_creacion'] = fila[4]
+			#	Devolver la clave cuyo valor sea el pasado como argumento
+			if BotServerDAO.__BD_TIPOS['TIPO_STICKER'][tipo] == int_value:
+				return tipo
 
-			#	Añadir el foro encontrado
-			datos[fila[0]] = foro
+		raise ValueError('"%d" not a valid value' % int_value)
 
-		#	Cerrar el cursor y semáforo
-		cursor.close()
-		mutex.release()
 
-		if not datos:
-			self.__log.debug('No se ha encontrado ningún foro docente')
-			datos = None
-		else:
-			self.__log.debug('Se ha encontrado %d foros', len(datos))
+	def __to_json_array(valores):
 
-		self.__log.debug('Finalizada función "listForos" de "BotServerDAO"')
+		"""Convierte una colección de valores (o de filas, de las que se toma
+		el primer valor) en un array JSON, que se pasa como parámetro a las
+		sentencias que filtran por un conjunto de valores mediante
+		"IN (SELECT value FROM json_each(?))". De esta forma, el texto de la
+		sentencia no depende del número de valores y se reutiliza la
+		sentencia preparada
+		"""
 
-		return datos
+		if not valores:
+			return None
 
-	def getUsuario_status_Foro(self, id_chat: int, id_usuario: int):
+		return json.dumps([v[0] if isinstance(v, (tuple, list, sqlite3.Row))
+													else v for v in valores])
 
-		"""Permite obtener información sobre el estado en un
-			determinado Foro
+	### Interfaz de la clase ###
 
-			Parámetros:
-			-----------
-			id_chat: int
-				Identificador de chat asociado al chat grupal del foro docente
+	def getUsuario(self, user_id: int):
 
-			id_usuario: int
-				Identificador asociado al usuario
+		"""
+		Permite obtener al usuario de la base de datos cuyo "id" de usuario
+			coincida con el que se ha pasado como argumento.
 
-			Devuelve:
-			---------
-				dict: Con los siguientes campos:
-					- ban: bool
-						Indica si el usuario está baneado o no
+		Argumentos:
+		-----------
+			user_id: "Id" del usuario por el cual se buscará en la base de datos
 
-					- n_avisos: int
-						Indica el número de avisos que lleva acumulado el
-						usuario por el envío de mensajes no pertenecientes al
-						ámbito académico
+		Devuelve:
+			RegistroUsuario: Registro accesible como diccionario con los
+				siguientes campos:
+				- telegram_user: (telegram.User) Usuario telegram con los datos
+					del usuario
+				- id_chat: (int) Id del chat del usuario
+				- fecha_registro: (datetime.datetime) Fecha de registro del
+									usuario
+				- tipo: (str) "usuario_docente" o "usuario_alumno"
+				- valido: (bool) Usuario válido (True) o no (False)
 		"""
 
-		self.__log.debug('Ejecutada función "getUsuario_status_Foro" de'\
-							' "BotServerDAO"')
+		self.__log.debug('Ejecutada función "getUsuario" de "BotServerDAO"')
 
-		#	Se comprueban que los datos sean válidos
-		if not isinstance(id_chat, int):
-			raise ValueError('"id_chat" debe de ser int')
+		#	Comprobar parámetros de entrada
+		if not isinstance(user_id, int):
+			raise ValueError('"user_id" debe ser int')
 
-		if not isinstance(id_usuario, int):
-			raise ValueError('"id_usuario" debe de ser int')
+		#	Consultar primero la caché de usuarios
+		encontrado, usuario, generacion = self.__cache_get('usuario', user_id)
 
-		#	Tomar cursor y semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
+		if encontrado:
+			self.__log.debug('Encontrado usuario id=%d en caché', user_id)
+			self.__log.debug('Finaliza la ejecución de la función'\
+											' "getUsuario" de "BotServerDAO"')
+			return usuario.copy() if usuario is not None else None
+
+		#	Tomar el cursor
+		cursor = self.__read_connection().cursor()
 
 		#	Realizar la consulta
-		self.__log.debug('Realizando consulta con campo id_chat=%d e '\
-									'id_usuario=%d' % (id_chat, id_usuario))
-		mutex.acquire()
-		cursor.execute('''SELECT ban, n_avisos
-							FROM Foro_Usuario
-							WHERE id_chat_foro=? AND id_usuario=?''',
-							(id_chat, id_usuario))
+		self.__log.debug('Realizando consulta con campo id=%d', user_id)
+
+		cursor.execute('SELECT * FROM Usuario WHERE id=?',(user_id,))
 
 		#	Tomar los datos de la consulta
 		datos = cursor.fetchone()
 
-		#	Cerrar el cursor y semáforo
+		#	Cerrar el cursor
 		cursor.close()
-		mutex.release()
 
 		if datos == None:
-			self.__log.debug('No encontrado al usuario con id=%d en el foro'\
-										' con id=%d' % (id_chat, id_usuario))
-			self.__log.debug('Finaliza la ejecución de la función '\
-								'"getUsuario_status_Foro" de "BotServerDAO"')
-			status = None
+			self.__log.debug('No encontrado usuario id=%d', user_id)
+			self.__cache_put('usuario', user_id, None, generacion)
+			self.__log.debug('Finaliza la ejecución de la función "getUsuario"'\
+														' de "BotServerDAO"')
+			return None
 		else:
-			self.__log.debug('Encontrado al usuario con id=%d en el foro'\
-										' con id=%d' % (id_chat, id_usuario))
-			status = {
-						'ban': bool(datos[0]),
-						'n_avisos': datos[1]
-					}
+			self.__log.debug('Encontrado usuario id=%d', user_id)
 
+			#	El usuario telegram.User se construye sólo cuando es
+			#	consultado
+			usuario = RegistroUsuario(*datos)
 
-			self.__log.debug('Finaliza la ejecución de la función '\
-								'"getUsuario_status_Foro" de "BotServerDAO"')
+			self.__cache_put('usuario', user_id, usuario, generacion)
 
-		return status
+			self.__log.debug('Finaliza la ejecución de la función'\
+											' "getUsuario" de "BotServerDAO"')
+			return usuario.copy()
 
-	def listUsuarios_in_Foro(self, id_chat: int, solo_alumnos=False,
-															solo_valido=True):
+	def existsUsuario(self, user_id: int):
 
-		"""Permite obtener información sobre todos los usuarios presentes en un
-			foro además de información sobre su status
+		"""
+		Permite determinar si existe un usuario de la base de datos cuyo "id"
+			de usuario coincida con el que se ha pasado como argumento.
 
-		Parámetros:
+		Argumentos:
 		-----------
-
-			id_chat: int
-				Identificador de chat asociado al chat grupal del foro docente
-
-			solo_alumnos: bool
-				Indica si sólo se desean listar los alumnos (True) o también
-				los docentes
+			user_id: "Id" del usuario por el cual se buscará en la base de datos
 
 		Devuelve:
-		---------
-			dict: Formado por el par id_usuario (int) - datos (dict)
-				Por su parte, los datos incluídos en el diccionario
-				presentan los siguientes campos:
-				- id_usuario: int
-					Identificador asociado al usuario asociado por Telegram
+			bool: True si existe o False en caso contrario
+		"""
 
-				- nombre: str
-					Primer nombre del usuario
+		self.__log.debug('Ejecutada función "existsUsuario" de "BotServerDAO"')
 
-				- apellidos: str
-					Segundo nombre o apellidos del usuario
+		#	Comprobar parámetros de entrada
+		if not isinstance(user_id, int):
+			raise ValueError('"user_id" debe ser int')
 
-				- username: str
-					Nombre de usuario asociado al Usuario en la plataforma
-					de mensajerı́a.
+		#	Consultar primero la caché de usuarios
+		encontrado, usuario, generacion = self.__cache_get('usuario', user_id)
 
-				- telegram_user: Telegram.user
-					Usuario Telegram con los datos del usuario
+		if encontrado:
+			self.__log.debug('Finaliza la ejecución de la función'\
+									' "existsUsuario" de "BotServerDAO"')
+			return usuario is not None
 
-				- id chat: int
-					Identificador asociado al canal de chat privado
-						de un Usuario
+		#	Preparar cursor
+		cursor = self.__read_connection().cursor()
 
-				- fecha registro: datetime.datetime
-						Fecha en la que el Usuario fue registrado en
-						su tipo actual.
+		#	Realizar la consulta
+		self.__log.debug('Realizando consulta con campo id=%d', user_id)
+		cursor.execute('SELECT * FROM Usuario WHERE id=?',(user_id,))
 
-				- ban: bool
-					Indica si el usuario está baneado o no
+		#	Tomar los datos de la consulta
+		datos = cursor.fetchone()
 
-				- n_avisos: int
-					Indica el número de avisos que lleva acumulado el
-					usuario por el envío de mensajes no pertenecientes al
-					ámbito académico
-		"""
+		#	Cerrar el cursor
+		cursor.close()
 
-		self.__log.debug('Ejecutada función "listUsuarios_in_Foro" '\
-							'de "BotServerDAO"')
+		if datos == None:
+			self.__log.debug('No encontrado usuario id=%d', user_id)
+			self.__log.debug('Finaliza la ejecución de la función'\
+									' "existsUsuario" de "BotServerDAO"')
+			return False
+		else:
+			self.__log.debug('Encontrado usuario id=%d', user_id)
+			self.__log.debug('Finaliza la ejecución de la función'\
+										' "existsUsuario" de "BotServerDAO"')
+			return True
 
-		#	Se comprueban que los datos sean válidos
-		if not isinstance(id_chat, int):
-			raise ValueError('"id_chat" debe de ser int')
 
-		#	Tomar el cursor y el semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
+	def addUsuario(self, id_usuario: int, nombre: str, apellidos: str,
+					username: str, id_chat: int,
+					fecha_registro: datetime.datetime, tipo: str,
+					valido=True):
 
-		#	Preparar la consulta
-		filtro_valido = 'Usuario.valido=1' if solo_valido else ''
-		filtro_alumnos = 'Usuario.tipo=0' if solo_alumnos else ''
-		nexo1 = 'AND' if solo_valido and solo_alumnos else ''
-		nexo2 = 'AND' if solo_valido or solo_alumnos else ''
+		"""Permite registrar un nuevo usuario en la base de datos:
 
-		#	Realizar la consulta
-		self.__log.debug('Realizando consulta con campo id_chat=%d' % id_chat)
-		mutex.acquire()
+		Parámetros:
+		-----------
+		id_usuario: int
+			Identificador asociado al usuario asociado por Telegram
 
-		consulta = cursor.execute(
-					'''SELECT Usuario.id, Usuario.nombre, Usuario.apellidos,
-							Usuario.username, Usuario.id_chat,
-							Usuario.fecha_registro, Usuario.tipo, Usuario.valido,
-							Foro_Usuario.ban, Foro_Usuario.n_avisos
-						FROM Usuario, Foro_Usuario
-						WHERE %s %s %s %s Usuario.id = Foro_Usuario.id_usuario AND
-							Foro_Usuario.id_chat_foro=?;''' % (
-							filtro_valido, nexo1, filtro_alumnos, nexo2),
-																(id_chat,))
+		nombre: str
+			Primer nombre del usuario
 
-		datos = {}	#	Guardar los datos recuperados en este diccionario
+		apellidos: str
+			Segundo nombre o apellidos del usuario
 
-		for fila in consulta:
+		username: str
+			Nombre de usuario asociado al Usuario en la plataforma
+			de mensajerı́a.
 
-			usuario = {}
+		id chat: int
+			Identificador asociado al canal de chat privado de un Usuario
 
-			usuario['telegram_user'] = telegram.User(id=fila[0],
-													first_name=fila[1],
-													is_bot=False,
-													last_name=fila[2],
-													username=fila[3]
-										)
+		fecha registro: datetime.datetime
+			Fecha en la que el Usuario fue registrado en su tipo actual.
 
-			usuario['id_chat'] = fila[4]
-			usuario['fecha_registro'] = fila[5]
-			usuario['tipo'] = fila[6]
-			usuario['valido'] = fila[7]
-			usuario['ban'] = fila[8]
-			usuario['n_avisos'] = fila[9]
+		tipo: str
+			Tipo de usuario: 'docente' o 'alumno'
 
-			#	Se añade el usuario a los datos
-			datos[fila[0]] = usuario
+		valido: bool
+			Indica si el usuario es válido o no. Por defecto True
+		"""
 
-			self.__log.debug('Encontrado usuario %s con id=%d en el foro con'\
-								' id=%d' % (usuario['telegram_user'].full_name,
-								fila[0], id_chat))
+		self.__log.debug('Ejecutada función "addUsuario" de "BotServerDAO"')
 
-		#	Cerrar el cursor y el semáforo
-		cursor.close()
-		mutex.release()
+		#	Comprobar los datos de entrada
+		if not isinstance(nombre, str):
+			raise ValueError('"nombre" debe ser str')
 
-		if not datos:
-			self.__log.debug('No encontrado ningún usuario en el '\
-													'foro con id=%d' % id_chat)
-			self.__log.debug('Finaliza la ejecución de la función '\
-									'"listUsuarios_in_Foro" de "BotServerDAO"')
-			return None
-		else:
-			self.__log.debug('Finaliza la ejecución de la función '\
-									'"listUsuarios_in_Foro" de "BotServerDAO"')
-			return datos
+		if apellidos:
 
-	def existsUsuarioAnyForo(self, id_usuario: int):
+			if not isinstance(apellidos, str):
+				raise ValueError('"apellidos" debe ser str')
 
-		"""Permite conocer si un usuario se halla registardo en al menos,
-			un foro docente
+		if username:
 
-		Argumentos:
-		-----------
-		id_usuario: int
-			Identificador del usuario al cual se desea aplicar la comprobación
+			if not isinstance(username, str):
+				raise ValueError('"username" debe ser str')
 
-		Devuelve:
-		---------
-			bool. True si el usuario se encuentra en al menos un foro docente
-					o False en caso contrario
-		"""
+		if not isinstance(id_chat, int):
+			raise ValueError('"id_chat" debe ser int')
 
-		self.__log.debug('Ejecutada función "existsUsuarioAnyForo" de'\
-															' "BotServerDAO"')
+		if not isinstance(fecha_registro, datetime.datetime):
+			raise ValueError('"fecha_registro" debe ser un objeto de tipo'\
+														' datetime.datetime')
 
-		#	Se comprueban que los datos sean válidos
-		if not isinstance(id_usuario, int):
-			raise ValueError('"id_usuario" debe de ser int')
+		if not isinstance(tipo, str):
+			raise ValueError('"tipo" debe ser str')
+		else:
+			tipo = BotServerDAO.__BD_TIPOS['TIPO_USUARIO'][tipo]
 
-		#	Tomar el cursor y el semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
+		if not isinstance(valido, bool):
+			raise ValueError('"valido" debe ser bool')
 
-		#	Ejecutar consulta
-		self.__log.debug('Ejecutando consulta con id_usuario = %d' % id_usuario)
-		mutex.acquire()
+		#	Se intentan insertar los datos en la tabla
+		datos = (id_usuario, nombre, apellidos, username, id_chat,
+														fecha_registro, tipo,
+														valido)
+		self.__log.debug('Insertando los siguientes datos:'\
+						' id_usuario=%s, nombre=%s, apellidos=%s,'\
+						' username=%s, id_chat=%s, fecha_registro=%s, tipo=%s,'\
+						' valido=%s', *datos)
 
-		existe = bool(cursor.execute(
-						'SELECT * FROM Foro_Usuario WHERE id_usuario=? LIMIT 1',
-													(id_usuario,)).fetchone())
+		def operacion(cursor):
+			cursor.execute('INSERT INTO Usuario VALUES(?,?,?,?,?,?,?,?);',
+																		datos)
+			self.__invalidate_cache('usuario', id_usuario)
 
+		#	Realizar la inserción y esperar a su confirmación
+		self.__write(operacion)
 
-		#	Cerrar el cursor y el semáforo
-		cursor.close()
-		mutex.release()
+		self.__log.debug('Inserción realizada con éxito, fin de ejecución '\
+								'de la función "addUsuario" de "BotServerDAO"')
 
-		self.__log.debug('Finalziada función "existsUsuarioAnyForo" de'\
-															' "BotServerDAO"')
 
-		return existe
 
-	def addUsuarioForo(self, id_chat: int, usuarios, ban=False, n_avisos=0):
+	def editUsuario(self, id_usuario: int, nombre=None, apellidos=None,
+					username=None, id_chat=None, fecha_registro=None,
+					tipo=None, valido=None):
 
-		"""
-		Permite registrar uno o más usuarios en un foro
+		"""Permite editar los datos de un usuario. Se debe de proporcionar
+			únicamente los parámetros cuyos valores se desean editar
 
 		Parámetros:
-		-----------
-		id_chat: int
-			Id de chat asignado al grupo o supergrupo asociado al foro
-		usuarios: (int o list[int])
-			Ids de los usuarios a registrar en el grupo docente
-		ban: bool
-			Indica si los usuarios se hallan baneados en el grupo o no.
-		n_avisos: int
-			Número de avisos dados a un usuario por el envío de
-					mensajes no pertenecientes al ámbito académico
-		"""
-
-		self.__log.debug('Ejecutada función "addUsuarioForo" de "BotServerDAO"')
-
-		#	Comprobar que los datos sean válidos
-		if not isinstance(id_chat, int):
-			raise ValueError('"id_chat" debe de ser int')
-
-		if not isinstance(usuarios, (int,list)):
-			raise ValueError('"usuarios" debe de ser int o una lista de int')
-
-		if not isinstance(ban, bool):
-			raise ValueError('"ban" debe de ser bool')
-
-		if not isinstance(n_avisos, int):
-			raise ValueError('"n_avisos" debe de ser int')
+		----------
+		id_usuario: int
+			Identificador asociado al usuario asociado por Telegram
 
-		#	tomar un cursor para insertar datos y preparar semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
+		nombre: str
+			Primer nombre del usuario
 
-		#	Se intentan insertar los datos en la tabla
-		if isinstance(usuarios, int):
-			datos = (id_chat, usuarios, ban, n_avisos)
-		else:
-			datos = [(id_chat, x, ban, n_avisos) for x in usuarios]
+		apellidos: str
+			Segundo nombre o apellidos del usuario
 
+		username: str
+			Nombre de usuario asociado al Usuario en la plataforma
+			de mensajerı́a.
 
-		#	Se inserta cada usuario perteneciente en la tabla
-		self.__log.debug('Insertando los siguientes datos en la '\
-						'tabla Foro_Usuario: ban={}, n_avisos={} para'\
-						' id_chat={} e id_usuario={}'.format(ban, n_avisos,
-														id_chat, usuarios))
-		mutex.acquire()
+		id chat: int
+			Identificador asociado al canal de chat privado de un Usuario
 
-		cursor.execute('INSERT INTO Foro_Usuario VALUES(?,?,?,?);',datos)
+		fecha registro: datetime.datetime
+				Fecha en la que el Usuario fue registrado en su tipo actual.
 
+		tipo: str
+			Tipo de usuario: 'docente' o 'alumno'
 
-		#	Realizar el commit
-		self.__con_bd.commit()
+		valido: bool
+			Indica si el usuario es válido o no. Por defecto True
+		"""
 
-		#	Cerrar el cursor y liberar el semáforo
-		cursor.close()
-		mutex.release()
+		self.__log.debug('Ejecutada función "editUsuario" de "BotServerDAO"')
 
-		self.__log.debug('Fin de ejecución de la función "addUsuarioForo" de '\
-															'"BotServerDAO"')
+		#	Se va a construir la consulta en función de los datos proporcionados
+		datos = []
+		campos = ''
 
-	def editUsuarioForo(self, id_chat: int, usuarios: list or int,
-													ban=None, n_avisos=None):
+		if nombre:
 
-		"""Permite editar los datos del estado de uno o más Usuarios en un Foro.
-			Se deben de proporcionar únicamente los parámetros de los valores
-			que se desean editar e "id_chat" y al menos el id de un usuario
+			if not isinstance(nombre, str):
+				raise ValueError('"nombre" debe ser str')
 
-		Parámetros:
-		----------
-				id_chat: int
-					Id de chat asignado al grupo o supergrupo asociado al foro
-				usuarios: (int o list[int])
-					Ids de los usuarios a registrar en el grupo docente
-				ban: bool
-					Indica si los usuarios se hallan baneados en el grupo o no.
-				n_avisos: int
-					Número de avisos dados a un usuario por el envío de
-							mensajes no pertenecientes al ámbito académico
-		"""
+			datos.append(nombre)
+			campos += 'nombre=?,'
 
-		self.__log.debug('Ejecutada función "editUsuarioForo" de '\
-															'"BotServerDAO"')
+		if apellidos:
 
-		#	Se toma un cursor para editar datos y un semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
+			if not isinstance(apellidos, str):
+				raise ValueError('"apellidos" debe ser str')
 
-		#	Se va a construir la consulta en función de los datos proporcionados
-		datos = []
-		campos = ''
+			datos.append(apellidos)
+			campos += 'apellidos=?,'
 
-		if not isinstance(id_chat, int):
-			raise ValueError('"id_chat" debe ser int')
+		if username:
 
+			if not isinstance(username, str):
+				raise ValueError('"username" debe ser str')
 
-		if isinstance(usuarios, int):
-			usuarios='(%s)' % str(usuarios) # Se convierte en tupla texto
-		elif isinstance(usuarios, list):
+			datos.append(username)
+			campos += 'username=?,'
 
-			#	Se convierte en tupla texto
-			aux = []
+		if id_chat is not None:
 
-			for i in usuarios:
+			if not isinstance(id_chat, int):
+				raise ValueError('"id_chat" debe ser int')
 
-				aux.append(str(i))
+			datos.append(id_chat)
+			campos += 'id_chat=?,'
 
-				if type(i) != int:
-					raise ValueError('"usuarios" contiene un valor que no es int')
+		if fecha_registro:
 
-			usuarios = '('+','.join(aux)+')'
+			if not isinstance(fecha_registro, datetime.datetime):
+				raise ValueError('"fecha_registro" debe ser un objeto de'\
+								' tipo datetime.datetime')
 
-		else:
-			raise ValueError('"usuarios" debe de ser un entero o una lista')
+			datos.append(fecha_registro)
+			campos += 'fecha_registro=?,'
 
-		if ban is not None:
+		if tipo:
 
-			if not isinstance(ban, bool):
-				raise ValueError('"ban" debe ser bool')
+			if not isinstance(tipo, str):
+				raise ValueError('"tipo" debe ser str')
 
-			datos.append(ban)
-			campos += 'ban=?,'
+			tipo = BotServerDAO.__BD_TIPOS['TIPO_USUARIO'][tipo]
 
-		if n_avisos is not None:
+			datos.append(tipo)
+			campos  +=  'tipo=?,'
 
-			if not isinstance(n_avisos, int):
-				raise ValueError('"n_avisos" debe ser int')
+		if valido is not None:
 
-			datos.append(n_avisos)
-			campos += 'n_avisos=?,'
+			if not isinstance(valido, bool):
+				raise ValueError('"valido" debe ser bool')
 
+			datos.append(valido)
+			campos += 'valido=?,'
 
 		if datos:
 			campos = campos[:-1]	#	Borrar coma sobrante
-			datos.append(id_chat)		#	Añadir al usuario
+			datos.append(id_usuario)		#	Añadir al usuario
 		else:
-			# No se ha especificaado ningún campo a modificar y no se hace nada
+			#	No se ha especificaado ningún campo a modificar
 			raise ValueError('Se debe de proporcionar al menos un parámetro')
 
 		#	Se ejecuta la actualización
-		self.__log.debug('Se ejecuta la sentencia de actualización '\
-						'con datos ban={} y n_avisos={} para'\
-						' id_chat={} e id_usuario={}'.format(ban, n_avisos,
-														id_chat, usuarios))
-		mutex.acquire()
-
-		cursor.execute('''UPDATE Foro_Usuario
-								SET %s WHERE id_chat_foro=?
-									AND id_usuario IN %s;''' % (campos,
-																usuarios),
-																tuple(datos))
-
-		self.__con_bd.commit()	#	Realiza el commit
-
-		#	Cerrar cursor y semáforo
-		cursor.close()
-		mutex.release()
+		self.__log.debug('Se ejecuta la sentencia de actualización'\
+						' con datos: id_usuario=%s, nombre=%s, apellidos=%s,'\
+						' username=%s, id_chat=%s, fecha_registro=%s, tipo=%s,'\
+						' valido=%s', id_usuario, nombre, apellidos,
+						username, id_chat, fecha_registro, tipo, valido)
+
+		def operacion(cursor):
+			cursor.execute(('UPDATE Usuario SET %s WHERE id=?' %
+														campos), tuple(datos))
+
+			#	Los datos del usuario también forman parte del listado de
+			#	usuarios de los foros en los que se encuentra
+			self.__invalidate_cache('usuario', id_usuario)
+			self.__invalidate_cache('usuarios_foro', *(fila[0] for fila in
+							cursor.execute('''SELECT id_chat_foro
+												FROM Foro_Usuario
+												WHERE id_usuario=?;''',
+												(id_usuario,))))
+
+		self.__write(operacion)
 
 		self.__log.debug('Actualización realizada con éxito, fin de ejecución'\
-						' de la función "editUsuarioForo" de "BotServerDAO"')
-
+							' de la función "editUsuario" de "BotServerDAO"')
 
-	def removeUsuarioForo(self, id_chat: int, usuarios: list or int):
+	def getForo(self, foro_id: int):
 
-		"""Permite eliminar el estado de uno o más usuarios en un foro docente.
+		"""
+		Permite obtener el foro docente de la base de datos cuyo "id" de foro
+			coincida con el que se ha pasado como argumento.
 
-		Parámetros:
+		Argumentos:
 		-----------
-		id_chat: int
-			Id de chat asignado al grupo o supergrupo asociado al foro
+			foro_id: "Id" del foro por el cual se buscará en la base de datos
 
-		usuarios: (int o list[int])
-			Ids de los usuarios a registrar en el grupo docente
+		Devuelve:
+			dict: Diccionario con los siguientes campos:
+				- id: id asignado al chat del foro
+				- nombre: Nombre asignado al grupo docente
+				- tipo: (str) "usuario_docente" o "usuario_alumno"
+				- valido: True: Si el foro es reconocido como un foro válido
+					(el asistente es administrador en el grupo o supergrupo),
+					False en caso contrario
 		"""
 
-		self.__log.debug('Ejecutada función "removeUsuarioForo" de'\
-															' "BotServerDAO"')
-
-		#	Se toma un cursor para eliminar datos y un semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
+		self.__log.debug('Ejecutada función "getForo" de "BotServerDAO"')
 
-		#	Comprobar que los datos proporcionados sean válidos y prrpararlos
-		if not isinstance(id_chat, int):
-			raise ValueError('"id_chat" debe ser int')
+		#	Comprobar datos de entrada
+		if not isinstance(foro_id, int):
+			raise ValueError('"foro_id" debe ser int')
 
-		if isinstance(usuarios, int):
-			usuarios='(%s)' % str(usuarios) # Se convierte en tupla texto
-		elif isinstance(usuarios, list):
+		#	Consultar primero la caché de foros
+		encontrado, foro, generacion = self.__cache_get('foro', foro_id)
 
-			#	Se convierte en tupla texto
-			aux = []
+		if encontrado:
+			self.__log.debug('Encontrado Foro id=%d en caché', foro_id)
+			self.__log.debug('Finaliza la ejecución de la función "getForo" de'\
+															' "BotServerDAO"')
+			return dict(foro) if foro is not None else None
 
-			for i in usuarios:
+		#	Tomar cursor
+		cursor = self.__read_connection().cursor()
 
-				aux.append(str(i))
+		#	Realizar la consulta
+		self.__log.debug('Realizando consulta con campo id_chat=%d', foro_id)
+		cursor.execute('SELECT * FROM Foro WHERE id_chat=?',(foro_id,))
 
-				if type(i) != int:
-					raise ValueError('"usuarios" contiene un valor'\
-															' que no es int')
+		#	Tomar los datos de la consulta
+		datos = cursor.fetchone()
 
-			usuarios = '('+','.join(aux)+')'
+		#	Cerrar el cursor
+		cursor.close()
 
+		if not datos:
+			self.__log.debug('No encontrado foro id=%d', foro_id)
+			self.__cache_put('foro', foro_id, None, generacion)
+			self.__log.debug('Finaliza la ejecución de la función "getForo" de'
+															' "BotServerDAO"')
+			return None
 		else:
-			raise ValueError('"usuarios" debe de ser un entero o una lista')
-
-		#	Se ejecuta el borrado
-		self.__log.debug('Se ejecuta la sentencia de borrado con datos'\
-						' id_chat=%d y para los usuarios con id en %s' % (
-														id_chat, usuarios))
-		mutex.acquire()
+			self.__log.debug('Encontrado Foro id=%d', foro_id)
 
-		cursor.execute('''DELETE FROM Foro_Usuario
-							WHERE id_chat_foro=?
-							AND id_usuario IN %s;''' % usuarios, (id_chat,))
+			foro = {}
 
-		self.__con_bd.commit()	#	Realiza el commit
+			foro['id'] = datos[0]
+			foro['nombre'] = datos[1]
+			foro['tipo'] = datos[2] #'group' if datos[2] == 0 else 'supergroup'
+			foro['valido'] = datos[3] #bool(datos[3])
 
-		#	Cerrar el cursor y el semáforo
-		cursor.close()
-		mutex.release()
+			self.__cache_put('foro', foro_id, foro, generacion)
 
-		self.__log.debug('Borrado realizada con éxito, fin de ejecución de la'\
-		' función "removeUsuarioForo" de "BotServerDAO"')
+			self.__log.debug('Finaliza la ejecución de la función "getForo" de'\
+															' "BotServerDAO"')
+			return dict(foro)
 
 
-	def addMensaje(self, recibido: bool, id_mensaje_chat: int,
-						id_usuario_emisor_receptor=None, id_chat=None,
-						fecha=None, academico=False,
-						texto=None, multimedia=None,
-						editado=False,
-						id_mensaje_chat_respondido=None,
-						pregunta_formulada=None,
-						pregunta_respondida=False) -> int:
+	def addForo(self, id_chat: int, nombre: str,
+				tipo: str, valido: bool, fecha_creacion: datetime.datetime):
 
-		"""Permite añadir un mensaje a la base de datos.
+		"""
+		Permite añadir un nuevo foro a la base de datos
 
-		Parámetros:
-		recibido: bool
-			Permite determinar si el mensaje fue recibido (True) o
-			enviado (False)
+		Atributos:
+		----------
+			id_chat: (int) Identificador de chat asignado univocamente al grupo
+						o supergrupo asociado al foro
+			nombre: (str) Nombre del grupo o supergrupo asignado al foro docente
+			tipo: (str) "group" si el foro lleva asociado un grupo o
+				"supergroup" si lleva asociado un foro
+			valido: (bool) True si el foro es válido (el asistente es usuario
+					administrador en dicho foro) o False en caso contrario
+		"""
 
-		id mensaje chat: int
-			Identificador asociado por la plataforma de mensajerı́a al Mensaje en
-			el chat en el que se mandó.
+		self.__log.debug('Ejecutada función "addForo" de "BotServerDAO"')
 
-		id_usuario_emisor_receptor: Id del usuario emisor del mensaje o receptor
-			para el caso de los chats privados, en caso contrario dejar a None
+		#	Comprobar que los datos sean válidos
+		if not isinstance(id_chat, int):
+			raise ValueError('"id_chat" debe de ser int')
 
-		id_chat: Id del chat del foro docente al que el mensaje fue enviado
-				o recibido. Para chats privados dejar en None.
+		if not isinstance(nombre, str):
+			raise ValueError('"nombre" debe de ser str')
 
-		fecha: datetime.datetime
-			Fecha en la que el mensaje fue enviado o recibido
+		if not isinstance(tipo, str):
+			raise ValueError('"tipo" debe de ser str')
+		else:
+			tipo = BotServerDAO.__BD_TIPOS['TIPO_FORO'][tipo]
 
-		academico: bool
-			Indica si el mensaje pertenece al ámbito académico o no. Sólo aplica
-			sentido para mensajes recibidos en chats grupales.
-			Por defecto es False
+		if not isinstance(valido, bool):
+			raise ValueError('"valido" debe de ser bool')
 
-		texto: str
-			Contenido del texto que de desea añadir al mensaje.
-			Se puede agregar luego haciendo uso de la función addDato y
-			addDatoTexto
+		if not isinstance(fecha_creacion, datetime.datetime):
+			raise ValueError('"fecha_creacion" debe de ser datetime.datetime')
 
-		multimedia: dict
-			Dato multimedia incluído con el mensaje. Se puede agregar después
-			mediante las funciones addDato y addDatoArchivo
+		#	Se intentan insertar los datos en la tabla
+		datos = (id_chat, nombre, tipo, valido, fecha_creacion)
+		self.__log.debug('Insertando los siguientes datos en la tabla'\
+						' Foro: id_chat=%s, nombre=%s, tipo=%s, valido=%s,'\
+						' fecha_creacion=%s', *datos)
 
-		editado: bool
-			Indica si el mensaje edita a otro mensaje registrado anteriormente.
-			Por defecto es False
+		def operacion(cursor):
+			cursor.execute('INSERT INTO Foro VALUES(?,?,?,?,?);', datos)
+			self.__invalidate_cache('foro', id_chat)
 
-		id_mensaje_chat_respondido: int
-			Identificador de chat del mensaje al cual responde este mensaje
+		self.__write(operacion)
 
-		pregunta_formulada: str
-			Representa la pregunta que ha sido formulada dentro del mensaje
-			(si la hay). Se debe de usar conjuntamente con pregunta_respondida
 
-		pregunta_respondida: bool
-			Indica si la pregunta formulada fue respondida (True) o no, se debe
-			de utilizar conjuntamente con pregunta_formulada
 
-		Devuelve:
-		---------
-			int: Identificador asociado al mensaje
+	def editForo(self, id_chat: int, nombre=None, tipo=None,
+								valido=None,
+								fecha_creacion: datetime.datetime=None):
 
-		"""
+		"""Permite editar los datos de un Foro existente. Únicamente se deben
+			de proporcionar los parámetros de los valores que se desean editar
+			y el "id_chat" del foro que se desea editar:
 
-		self.__log.debug('Iniciada función "addMensaje" de "BotServerDAO"')
+			Parámetros:
+			-----------
+			id_chat: (int) Identificador de chat asignado univocamente al grupo
+						o supergrupo asociado al foro
+			nombre: (str) Nombre del grupo o supergrupo asignado al foro docente
+			tipo: (str) "grupo" si el foro lleva asociado un grupo o
+				"supergrupo" si lleva asociado un supergrupo
+			valido: (bool) True si el foro es válido (el asistente es usuario
+					administrador en dicho foro) o False en caso contrario
 
-		#	Comprobar los datos de entrada
-		if not isinstance(id_mensaje_chat, int):
-			raise ValueError('"id_mensaje_chat" debe de ser int')
+		"""
 
-		if (id_usuario_emisor_receptor and
-								not isinstance(id_usuario_emisor_receptor, int)):
-			raise ValueError('"id_usuario_emisor_receptor" debe de ser int')
+		self.__log.debug('Ejecutada función "editForo" de "BotServerDAO"')
 
-		if id_chat and not isinstance(id_chat, int):
-				raise ValueError('"id_chat" debe de ser int')
+		#	Se va a construir la consulta en función de los datos proporcionados
+		datos = []
+		campos = ''
 
-		if fecha and not isinstance(fecha, datetime.datetime):
-				raise ValueError('"id_chat" debe de ser de tipo'\
-														' "datetime.datetime"')
-		else:
-			fecha = datetime.datetime.now()
+		if nombre:
+			if not isinstance(nombre, str):
+				raise ValueError('"nombre" debe ser str')
 
-		if academico and not isinstance(academico, bool):
-				raise ValueError('"academico" debe ser bool')
+			datos.append(nombre)
+			campos += 'nombre=?,'
 
-		if not isinstance(editado, bool):
-				raise ValueError('"editado" debe de ser bool')
+		if tipo:
 
-		if (id_mensaje_chat_respondido and
-							not isinstance(id_mensaje_chat_respondido, int)):
-				raise ValueError('"id_mensaje_chat_respondido" debe de ser int')
+			if not isinstance(tipo, str) and tipo not in ('grupo','supergrupo'):
+				raise ValueError('"tipo" debe ser str y debe de adoptar los'\
+											' valores "grupo" y "supergrupo"')
 
-		if multimedia:
-			if ('tipo' not in multimedia or
-	not (multimedia['tipo'] in BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO'] or
-					multimedia['tipo'] in ('contacto', 'localizacion'))):
-				raise ValueError('El "tipo" del dato multimedia debe de ser'\
-								' proporcionado o no es válido')
+			datos.append(tipo)
+			campos += 'tipo=?,'
 
-		if pregunta_formulada and not isinstance(pregunta_formulada, str):
-			raise ValueError('"pregunta_formulada" debe de ser str')
+		if valido is not None:
 
-		if pregunta_respondida and not isinstance(pregunta_respondida, bool):
-			raise ValueError('"pregunta_respondida" debe de ser bool')
+			if not isinstance(valido, bool):
+				raise ValueError('"valido" debe ser bool')
 
-		#	Preparar el cursor y el semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
+			datos.append(int(valido))
+			campos += 'valido=?,'
 
-		#	Se ejecutan todas las inserciones
-		self.__log.debug('Ejecutando inserciones')
-		mutex.acquire()
+		if fecha_creacion:
 
-		#	Insertar en Evento
-		cursor.execute('INSERT INTO Evento(fecha) VALUES(?);', (fecha,))
-		id_mensaje = cursor.execute('SELECT last_insert_rowid()').fetchone()[0]
+			if not isinstance(fecha_creacion, datetime.datetime):
+				raise valueError('"fecha_creacion" no es datetime.datetime')
 
-		#	Insertar Mensaje
-		cursor.execute('INSERT INTO Mensaje VALUES(?, ?, ?);',
-						(id_mensaje, id_mensaje_chat, True))
+			datos.append(fecha_creacion)
+			campos += 'fecha_creacion=?,'
 
-		#	Insertar en MensajeRecibidoPublico o MensajeRecibidoPrivado
-		if recibido:
-			if id_chat:
-				cursor.execute(
-						'INSERT INTO MensajeRecibidoPublico VALUES(?,?,?,?);',
-						(id_mensaje, academico, id_usuario_emisor_receptor,
-							id_chat))
-
-				if pregunta_formulada:
-					cursor.execute('''INSERT INTO PreguntaEfectuadaChatGrupal
-										VALUES(?,?,?)''',
-										(id_mensaje, pregunta_formulada,
-										pregunta_respondida))
-			else:
-				cursor.execute('INSERT INTO MensajeRecibidoPrivado VALUES(?,?);',
-									(id_mensaje,  id_usuario_emisor_receptor))
-
-				if pregunta_formulada:
-					cursor.execute('''INSERT INTO PreguntaEfectuadaChatPrivado
-										VALUES(?,?,?)''',
-										(id_mensaje, pregunta_formulada,
-										pregunta_respondida))
+		if datos:
+			campos = campos[:-1]	#	Borrar coma sobrante
+			datos.append(id_chat)	#	Añadir al usuario
 		else:
-			if id_chat:
-				cursor.execute('INSERT INTO MensajeEnviadoPublico VALUES(?,?);',
-							(id_mensaje, id_chat))
-			else:
-				cursor.execute('INSERT INTO MensajeEnviadoPrivado VALUES(?,?);',
-									(id_mensaje,  id_usuario_emisor_receptor))
+			#	No se ha especificaado ningún campo a modificar
+			raise ValueError('Se debe de proporcionar al menos un parámetro')
 
-		#	Registrar la edición de un mensaje
-		if editado:
+		#	Se ejecuta la actualización
+		self.__log.debug('Se ejecuta la sentencia de actualización con datos:'\
+						' id_chat=%s, nombre=%s, tipo=%s, valido=%s,'\
+						' fecha_creacion=%s', id_chat, nombre, tipo,
+													valido, fecha_creacion)
 
-			#	Buscar la id asignada al mensaje referenciado en todos los
-			#	subtipos de Mensaje
-			id_mensaje_editado = cursor.execute(
-							'''SELECT id
-								FROM
-								(SELECT MensajeEnviadoPrivado.id AS id,
-									Evento.fecha AS fecha,
-									id_usuario_destinatario AS id_chat,
-									id_mensaje_chat
-								FROM MensajeEnviadoPrivado, Mensaje, Evento
-								WHERE Mensaje.id=MensajeEnviadoPrivado.id
-								AND Evento.id=Mensaje.id
-								AND id_mensaje_chat=?
-								AND id_chat=?
-								UNION
-								SELECT MensajeEnviadoPublico.id AS id,
-									Evento.fecha AS fecha,
-									id_chat_foro_destino AS id_chat,
-									id_mensaje_chat
-								FROM MensajeEnviadoPublico, Mensaje, Evento
-								WHERE Mensaje.id=MensajeEnviadoPublico.id
-								AND Evento.id=Mensaje.id
-								AND id_mensaje_chat=?
-								AND id_chat=?
-								UNION
-								SELECT MensajeRecibidoPrivado.id AS id,
-									Evento.fecha AS fecha,
-									id_usuario_emisor AS id_chat,
-									id_mensaje_chat
-								FROM MensajeRecibidoPrivado, Mensaje, Evento
-								WHERE Mensaje.id=MensajeRecibidoPrivado.id
-								AND Evento.id=Mensaje.id
-								AND id_mensaje_chat=?
-								AND id_chat=?
-								UNION
-								SELECT MensajeRecibidoPublico.id AS id,
-									Evento.fecha AS fecha,
-									id_chat_foro AS id_chat,
-									id_mensaje_chat
-								FROM MensajeRecibidoPublico, Mensaje, Evento
-								WHERE Mensaje.id=MensajeRecibidoPublico.id
-								AND Evento.id=Mensaje.id
-								AND Mensaje.id_mensaje_chat=?
-								AND id_chat=?
-								ORDER BY fecha
-								)
-								WHERE id <> %d;''' % id_mensaje,
-								(id_mensaje_chat,
-									id_usuario_emisor_receptor,
-								id_mensaje_chat,
-									id_chat,
-								id_mensaje_chat,
-									id_usuario_emisor_receptor,
-								id_mensaje_chat,
-									id_chat)).fetchone()[0]
-
-			cursor.execute('UPDATE Mensaje SET existente=? WHERE id=?',
-							(False, id_mensaje_editado))
-
-			cursor.execute('INSERT INTO Mensaje_Mensaje_Editado VALUES (?,?);',
-							(id_mensaje, id_mensaje_editado))
-
-		#	Registrar la edición de un mensaje
-		if id_mensaje_chat_respondido:
-
-			#	Buscar la id asignada al mensaje referenciado en todos los
-			#	subtipos de Mensaje
-			id_mensaje_respondido = cursor.execute(
-								'''SELECT id
-									FROM
-									(SELECT MensajeEnviadoPrivado.id AS id,
-										id_usuario_destinatario AS id_chat,
-										id_mensaje_chat
-									FROM MensajeEnviadoPrivado, Mensaje
-									WHERE Mensaje.id=MensajeEnviadoPrivado.id
-									AND Mensaje.id_mensaje_chat=?
-									AND id_chat=?
-									AND existente=1
-									UNION
-									SELECT MensajeEnviadoPublico.id AS id,
-										id_chat_foro_destino AS id_chat,
-										id_mensaje_chat
-									FROM MensajeEnviadoPublico, Mensaje
-									WHERE Mensaje.id=MensajeEnviadoPublico.id
-									AND Mensaje.id_mensaje_chat=?
-									AND id_chat=?
-									AND existente=1
-									UNION
-									SELECT MensajeRecibidoPrivado.id AS id,
-										id_usuario_emisor AS id_chat,
-										id_mensaje_chat
-									FROM MensajeRecibidoPrivado, Mensaje
-									WHERE Mensaje.id=MensajeRecibidoPrivado.id
-									AND Mensaje.id_mensaje_chat=?
-									AND id_chat=?
-									AND existente=1
-									UNION
-									SELECT MensajeRecibidoPublico.id AS id,
-										id_chat_foro AS id_chat,
-										id_mensaje_chat
-									FROM MensajeRecibidoPublico, Mensaje
-									WHERE Mensaje.id=MensajeRecibidoPublico.id
-									AND Mensaje.id_mensaje_chat=?
-									AND id_chat=?
-									AND existente=1
-									);''',
-								(id_mensaje_chat_respondido,
-									id_usuario_emisor_receptor,
-								id_mensaje_chat_respondido,
-									id_chat,
-								id_mensaje_chat_respondido,
-									id_usuario_emisor_receptor,
-								id_mensaje_chat_respondido,
-									id_chat)).fetchone()
-
-			if id_mensaje_respondido:
-				id_mensaje_respondido = id_mensaje_respondido[0]
-
-				cursor.execute(
-							'INSERT INTO Mensaje_Mensaje_Editado VALUES (?,?);',
-							(id_mensaje, id_mensaje_respondido))
-
-		# Hacer el commit
-		self.__con_bd.commit()
-
-		#	Insertar el texto
-		if texto:
-			self.addDatoTexto(fecha_creacion=fecha, texto=texto,
-								id_mensaje=id_mensaje, use_mutex=False)
-
-		#	Insertar los datos multimedia
-		if multimedia:
-			if multimedia['tipo'] == 'contacto':
-				self.addDatoContacto(
-	fecha_creacion=fecha,
-	telefono=multimedia['telefono'] if 'telefono' in multimedia else None,
-	nombre=multimedia['nombre'] if 'nombre' in multimedia else None,
-	apellidos=multimedia['apellidos'] if 'apellidos' in multimedia else None,
-	id_usuario=multimedia['id_usuario'] if 'id_usuario' in multimedia else None,
-	vcard=multimedia['vcard'] if 'vcard' in multimedia else None,
-	id_mensaje=id_mensaje, use_mutex=False)
-
-			elif multimedia['tipo'] == 'localizacion':
-				self.addDatoLocalizacion(
-	fecha_creacion=fecha,
-	longitud=multimedia['longitud'] if 'longitud' in multimedia else None,
-	latitud=multimedia['latitud'] if 'latitud' in multimedia else None,
-	titulo=multimedia['titulo'] if 'titulo' in multimedia else None,
-	direccion=multimedia['direccion'] if 'direccion' in multimedia else None,
-	id_cuadrante=multimedia['id_cuadrante'] if 'id_cuadrante' in multimedia else None,
-	tipo_cuadrante=multimedia['tipo_cuadrante'] if 'tipo_cuadrante' in multimedia else None,
-	id_mensaje=id_mensaje, use_mutex=False)
+		def operacion(cursor):
+			self.__invalidate_cache('foro', id_chat)
+			return cursor.execute('UPDATE Foro SET %s WHERE'\
+									' id_chat=?' % (campos), tuple(datos)).rowcount
 
-			else:
-				self.addDatoArchivo(fecha_creacion=fecha,
-	tipo=multimedia['tipo'],
-	ruta_archivo=multimedia['ruta_archivo'] if 'ruta_archivo' in multimedia else None,
-	file_id=multimedia['file_id'] if 'file_id' in multimedia else None,
-	mime_type=multimedia['mime_type'] if 'mime_type' in multimedia else None,
-	sticker_emoji=multimedia['sticker_emoji'] if 'sticker_emoji' in multimedia else None,
-	sticker_conjunto=multimedia['sticker_conjunto'] if 'sticker_conjunto' in multimedia else None,
-	sticker_tipo=multimedia['sticker_tipo'] if 'sticker_tipo' in multimedia else None,
-	use_mutex=False)
-
-		#	Cerrar el cursor y el semáforo
-		cursor.close()
-		mutex.release()
+		actualizacion = self.__write(operacion)
 
-		self.__log.debug('Finalizada función "addMensaje" de "BotServerDAO"')
-		return id_mensaje
+		return actualizacion
 
-	def addMensajeRespuesta(self, id_mensaje: int,
-							pregunta: str,
-							respondido: bool):
+	def removeForo(self, id_chat: int):
 
-		"""Permite registrar una pregunta respondida o no en un mensaje que
-			la contiene
+		"""Permite eliminar un Foro de la base de datos
 
-		Atributos:
-		----------
+		Parámetros:
+		-----------
+		id_chat: int
+			Identificador del foro que se desea eliminar
 
-		id_mensaje: int
-			Identificador del mensaje al cual se desea añadir la preguta
-			(no se debe de confundir con el id de chat del mensaje)
+		"""
+		self.__log.debug('Ejecutada función "removeForo" de "BotServerDAO"')
 
-		pregunta_formulada: str
-			Representa la pregunta que ha sido formulada dentro del mensaje
-			(si la hay). Se debe de usar conjuntamente con pregunta_respondida
+		#	Comprobar que los datos proporcionados sean válidos y prepararlos
+		if type(id_chat) != int:
+			raise ValueError('"id_chat" debe ser int')
 
-		pregunta_respondida: bool
-			Indica si la pregunta formulada fue respondida (True) o no, se debe
-			de utilizar conjuntamente con pregunta_formulada
+		#	Se ejecuta el borrado
+		self.__log.debug('Se ejecuta la sentencia de borrado con datos'\
+							' id_chat=%d', id_chat)
+
+		def operacion(cursor):
+			cursor.execute('DELETE FROM Foro WHERE id_chat=?;', (id_chat,))
+			self.__invalidate_cache('foro', id_chat)
+			self.__invalidate_cache('usuarios_foro', id_chat)
+			self.__invalidate_cache_foro('usuario_foro', id_chat)
+
+		self.__write(operacion)
+
+
+	def listForos(self, solo_validos=True):
+
+		"""Permite listar todos los foros almacenados
+
+		Argumentos:
+		-----------
+		solo_validos: bool
+			Establece si en el listado sólo deben de aparecer los foros válidos
+			(True) o todos (False)
+
+		Devuelve:
+		---------
+		dict: Que consta del par id (int) - foro (dict)
+			"foro" es a su vez un diccionario con los siguientes datos:
+			- nombre: str
+				Nombre o tı́tulo de grupo asociado al Foro.
+			- tipo: str
+				Tipo de chat grupal asociado al Foro y que puede ser:
+				grupo o supergrupo.
+			- fecha_registro: datetime.datetime
+				Fecha en la que el foro fue registrado en el sistema en
+				su tipo actual
+			- valido: bool
+				Indica si el foro es válido (True) o no (False)
 		"""
 
-		self.__log.debug('Iniciada función "addMensajeRespuesta" de "BotServerDAO"')
+		self.__log.debug('Ejecutada función "listForos" de "BotServerDAO"')
 
-		#	Comprobar los datos de entrada
-		if not isinstance(id_mensaje, int):
-			raise ValueError('"id_mensaje" debe de ser int')
+		#	Obtener cursor
+		cursor = self.__read_connection().cursor()
 
-		if not isinstance(pregunta, str):
-			raise ValueError('"pregunta" debe de ser str')
+		datos = {}
 
-		if not isinstance(respondido, bool):
-			raise ValueError('"respondido" debe de ser bool')
+		#	Realizar la consulta
+		for fila in cursor.execute('SELECT * FROM Foro WHERE valido=1 OR ?=0;',
+														(bool(solo_validos),)):
 
-		#	Tomar cursor y preparar semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
+			#self.__log.debug('Encontrado Foro id=%d', fila[0])
 
-		#	Ejecutar las inserciones
-		self.__log.debug('Insertando valores: pregunta=%s y '\
-							'respondido=%s para id_mensaje=%d' % (pregunta,
-																	respondido,
-																	id_mensaje))
-		mutex.acquire()
+			foro = {}
 
-		cursor.execute('''INSERT INTO PreguntaEfectuadaChatGrupal
-							SELECT ?, ?, ?
-							WHERE EXISTS
-							(SELECT id FROM MensajeRecibidoPublico
-								WHERE id=?);''',
-								(id_mensaje, pregunta, respondido, id_mensaje))
+			foro['nombre'] = fila[1]
+			foro['tipo'] = fila[2] #'group' if fila[2] == 0 else 'supergroup'
+			foro['valido'] = fila[3]
+			foro['fecha_creacion'] = fila[4]
 
-		#	Realizar el commit
-		self.__con_bd.commit()
+			#	Añadir el foro encontrado
+			datos[fila[0]] = foro
 
-		#	Cerrar cursor y liberar semáforo
+		#	Cerrar el cursor
 		cursor.close()
-		mutex.release()
 
-		self.__log.debug('Finalizada función "addMensajeRespuesta" de "BotServerDAO"')
+		if not datos:
+			self.__log.debug('No se ha encontrado ningún foro docente')
+			datos = None
+		else:
+			self.__log.debug('Se ha encontrado %d foros', len(datos))
 
-	def addEventoChatGrupal(self, tipo: str, id_usuario: int, id_chat: int,
-							fecha: datetime.datetime) -> int:
+		self.__log.debug('Finalizada función "listForos" de "BotServerDAO"')
 
-		"""Permite registrar un evento de chat grupal
+		return datos
 
-		Atributos:
-		----------
+	def getUsuario_status_Foro(self, id_chat: int, id_usuario: int):
 
-		tipo: str
-			Tipo de evento acontencido, se permiten los siguientes valores:
-			"entrada", "salida", "registro", "ban", "readmision" y "expulsion"
+		"""Permite obtener información sobre el estado en un
+			determinado Foro
 
-		id_usuario: int
-			Identificador del usuario implicado en el suceso del registro
+			Parámetros:
+			-----------
+			id_chat: int
+				Identificador de chat asociado al chat grupal del foro docente
 
-		id_chat: int
-			Identificador del foro docente asociado al evento
+			id_usuario: int
+				Identificador asociado al usuario
 
-		fecha: datetime.datetime
-			Fecha en la que se produce el evento
+			Devuelve:
+			---------
+				RegistroEstadoForo: Registro accesible como diccionario con
+					los siguientes campos:
+					- ban: bool
+						Indica si el usuario está baneado o no
 
-		Devuelve:
-		---------
-			int: Identificador del evento almacenado
+					- n_avisos: int
+						Indica el número de avisos que lleva acumulado el
+						usuario por el envío de mensajes no pertenecientes al
+						ámbito académico
 		"""
 
-		self.__log.debug('Iniciada función "addEventoChatGrupal" de '\
-							'"BotServerDAO"')
+		self.__log.debug('Ejecutada función "getUsuario_status_Foro" de'\
+							' "BotServerDAO"')
 
-		#	Comprobar los datos de entrada
-		if not isinstance(tipo, str):
-			raise ValueError('"tipo" debe de ser str')
-		else:
-			tipo = BotServerDAO.__BD_TIPOS['TIPO_EVENTO_CHAT_GRUPAL'][tipo]
+		#	Se comprueban que los datos sean válidos
+		if not isinstance(id_chat, int):
+			raise ValueError('"id_chat" debe de ser int')
 
 		if not isinstance(id_usuario, int):
 			raise ValueError('"id_usuario" debe de ser int')
 
-		if not isinstance(id_chat, int):
-			raise ValueError('"id_chat" debe de ser int')
+		#	Consultar primero la caché de estados
+		encontrado, status, generacion = self.__cache_get('usuario_foro',
+														(id_chat, id_usuario))
 
-		if not isinstance(fecha, datetime.datetime):
-			raise ValueError('"fecha" debe de ser objeto de '\
-								'tipo datetime.datetime')
+		if encontrado:
+			self.__log.debug('Finaliza la ejecución de la función '\
+								'"getUsuario_status_Foro" de "BotServerDAO"')
+			return status.copy() if status is not None else None
 
-		#	Tomar cursor y semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
+		#	Tomar cursor
+		cursor = self.__read_connection().cursor()
 
-		#	Realizar inserciones
-		self.__log.debug('Insertando valores: tipo=%s, '\
-							'id_usuario=%d, id_chat=%d y fecha=%s' % (
-											tipo, id_usuario, id_chat, fecha))
-		mutex.acquire()
+		#	Realizar la consulta
+		self.__log.debug('Realizando consulta con campo id_chat=%d e '\
+									'id_usuario=%d', id_chat, id_usuario)
+		cursor.execute('''SELECT ban, n_avisos
+							FROM Foro_Usuario
+							WHERE id_chat_foro=? AND id_usuario=?''',
+							(id_chat, id_usuario))
 
-		cursor.execute('INSERT INTO Evento(fecha) VALUES (?)', (fecha,))
-		id_evento = cursor.execute('SELECT last_insert_rowid();').fetchone()[0]
+		#	Tomar los datos de la consulta
+		datos = cursor.fetchone()
 
-		cursor.execute('INSERT INTO EventoChatGrupal VALUES (?,?,?,?);',
-						(id_evento, tipo, id_usuario, id_chat))
+		#	Cerrar el cursor
+		cursor.close()
 
-		#	Realizar commit
-		self.__con_bd.commit()
+		if datos == None:
+			self.__log.debug('No encontrado al usuario con id=%d en el foro'\
+										' con id=%d', id_chat, id_usuario)
+			self.__log.debug('Finaliza la ejecución de la función '\
+								'"getUsuario_status_Foro" de "BotServerDAO"')
+			status = None
+		else:
+			self.__log.debug('Encontrado al usuario con id=%d en el foro'\
+										' con id=%d', id_chat, id_usuario)
+			status = RegistroEstadoForo(bool(datos[0]), datos[1])
 
-		#	Cerrar cursor y semáforo
-		cursor.close()
-		mutex.release()
 
-		self.__log.debug('Finalizada función "addEventoChatGrupal" de "BotServerDAO"')
-		return id_evento
+			self.__log.debug('Finaliza la ejecución de la función '\
+								'"getUsuario_status_Foro" de "BotServerDAO"')
 
-	def addComunicado(self,
-						fecha_envio: datetime.datetime,
-						id_docente_emisor: int,
-						ids_chat_foro: list or int) -> int:
+		self.__cache_put('usuario_foro', (id_chat, id_usuario), status,
+																	generacion)
 
-		"""Permite registrar un Comunicado pendiente de envío en la base
-			de datos
+		return status.copy() if status is not None else None
 
-		Atributos:
-		----------
+	def listUsuarios_in_Foro(self, id_chat: int, solo_alumnos=False,
+															solo_valido=True):
 
-		fecha_envio: datetime.datetime
-			Fecha en la que se enviará el comunicado
+		"""Permite obtener información sobre todos los usuarios presentes en un
+			foro además de información sobre su status
 
-		id_docente_emisor: int
-			Identificador de Usuario del usuario docente que solicitó el envío
-			del Comunicado
+		Parámetros:
+		-----------
 
-		id_chat_foro: list o int
-			Identificadores de los chats de los foros docentes a los cuales
-			va dirigido el comunicado
+			id_chat: int
+				Identificador de chat asociado al chat grupal del foro docente
+
+			solo_alumnos: bool
+				Indica si sólo se desean listar los alumnos (True) o también
+				los docentes
 
 		Devuelve:
 		---------
-			int: Identificador del Comunicado
-		"""
+			dict: Formado por el par id_usuario (int) - datos
+				(RegistroUsuario). Por su parte, los datos incluídos en el
+				registro presentan los siguientes campos:
+				- id_usuario: int
+					Identificador asociado al usuario asociado por Telegram
 
-		self.__log.debug('Iniciada función "addComunicado" de "BotServerDAO"')
+				- nombre: str
+					Primer nombre del usuario
 
-		#	Comprobar y procesar los parámetros de entrada
-		if not isinstance(fecha_envio, datetime.datetime):
-			raise ValueError('"fecha_envio" debe de ser objeto de tipo '\
-															'datetime.datetime')
+				- apellidos: str
+					Segundo nombre o apellidos del usuario
 
+				- username: str
+					Nombre de usuario asociado al Usuario en la plataforma
+					de mensajerı́a.
 
-		if not isinstance(id_docente_emisor, int):
-			raise ValueError('"id_docente_emisor" debe de ser int')
+				- telegram_user: Telegram.user
+					Usuario Telegram con los datos del usuario
 
+				- id chat: int
+					Identificador asociado al canal de chat privado
+						de un Usuario
 
-		if isinstance(ids_chat_foro, list):
+				- fecha registro: datetime.datetime
+						Fecha en la que el Usuario fue registrado en
+						su tipo actual.
 
-			for id_chat_foro in ids_chat_foro:
-				if type(id_chat_foro) != int:
-					raise ValueError('"ids_chat_foro" contiene algún valor '\
-																'que no es int')
+				- ban: bool
+					Indica si el usuario está baneado o no
 
-		elif type(ids_chat_foro) == int:
-			ids_chat_foro = [ids_chat_foro]
+				- n_avisos: int
+					Indica el número de avisos que lleva acumulado el
+					usuario por el envío de mensajes no pertenecientes al
+					ámbito académico
+		"""
 
-		else:
-			raise ValueError('"ids_chat_foro" debe de ser un int o lista de int')
+		self.__log.debug('Ejecutada función "listUsuarios_in_Foro" '\
+							'de "BotServerDAO"')
 
-		#	Obtener el cursor y preparar semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
+		#	Se comprueban que los datos sean válidos
+		if not isinstance(id_chat, int):
+			raise ValueError('"id_chat" debe de ser int')
 
-		#	Ejecutar las inserciones
-		mutex.acquire()
+		#	Consultar primero la caché, que almacena todos los usuarios del
+		#	foro sin filtrar
+		encontrado, datos, generacion = self.__cache_get('usuarios_foro',
+																	id_chat)
 
-		datos = (fecha_envio, id_docente_emisor)
-		self.__log.debug('Insertando valores fecha_envio={}, '\
-						'id_docente_emisor={} y con id_chat_foro en {}'.format(
-						fecha_envio, id_docente_emisor, ids_chat_foro))
+		if not encontrado:
+			datos = self.__query_usuarios_in_foro(id_chat)
+			self.__cache_put('usuarios_foro', id_chat, datos, generacion)
 
-		cursor.execute('''INSERT INTO
-							Comunicado(fecha_envio, id_docente)
-							VALUES (?,?);''',
-							datos)
+		#	Filtrar los usuarios solicitados
+		datos = {id_usuario: usuario.copy()
+					for id_usuario, usuario in datos.items()
+					if (usuario['valido'] or not solo_valido) and
+						(usuario['tipo'] == 'alumno' or not solo_alumnos)}
 
-		id_comunicado = cursor.execute('SELECT last_insert_rowid();').fetchone()[0]
+		if not datos:
+			self.__log.debug('No encontrado ningún usuario en el '\
+													'foro con id=%d', id_chat)
+			self.__log.debug('Finaliza la ejecución de la función '\
+									'"listUsuarios_in_Foro" de "BotServerDAO"')
+			return None
+		else:
+			self.__log.debug('Finaliza la ejecución de la función '\
+									'"listUsuarios_in_Foro" de "BotServerDAO"')
+			return datos
 
-		for id_chat_foro in ids_chat_foro:
-			#	Se registran todos los foros a los que va dirigido el Comunicado
-			datos = (id_comunicado, id_chat_foro)
-			cursor.execute('INSERT INTO Comunicado_Foro VALUES(?,?);', datos)
+	def __query_usuarios_in_foro(self, id_chat: int):
 
-		#	Realizar commit
-		self.__con_bd.commit()
+		"""Consulta en la base de datos todos los usuarios de un foro, sean
+		válidos o no, junto con su estado en el foro
 
-		#	Cerrar el cursor y liberar semáforo
-		cursor.close()
-		mutex.release()
+		Devuelve:
+		---------
+			dict: Formado por el par id_usuario (int) - datos (dict), con los
+				mismos campos que "listUsuarios_in_Foro"
+		"""
 
-		self.__log.debug('Finalizada función "addComunicado" de "BotServerDAO"')
+		#	Tomar el cursor
+		cursor = self.__read_connection().cursor()
 
-		return id_comunicado
+		#	Realizar la consulta
+		self.__log.debug('Realizando consulta con campo id_chat=%d', id_chat)
 
-	def listComunicados(self) -> OrderedDict:
+		consulta = cursor.execute(
+					'''SELECT Usuario.id, Usuario.nombre, Usuario.apellidos,
+							Usuario.username, Usuario.id_chat,
+							Usuario.fecha_registro, Usuario.tipo, Usuario.valido,
+							Foro_Usuario.ban, Foro_Usuario.n_avisos
+						FROM Usuario, Foro_Usuario
+						WHERE Usuario.id = Foro_Usuario.id_usuario AND
+							Foro_Usuario.id_chat_foro=?;''', (id_chat,))
 
-		"""Permite listar todos los Comunicados pendientes de envío
+		datos = {}	#	Guardar los datos recuperados en este diccionario
 
-		Devuelve:
-		---------
-			OrderedDict, None
-				Diccionario con el par id_comunicado (int)-datos (dict)
+		for fila in consulta:
 
-			datos constituye a su vez un diccionario con los siguientes campos:
-			- fecha_envio: datetime.datetime
-				Fecha de envío del Comunicado
+			#	Se añade el usuario a los datos
+			datos[fila[0]] = RegistroUsuario(*fila)
 
-			- docente_emisor: str
-				Nombre completo del Uuario docente que lo programó
+		self.__log.debug('Encontrados %d usuarios en el foro con id=%d',
+															len(datos), id_chat)
 
-			- foros: dict
-				Dicionario con el par: id_chat (int) - nombre_foro (str)
-		"""
+		#	Cerrar el cursor
+		cursor.close()
 
-		self.__log.debug('Iniciada función "listComunicados" de "BotServerDAO"')
+		return datos
 
-		#	Obtener cursor y semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
+	def existsUsuarioAnyForo(self, id_usuario: int):
 
-		#	Realizar consulta
-		self.__log.debug('Realizando consulta')
-		mutex.acquire()
+		"""Permite conocer si un usuario se halla registardo en al menos,
+			un foro docente
 
-		consulta = cursor.execute(
-						'''SELECT Comunicado.id, Comunicado.fecha_envio,
-								CASE Usuario.apellidos
-									WHEN NULL THEN Usuario.nombre
-									ELSE Usuario.nombre||\' \'||Usuario.apellidos
-									END,
-								Foro.id_chat, Foro.nombre
-							FROM Comunicado, Comunicado_Foro, Foro, Usuario
-							WHERE Comunicado.id=Comunicado_Foro.id_comunicado
-									AND Comunicado_Foro.id_chat_foro=Foro.id_chat
-									AND COmunicado.id_docente=Usuario.id
-							GROUP BY Comunicado.id;''')
+		Argumentos:
+		-----------
+		id_usuario: int
+			Identificador del usuario al cual se desea aplicar la comprobación
 
-		comunicados = {}
+		Devuelve:
+		---------
+			bool. True si el usuario se encuentra en al menos un foro docente
+					o False en caso contrario
+		"""
 
-		for fila in consulta:
+		self.__log.debug('Ejecutada función "existsUsuarioAnyForo" de'\
+															' "BotServerDAO"')
 
-			#	Añadir los datos de cada comunicado diferente en el diccionario
-			if fila[0] not in comunicados:
-				comunicados[fila[0]] = {
-										'fecha_envio': fila[1],
-										'docente_emisor': fila[2],
-										'foros': {}
-									}
-									#	'anclar': fila[2],
-			#	Añadir cada foro docente en el que se halle registrado
-			comunicados[fila[0]]['foros'][fila[3]] = fila[4]
+		#	Se comprueban que los datos sean válidos
+		if not isinstance(id_usuario, int):
+			raise ValueError('"id_usuario" debe de ser int')
 
-		#	Cerrar cursor y liberar semáforo
-		cursor.close()
-		mutex.release()
+		#	Tomar el cursor
+		cursor = self.__read_connection().cursor()
 
-		self.__log.debug('Finalizada función "listComunicados" de "BotServerDAO"')
+		#	Ejecutar consulta
+		self.__log.debug('Ejecutando consulta con id_usuario = %d', id_usuario)
 
+		existe = bool(cursor.execute(
+						'SELECT * FROM Foro_Usuario WHERE id_usuario=? LIMIT 1',
+													(id_usuario,)).fetchone())
 
-		return comunicados if comunicados else None
 
-	def getComunicado(self, id_comunicado: int):
+		#	Cerrar el cursor
+		cursor.close()
 
-		"""Permite obtener los datos y el contenido de un Comunicado
+		self.__log.debug('Finalziada función "existsUsuarioAnyForo" de'\
+															' "BotServerDAO"')
 
-		Recibe:
-		-------
-		id_comunicado: int
-			Identificador del Comunicado cuya infromación se desea obtener
+		return existe
 
-		Devuelve:
-			dict: Compuesto por lo siguiente:
-			- fecha_envio: datetime.datetime
-				Fecha de envío del Comunicado
+	def addUsuarioForo(self, id_chat: int, usuarios, ban=False, n_avisos=0):
 
-			- docente_emisor: str
-				Nombre completo del Uuario docente que lo programó
+		"""
+		Permite registrar uno o más usuarios en un foro
 
-			- datos: OrderedDict
-				Diccionario ordenado que consta del par:
-				id_dato (int) - dato (dict)
+		Parámetros:
+		-----------
+		id_chat: int
+			Id de chat asignado al grupo o supergrupo asociado al foro
+		usuarios: (int o list[int])
+			Ids de los usuarios a registrar en el grupo docente
+		ban: bool
+			Indica si los usuarios se hallan baneados en el grupo o no.
+		n_avisos: int
+			Número de avisos dados a un usuario por el envío de
+					mensajes no pertenecientes al ámbito académico
+		"""
 
-			En concreto, datos puede presentar los siguientes formatos
+		self.__log.debug('Ejecutada función "addUsuarioForo" de "BotServerDAO"')
 
-			Para tipo texto:
+		#	Comprobar que los datos sean válidos
+		if not isinstance(id_chat, int):
+			raise ValueError('"id_chat" debe de ser int')
 
-			·tipo_dato: 'texto'
-			·contenido: str o list str
-			 	Texto o textos a almacenar
+		if isinstance(usuarios, int):
+			usuarios = [usuarios]
+		elif isinstance(usuarios, list):
 
-			Para tipo Multimedia con Archivo:
+			for i in usuarios:
+				if type(i) != int:
+					raise ValueError('"usuarios" contiene un valor que no es int')
 
-			·tipo_dato: str
-				Tipo de Dato Multimedia almacenado: Puede adoptar los valores
-				'imagen', 'audio', 'video'. 'nota_voz', 'nota_video',
-				'documento','animacion' y 'sticker'
+		else:
+			raise ValueError('"usuarios" debe de ser int o una lista de int')
 
-			contenido: str o None
-				Ruta en el sistema de ficheros en la que el servidor ha
-				almacenado el Archivo.
+		if not isinstance(ban, bool):
+			raise ValueError('"ban" debe de ser bool')
 
-			·mime type: str o None
-				Valor del encabezado Mime asociado al archivo
+		if not isinstance(n_avisos, int):
+			raise ValueError('"n_avisos" debe de ser int')
 
-			·file id: int o None
-				Identificador de archivo asociado por la plataforma de
-				mensajerı́a a dicho Archivo.
+		#	Se intentan insertar los datos en la tabla
+		datos = [(id_chat, x, ban, n_avisos) for x in usuarios]
 
-			·sticker_emoji: str o None
-				emoji asociado al Sticker. Sólo para stickers
-				Parámetro opcional
+		#	Se inserta cada usuario perteneciente en la tabla
+		self.__log.debug('Insertando los siguientes datos en la '\
+						'tabla Foro_Usuario: ban=%s, n_avisos=%s para'\
+						' id_chat=%s e id_usuario=%s', ban, n_avisos,
+														id_chat, usuarios)
 
-			·sticker_conjunto: str o None
-				Nombre del conjunto al que pertenece el Sticker.
-				Sólo para stickers
-				Parámetro opcional
+		#	Todos los usuarios se insertan en una misma transacción
+		def operacion(cursor):
+			cursor.executemany('INSERT INTO Foro_Usuario VALUES(?,?,?,?);',
+																		datos)
+			self.__invalidate_cache('usuario_foro', *((id_chat, id_usuario)
+													for id_usuario in usuarios))
+			self.__invalidate_cache('usuarios_foro', id_chat)
 
-			·sticker_tipo: str o None
-				Tipo de sticker, puede adoptar dos valores: normal o animado.
-				Sólo para stickers.
-				Parámetro opcional
-				NOTA: Actualmente en desuso
+		self.__write(operacion)
 
-			Para tipo Contacto:
+		self.__log.debug('Fin de ejecución de la función "addUsuarioForo" de '\
+															'"BotServerDAO"')
 
-			·tipo_dato: 'contacto'
+	def registerUsuariosForo(self, id_chat: int, usuarios: list,
+											fecha: datetime.datetime) -> list:
 
-			·nombre: str
-				Nombre o primer nombre asociado al Contacto.
+		"""
+		Permite registrar a uno o más usuarios en un foro en una única
+		transacción: registra como alumnos a los usuarios que no existan,
+		hace válidos a los usuarios existentes que no lo sean, inscribe en el
+		foro a los que no estuvieran inscritos y registra un evento de chat
+		grupal de "registro" por cada nueva inscripción
 
-			·apellidos: str o None
-				Nombre o segundo nombre asociado al Contacto.
-				Parámetro opcional
+		Parámetros:
+		-----------
+		id_chat: int
+			Id de chat asignado al grupo o supergrupo asociado al foro
 
-			·telefono: str
-				Número de teléfono asociado al Contacto.
+		usuarios: list de tuple(int, str, str, str)
+			Identificador, nombre, apellidos y username de cada usuario
 
-			·vcard: str o None
-				Datos recogidos en la vcard asociada al Contacto.
-				Parámetro opcional
+		fecha: datetime.datetime
+			Fecha de registro de los nuevos usuarios y de los eventos
 
-			·id_usuario: int o None
-				Identificador de usuario asociado por la plataforma de
-				mensajerı́a al usuario asociado al Contacto.
-				Parámetro opcional
+		Devuelve:
+		---------
+			list de int: Identificadores de los usuarios inscritos en el foro
+				por esta operación
+		"""
 
-			Para tipo Localizacion y Avenida:
+		self.__log.debug('Iniciada función "registerUsuariosForo" de '\
+															'"BotServerDAO"')
 
-			·tipo_dato: 'localizacion'
+		#	Comprobar que los datos sean válidos
+		if not isinstance(id_chat, int):
+			raise ValueError('"id_chat" debe de ser int')
 
-			·latitud: int
-				Latitud geográfica de la Localizacion o Avenida.
+		if not isinstance(usuarios, list):
+			raise ValueError('"usuarios" debe de ser una lista')
 
-			·longitud: int
-				Longitud geográfica de la Localizacion o Avenida
+		for usuario in usuarios:
+			if (not isinstance(usuario, tuple) or len(usuario) != 4 or
+												type(usuario[0]) != int):
+				raise ValueError('"usuarios" debe de contener tuplas con '\
+									'id (int), nombre, apellidos y username')
 
-			·titulo: str o None
-				Tı́tulo que recibe la Avenida localizada en la Localizacion.
-				Parámetro opcional
+		if not isinstance(fecha, datetime.datetime):
+			raise ValueError('"fecha" debe de ser objeto de '\
+								'tipo datetime.datetime')
 
-			·direccion: str o None
-				Direccion de la avenida localizada en la Localizacion.
-				Parámetro opcional
+		#	Identificadores de los usuarios sin repetir
+		ids_usuarios = list(OrderedDict.fromkeys(u[0] for u in usuarios))
+		tipo_alumno = BotServerDAO.__BD_TIPOS['TIPO_USUARIO']['alumno']
+
+		self.__log.debug('Registrando en el foro con id=%d a los usuarios con'\
+											' id en %s', id_chat, ids_usuarios)
+
+		def operacion(cursor):
+
+			#	Registrar a los usuarios que no existan y hacer válidos al
+			#	resto. Los datos de los usuarios existentes no se modifican
+			cursor.executemany('''INSERT INTO Usuario VALUES(?,?,?,?,?,?,?,?)
+									ON CONFLICT(id) DO UPDATE SET valido=1
+									WHERE Usuario.valido=0;''',
+								[(id_usuario, nombre, apellidos, username,
+									id_usuario, fecha, tipo_alumno, True)
+								for id_usuario, nombre, apellidos, username
+																in usuarios])
+
+			#	Inscribir a los usuarios que no estuvieran inscritos
+			existentes = {fila[0] for fila in cursor.execute(
+									'''SELECT id_usuario FROM Foro_Usuario
+										WHERE id_chat_foro=? AND id_usuario IN
+										(SELECT value FROM json_each(?));''',
+						(id_chat, BotServerDAO.__to_json_array(ids_usuarios)))}
+
+			nuevos = [x for x in ids_usuarios if x not in existentes]
+
+			cursor.executemany('INSERT INTO Foro_Usuario VALUES(?,?,?,?);',
+								[(id_chat, x, False, 0) for x in nuevos])
+
+			self.__insert_eventos_chat_grupal(cursor,
+							BotServerDAO.__BD_TIPOS['TIPO_EVENTO_CHAT_GRUPAL']
+							['registro'], nuevos, id_chat, fecha)
+
+			#	La validez de los usuarios forma parte del listado de usuarios
+			#	de todos los foros en los que se encuentran
+			self.__invalidate_cache('usuario', *ids_usuarios)
+			self.__invalidate_cache('usuario_foro', *((id_chat, x)
+															for x in nuevos))
+			self.__invalidate_cache('usuarios_foro', *(fila[0] for fila in
+							cursor.execute('''SELECT DISTINCT id_chat_foro
+										FROM Foro_Usuario WHERE id_usuario IN
+										(SELECT value FROM json_each(?));''',
+							(BotServerDAO.__to_json_array(ids_usuarios),))))
+
+			return nuevos
+
+		nuevos = self.__write(operacion)
+
+		self.__log.debug('Finalizada función "registerUsuariosForo" de '\
+															'"BotServerDAO"')
+		return nuevos
 
-			·id cuadrante: int o None
-				Identificador del cuadrante asociado a la avenida localizada en la
-				Localizacion. Parámetro opcional
+	def editUsuarioForo(self, id_chat: int, usuarios: list or int,
+													ban=None, n_avisos=None):
 
-			·tipo cuadrante: str o None
-				Tipo de cuadrante asociado a la avenida localizada en la
-				Localizacion.
-				Parámetro opcional
+		"""Permite editar los datos del estado de uno o más Usuarios en un Foro.
+			Se deben de proporcionar únicamente los parámetros de los valores
+			que se desean editar e "id_chat" y al menos el id de un usuario
 
-			- foros: dict
-				Dicionario con el par: id_chat (int) - nombre_foro (str)
+		Parámetros:
+		----------
+				id_chat: int
+					Id de chat asignado al grupo o supergrupo asociado al foro
+				usuarios: (int o list[int])
+					Ids de los usuarios a registrar en el grupo docente
+				ban: bool
+					Indica si los usuarios se hallan baneados en el grupo o no.
+				n_avisos: int
+					Número de avisos dados a un usuario por el envío de
+							mensajes no pertenecientes al ámbito académico
 		"""
 
-		self.__log.debug('Iniciada función "getComunicado" de "BotServerDAO"')
+		self.__log.debug('Ejecutada función "editUsuarioForo" de '\
+															'"BotServerDAO"')
 
-		#	Comprobar y procesar los parámetros de entrada
-		if not isinstance(id_comunicado, int):
-			raise ValueError('"id_comunicado" no es int')
+		if not isinstance(id_chat, int):
+			raise ValueError('"id_chat" debe ser int')
 
-		#	Tomar cursor y semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
+		if isinstance(usuarios, int):
+			usuarios = [usuarios]
+		elif isinstance(usuarios, list):
 
-		#	Realizar consulta
-		self.__log.debug('Realizando consulta con id_comunicado=%d' % id_comunicado)
-		mutex.acquire()
+			for i in usuarios:
+				if type(i) != int:
+					raise ValueError('"usuarios" contiene un valor que no es int')
 
-		cursor.execute('''SELECT fecha_envio, id_docente
-							FROM Comunicado
-							WHERE id=?''', (id_comunicado,))
-		datos = cursor.fetchone()
+		else:
+			raise ValueError('"usuarios" debe de ser un entero o una lista')
 
-		#if not datos:
-		#	return None
+		if ban is not None and not isinstance(ban, bool):
+			raise ValueError('"ban" debe ser bool')
 
-		comunicado = {
-						'fecha_envio': datos[0],
-						'docente_emisor': datos[1]
-					}
+		if n_avisos is not None and not isinstance(n_avisos, int):
+			raise ValueError('"n_avisos" debe ser int')
 
-		#	Tomar los textos
-		comunicado['datos'] = OrderedDict()
+		if ban is None and n_avisos is None:
+			# No se ha especificaado ningún campo a modificar y no se hace nada
+			raise ValueError('Se debe de proporcionar al menos un parámetro')
 
-		consulta = cursor.execute(
-						'''SELECT
-							DatoTextoMultimedia.id AS id_dato,
-							DatoTextoMultimedia.fecha_creacion AS fecha_creacion,
-							DatoTextoMultimedia.tipo AS
-												"tipo_dato [TIPO_DATOARCHIVO]",
-							DatoTextoMultimedia.contenido AS contenido,
-							DatoTextoMultimedia.file_id AS file_id,
-							DatoTextoMultimedia.mime_type AS mime_type,
-							DatoTextoMultimedia.sticker_emoji AS sticker_emoji,
+		#	Se ejecuta la actualización
+		self.__log.debug('Se ejecuta la sentencia de actualización '\
+						'con datos ban=%s y n_avisos=%s para'\
+						' id_chat=%s e id_usuario=%s', ban, n_avisos,
+														id_chat, usuarios)
+
+		def operacion(cursor):
+			#	Los campos no proporcionados conservan su valor
+			cursor.execute('''UPDATE Foro_Usuario
+									SET ban=COALESCE(?, ban),
+										n_avisos=COALESCE(?, n_avisos)
+									WHERE id_chat_foro=?
+										AND id_usuario IN
+									(SELECT value FROM json_each(?));''',
+							(ban, n_avisos, id_chat,
+										BotServerDAO.__to_json_array(usuarios)))
+			self.__invalidate_cache('usuario_foro', *((id_chat, id_usuario)
+													for id_usuario in usuarios))
+			self.__invalidate_cache('usuarios_foro', id_chat)
+
+		self.__write(operacion)
+
+		self.__log.debug('Actualización realizada con éxito, fin de ejecución'\
+						' de la función "editUsuarioForo" de "BotServerDAO"')
+
+
+	def removeUsuarioForo(self, id_chat: int, usuarios: list or int):
+
+		"""Permite eliminar el estado de uno o más usuarios en un foro docente.
+
+		Parámetros:
+		-----------
+		id_chat: int
+			Id de chat asignado al grupo o supergrupo asociado al foro
+
+		usuarios: (int o list[int])
+			Ids de los usuarios a registrar en el grupo docente
+		"""
+
+		self.__log.debug('Ejecutada función "removeUsuarioForo" de'\
+															' "BotServerDAO"')
+
+		#	Comprobar que los datos proporcionados sean válidos y prrpararlos
+		if not isinstance(id_chat, int):
+			raise ValueError('"id_chat" debe ser int')
+
+		if isinstance(usuarios, int):
+			usuarios = [usuarios]
+		elif isinstance(usuarios, list):
+
+			for i in usuarios:
+				if type(i) != int:
+					raise ValueError('"usuarios" contiene un valor'\
+															' que no es int')
+
+		else:
+			raise ValueError('"usuarios" debe de ser un entero o una lista')
+
+		#	Se ejecuta el borrado
+		self.__log.debug('Se ejecuta la sentencia de borrado con datos'\
+						' id_chat=%d y para los usuarios con id en %s',
+														id_chat, usuarios)
+
+		def operacion(cursor):
+			cursor.execute('''DELETE FROM Foro_Usuario
+								WHERE id_chat_foro=?
+								AND id_usuario IN
+								(SELECT value FROM json_each(?));''',
+							(id_chat, BotServerDAO.__to_json_array(usuarios)))
+			self.__invalidate_cache('usuario_foro', *((id_chat, id_usuario)
+													for id_usuario in usuarios))
+			self.__invalidate_cache('usuarios_foro', id_chat)
+
+		self.__write(operacion)
+
+		self.__log.debug('Borrado realizada con éxito, fin de ejecución de la'\
+		' función "removeUsuarioForo" de "BotServerDAO"')
+
+
+	def addMensaje(self, recibido: bool, id_mensaje_chat: int,
+						id_usuario_emisor_receptor=None, id_chat=None,
+						fecha=None, academico=False,
+						texto=None, multimedia=None,
+						editado=False,
+						id_mensaje_chat_respondido=None,
+						pregunta_formulada=None,
+						pregunta_respondida=False,
+						datos=None) -> int or tuple:
+
+		"""Permite añadir un mensaje a la base de datos.
+
+		Parámetros:
+		recibido: bool
+			Permite determinar si el mensaje fue recibido (True) o
+			enviado (False)
+
+		id mensaje chat: int
+			Identificador asociado por la plataforma de mensajerı́a al Mensaje en
+			el chat en el que se mandó.
+
+		id_usuario_emisor_receptor: Id del usuario emisor del mensaje o receptor
+			para el caso de los chats privados, en caso contrario dejar a None
+
+		id_chat: Id del chat del foro docente al que el mensaje fue enviado
+				o recibido. Para chats privados dejar en None.
+
+		fecha: datetime.datetime
+			Fecha en la que el mensaje fue enviado o recibido
+
+		academico: bool
+			Indica si el mensaje pertenece al ámbito académico o no. Sólo aplica
+			sentido para mensajes recibidos en chats grupales.
+			Por defecto es False
+
+		texto: str
+			Contenido del texto que de desea añadir al mensaje.
+			Se puede agregar luego haciendo uso de la función addDato y
+			addDatoTexto
+
+		multimedia: dict
+			Dato multimedia incluído con el mensaje. Se puede agregar después
+			mediante las funciones addDato y addDatoArchivo
+
+		editado: bool
+			Indica si el mensaje edita a otro mensaje registrado anteriormente.
+			Por defecto es False
+
+		id_mensaje_chat_respondido: int
+			Identificador de chat del mensaje al cual responde este mensaje
+
+		pregunta_formulada: str
+			Representa la pregunta que ha sido formulada dentro del mensaje
+			(si la hay). Se debe de usar conjuntamente con pregunta_respondida
+
+		pregunta_respondida: bool
+			Indica si la pregunta formulada fue respondida (True) o no, se debe
+			de utilizar conjuntamente con pregunta_formulada
+
+		datos: list de dict
+			Datos contenidos en el mensaje con el formato de addDato, que se
+			insertan en la misma transacción que el mensaje. Un dato que no
+			puede insertarse se descarta sin descartar el mensaje ni el resto
+			de datos
+
+		Devuelve:
+		---------
+			int: Identificador asociado al mensaje o, si se proporcionan
+				"datos", tuple con el identificador del mensaje y la lista de
+				identificadores de sus datos en el mismo orden, con None en
+				los datos descartados
+
+		"""
+
+		self.__log.debug('Iniciada función "addMensaje" de "BotServerDAO"')
+
+		#	Comprobar los datos de entrada
+		if not isinstance(id_mensaje_chat, int):
+			raise ValueError('"id_mensaje_chat" debe de ser int')
+
+		if (id_usuario_emisor_receptor and
+								not isinstance(id_usuario_emisor_receptor, int)):
+			raise ValueError('"id_usuario_emisor_receptor" debe de ser int')
+
+		if id_chat and not isinstance(id_chat, int):
+				raise ValueError('"id_chat" debe de ser int')
+
+		if fecha and not isinstance(fecha, datetime.datetime):
+				raise ValueError('"id_chat" debe de ser de tipo'\
+														' "datetime.datetime"')
+		elif not fecha:
+			fecha = datetime.datetime.now()
+
+		if academico and not isinstance(academico, bool):
+				raise ValueError('"academico" debe ser bool')
+
+		if not isinstance(editado, bool):
+				raise ValueError('"editado" debe de ser bool')
+
+		if (id_mensaje_chat_respondido and
+							not isinstance(id_mensaje_chat_respondido, int)):
+				raise ValueError('"id_mensaje_chat_respondido" debe de ser int')
+
+		if multimedia:
+			if ('tipo' not in multimedia or
+	not (multimedia['tipo'] in BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO'] or
+					multimedia['tipo'] in ('contacto', 'localizacion'))):
+				raise ValueError('El "tipo" del dato multimedia debe de ser'\
+								' proporcionado o no es válido')
+
+		if pregunta_formulada and not isinstance(pregunta_formulada, str):
+			raise ValueError('"pregunta_formulada" debe de ser str')
+
+		if pregunta_respondida and not isinstance(pregunta_respondida, bool):
+			raise ValueError('"pregunta_respondida" debe de ser bool')
+
+		if datos is not None and not isinstance(datos, list):
+			raise ValueError('"datos" debe de ser list')
+
+		#	Se ejecutan todas las inserciones en una misma transacción. Los
+		#	datos del mensaje se insertan dentro de la misma operación
+		self.__log.debug('Ejecutando inserciones')
+
+		def operacion(cursor):
+
+			#	Insertar en Evento
+			cursor.execute('INSERT INTO Evento(fecha) VALUES(?);', (fecha,))
+			id_mensaje = cursor.execute('SELECT last_insert_rowid()').fetchone()[0]
+
+			#	Insertar Mensaje
+			cursor.execute('INSERT INTO Mensaje VALUES(?, ?, ?);',
+							(id_mensaje, id_mensaje_chat, True))
+
+			#	Insertar en MensajeRecibidoPublico o MensajeRecibidoPrivado
+			if recibido:
+				if id_chat:
+					cursor.execute('''INSERT INTO MensajeRecibidoPublico(id,
+										academico, id_usuario_emisor,
+										id_chat_foro, fecha)
+									VALUES(?,?,?,?,?);''',
+							(id_mensaje, academico, id_usuario_emisor_receptor,
+								id_chat, fecha))
+
+					if pregunta_formulada:
+						cursor.execute('''INSERT INTO PreguntaEfectuadaChatGrupal
+											VALUES(?,?,?)''',
+											(id_mensaje, pregunta_formulada,
+											pregunta_respondida))
+				else:
+					cursor.execute('INSERT INTO MensajeRecibidoPrivado VALUES(?,?);',
+										(id_mensaje,  id_usuario_emisor_receptor))
+
+					if pregunta_formulada:
+						cursor.execute('''INSERT INTO PreguntaEfectuadaChatPrivado
+											VALUES(?,?,?)''',
+											(id_mensaje, pregunta_formulada,
+											pregunta_respondida))
+			else:
+				if id_chat:
+					cursor.execute('''INSERT INTO MensajeEnviadoPublico(id,
+										id_chat_foro_destino, fecha)
+									VALUES(?,?,?);''',
+								(id_mensaje, id_chat, fecha))
+				else:
+					cursor.execute('INSERT INTO MensajeEnviadoPrivado VALUES(?,?);',
+										(id_mensaje,  id_usuario_emisor_receptor))
+
+			#	Actualizar el recuento diario de mensajes del foro. El día se
+			#	calcula en SQL con la misma expresión que el resto de consultas
+			#	del recuento
+			if id_chat:
+				cursor.execute('''INSERT INTO ResumenMensajesForo
+									VALUES(?,DATE(?, 'unixepoch', 'localtime'),
+											?,?,?,?)
+								ON CONFLICT(id_chat_foro, dia) DO UPDATE SET
+								recibidos=recibidos+excluded.recibidos,
+								enviados=enviados+excluded.enviados,
+								academicos=academicos+excluded.academicos,
+								no_academicos=no_academicos+
+												excluded.no_academicos;''',
+								(id_chat, fecha,
+								int(recibido), int(not recibido),
+								int(recibido and academico is True),
+								int(recibido and academico is not True)))
+
+			#	Chat en el que se identifica el mensaje: el foro docente o, para
+			#	los chats privados, el usuario
+			chat = id_chat or id_usuario_emisor_receptor
+
+			#	Registrar la edición de un mensaje
+			if editado:
+
+				#	Buscar la id asignada al mensaje original y a su última
+				#	versión
+				ids_editado = self.__lookup_mensaje(cursor, chat,
+															id_mensaje_chat)
+
+				if ids_editado:
+					id_mensaje_original, id_mensaje_editado = ids_editado
+
+					cursor.execute('UPDATE Mensaje SET existente=? WHERE id=?',
+									(False, id_mensaje_editado))
+
+					cursor.execute(
+								'INSERT INTO Mensaje_Mensaje_Editado VALUES (?,?);',
+								(id_mensaje, id_mensaje_original))
+			else:
+				ids_editado = None
+
+			#	Registrar la respuesta a un mensaje
+			if id_mensaje_chat_respondido:
+
+				#	Buscar la id asignada a la última versión del mensaje
+				#	respondido
+				ids_respondido = self.__lookup_mensaje(cursor, chat,
+												id_mensaje_chat_respondido)
+
+				if ids_respondido:
+					cursor.execute(
+							'INSERT INTO Mensaje_Mensaje_Respuesta VALUES (?,?);',
+							(id_mensaje, ids_respondido[1]))
+
+			#	Insertar el texto
+			if texto:
+				self.addDatoTexto(fecha_creacion=fecha, texto=texto,
+									id_mensaje=id_mensaje)
+
+			#	Insertar los datos multimedia
+			if multimedia:
+				if multimedia['tipo'] == 'contacto':
+					self.addDatoContacto(
+		fecha_creacion=fecha,
+		telefono=multimedia['telefono'] if 'telefono' in multimedia else None,
+		nombre=multimedia['nombre'] if 'nombre' in multimedia else None,
+		apellidos=multimedia['apellidos'] if 'apellidos' in multimedia else None,
+		id_usuario=multimedia['id_usuario'] if 'id_usuario' in multimedia else None,
+		vcard=multimedia['vcard'] if 'vcard' in multimedia else None,
+		id_mensaje=id_mensaje)
+
+				elif multimedia['tipo'] == 'localizacion':
+					self.addDatoLocalizacion(
+		fecha_creacion=fecha,
+		longitud=multimedia['longitud'] if 'longitud' in multimedia else None,
+		latitud=multimedia['latitud'] if 'latitud' in multimedia else None,
+		titulo=multimedia['titulo'] if 'titulo' in multimedia else None,
+		direccion=multimedia['direccion'] if 'direccion' in multimedia else None,
+		id_cuadrante=multimedia['id_cuadrante'] if 'id_cuadrante' in multimedia else None,
+		tipo_cuadrante=multimedia['tipo_cuadrante'] if 'tipo_cuadrante' in multimedia else None,
+		id_mensaje=id_mensaje)
+
+				else:
+					self.addDatoArchivo(fecha_creacion=fecha,
+		tipo=multimedia['tipo'],
+		ruta_archivo=multimedia['ruta_archivo'] if 'ruta_archivo' in multimedia else None,
+		file_id=multimedia['file_id'] if 'file_id' in multimedia else None,
+		mime_type=multimedia['mime_type'] if 'mime_type' in multimedia else None,
+		sticker_emoji=multimedia['sticker_emoji'] if 'sticker_emoji' in multimedia else None,
+		sticker_conjunto=multimedia['sticker_conjunto'] if 'sticker_conjunto' in multimedia else None,
+		sticker_tipo=multimedia['sticker_tipo'] if 'sticker_tipo' in multimedia else None,
+		id_mensaje=id_mensaje)
+
+			#	Registrar el mensaje como última versión del mensaje del chat
+			if chat:
+				self.__register_mensaje(cursor, chat, id_mensaje_chat,
+							ids_editado[0] if ids_editado else id_mensaje,
+							id_mensaje)
+
+			if datos is None:
+				return id_mensaje
+
+			#	Insertar los datos del mensaje, cada uno en su propio
+			#	savepoint para descartar sólo los datos erróneos
+			ids_datos = []
+
+			for dato in datos:
+				cursor.execute('SAVEPOINT dato')
+
+				try:
+					ids_datos.append(self.addDato(dato=dato,
+											fecha_creacion=fecha,
+											id_mensaje=id_mensaje))
+				except Exception as e:
+					cursor.execute('ROLLBACK TO dato')
+					ids_datos.append(None)
+					self.__log.error('Error al registrar un dato del mensaje '\
+										'con id %d:\n%s' % (id_mensaje, str(e)))
+				finally:
+					cursor.execute('RELEASE dato')
+
+			return id_mensaje, ids_datos
+
+		id_mensaje = self.__write(operacion)
+
+		self.__log.debug('Finalizada función "addMensaje" de "BotServerDAO"')
+		return id_mensaje
+
+	def addMensajeRespuesta(self, id_mensaje: int,
+							pregunta: str,
+							respondido: bool):
+
+		"""Permite registrar una pregunta respondida o no en un mensaje que
+			la contiene
+
+		Atributos:
+		----------
+
+		id_mensaje: int
+			Identificador del mensaje al cual se desea añadir la preguta
+			(no se debe de confundir con el id de chat del mensaje)
+
+		pregunta_formulada: str
+			Representa la pregunta que ha sido formulada dentro del mensaje
+			(si la hay). Se debe de usar conjuntamente con pregunta_respondida
+
+		pregunta_respondida: bool
+			Indica si la pregunta formulada fue respondida (True) o no, se debe
+			de utilizar conjuntamente con pregunta_formulada
+		"""
+
+		self.__log.debug('Iniciada función "addMensajeRespuesta" de "BotServerDAO"')
+
+		#	Comprobar los datos de entrada
+		if not isinstance(id_mensaje, int):
+			raise ValueError('"id_mensaje" debe de ser int')
+
+		if not isinstance(pregunta, str):
+			raise ValueError('"pregunta" debe de ser str')
+
+		if not isinstance(respondido, bool):
+			raise ValueError('"respondido" debe de ser bool')
+
+		#	Ejecutar las inserciones
+		self.__log.debug('Insertando valores: pregunta=%s y '\
+							'respondido=%s para id_mensaje=%d', pregunta,
+																	respondido,
+																	id_mensaje)
+
+		def operacion(cursor):
+			cursor.execute('''INSERT INTO PreguntaEfectuadaChatGrupal
+								SELECT ?, ?, ?
+								WHERE EXISTS
+								(SELECT id FROM MensajeRecibidoPublico
+									WHERE id=?);''',
+									(id_mensaje, pregunta, respondido, id_mensaje))
+
+		self.__write(operacion)
+
+		self.__log.debug('Finalizada función "addMensajeRespuesta" de "BotServerDAO"')
+
+	def addEventoChatGrupal(self, tipo: str, id_usuario: int or list,
+							id_chat: int, fecha: datetime.datetime) -> int:
+
+		"""Permite registrar un evento de chat grupal para uno o más
+			usuarios. Los eventos de varios usuarios se registran en una
+			misma transacción
+
+		Atributos:
+		----------
+
+		tipo: str
+			Tipo de evento acontencido, se permiten los siguientes valores:
+			"entrada", "salida", "registro", "ban", "readmision" y "expulsion"
+
+		id_usuario: int o list de int
+			Identificador del usuario implicado en el suceso del registro o
+			lista de identificadores si el evento implica a varios usuarios
+
+		id_chat: int
+			Identificador del foro docente asociado al evento
+
+		fecha: datetime.datetime
+			Fecha en la que se produce el evento
+
+		Devuelve:
+		---------
+			int: Identificador del evento almacenado o list de int con los
+				identificadores de los eventos de cada usuario si se ha
+				proporcionado una lista de usuarios
+		"""
+
+		self.__log.debug('Iniciada función "addEventoChatGrupal" de '\
+							'"BotServerDAO"')
+
+		#	Comprobar los datos de entrada
+		if not isinstance(tipo, str):
+			raise ValueError('"tipo" debe de ser str')
+		else:
+			tipo = BotServerDAO.__BD_TIPOS['TIPO_EVENTO_CHAT_GRUPAL'][tipo]
+
+		if isinstance(id_usuario, int):
+			usuarios = [id_usuario]
+		elif isinstance(id_usuario, list):
+			usuarios = id_usuario
+
+			for i in usuarios:
+				if type(i) != int:
+					raise ValueError('"id_usuario" contiene un valor que no'\
+																	' es int')
+		else:
+			raise ValueError('"id_usuario" debe de ser int o una lista de int')
+
+		if not isinstance(id_chat, int):
+			raise ValueError('"id_chat" debe de ser int')
+
+		if not isinstance(fecha, datetime.datetime):
+			raise ValueError('"fecha" debe de ser objeto de '\
+								'tipo datetime.datetime')
+
+		#	Realizar inserciones
+		self.__log.debug('Insertando valores: tipo=%s, '\
+							'id_usuario=%s, id_chat=%d y fecha=%s',
+											tipo, id_usuario, id_chat, fecha)
+
+		def operacion(cursor):
+			ids_eventos = self.__insert_eventos_chat_grupal(cursor, tipo,
+												usuarios, id_chat, fecha)
+
+			return (ids_eventos[0] if isinstance(id_usuario, int)
+															else ids_eventos)
+
+		id_evento = self.__write(operacion)
+
+		self.__log.debug('Finalizada función "addEventoChatGrupal" de "BotServerDAO"')
+		return id_evento
+
+	def __insert_eventos_chat_grupal(self, cursor, tipo: int, usuarios: list,
+									id_chat: int, fecha: datetime.datetime):
+
+		"""Inserta un evento de chat grupal del mismo tipo para cada uno de
+		los usuarios indicados. Debe de ser llamada desde el hilo escritor
+
+		Devuelve:
+		---------
+			list de int: Identificadores de los eventos insertados
+		"""
+
+		ids_eventos = []
+
+		for _ in usuarios:
+			cursor.execute('INSERT INTO Evento(fecha) VALUES (?)', (fecha,))
+			ids_eventos.append(cursor.lastrowid)
+
+		cursor.executemany('''INSERT INTO EventoChatGrupal(id, tipo, id_usuario,
+									id_chat_foro, fecha)
+								VALUES (?,?,?,?,?);''',
+							[(id_evento, tipo, x, id_chat, fecha)
+								for id_evento, x in zip(ids_eventos, usuarios)])
+
+		return ids_eventos
+
+	def addComunicado(self,
+						fecha_envio: datetime.datetime,
+						id_docente_emisor: int,
+						ids_chat_foro: list or int) -> int:
+
+		"""Permite registrar un Comunicado pendiente de envío en la base
+			de datos
+
+		Atributos:
+		----------
+
+		fecha_envio: datetime.datetime
+			Fecha en la que se enviará el comunicado
+
+		id_docente_emisor: int
+			Identificador de Usuario del usuario docente que solicitó el envío
+			del Comunicado
+
+		id_chat_foro: list o int
+			Identificadores de los chats de los foros docentes a los cuales
+			va dirigido el comunicado
+
+		Devuelve:
+		---------
+			int: Identificador del Comunicado
+		"""
+
+		self.__log.debug('Iniciada función "addComunicado" de "BotServerDAO"')
+
+		#	Comprobar y procesar los parámetros de entrada
+		if not isinstance(fecha_envio, datetime.datetime):
+			raise ValueError('"fecha_envio" debe de ser objeto de tipo '\
+															'datetime.datetime')
+
+		if not isinstance(id_docente_emisor, int):
+			raise ValueError('"id_docente_emisor" debe de ser int')
+
+		if isinstance(ids_chat_foro, list):
+
+			for id_chat_foro in ids_chat_foro:
+				if type(id_chat_foro) != int:
+					raise ValueError('"ids_chat_foro" contiene algún valor '\
+																'que no es int')
+
+		elif type(ids_chat_foro) == int:
+			ids_chat_foro = [ids_chat_foro]
+
+		else:
+			raise ValueError('"ids_chat_foro" debe de ser un int o lista de int')
+
+		#	Ejecutar las inserciones
+		def operacion(cursor):
+			datos = (fecha_envio, id_docente_emisor)
+			self.__log.debug('Insertando valores fecha_envio=%s, '\
+							'id_docente_emisor=%s y con id_chat_foro en %s',
+							fecha_envio, id_docente_emisor, ids_chat_foro)
+
+			cursor.execute('''INSERT INTO
+								Comunicado(fecha_envio, id_docente)
+								VALUES (?,?);''',
+								datos)
+
+			id_comunicado = cursor.execute('SELECT last_insert_rowid();').fetchone()[0]
+
+			for id_chat_foro in ids_chat_foro:
+				#	Se registran todos los foros a los que va dirigido el Comunicado
+				datos = (id_comunicado, id_chat_foro)
+				cursor.execute('INSERT INTO Comunicado_Foro VALUES(?,?);', datos)
+
+			return id_comunicado
+
+		id_comunicado = self.__write(operacion)
+
+		self.__log.debug('Finalizada función "addComunicado" de "BotServerDAO"')
+
+		return id_comunicado
+
+	def listComunicados(self) -> OrderedDict:
+
+		"""Permite listar todos los Comunicados pendientes de envío
+
+		Devuelve:
+		---------
+			OrderedDict, None
+				Diccionario con el par id_comunicado (int)-datos (dict)
+
+			datos constituye a su vez un diccionario con los siguientes campos:
+			- fecha_envio: datetime.datetime
+				Fecha de envío del Comunicado
+
+			- docente_emisor: str
+				Nombre completo del Uuario docente que lo programó
+
+			- foros: dict
+				Dicionario con el par: id_chat (int) - nombre_foro (str)
+		"""
+
+		self.__log.debug('Iniciada función "listComunicados" de "BotServerDAO"')
+
+		#	Obtener cursor
+		cursor = self.__read_connection().cursor()
+
+		#	Realizar consulta
+		self.__log.debug('Realizando consulta')
+
+		consulta = cursor.execute(
+						'''SELECT Comunicado.id, Comunicado.fecha_envio,
+								CASE Usuario.apellidos
+									WHEN NULL THEN Usuario.nombre
+									ELSE Usuario.nombre||\' \'||Usuario.apellidos
+									END,
+								Foro.id_chat, Foro.nombre
+							FROM Comunicado, Comunicado_Foro, Foro, Usuario
+							WHERE Comunicado.id=Comunicado_Foro.id_comunicado
+									AND Comunicado_Foro.id_chat_foro=Foro.id_chat
+									AND COmunicado.id_docente=Usuario.id
+							GROUP BY Comunicado.id;''')
+
+		comunicados = {}
+
+		for fila in consulta:
+
+			#	Añadir los datos de cada comunicado diferente en el diccionario
+			if fila[0] not in comunicados:
+				comunicados[fila[0]] = {
+										'fecha_envio': fila[1],
+										'docente_emisor': fila[2],
+										'foros': {}
+									}
+									#	'anclar': fila[2],
+			#	Añadir cada foro docente en el que se halle registrado
+			comunicados[fila[0]]['foros'][fila[3]] = fila[4]
+
+		#	Cerrar cursor
+		cursor.close()
+
+		self.__log.debug('Finalizada función "listComunicados" de "BotServerDAO"')
+
+
+		return comunicados if comunicados else None
+
+	def getComunicado(self, id_comunicado: int):
+
+		"""Permite obtener los datos y el contenido de un Comunicado
+
+		Recibe:
+		-------
+		id_comunicado: int
+			Identificador del Comunicado cuya infromación se desea obtener
+
+		Devuelve:
+			dict: Compuesto por lo siguiente:
+			- fecha_envio: datetime.datetime
+				Fecha de envío del Comunicado
+
+			- docente_emisor: str
+				Nombre completo del Uuario docente que lo programó
+
+			- datos: OrderedDict
+				Diccionario ordenado que consta del par:
+				id_dato (int) - dato (dict)
+
+			En concreto, datos puede presentar los siguientes formatos
+
+			Para tipo texto:
+
+			·tipo_dato: 'texto'
+			·contenido: str o list str
+			 	Texto o textos a almacenar
+
+			Para tipo Multimedia con Archivo:
+
+			·tipo_dato: str
+				Tipo de Dato Multimedia almacenado: Puede adoptar los valores
+				'imagen', 'audio', 'video'. 'nota_voz', 'nota_video',
+				'documento','animacion' y 'sticker'
+
+			contenido: str o None
+				Ruta en el sistema de ficheros en la que el servidor ha
+				almacenado el Archivo.
+
+			·mime type: str o None
+				Valor del encabezado Mime asociado al archivo
+
+			·file id: int o None
+				Identificador de archivo asociado por la plataforma de
+				mensajerı́a a dicho Archivo.
+
+			·sticker_emoji: str o None
+				emoji asociado al Sticker. Sólo para stickers
+				Parámetro opcional
+
+			·sticker_conjunto: str o None
+				Nombre del conjunto al que pertenece el Sticker.
+				Sólo para stickers
+				Parámetro opcional
+
+			·sticker_tipo: str o None
+				Tipo de sticker, puede adoptar dos valores: normal o animado.
+				Sólo para stickers.
+				Parámetro opcional
+				NOTA: Actualmente en desuso
+
+			Para tipo Contacto:
+
+			·tipo_dato: 'contacto'
+
+			·nombre: str
+				Nombre o primer nombre asociado al Contacto.
+
+			·apellidos: str o None
+				Nombre o segundo nombre asociado al Contacto.
+				Parámetro opcional
+
+			·telefono: str
+				Número de teléfono asociado al Contacto.
+
+			·vcard: str o None
+				Datos recogidos en la vcard asociada al Contacto.
+				Parámetro opcional
+
+			·id_usuario: int o None
+				Identificador de usuario asociado por la plataforma de
+				mensajerı́a al usuario asociado al Contacto.
+				Parámetro opcional
+
+			Para tipo Localizacion y Avenida:
+
+			·tipo_dato: 'localizacion'
+
+			·latitud: int
+				Latitud geográfica de la Localizacion o Avenida.
+
+			·longitud: int
+				Longitud geográfica de la Localizacion o Avenida
+
+			·titulo: str o None
+				Tı́tulo que recibe la Avenida localizada en la Localizacion.
+				Parámetro opcional
+
+			·direccion: str o None
+				Direccion de la avenida localizada en la Localizacion.
+				Parámetro opcional
+
+			·id cuadrante: int o None
+				Identificador del cuadrante asociado a la avenida localizada en la
+				Localizacion. Parámetro opcional
+
+			·tipo cuadrante: str o None
+				Tipo de cuadrante asociado a la avenida localizada en la
+				Localizacion.
+				Parámetro opcional
+
+			- foros: dict
+				Dicionario con el par: id_chat (int) - nombre_foro (str)
+		"""
+
+		self.__log.debug('Iniciada función "getComunicado" de "BotServerDAO"')
+
+		#	Comprobar y procesar los parámetros de entrada
+		if not isinstance(id_comunicado, int):
+			raise ValueError('"id_comunicado" no es int')
+
+		#	Tomar cursor
+		cursor = self.__read_connection().cursor()
+
+		#	Realizar consulta
+		self.__log.debug('Realizando consulta con id_comunicado=%d',
+																id_comunicado)
+
+		cursor.execute('''SELECT fecha_envio, id_docente
+							FROM Comunicado
+							WHERE id=?''', (id_comunicado,))
+		datos = cursor.fetchone()
+
+		#if not datos:
+		#	return None
+
+		comunicado = {
+						'fecha_envio': datos[0],
+						'docente_emisor': datos[1]
+					}
+
+		#	Tomar los textos
+		comunicado['datos'] = OrderedDict()
+
+		consulta = cursor.execute(
+						'''SELECT
+							DatoTextoMultimedia.id AS id_dato,
+							DatoTextoMultimedia.fecha_creacion AS fecha_creacion,
+							DatoTextoMultimedia.tipo AS
+												"tipo_dato [TIPO_DATOARCHIVO]",
+							DatoTextoMultimedia.contenido AS contenido,
+							DatoTextoMultimedia.file_id AS file_id,
+							DatoTextoMultimedia.mime_type AS mime_type,
+							DatoTextoMultimedia.sticker_emoji AS sticker_emoji,
 							DatoTextoMultimedia.conjunto AS sticker_conjunto,
 							DatoTextoMultimedia.tipo_sticker AS
 												"tipo_sticker [TIPO_STICKER]",
@@ -2329,623 +3671,1867 @@ class BotServerDAO:
 								(id_comunicado,))
 
 
-		#	Introducir cada dato extraído en en la lista de mensajes organizados
-		for m in consulta:
+		#	Introducir cada dato extraído en en la lista de mensajes organizados
+		for m in consulta:
+
+			#	Mapear manualmente el TIPO_DATOARCHIVO a la cadena
+			#	correspondiente porque no se ejecuta manuialmente
+			tipo_dato = m[2]
+
+			#	Registrar los datos contenidos en el mismo
+			if tipo_dato == 'texto':
+				#	El dato es texto
+				comunicado['datos'][m[0]] = dict(zip(m.keys()[1:4], m[1:4]))
+			elif tipo_dato in BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO'] and tipo_dato != 'sticker':
+				#	El dato es multimedia diferente de sticker
+				comunicado['datos'][m[0]] = dict(zip(m.keys()[1:6], m[1:6]))
+			elif tipo_dato == 'sticker':
+				#	El dato es multimedia sticker
+				comunicado['datos'][m[0]] = dict(zip(m.keys()[1:9], m[1:9]))
+			elif tipo_dato == 'contacto':
+				#	El dato es contacto
+				comunicado['datos'][m[0]] = dict(zip(m.keys()[1:3], m[1:3]))
+				comunicado['datos'][m[0]].update(dict(zip(m.keys()[9:14], m[9:14])))
+			else:
+				#	El dato es una localización
+				comunicado['datos'][m[0]] = dict(zip(m.keys()[1:3], m[1:3]))
+				comunicado['datos'][m[0]].update(dict(zip(m.keys()[14:], m[14:])))
+
+			#	Cambiar el tipo_datos por su cadena correspondiente
+			comunicado['datos'][m[0]]['tipo_dato'] = tipo_dato
+
+
+		#	Tomar los foros
+		comunicado['foros'] = {}
+
+		consulta = cursor.execute(
+							'''SELECT Foro.id_chat, Foro.nombre
+								FROM Foro, Comunicado_Foro
+								WHERE Foro.id_chat=Comunicado_Foro.id_chat_foro
+								AND Comunicado_Foro.id_comunicado=?;''',
+								(id_comunicado,))
+
+		if consulta:
+			for fila in consulta:
+				comunicado['foros'][fila[0]] = fila[1]
+
+		#	Cerrar cursor
+		cursor.close()
+
+		self.__log.debug('Finalizada función "getComunicado" de "BotServerDAO"')
+		return comunicado
+
+	def removeComunicado(self, id_comunicado: int):
+
+		"""Permite eliminar un Comunicado registrado
+
+		Recibe:
+		-------
+		id_comunicado: int
+			Identificador del Comunicado cuya infromación se desea obtener
+
+		Devuelve:
+			list de str
+			Lista de ficheros asociados a los datos multimedia del comunicado y
+			que ya puede ser eliminado
+		"""
+
+		self.__log.debug('Iniciada función "removeComunicado" de '\
+															'"BotServerDAO"')
+
+		#	Comprobar parámetros de entrada
+		if not isinstance(id_comunicado, int):
+			raise ValueError('"id_comunicado" debe de ser un int')
+
+		#	Realizar borrados
+		self.__log.debug('Borrando Comunicado con id=%s', id_comunicado)
+
+		def operacion(cursor):
+			#	Borrar todos los datos asociados al comunicado
+			consulta = cursor.execute('''SELECT id_dato
+									FROM Dato_Comunicado
+									WHERE id_comunicado=?;''',
+									(id_comunicado,))
+
+			id_dato = BotServerDAO.__to_json_array(consulta.fetchall())
+
+			#	Lista de archivos a borrar
+			arch_borr = None
+
+			if id_dato:
+
+				#	Conocer todos los archivos borrados
+				consulta = cursor.execute(
+							'''SELECT ruta_archivo
+								FROM DatoArchivo, Dato_Comunicado
+								WHERE Dato_Comunicado.id_comunicado=?
+								AND Dato_Comunicado.id_dato=DatoArchivo.id''',
+								(id_comunicado,))
+				arch_borr = [fila[0] for fila in consulta] or None
+
+				for tabla in ('DatoTexto', 'DatoArchivoSticker', 'DatoArchivo',
+								'DatoContacto', 'DatoLocalizacion'):
+					cursor.execute('''DELETE FROM %s WHERE id IN
+									(SELECT value FROM json_each(?));''' % tabla,
+									(id_dato,))
+
+				cursor.execute('''DELETE FROM Dato_Comunicado WHERE id_dato IN
+								(SELECT value FROM json_each(?));''', (id_dato,))
+				cursor.execute('''DELETE FROM Dato WHERE id IN
+								(SELECT value FROM json_each(?));''', (id_dato,))
+
+			#	Borrar la lista de foros asignados al comunicado
+			cursor.execute('DELETE FROM Comunicado_Foro WHERE id_comunicado=?',
+							(id_comunicado,))
+
+			cursor.execute('DELETE FROM Comunicado WHERE id=?', (id_comunicado,))
+
+			return arch_borr
+
+		arch_borr = self.__write(operacion)
+
+		self.__log.debug('Finalizada función "removeComunicado" de "BotServerDAO"')
+		return arch_borr
+
+	#	Recuentos de los mensajes recibidos y académicos y de los mensajes
+	#	enviados de un foro en un intervalo de tiempo, a través de los
+	#	índices (foro, fecha). "{bd}" se sustituye por la base de datos
+	#	consultada y "{op_fin}" por el operador de comparación con el
+	#	extremo final del intervalo
+	__CONSULTAS_RECUENTO_FORO = (
+'''SELECT COUNT(*), COUNT(CASE WHEN academico IS 1 THEN 1 END)
+FROM {bd}.MensajeRecibidoPublico
+WHERE id_chat_foro=? AND fecha >= ? AND fecha {op_fin} ?;''',
+'''SELECT COUNT(*)
+FROM {bd}.MensajeEnviadoPublico
+WHERE id_chat_foro_destino=? AND fecha >= ? AND fecha {op_fin} ?;''')
+
+	def __count_mensajes_intervalo(self, cursor, id_chat: int,
+							inicio: datetime.datetime, fin: datetime.datetime,
+							incluir_fin: bool):
+
+		"""Cuenta directamente sobre los mensajes los mensajes recibidos,
+		enviados, académicos y no académicos de un foro en un intervalo de
+		tiempo reducido, recorriendo los índices (foro, fecha). El
+		extremo final del intervalo se incluye sólo si incluir_fin es True.
+		Se cuentan también los mensajes de los ficheros de archivo de los
+		periodos que abarca el intervalo
+		"""
+
+		op_fin = '<=' if incluir_fin else '<'
+		recibidos = enviados = academicos = 0
+
+		esquemas = ['main'] + [self.__attach_archivo(periodo, fichero)
+								for periodo, fichero, _, _ in
+								self.__periodos_archivados(inicio, fin)]
+
+		for esquema in esquemas:
+
+			if esquema is None:
+				continue
+
+			consulta_recibidos, consulta_enviados = (
+								consulta.format(bd=esquema, op_fin=op_fin)
+								for consulta in
+									BotServerDAO.__CONSULTAS_RECUENTO_FORO)
+
+			n_recibidos, n_academicos = cursor.execute(consulta_recibidos,
+										(id_chat, inicio, fin)).fetchone()
+
+			enviados += cursor.execute(consulta_enviados,
+										(id_chat, inicio, fin)).fetchone()[0]
+
+			recibidos += n_recibidos
+			academicos += n_academicos
+
+		return {
+					'recibidos': recibidos,
+					'enviados': enviados,
+					'academicos': academicos,
+					'no_academicos': recibidos - academicos
+				}
+
+	def getResumenMensajesForo(self, id_chat: int,
+							fecha_inicio: datetime.datetime,
+							fecha_fin: datetime.datetime):
+
+		"""Permite obtener el número de mensajes registrados en un Foro
+		Docente en un intervalo de tiempo. Los días completos del intervalo
+		se toman del recuento diario de mensajes de cada foro, que se
+		conserva al archivar los mensajes, y sólo los días inicial y final
+		se cuentan sobre los mensajes
+
+		Recibe:
+		-------
+		id_chat: int
+			Identificador del chat sobre el que se aplica la operación
+
+		fecha_inicio: datetime.datetime
+			Fecha de inicio a partir de la cual se empiezan a contar mensajes
+
+		fecha_fin: datetime.datetime
+			Fecha de fin a partir de la cual se dejan de contar mensajes
+
+		Devuelve:
+		---------
+			dict: Diccionario con el número de mensajes recibidos
+			("recibidos"), enviados por el sistema ("enviados") y recibidos
+			académicos ("academicos") y no académicos ("no_academicos")
+		"""
+
+		self.__log.debug('Iniciada función "getResumenMensajesForo" de'\
+															' "BotServerDAO"')
+
+		#	Comprobar los datos de entrada
+		if not isinstance(id_chat, int):
+			raise ValueError('"id_chat" debe ser int')
+
+		if not isinstance(fecha_inicio, datetime.datetime):
+			raise ValueError('"fecha_inicio" debe ser de tipo datetime.datetime')
+
+		if not isinstance(fecha_fin, datetime.datetime):
+			raise ValueError('"fecha_fin" debe ser de tipo datetime.datetime')
+
+		#	Tomar el cursor
+		cursor = self.__read_connection().cursor()
+
+		self.__log.debug('Realizando consulta con valores id_chat=%s, '\
+							'desde fecha_inicio=%s hasta fecha_fin=%s',
+								id_chat, fecha_inicio, fecha_fin)
+
+		#	Los días del recuento se toman en hora local, como la expresión
+		#	DATE(fecha, 'unixepoch', 'localtime') con la que se calculan
+		fecha_inicio = datetime.datetime.fromtimestamp(fecha_inicio.timestamp())
+		fecha_fin = datetime.datetime.fromtimestamp(fecha_fin.timestamp())
+
+		#	Primer día completo del intervalo y comienzo del último día
+		un_dia = datetime.timedelta(days=1)
+		inicio_completo = datetime.datetime.combine(fecha_inicio.date(),
+														datetime.time())
+		if inicio_completo < fecha_inicio:
+			inicio_completo += un_dia
+
+		inicio_ultimo = datetime.datetime.combine(fecha_fin.date(),
+														datetime.time())
+
+		if fecha_fin < fecha_inicio:
+			resumen = dict.fromkeys(('recibidos', 'enviados', 'academicos',
+														'no_academicos'), 0)
+
+		elif inicio_completo >= inicio_ultimo:
+			#	El intervalo no contiene ningún día completo
+			resumen = self.__count_mensajes_intervalo(cursor, id_chat,
+										fecha_inicio, fecha_fin, True)
+
+		else:
+			#	Sumar los días completos
+			fila = cursor.execute('''SELECT TOTAL(recibidos), TOTAL(enviados),
+										TOTAL(academicos), TOTAL(no_academicos)
+									FROM ResumenMensajesForo
+									WHERE id_chat_foro=? AND dia BETWEEN
+										DATE(?, 'unixepoch', 'localtime') AND
+										DATE(?, 'unixepoch', 'localtime');''',
+									(id_chat, inicio_completo,
+									inicio_ultimo-un_dia)).fetchone()
+
+			resumen = dict(zip(('recibidos', 'enviados', 'academicos',
+								'no_academicos'), [int(n) for n in fila]))
+
+			#	Añadir el comienzo y el final del intervalo
+			for parcial in (self.__count_mensajes_intervalo(cursor, id_chat,
+										fecha_inicio, inicio_completo, False),
+							self.__count_mensajes_intervalo(cursor, id_chat,
+										inicio_ultimo, fecha_fin, True)):
+				for campo in parcial:
+					resumen[campo] += parcial[campo]
+
+		#	Cerrar cursor
+		cursor.close()
+
+		self.__log.debug('Finalizada función "getResumenMensajesForo" de'\
+															' "BotServerDAO"')
+		return resumen
+
+	def countMensajesForo(self, id_chat: int,
+							fecha_inicio: datetime.datetime,
+							fecha_fin: datetime.datetime):
+
+		"""Permite contar los mensajes registrados en un Foro Docente
+
+		Recibe:
+		-------
+		id_chat: int
+			Identificador del chat sobre el que se aplica la operación
+
+		fecha_inicio: datetime.datetime
+			Fecha de inicio a partir de la cual se empiezan a contar mensajes
+
+		fecha_fin: datetime.datetime
+			Fecha de fin a partir de la cual se dejan de contar mensajes
+		"""
+
+		self.__log.debug('Iniciada función "countMessagesForo" de'\
+															' "BotServerDAO"')
+
+		resumen = self.getResumenMensajesForo(id_chat, fecha_inicio, fecha_fin)
+		n_mensajes = resumen['recibidos'] + resumen['enviados']
+
+		self.__log.debug('Finalizada función "countMessagesForo" de "BotServerDAO"')
+		return n_mensajes
+
+	def getMensajesForo(self, id_chat: int,
+					fecha_inicio: datetime.datetime, fecha_fin: datetime,
+					division=None, particion=None):
+
+		"""Permite obtener todos los datos de los mensajes enviados en un foro
+			en un intervalo de tiempo específico
+
+		Recibe:
+		------
+		id_chat: int
+			Identificador del chat sobre el que se aplica la operación
+
+		fecha_inicio: datetime.datetime
+			Fecha de inicio a partir de la cual se empiezan a recopilar mensajes
+
+		fecha_fin: datetime.datetime
+			Fecha de fin a partir de la cual se dejan de recopilar mensajes
+
+		division: int
+			Indica el número de particiones en las que se va a dividir la
+			recopilación. Este parámetro debe de ser usado conjuntamente con
+			paticion
+
+		particion: int
+			Indica el número de partición considerada en esta consulta. Este
+			parámetro debe de ser usado conjuntamente con "division"
+
+
+		Devuelve:
+			OrderedDict: Diccionario ordenado que consta del par:
+			id_mensaje (int) - datos_mensaje (RegistroMensaje)
+
+			Por su parte, datos_mensaje se halla compuesto por los siguientes
+			parámetros:
+			- nombre_usuario: str
+				Nombre del usuario que envió el mensaje
+
+			- tipo_usuario: str
+				Indica el tipo de usuario que envió el mensaje: docente y alumno
+				None si el mensaje es del asistente
+
+			- fecha: datetime.datetime
+				Fecha en la que se envió o reibió el mensaje
+
+			- academico: bool
+				Indica si el mensaje es académico o no. Sólo tiene sentido
+				para los mensajes recibidos en foros docentes
+
+			- tipo_evento: str
+				Tipo del evento acontecido en el chat grupal
+
+			Para los mensajes, se incluyen los campos nombre_usuario,
+				tipo_usuario, fecha y academico, mientras que para los Eventos
+				se incluyen los campos nombre_usuario, tipo_usuario, fecha y
+				tipo_evento
+
+			- datos: dict
+				Almacena los datos que incluye el mensaje
+
+			En concreto, datos puede presentar los siguientes formatos
+
+			Para tipo texto:
+
+			·tipo_dato: 'texto'
+			·contenido: str o list str
+			 	Texto o textos a almacenar
+
+			Para tipo Multimedia con Archivo:
+
+			·tipo_dato: str
+				Tipo de Dato Multimedia almacenado: Puede adoptar los valores
+				'imagen', 'audio', 'video'. 'nota_voz', 'nota_video',
+				'documento','animacion' y 'sticker'
+
+			·contenido: str o None
+				Ruta en el sistema de ficheros en la que el servidor ha
+				almacenado el Archivo.
+
+			·mime type: str o None
+				Valor del encabezado Mime asociado al archivo
+
+			·file id: int o None
+				Identificador de archivo asociado por la plataforma de
+				mensajerı́a a dicho Archivo.
+
+			·sticker_emoji: str o None
+				emoji asociado al Sticker. Sólo para stickers
+				Parámetro opcional
+
+			·sticker_conjunto: str o None
+				Nombre del conjunto al que pertenece el Sticker.
+				Sólo para stickers
+				Parámetro opcional
+
+			·sticker_tipo: str o None
+				Tipo de sticker, puede adoptar dos valores: normal o animado.
+				Sólo para stickers.
+				Parámetro opcional
+				NOTA: Actualmente en desuso
+
+			Para tipo Contacto:
+
+			·tipo_dato: 'contacto'
+
+			·nombre: str
+				Nombre o primer nombre asociado al Contacto.
+
+			·apellidos: str o None
+				Nombre o segundo nombre asociado al Contacto.
+				Parámetro opcional
+
+			·telefono: str
+				Número de teléfono asociado al Contacto.
+
+			·vcard: str o None
+				Datos recogidos en la vcard asociada al Contacto.
+				Parámetro opcional
+
+			·id_usuario: int o None
+				Identificador de usuario asociado por la plataforma de
+				mensajerı́a al usuario asociado al Contacto.
+				Parámetro opcional
+
+			Para tipo Localizacion y Avenida:
+
+			·tipo_dato: 'localizacion'
+
+			·latitud: int
+				Latitud geográfica de la Localizacion o Avenida.
+
+			·longitud: int
+				Longitud geográfica de la Localizacion o Avenida
+
+			·titulo: str o None
+				Tı́tulo que recibe la Avenida localizada en la Localizacion.
+				Parámetro opcional
+
+			·direccion: str o None
+				Direccion de la avenida localizada en la Localizacion.
+				Parámetro opcional
+
+			·id cuadrante: int o None
+				Identificador del cuadrante asociado a la avenida localizada en
+				la Localizacion. Parámetro opcional
+
+			·tipo cuadrante: str o None
+				Tipo de cuadrante asociado a la avenida localizada en la
+				Localizacion.
+				Parámetro opcional
+
+		"""
+
+		self.__log.debug('Iniciada función "getMessagesForo" de "BotServerDAO"')
+
+		#	Comprobar los datos de entrada
+		if not isinstance(id_chat, int):
+			raise ValueError('"id_chat" debe ser int')
+
+		if not isinstance(fecha_inicio, datetime.datetime):
+			raise ValueError('"fecha_inicio" debe ser de tipo datetime.datetime')
+
+		if not isinstance(fecha_fin, datetime.datetime):
+			raise ValueError('"fecha_fin" debe ser de tipo datetime.datetime')
+
+		if bool(not division) ^ bool(particion is None):
+			raise ValueError('"division" y "particion" deben de presentar '\
+								'ambos valores enteros o None')
+		elif division:
+			if not isinstance(division, int):
+				raise ValueError('"division" debe de ser int')
+
+			if not isinstance(particion, int):
+				raise ValueError('"particion" debe de ser int')
+
+		#	Los mensajes se recorren mediante iterMensajesForo, que los lee en
+		#	orden de fecha a través del índice de fechas de Evento y consulta
+		#	también los ficheros de archivo de los periodos archivados. La
+		#	partición se toma sobre los mensajes del foro en el intervalo
+		self.__log.debug('Realizando consulta en foro con id=%d, '\
+						'desde %s a %s', id_chat, fecha_inicio, fecha_fin)
+
+		mensajes = self.iterMensajesForo(id_chat, fecha_inicio, fecha_fin)
+
+		if division:
+			mensajes = itertools.islice(mensajes, division*particion,
+												division*(particion+1))
+
+		mensaje = OrderedDict(mensajes)
+
+		self.__log.debug('Finalizada función "getMessagesForo" de "BotServerDAO"')
+		return mensaje
+
+	#	Consultas de las cabeceras de los mensajes recibidos, de los mensajes
+	#	enviados y de los eventos de un foro a partir de una fecha y un
+	#	identificador de evento. Cada consulta recorre el índice (foro,
+	#	fecha) de su tabla, de modo que sólo lee las filas del foro y las
+	#	obtiene ya ordenadas por (fecha, id) sin tener que ordenar el resto
+	#	del intervalo en cada página. "{bd}" se sustituye por la base de
+	#	datos consultada: la principal o un fichero de archivo adjunto
+	__CONSULTAS_CABECERAS_FORO = (
+'''SELECT MensajeRecibidoPublico.id AS id_mensaje,
+	CASE WHEN Usuario.apellidos IS NULL
+		THEN Usuario.nombre
+	ELSE Usuario.nombre||" "||Usuario.apellidos
+	END AS nombre_usuario,
+	Usuario.tipo AS "tipo_usuario [TIPO_USUARIO]",
+	MensajeRecibidoPublico.fecha AS fecha,
+	academico,
+	NULL AS evento_mensaje,
+	CAST(MensajeRecibidoPublico.fecha AS REAL) AS clave
+FROM {bd}.MensajeRecibidoPublico, {bd}.Mensaje, Usuario
+WHERE Mensaje.id=MensajeRecibidoPublico.id
+	AND MensajeRecibidoPublico.id_usuario_emisor=Usuario.id
+	AND id_chat_foro=? AND existente=1
+	AND (MensajeRecibidoPublico.fecha, MensajeRecibidoPublico.id) > (?, ?)
+	AND (MensajeRecibidoPublico.fecha, MensajeRecibidoPublico.id) <= (?, ?)
+ORDER BY MensajeRecibidoPublico.fecha, MensajeRecibidoPublico.id
+LIMIT ?;''',
+'''SELECT MensajeEnviadoPublico.id AS id_mensaje,
+	"Bot" AS nombre_usuario,
+	NULL AS "tipo_usuario [TIPO_USUARIO]",
+	MensajeEnviadoPublico.fecha AS fecha,
+	1 AS academico,
+	NULL AS evento_mensaje,
+	CAST(MensajeEnviadoPublico.fecha AS REAL) AS clave
+FROM {bd}.MensajeEnviadoPublico, {bd}.Mensaje
+WHERE Mensaje.id=MensajeEnviadoPublico.id
+	AND id_chat_foro_destino=? AND existente=1
+	AND (MensajeEnviadoPublico.fecha, MensajeEnviadoPublico.id) > (?, ?)
+	AND (MensajeEnviadoPublico.fecha, MensajeEnviadoPublico.id) <= (?, ?)
+ORDER BY MensajeEnviadoPublico.fecha, MensajeEnviadoPublico.id
+LIMIT ?;''',
+'''SELECT EventoChatGrupal.id AS id_mensaje,
+	CASE WHEN Usuario.apellidos IS NULL
+		THEN Usuario.nombre
+		ELSE Usuario.nombre||" "||Usuario.apellidos
+	END AS nombre_usuario,
+	NULL AS "tipo_usuario [TIPO_USUARIO]",
+	EventoChatGrupal.fecha AS fecha,
+	1 AS academico,
+	CASE EventoChatGrupal.tipo
+	WHEN 0
+		THEN Usuario.nombre||" entró en el grupo"
+	WHEN 1
+		THEN Usuario.nombre||" salió del grupo"
+	WHEN 2
+		THEN Usuario.nombre||" fue registrad@"
+	WHEN 3
+		THEN Usuario.nombre||" salió del grupo"
+	WHEN 4
+		THEN Usuario.nombre||" fue banead@ del grupo"
+	WHEN 5
+		THEN Usuario.nombre||" fue expulsad@ del grupo"
+	ELSE NULL
+	END AS evento_mensaje,
+	CAST(EventoChatGrupal.fecha AS REAL) AS clave
+FROM {bd}.EventoChatGrupal, Usuario
+WHERE EventoChatGrupal.id_usuario=Usuario.id
+	AND id_chat_foro=?
+	AND (EventoChatGrupal.fecha, EventoChatGrupal.id) > (?, ?)
+	AND (EventoChatGrupal.fecha, EventoChatGrupal.id) <= (?, ?)
+ORDER BY EventoChatGrupal.fecha, EventoChatGrupal.id
+LIMIT ?;''')
+
+	def __iter_cabeceras_foro(self, consulta: str, archivo: tuple or None,
+							id_chat: int, clave_inicio: tuple, clave_fin: tuple,
+							tam_pagina: int):
+
+		"""Recorre mediante paginación por clave (fecha, id) las filas
+		devueltas por una de las consultas de cabeceras de un foro entre dos
+		claves, excluida la inicial e incluida la final. Cada página se
+		obtiene con una consulta independiente sobre la base de datos
+		principal o, si se indica el periodo y el fichero de "archivo", sobre
+		dicho fichero de archivo, que se adjunta a la conexión en cada página
+		"""
+
+		clave = clave_inicio
+
+		while True:
+
+			if archivo:
+				esquema = self.__attach_archivo(*archivo)
+
+				if esquema is None:
+					return
+			else:
+				esquema = 'main'
+
+			cursor = self.__read_connection().cursor()
+			filas = cursor.execute(consulta.format(bd=esquema),
+									(id_chat, clave[0], clave[1], clave_fin[0],
+									clave_fin[1], tam_pagina)).fetchall()
+			cursor.close()
+
+			for fila in filas:
+				yield (fila['clave'], fila['id_mensaje']), archivo, fila
+
+			if len(filas) < tam_pagina:
+				return
+
+			clave = (filas[-1]['clave'], filas[-1]['id_mensaje'])
+
+	def __get_datos_mensajes(self, ids_mensaje: list, esquema: str='main'):
+
+		"""Obtiene todos los datos de los mensajes indicados de la base de
+		datos principal o del fichero de archivo adjunto con nombre "esquema"
+
+		Devuelve:
+		---------
+			dict: Diccionario id_mensaje (int) - datos (OrderedDict) con el
+				mismo formato que los datos devueltos por getMensajesForo
+		"""
+
+		datos = {}
+
+		if not ids_mensaje:
+			return datos
+
+		cursor = self.__read_connection().cursor()
+		cursor.execute('''SELECT Dato_Mensaje.id_mensaje AS id_mensaje,
+							Dato_Mensaje.id_dato AS id_dato,
+							DatoTexto.texto AS texto,
+							DatoArchivo.tipo AS "tipo_dato [TIPO_DATOARCHIVO]",
+							DatoArchivo.ruta_archivo AS contenido,
+							DatoArchivo.file_id AS file_id,
+							DatoArchivo.mime_type AS mime_type,
+							DatoArchivoSticker.emoji AS sticker_emoji,
+							DatoArchivoSticker.conjunto AS sticker_conjunto,
+							DatoArchivoSticker.tipo
+										AS "tipo_sticker [TIPO_STICKER]",
+							DatoContacto.telefono AS telefono,
+							DatoContacto.nombre AS nombre,
+							DatoContacto.apellidos AS apellidos,
+							DatoContacto.id_usuario AS id_usuario,
+							DatoContacto.vcard AS vcard,
+							DatoLocalizacion.longitud AS longitud,
+							DatoLocalizacion.latitud AS latitud,
+							DatoLocalizacion.titulo AS titulo,
+							DatoLocalizacion.direccion AS direccion,
+							DatoLocalizacion.id_cuadrante AS id_cuadrante,
+							DatoLocalizacion.tipo_cuadrante AS tipo_cuadrante
+						FROM %s.Dato_Mensaje
+						LEFT JOIN %s.DatoTexto
+							ON DatoTexto.id=Dato_Mensaje.id_dato
+						LEFT JOIN %s.DatoArchivo
+							ON DatoArchivo.id=Dato_Mensaje.id_dato
+						LEFT JOIN %s.DatoArchivoSticker
+							ON DatoArchivoSticker.id=Dato_Mensaje.id_dato
+						LEFT JOIN %s.DatoContacto
+							ON DatoContacto.id=Dato_Mensaje.id_dato
+						LEFT JOIN %s.DatoLocalizacion
+							ON DatoLocalizacion.id=Dato_Mensaje.id_dato
+						WHERE Dato_Mensaje.id_mensaje IN
+							(SELECT value FROM json_each(?))
+						ORDER BY Dato_Mensaje.id_mensaje,
+									Dato_Mensaje.id_dato;''' % ((esquema,)*6),
+						(BotServerDAO.__to_json_array(ids_mensaje),))
+
+		for d in cursor:
+
+			#	Registrar SOLO los campos que correspondan al tipo de dato
+			if d['texto'] is not None:
+				dato = RegistroDato('texto', d['texto'])
+
+			elif d['tipo_dato'] == 'sticker':
+				dato = RegistroDato(*d[3:10])
+
+			elif d['tipo_dato'] is not None:
+				dato = RegistroDato(*d[3:7])
+
+			elif d['telefono'] is not None:
+				dato = RegistroDato('contacto', **dict(zip(d.keys()[10:15],
+																	d[10:15])))
+
+			elif d['longitud'] is not None:
+				dato = RegistroDato('localizacion', **dict(zip(d.keys()[15:],
+																	d[15:])))
+
+			else:
+				continue
+
+			datos.setdefault(d['id_mensaje'], OrderedDict())[d['id_dato']] = dato
+
+		cursor.close()
+
+		return datos
+
+	def __iter_mensajes_ventana(self, id_chat: int, archivos: list,
+							clave_inicio: tuple, clave_fin: tuple,
+							tam_pagina: int):
+
+		"""Recorre ordenadamente los mensajes y eventos de un foro entre dos
+		claves (fecha, id) de la base de datos principal (None) y de los
+		ficheros de archivo (periodo, fichero) indicados en "archivos"
+		"""
+
+		#	Mezclar ordenadamente los mensajes recibidos, los enviados y los
+		#	eventos del foro de cada base de datos
+		cabeceras = heapq.merge(*[self.__iter_cabeceras_foro(consulta,
+									archivo, id_chat, clave_inicio, clave_fin,
+									tam_pagina)
+							for consulta in BotServerDAO.__CONSULTAS_CABECERAS_FORO
+							for archivo in archivos],
+							key=lambda c: c[0])
+
+		while True:
+
+			#	Tomar la siguiente página de mensajes y sus datos
+			pagina = [(archivo, fila) for _, archivo, fila in
+								itertools.islice(cabeceras, tam_pagina)]
+
+			if not pagina:
+				break
+
+			datos = {}
+
+			for archivo in archivos:
+				ids_mensaje = [m['id_mensaje'] for a, m in pagina
+								if a == archivo and m['evento_mensaje'] is None]
+
+				if not ids_mensaje:
+					continue
+
+				esquema = (self.__attach_archivo(*archivo) if archivo
+																else 'main')
+
+				if esquema is not None:
+					datos.update(self.__get_datos_mensajes(ids_mensaje,
+																	esquema))
+
+			for _, m in pagina:
+
+				if m['evento_mensaje']:
+					#	El mensaje contiene un evento
+					mensaje = RegistroMensaje(m[1], m[3],
+												evento=m['evento_mensaje'])
+
+				elif m['id_mensaje'] in datos:
+					mensaje = RegistroMensaje(m[1], m[3], m[2], m[4],
+												datos[m['id_mensaje']])
+
+				else:
+					#	Los mensajes sin datos no se recopilan
+					continue
+
+				yield m['id_mensaje'], mensaje
+
+	def iterMensajesForo(self, id_chat: int,
+							fecha_inicio: datetime.datetime,
+							fecha_fin: datetime.datetime,
+							tam_pagina: int=1000):
+
+		"""Permite recorrer todos los mensajes y eventos de un foro en un
+			intervalo de tiempo específico, ordenados por fecha, sin cargarlos
+			todos en memoria. Los mensajes se leen de la base de datos en
+			páginas consecutivas mediante paginación por clave (fecha, id).
+			Los mensajes de los periodos archivados se leen de sus ficheros
+			de archivo
+
+		Recibe:
+		------
+		id_chat: int
+			Identificador del chat sobre el que se aplica la operación
+
+		fecha_inicio: datetime.datetime
+			Fecha de inicio a partir de la cual se empiezan a recopilar mensajes
+
+		fecha_fin: datetime.datetime
+			Fecha de fin a partir de la cual se dejan de recopilar mensajes
+
+		tam_pagina: int
+			Número máximo de mensajes leídos en cada consulta. Por defecto 1000
+
+		Devuelve:
+			Generador de tuplas (id_mensaje, datos_mensaje) con el mismo
+			formato que los pares del diccionario devuelto por getMensajesForo
+		"""
+
+		self.__log.debug('Iniciada función "iterMensajesForo" de "BotServerDAO"')
+
+		#	Comprobar los datos de entrada
+		if not isinstance(id_chat, int):
+			raise ValueError('"id_chat" debe ser int')
+
+		if not isinstance(fecha_inicio, datetime.datetime):
+			raise ValueError('"fecha_inicio" debe ser de tipo datetime.datetime')
+
+		if not isinstance(fecha_fin, datetime.datetime):
+			raise ValueError('"fecha_fin" debe ser de tipo datetime.datetime')
+
+		if not isinstance(tam_pagina, int) or tam_pagina < 1:
+			raise ValueError('"tam_pagina" debe de ser int mayor que 0')
+
+		#	Dividir el intervalo en ventanas consecutivas en los límites de
+		#	los periodos archivados que abarca, de forma que cada ventana
+		#	consulta como mucho un fichero de archivo además de la base de
+		#	datos principal
+		periodos = self.__periodos_archivados(fecha_inicio, fecha_fin)
+
+		claves = ([(fecha_inicio.timestamp(), -1)] +
+					sorted({(limite.timestamp(), -1)
+							for _, _, inicio, fin in periodos
+							for limite in (inicio, fin)
+							if fecha_inicio < limite <= fecha_fin}) +
+					[(fecha_fin.timestamp(), BotServerDAO.__MAX_ID)])
+
+		for clave_inicio, clave_fin in zip(claves, claves[1:]):
+
+			archivos = [None] + [(periodo, fichero)
+								for periodo, fichero, inicio, fin in periodos
+								if (inicio.timestamp(), -1) < clave_fin and
+									(fin.timestamp(), -1) > clave_inicio]
+
+			yield from self.__iter_mensajes_ventana(id_chat, archivos,
+										clave_inicio, clave_fin, tam_pagina)
+
+		self.__log.debug('Finalizada función "iterMensajesForo" de "BotServerDAO"')
+
+	def searchMensajesForo(self, texto: str, id_chat: int=None,
+							fecha_inicio: datetime.datetime=None,
+							fecha_fin: datetime.datetime=None,
+							limite: int=20) -> list:
+
+		"""Permite buscar los mensajes de los Foros Docentes que contienen
+			todas las palabras de un texto mediante el índice de texto
+			completo de los mensajes. Las palabras se buscan sin distinguir
+			mayúsculas, minúsculas ni tildes y como prefijo, de forma que
+			"recurs" encuentra "recursión" y "recursivo". Los mensajes de
+			los periodos archivados no se incluyen en la búsqueda
+
+		Parámetros:
+		-----------
+		texto: str
+			Palabras a buscar
+
+		id_chat: int o None
+			Identificador del foro en el que buscar. Con None se busca en
+			todos los foros
+
+		fecha_inicio: datetime.datetime o None
+			Fecha a partir de la cual se buscan mensajes
+
+		fecha_fin: datetime.datetime o None
+			Fecha hasta la que se buscan mensajes
+
+		limite: int
+			Número máximo de mensajes devueltos. Por defecto 20
+
+		Devuelve:
+		---------
+			list de RegistroCoincidencia: Mensajes encontrados, del más
+			reciente al más antiguo, con el identificador y nombre del foro
+			("id_chat", "nombre_foro"), el nombre y tipo del usuario que lo
+			envió ("nombre_usuario", "tipo_usuario"), su fecha ("fecha") y
+			el texto que coincide con la búsqueda ("texto")
+		"""
+
+		self.__log.debug('Iniciada función "searchMensajesForo" de'\
+															' "BotServerDAO"')
+
+		#	Comprobar los datos de entrada
+		if not isinstance(texto, str):
+			raise ValueError('"texto" debe de ser str')
+
+		if id_chat is not None and not isinstance(id_chat, int):
+			raise ValueError('"id_chat" debe de ser int o None')
+
+		if fecha_inicio is not None and not isinstance(fecha_inicio,
+															datetime.datetime):
+			raise ValueError('"fecha_inicio" debe ser de tipo '\
+												'datetime.datetime o None')
+
+		if fecha_fin is not None and not isinstance(fecha_fin,
+															datetime.datetime):
+			raise ValueError('"fecha_fin" debe ser de tipo datetime.datetime'\
+																	' o None')
+
+		if not isinstance(limite, int) or limite < 1:
+			raise ValueError('"limite" debe de ser int mayor que 0')
+
+		#	Cada palabra se busca como prefijo entre comillas, de forma que
+		#	el texto introducido no se interprete como sintaxis de FTS5
+		palabras = re.findall(r'\w+', texto)
+
+		if not palabras:
+			return []
+
+		consulta = ' '.join('"%s"*' % palabra for palabra in palabras)
+
+		cursor = self.__read_connection().cursor()
+		cursor.execute('''SELECT Dato_Mensaje.id_mensaje AS id_mensaje,
+							Foro.id_chat AS id_chat,
+							Foro.nombre AS nombre_foro,
+							CASE WHEN MensajeRecibidoPublico.id IS NULL
+								THEN "Bot"
+							WHEN Usuario.apellidos IS NULL
+								THEN Usuario.nombre
+							ELSE Usuario.nombre||" "||Usuario.apellidos
+							END AS nombre_usuario,
+							Usuario.tipo AS "tipo_usuario [TIPO_USUARIO]",
+							Evento.fecha AS fecha,
+							TextoMensaje.texto AS texto
+						FROM TextoMensaje
+						JOIN Dato_Mensaje
+							ON Dato_Mensaje.id_dato=TextoMensaje.rowid
+						JOIN Mensaje ON Mensaje.id=Dato_Mensaje.id_mensaje
+						JOIN Evento ON Evento.id=Dato_Mensaje.id_mensaje
+						LEFT JOIN MensajeRecibidoPublico
+							ON MensajeRecibidoPublico.id=Dato_Mensaje.id_mensaje
+						LEFT JOIN MensajeEnviadoPublico
+							ON MensajeEnviadoPublico.id=Dato_Mensaje.id_mensaje
+						LEFT JOIN Usuario
+							ON Usuario.id=MensajeRecibidoPublico.id_usuario_emisor
+						JOIN Foro
+							ON Foro.id_chat=COALESCE(
+									MensajeRecibidoPublico.id_chat_foro,
+									MensajeEnviadoPublico.id_chat_foro_destino)
+						WHERE TextoMensaje MATCH ?1 AND Mensaje.existente=1
+							AND (?2 IS NULL OR Foro.id_chat=?2)
+							AND (?3 IS NULL OR Evento.fecha >= ?3)
+							AND (?4 IS NULL OR Evento.fecha <= ?4)
+						ORDER BY Evento.fecha DESC, Evento.id DESC
+						LIMIT ?5;''',
+						(consulta, id_chat, fecha_inicio, fecha_fin, limite))
+
+		coincidencias = [RegistroCoincidencia(*fila) for fila in cursor]
+
+		cursor.close()
+
+		self.__log.debug('Finalizada función "searchMensajesForo" de'\
+															' "BotServerDAO"')
+		return coincidencias
+
+	def __periodo_archivo(fecha: datetime.datetime):
+
+		"""Obtiene el periodo de archivo al que pertenece una fecha
+
+		Devuelve:
+		---------
+			tuple(str, datetime.datetime, datetime.datetime): Nombre del
+				periodo ("AAAA_N") y sus fechas de inicio y de fin, esta
+				última excluida
+		"""
+
+		meses = BotServerDAO.__MESES_PERIODO_ARCHIVO
+		n_periodo = (fecha.month-1)//meses
+		mes_fin = (n_periodo+1)*meses
+
+		inicio = datetime.datetime(fecha.year, n_periodo*meses+1, 1)
+		fin = datetime.datetime(fecha.year + mes_fin//12, mes_fin%12+1, 1)
+
+		return '%d_%d' % (fecha.year, n_periodo+1), inicio, fin
+
+	def __install_archivo(filename_output: str):
+
+		"""Crea un fichero de archivo con el esquema de la base de datos y
+		los índices usados por las consultas de mensajes
+		"""
+
+		BotServerDAO.__install_database(filename_output=filename_output)
+		BotServerDAO.__migrate_archivo(filename_output)
+
+	def __archive_periodo(self, periodo: str, inicio: datetime.datetime,
+							fin: datetime.datetime, id_max: int):
+
+		"""Traslada los eventos de un periodo con identificador no superior
+		a id_max, junto con sus mensajes y datos, al fichero de archivo del
+		periodo
+
+		Devuelve:
+		---------
+			tuple(int, int): Número de eventos y de datos trasladados
+		"""
+
+		fichero = 'cprofessorbot_archivo_%s.db' % periodo
+		ruta = self.__directorio_archivo + fichero
+
+		if not os.path.isfile(ruta):
+			BotServerDAO.__install_archivo(filename_output=ruta)
+		else:
+			BotServerDAO.__migrate_archivo(ruta)
+
+		#	Eventos del periodo a archivar en la base de datos indicada
+		eventos = 'SELECT id FROM %s.Evento WHERE fecha >= ? AND fecha < ?'\
+																' AND id <= ?'
+		parametros = (inicio, fin, id_max)
+
+		#	Copiar las filas al fichero de archivo y confirmar la copia antes
+		#	de eliminarlas de la base de datos principal. Si el proceso se
+		#	interrumpe entre ambos pasos, el fichero contiene filas que no se
+		#	consultan hasta que el periodo se registra en el catálogo y que
+		#	se ignoran al repetir la copia
+		con = sqlite3.connect(ruta, isolation_level=None, uri=self.__memoria)
+
+		try:
+			con.execute('ATTACH DATABASE ? AS principal;', (self.__origen,))
+			con.execute('BEGIN')
+
+			for tabla, columna in BotServerDAO.__TABLAS_ARCHIVO_EVENTO:
+				con.execute('''INSERT OR IGNORE INTO main.%s
+								SELECT * FROM principal.%s
+								WHERE %s IN (%s);''' % (tabla, tabla, columna,
+								eventos % 'principal'), parametros)
+
+			for tabla in BotServerDAO.__TABLAS_ARCHIVO_DATO:
+				con.execute('''INSERT OR IGNORE INTO main.%s
+								SELECT * FROM principal.%s
+								WHERE id IN (SELECT id_dato
+											FROM principal.Dato_Mensaje
+											WHERE id_mensaje IN (%s));''' % (
+								tabla, tabla, eventos % 'principal'), parametros)
+
+			con.execute('COMMIT')
+
+		except BaseException:
+			if con.in_transaction:
+				con.execute('ROLLBACK')
+			raise
+
+		finally:
+			con.close()
+
+		#	Eliminar las filas de la base de datos principal y registrar el
+		#	periodo en el catálogo en una misma transacción
+		def operacion(cursor):
+
+			filtro = eventos % 'main'
+
+			for tabla in BotServerDAO.__TABLAS_ARCHIVO_DATO:
+				cursor.execute('''DELETE FROM %s WHERE id IN
+									(SELECT id_dato FROM Dato_Mensaje
+									WHERE id_mensaje IN (%s));''' % (tabla,
+									filtro), parametros)
+
+			n_datos = cursor.rowcount
+
+			cursor.execute('''DELETE FROM Mensaje_Chat
+								WHERE id_mensaje_actual IN (%s);''' % filtro,
+								parametros)
+
+			for tabla, columna in BotServerDAO.__TABLAS_ARCHIVO_EVENTO:
+				cursor.execute('DELETE FROM %s WHERE %s IN (%s);' % (tabla,
+									columna, filtro), parametros)
+
+			n_eventos = cursor.rowcount
+
+			cursor.execute('''INSERT INTO ArchivoMensajes
+								VALUES(?,?,?,?,?,?,?)
+							ON CONFLICT(periodo) DO UPDATE SET
+								n_eventos=n_eventos+excluded.n_eventos,
+								n_datos=n_datos+excluded.n_datos,
+								fecha_archivo=excluded.fecha_archivo;''',
+							(periodo, fichero, inicio, fin, n_eventos, n_datos,
+							datetime.datetime.now()))
+
+			#	La caché de mensajes recientes puede contener mensajes
+			#	archivados
+			self.__cache_mensajes.clear()
+
+			return n_eventos, n_datos
+
+		return self.__write(operacion)
+
+	def archiveMensajes(self, fecha_limite: datetime.datetime) -> list:
+
+		"""Traslada los mensajes y eventos de los periodos semestrales
+			finalizados antes de la fecha límite, junto con sus datos, a un
+			fichero de archivo por periodo, manteniendo reducida la base de
+			datos principal. Los recuentos diarios de mensajes de los foros
+			se conservan en la base de datos principal y los archivos
+			multimedia no se mueven
+
+		Parámetros:
+		-----------
+		fecha_limite: datetime.datetime
+			Fecha límite de archivo. Sólo se archivan los periodos que
+			finalizan antes de esta fecha
+
+		Devuelve:
+		---------
+			list de dict: Un diccionario por cada periodo archivado con el
+			nombre del periodo ("periodo"), el nombre del fichero de archivo
+			("fichero") y el número de eventos ("eventos") y de datos
+			("datos") trasladados
+		"""
+
+		self.__log.debug('Iniciada función "archiveMensajes" de "BotServerDAO"')
+
+		#	Comprobar los datos de entrada
+		if not isinstance(fecha_limite, datetime.datetime):
+			raise ValueError('"fecha_limite" debe ser de tipo datetime.datetime')
+
+		os.makedirs(self.__directorio_archivo, exist_ok=True)
+
+		informe = []
+		cursor = self.__read_connection().cursor()
+		fecha = cursor.execute('SELECT MIN(fecha) FROM Evento;').fetchone()[0]
+
+		while fecha is not None:
+
+			periodo, inicio, fin = BotServerDAO.__periodo_archivo(
+										datetime.datetime.fromtimestamp(fecha))
+
+			if fin > fecha_limite:
+				break
+
+			#	Los eventos registrados a partir de este momento con fecha
+			#	del periodo se archivarán en la siguiente ejecución
+			id_max = cursor.execute('''SELECT MAX(id) FROM Evento
+										WHERE fecha >= ? AND fecha < ?;''',
+										(inicio, fin)).fetchone()[0]
+
+			n_eventos, n_datos = self.__archive_periodo(periodo, inicio, fin,
+																	id_max)
+
+			self.__log.info('Archivado el periodo %s: %d eventos y %d datos '\
+							'trasladados a su fichero de archivo' % (periodo,
+							n_eventos, n_datos))
+
+			informe.append({
+								'periodo': periodo,
+								'fichero': 'cprofessorbot_archivo_%s.db' %
+																	periodo,
+								'eventos': n_eventos,
+								'datos': n_datos
+							})
+
+			fecha = cursor.execute('''SELECT MIN(fecha) FROM Evento
+										WHERE fecha >= ?;''',
+										(fin,)).fetchone()[0]
+
+		cursor.close()
+
+		self.__log.debug('Finalizada función "archiveMensajes" de "BotServerDAO"')
+		return informe
+
+	def __delete_eventos(cursor, ids_eventos: str, esquema: str='main'):
+
+		"""Elimina los eventos del array JSON "ids_eventos" junto con sus
+		mensajes y datos, de la base de datos principal o de un fichero de
+		archivo adjunto como "esquema", que no contiene la tabla Mensaje_Chat
+
+		Devuelve:
+		---------
+			tuple(int, int): Número de eventos y de datos eliminados
+		"""
+
+		filtro = 'SELECT value FROM json_each(?)'
+
+		for tabla in BotServerDAO.__TABLAS_ARCHIVO_DATO:
+			cursor.execute('''DELETE FROM %s.%s WHERE id IN
+								(SELECT id_dato FROM %s.Dato_Mensaje
+								WHERE id_mensaje IN (%s));''' % (esquema, tabla,
+								esquema, filtro), (ids_eventos,))
+
+		n_datos = cursor.rowcount
+
+		if esquema == 'main':
+			cursor.execute('''DELETE FROM Mensaje_Chat
+								WHERE id_mensaje_actual IN (%s);''' % filtro,
+								(ids_eventos,))
+
+		for tabla, columna in BotServerDAO.__TABLAS_ARCHIVO_EVENTO:
+			cursor.execute('DELETE FROM %s.%s WHERE %s IN (%s);' % (esquema,
+									tabla, columna, filtro), (ids_eventos,))
+
+		n_eventos = cursor.rowcount
+
+		return n_eventos, n_datos
+
+	def __recuento_resumen_eventos(cursor, ids_eventos: str,
+													esquema: str='main'):
+
+		"""Calcula, por foro y día, el número de mensajes de los foros entre
+		los eventos del array JSON "ids_eventos" con el mismo criterio que
+		el recuento diario de ResumenMensajesForo. Se ejecuta sobre la base
+		de datos principal o sobre un fichero de archivo adjunto como
+		"esquema"
+
+		Devuelve:
+		---------
+			list(tuple): Con el foro, el día y el número de mensajes
+				recibidos, enviados, académicos y no académicos
+		"""
 
-			#	Mapear manualmente el TIPO_DATOARCHIVO a la cadena
-			#	correspondiente porque no se ejecuta manuialmente
-			tipo_dato = m[2]
+		filtro = 'SELECT value FROM json_each(?)'
 
-			#	Registrar los datos contenidos en el mismo
-			if tipo_dato == 'texto':
-				#	El dato es texto
-				comunicado['datos'][m[0]] = dict(zip(m.keys()[1:4], m[1:4]))
-			elif tipo_dato in BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO'] and tipo_dato != 'sticker':
-				#	El dato es multimedia diferente de sticker
-				comunicado['datos'][m[0]] = dict(zip(m.keys()[1:6], m[1:6]))
-			elif tipo_dato == 'sticker':
-				#	El dato es multimedia sticker
-				comunicado['datos'][m[0]] = dict(zip(m.keys()[1:9], m[1:9]))
-			elif tipo_dato == 'contacto':
-				#	El dato es contacto
-				comunicado['datos'][m[0]] = dict(zip(m.keys()[1:3], m[1:3]))
-				comunicado['datos'][m[0]].update(dict(zip(m.keys()[9:14], m[9:14])))
-			else:
-				#	El dato es una localización
-				comunicado['datos'][m[0]] = dict(zip(m.keys()[1:3], m[1:3]))
-				comunicado['datos'][m[0]].update(dict(zip(m.keys()[14:], m[14:])))
+		return cursor.execute('''SELECT id_chat_foro, dia, SUM(recibido),
+									SUM(1-recibido),
+									SUM(recibido AND academico IS 1),
+									SUM(recibido AND academico IS NOT 1)
+								FROM
+								(SELECT id_chat_foro,
+									DATE(fecha, 'unixepoch', 'localtime') AS dia,
+									1 AS recibido, academico
+								FROM %(bd)s.MensajeRecibidoPublico
+								WHERE id IN (%(filtro)s)
+								UNION ALL
+								SELECT id_chat_foro_destino AS id_chat_foro,
+									DATE(fecha, 'unixepoch', 'localtime') AS dia,
+									0 AS recibido, NULL AS academico
+								FROM %(bd)s.MensajeEnviadoPublico
+								WHERE id IN (%(filtro)s))
+								GROUP BY id_chat_foro, dia;''' % {'bd': esquema,
+																'filtro': filtro},
+								(ids_eventos, ids_eventos)).fetchall()
+
+	def __descontar_resumen(cursor, recuentos: list):
+
+		"""Descuenta de ResumenMensajesForo los recuentos por foro y día de
+		los mensajes eliminados (ver __recuento_resumen_eventos) y elimina
+		los recuentos diarios que quedan sin mensajes
+		"""
 
-			#	Cambiar el tipo_datos por su cadena correspondiente
-			comunicado['datos'][m[0]]['tipo_dato'] = tipo_dato
+		if not recuentos:
+			return
 
+		cursor.executemany('''UPDATE ResumenMensajesForo
+								SET recibidos=MAX(recibidos-?, 0),
+									enviados=MAX(enviados-?, 0),
+									academicos=MAX(academicos-?, 0),
+									no_academicos=MAX(no_academicos-?, 0)
+								WHERE id_chat_foro=? AND dia=?;''',
+								[(recibidos, enviados, academicos, no_academicos,
+									id_chat, dia)
+								for id_chat, dia, recibidos, enviados,
+									academicos, no_academicos in recuentos])
 
-		#	Tomar los foros
-		comunicado['foros'] = {}
+		cursor.executemany('''DELETE FROM ResumenMensajesForo
+								WHERE id_chat_foro=? AND dia=? AND
+									recibidos=0 AND enviados=0;''',
+								[(id_chat, dia) for id_chat, dia, *_ in recuentos])
 
-		consulta = cursor.execute(
-							'''SELECT Foro.id_chat, Foro.nombre
-								FROM Foro, Comunicado_Foro
-								WHERE Foro.id_chat=Comunicado_Foro.id_chat_foro
-								AND Comunicado_Foro.id_comunicado=?;''',
-								(id_comunicado,))
+	def __prune_archivo(self, periodo: str, fichero: str, limites: dict,
+															tam_lote: int):
 
-		if consulta:
-			for fila in consulta:
-				comunicado['foros'][fila[0]] = fila[1]
+		"""Elimina en lotes los eventos anteriores a la fecha límite de su
+		clase del fichero de archivo de un periodo. Si el fichero queda vacío
+		se elimina junto con su entrada del catálogo y, si no, se compacta
 
-		#	Cerrar cursor y semáforo
-		cursor.close()
-		mutex.release()
+		Devuelve:
+		---------
+			tuple(int, int, int, bool): Número de eventos y de datos
+				eliminados, bytes liberados y si el fichero ha sido eliminado
+		"""
 
-		self.__log.debug('Finalizada función "getComunicado" de "BotServerDAO"')
-		return comunicado
+		ruta = self.__directorio_archivo + fichero
 
-	def removeComunicado(self, id_comunicado: int):
+		if not os.path.isfile(ruta):
+			return 0, 0, 0, False
 
-		"""Permite eliminar un Comunicado registrado
+		tamano = os.path.getsize(ruta)
+		n_eventos = n_datos = 0
 
-		Recibe:
-		-------
-		id_comunicado: int
-			Identificador del Comunicado cuya infromación se desea obtener
+		if self.__memoria:
+			ruta_adjunta = 'file:%s?mode=rw&vfs=%s' % (
+									pathname2url(os.path.abspath(ruta)),
+									BotServerDAO.__VFS_DISCO)
+		else:
+			ruta_adjunta = ruta
+
+		#	Cada lote se ejecuta en el hilo escritor con el fichero adjunto a
+		#	la conexión de escritura, de modo que los eventos se eliminan del
+		#	fichero y se descuentan del recuento diario de los foros de la
+		#	base de datos principal en una misma transacción. Con la base de
+		#	datos principal en modo WAL, la confirmación es atómica en cada
+		#	fichero pero no entre ambos
+		def lote(cursor, seleccion, fecha_limite, clave):
+			cursor.execute('ATTACH DATABASE ? AS archivo_depuracion;',
+															(ruta_adjunta,))
+
+			try:
+				cursor.execute('BEGIN')
+
+				try:
+					filas = cursor.execute(seleccion, (clave[0], clave[1],
+										fecha_limite, tam_lote)).fetchall()
+
+					eventos = datos = 0
+
+					if filas:
+						ids_eventos = BotServerDAO.__to_json_array(filas)
+						BotServerDAO.__descontar_resumen(cursor,
+							BotServerDAO.__recuento_resumen_eventos(cursor,
+										ids_eventos, 'archivo_depuracion'))
+						eventos, datos = BotServerDAO.__delete_eventos(cursor,
+										ids_eventos, 'archivo_depuracion')
+
+					cursor.execute('COMMIT')
+
+				except BaseException:
+					cursor.execute('ROLLBACK')
+					raise
+
+			finally:
+				cursor.execute('DETACH DATABASE archivo_depuracion;')
+
+			return eventos, datos, ((filas[-1][1], filas[-1][0])
+										if len(filas) == tam_lote else None)
+
+		for clase, fecha_limite in limites.items():
+
+			seleccion = BotServerDAO.__seleccion_clase(clase,
+														'archivo_depuracion')
+			clave = (0, -1)
+
+			while clave is not None:
+				eventos, datos, clave = self.__submit_write(
+							lambda cursor, clave=clave: lote(cursor, seleccion,
+												fecha_limite, clave),
+							en_transaccion=False).result()
+				n_eventos += eventos
+				n_datos += datos
+
+		con = sqlite3.connect(ruta, isolation_level=None)
+		cursor = con.cursor()
+
+		try:
+			restantes = cursor.execute('SELECT COUNT(*) FROM Evento;'
+																).fetchone()[0]
+
+			if restantes and n_eventos:
+				cursor.execute('VACUUM;')
+
+		finally:
+			cursor.close()
+			con.close()
+
+		if n_eventos:
+			def operacion(cursor):
+				if restantes:
+					cursor.execute('''UPDATE ArchivoMensajes
+										SET n_eventos=MAX(n_eventos-?, 0),
+											n_datos=MAX(n_datos-?, 0)
+										WHERE periodo=?;''',
+										(n_eventos, n_datos, periodo))
+				else:
+					cursor.execute('DELETE FROM ArchivoMensajes WHERE periodo=?;',
+									(periodo,))
+
+			self.__write(operacion)
+
+		if not restantes:
+			#	El periodo ya no se consulta al no estar en el catálogo
+			os.remove(ruta)
+			return n_eventos, n_datos, tamano, True
+
+		return n_eventos, n_datos, tamano - os.path.getsize(ruta), False
+
+	def __seleccion_clase(clase: str, esquema: str='main'):
+
+		"""Construye la consulta que selecciona, mediante paginación por
+		clave (fecha, id), los identificadores y claves de los eventos de
+		una clase de mensajes anteriores a una fecha límite de la base de
+		datos principal o de un fichero de archivo adjunto como "esquema"
+		"""
+
+		return '''SELECT id, CAST(fecha AS REAL) AS clave
+					FROM %s.Evento
+					WHERE (fecha, id) > (?, ?) AND fecha < ? AND (%s)
+					ORDER BY fecha, id
+					LIMIT ?;''' % (esquema, ' OR '.join(
+								'EXISTS (SELECT 1 FROM %s.%s WHERE %s.id=Evento.id)'
+								% (esquema, tabla, tabla)
+								for tabla in BotServerDAO.__TABLAS_CLASE_EVENTO[
+																		clase]))
+
+	def pruneMensajes(self, limites: dict, tam_lote: int=None) -> dict:
+
+		"""Elimina definitivamente los mensajes y eventos anteriores a la
+			fecha límite de retención de su clase, junto con sus datos, de
+			la base de datos principal y de los ficheros de archivo. Los
+			eventos se eliminan en lotes, cada uno en su propia transacción,
+			para no retrasar el resto de escrituras. Los ficheros de archivo
+			que quedan vacíos se eliminan y el resto se compactan.
+
+			El espacio liberado en la base de datos principal se devuelve al
+			sistema de ficheros con incrementalVacuum y los archivos
+			multimedia que dejan de estar referenciados no se eliminan (ver
+			listRutasArchivos)
+
+		Parámetros:
+		-----------
+		limites: dict
+			Formado por el par clase (str) - fecha límite
+			(datetime.datetime). Las clases admitidas son "privados" (mensajes
+			de los chats privados), "foros" (mensajes y eventos de los foros)
+			y "resumen_foros" (recuentos diarios de mensajes de los foros,
+			de los que se descuentan los mensajes de los foros eliminados).
+			Las clases omitidas no se depuran
+
+		tam_lote: int
+			Número máximo de eventos eliminados en cada transacción. Por
+			defecto 500
 
 		Devuelve:
-			list de str
-			Lista de ficheros asociados a los datos multimedia del comunicado y
-			que ya puede ser eliminado
+		---------
+			dict: Con el número de eventos ("eventos"), datos ("datos") y
+				recuentos diarios ("resumenes") eliminados, los ficheros de
+				archivo eliminados ("archivos_eliminados"), los bytes
+				liberados en los ficheros de archivo
+				("bytes_archivo_liberados") y la duración en segundos
+				("duracion")
 		"""
 
-		self.__log.debug('Iniciada función "removeComunicado" de '\
-															'"BotServerDAO"')
+		self.__log.debug('Iniciada función "pruneMensajes" de "BotServerDAO"')
 
-		#	Comprobar parámetros de entrada
-		if not isinstance(id_comunicado, int):
-			raise ValueError('"id_comunicado" debe de ser un int')
+		#	Comprobar los datos de entrada
+		if not isinstance(limites, dict):
+			raise ValueError('"limites" debe de ser dict')
 
-		#	Tomar cursor y semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
+		for clase, fecha_limite in limites.items():
+			if (clase not in BotServerDAO.__TABLAS_CLASE_EVENTO and
+												clase != 'resumen_foros'):
+				raise ValueError('Clase "%s" no admitida en "limites"' % clase)
 
-		#	Realizar borrados
-		self.__log.debug('Borrando Comunicado con id=%s' % str(id_comunicado))
-		mutex.acquire()
+			if not isinstance(fecha_limite, datetime.datetime):
+				raise ValueError('Las fechas de "limites" deben ser de tipo'\
+														' datetime.datetime')
 
-		#	Borrar todos los datos asociados al comunicado
-		consulta = cursor.execute('''SELECT id_dato
-								FROM Dato_Comunicado
-								WHERE id_comunicado=?;''',
-								(id_comunicado,))
+		if tam_lote is None:
+			tam_lote = BotServerDAO.__TAM_LOTE_DEPURACION
+		elif not isinstance(tam_lote, int) or tam_lote < 1:
+			raise ValueError('"tam_lote" debe de ser int mayor que 0')
+
+		inicio = time.perf_counter()
+		informe = {
+					'eventos': 0,
+					'datos': 0,
+					'resumenes': 0,
+					'archivos_eliminados': [],
+					'bytes_archivo_liberados': 0
+				}
 
-		id_dato = BotServerDAO.__to_sql_tuple(consulta.fetchall())
+		limites_eventos = {clase: fecha_limite
+							for clase, fecha_limite in limites.items()
+							if clase in BotServerDAO.__TABLAS_CLASE_EVENTO}
 
-		#	Lista de archivos a borrar
-		arch_borr = None
+		#	Eliminar los eventos de la base de datos principal
+		for clase, fecha_limite in limites_eventos.items():
 
-		if id_dato:
+			seleccion = BotServerDAO.__seleccion_clase(clase)
 
-			#	Conocer todos los archivos borrados
-			consulta = cursor.execute(
-						'''SELECT ruta_archivo
-							FROM DatoArchivo, Dato_Comunicado
-							WHERE Dato_Comunicado.id_comunicado=?
-							AND Dato_Comunicado.id_dato=DatoArchivo.id''',
-							(id_comunicado,))
-			arch_borr = BotServerDAO.__to_sql_tuple(consulta.fetchall())
-
-			cursor.execute('DELETE FROM DatoTexto WHERE id IN %s' % id_dato)
-			cursor.execute(('DELETE FROM DatoArchivoSticker WHERE id IN %s' %
-																	id_dato))
-			cursor.execute('DELETE FROM DatoArchivo WHERE id IN %s' % id_dato)
-			cursor.execute('DELETE FROM DatoContacto WHERE id IN %s' % id_dato)
-			cursor.execute(('DELETE FROM DatoLocalizacion WHERE id IN %s' %
-																	id_dato))
-			cursor.execute(('DELETE FROM Dato_Comunicado WHERE id_dato IN %s' %
-																	id_dato))
-			cursor.execute('DELETE FROM Dato WHERE id IN %s' % id_dato)
-
-		#	Borrar la lista de foros asignados al comunicado
-		cursor.execute('DELETE FROM Comunicado_Foro WHERE id_comunicado=?',
-						(id_comunicado,))
-
-		cursor.execute('DELETE FROM Comunicado WHERE id=?', (id_comunicado,))
-
-		#	Realizar commit
-		self.__con_bd.commit()
-
-		#	Cerrar cursor y liberar semáforos
-		mutex.release()
-		cursor.close()
+			def operacion(cursor, clave):
+				filas = cursor.execute(seleccion, (clave[0], clave[1],
+										fecha_limite, tam_lote)).fetchall()
 
-		self.__log.debug('Finalizada función "removeComunicado" de "BotServerDAO"')
-		return arch_borr
+				if not filas:
+					return 0, 0, None
 
-	def countMensajesForo(self, id_chat: int,
-							fecha_inicio: datetime.datetime,
-							fecha_fin: datetime.datetime):
+				ids_eventos = BotServerDAO.__to_json_array(filas)
 
-		"""Permite contar los mensajes registrados en un Foro Docente
+				#	Descontar los mensajes eliminados del recuento diario de
+				#	los foros en la misma transacción
+				BotServerDAO.__descontar_resumen(cursor,
+						BotServerDAO.__recuento_resumen_eventos(cursor,
+																ids_eventos))
 
-		Recibe:
-		-------
-		id_chat: int
-			Identificador del chat sobre el que se aplica la operación
+				n_eventos, n_datos = BotServerDAO.__delete_eventos(cursor,
+																ids_eventos)
 
-		fecha_inicio: datetime.datetime
-			Fecha de inicio a partir de la cual se empiezan a contar mensajes
+				#	La caché de mensajes recientes puede contener mensajes
+				#	eliminados
+				self.__cache_mensajes.clear()
 
-		fecha_fin: datetime.datetime
-			Fecha de fin a partir de la cual se dejan de contar mensajes
+				return n_eventos, n_datos, ((filas[-1][1], filas[-1][0])
+										if len(filas) == tam_lote else None)
+
+			clave = (0, -1)
+
+			while clave is not None:
+				n_eventos, n_datos, clave = self.__write(
+								lambda cursor, clave=clave: operacion(cursor,
+																	clave))
+				informe['eventos'] += n_eventos
+				informe['datos'] += n_datos
+
+			self.__log.debug('Depurada la clase "%s": %d eventos eliminados',
+											clase, informe['eventos'])
+
+		#	Eliminar los recuentos diarios de los foros
+		if 'resumen_foros' in limites:
+
+			dia_limite = limites['resumen_foros']
+
+			def operacion(cursor):
+				cursor.execute('''DELETE FROM ResumenMensajesForo
+									WHERE (id_chat_foro, dia) IN
+									(SELECT id_chat_foro, dia
+									FROM ResumenMensajesForo
+									WHERE dia <
+										DATE(?, 'unixepoch', 'localtime')
+									LIMIT ?);''', (dia_limite, tam_lote))
+
+				return cursor.rowcount
+
+			n_resumenes = tam_lote
+
+			while n_resumenes == tam_lote:
+				n_resumenes = self.__write(operacion)
+				informe['resumenes'] += n_resumenes
+
+		#	Depurar los ficheros de archivo de los periodos que comienzan
+		#	antes de alguna de las fechas límite
+		if limites_eventos:
+			cursor = self.__read_connection().cursor()
+			periodos = cursor.execute('''SELECT periodo, fichero
+										FROM ArchivoMensajes
+										WHERE fecha_inicio < ?
+										ORDER BY fecha_inicio;''',
+										(max(limites_eventos.values()),)
+										).fetchall()
+			cursor.close()
+
+			for periodo, fichero in periodos:
+				n_eventos, n_datos, liberados, eliminado = self.__prune_archivo(
+										periodo, fichero, limites_eventos,
+										tam_lote)
+
+				informe['eventos'] += n_eventos
+				informe['datos'] += n_datos
+				informe['bytes_archivo_liberados'] += liberados
+
+				if eliminado:
+					informe['archivos_eliminados'].append(fichero)
+
+		informe['duracion'] = time.perf_counter() - inicio
+
+		self.__log.debug('Finalizada función "pruneMensajes" de "BotServerDAO"')
+		return informe
+
+	def incrementalVacuum(self, paginas_paso: int=None) -> dict:
+
+		"""Devuelve al sistema de ficheros el espacio de las páginas
+			libres de la base de datos principal mediante la compactación
+			incremental de SQLite, en pasos de pocas páginas realizados entre
+			dos transacciones del hilo escritor. Si la base de datos fue
+			creada sin compactación incremental, antes se convierte mediante
+			una compactación completa (VACUUM), que sólo se realiza una vez y
+			durante la cual las escrituras esperan
+
+		Parámetros:
+		-----------
+		paginas_paso: int
+			Número de páginas liberadas en cada paso. Por defecto 1024
+
+		Devuelve:
+		---------
+			dict: Con el número de páginas ("paginas") y de bytes ("bytes")
+				liberados, si la base de datos ha sido convertida
+				("convertida") y la duración en segundos ("duracion")
 		"""
 
-		self.__log.debug('Iniciada función "countMessagesForo" de'\
-															' "BotServerDAO"')
+		self.__log.debug('Iniciada función "incrementalVacuum" de "BotServerDAO"')
 
 		#	Comprobar los datos de entrada
-		if not isinstance(id_chat, int):
-			raise ValueError('"id_chat" debe ser int')
+		if paginas_paso is None:
+			paginas_paso = BotServerDAO.__PAGINAS_PASO_COMPACTACION
+		elif not isinstance(paginas_paso, int) or paginas_paso < 1:
+			raise ValueError('"paginas_paso" debe de ser int mayor que 0')
 
-		if not isinstance(fecha_inicio, datetime.datetime):
-			raise ValueError('"fecha_inicio" debe ser de tipo datetime.datetime')
+		inicio = time.perf_counter()
 
-		if not isinstance(fecha_fin, datetime.datetime):
-			raise ValueError('"fecha_fin" debe ser de tipo datetime.datetime')
+		def tamano(cursor):
+			return (cursor.execute('PRAGMA page_count;').fetchone()[0],
+					cursor.execute('PRAGMA page_size;').fetchone()[0])
 
-		#	Tomar el cursor y preparar semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
-
-		#	Ejecutar la sentencia
-		self.__log.debug('Realizando consulta con valores id_chat={}, '\
-							'desde fecha_inicio={} hasta fecha_fin={}'.format(
-								id_chat, fecha_inicio, fecha_fin))
-		mutex.acquire()
-		cursor.execute('''SELECT a.num+b.num
-							FROM
-							(SELECT COUNT(MensajeRecibidoPublico.id) AS num
-								FROM MensajeRecibidoPublico, Evento
-								WHERE id_chat_foro=? AND
-									fecha BETWEEN ? AND ?
-									AND Evento.id=MensajeRecibidoPublico.id) a,
-							(SELECT COUNT(MensajeEnviadoPublico.id) AS num
-								FROM MensajeEnviadoPublico, Evento
-								WHERE id_chat_foro_destino=? AND
-								fecha BETWEEN ? AND ?
-								AND Evento.id=MensajeEnviadoPublico.id) b;''',
-							(id_chat, fecha_inicio, fecha_fin)*2)
-
-		n_mensajes = cursor.fetchone()[0]
-
-		#	Cerrar cursor y liberar semáforo
-		cursor.close()
-		mutex.release()
+		def convertir(cursor):
+			#	Modo de compactación 2: incremental
+			if cursor.execute('PRAGMA auto_vacuum;').fetchone()[0] == 2:
+				return None
 
-		self.__log.debug('Finalizada función "countMessagesForo" de "BotServerDAO"')
-		return n_mensajes
+			paginas = tamano(cursor)[0]
 
-	def getMensajesForo(self, id_chat: int,
-					fecha_inicio: datetime.datetime, fecha_fin: datetime,
-					division=None, particion=None):
+			cursor.execute('PRAGMA auto_vacuum = INCREMENTAL;')
+			cursor.execute('VACUUM;')
 
-		"""Permite obtener todos los datos de los mensajes enviados en un foro
-			en un intervalo de tiempo específico
+			return paginas - tamano(cursor)[0]
 
-		Recibe:
-		------
-		id_chat: int
-			Identificador del chat sobre el que se aplica la operación
+		def paso(cursor):
+			libres = cursor.execute('PRAGMA freelist_count;').fetchone()[0]
 
-		fecha_inicio: datetime.datetime
-			Fecha de inicio a partir de la cual se empiezan a recopilar mensajes
+			#	La sentencia libera una página en cada paso de su ejecución,
+			#	por lo que se ejecuta como script para completarla
+			if libres:
+				cursor.executescript('PRAGMA incremental_vacuum(%d);' %
+																paginas_paso)
 
-		fecha_fin: datetime.datetime
-			Fecha de fin a partir de la cual se dejan de recopilar mensajes
+			return libres - cursor.execute('PRAGMA freelist_count;'
+																).fetchone()[0]
 
-		division: int
-			Indica el número de particiones en las que se va a dividir la
-			recopilación. Este parámetro debe de ser usado conjuntamente con
-			paticion
+		convertidas = self.__submit_write(convertir,
+											en_transaccion=False).result()
 
-		particion: int
-			Indica el número de partición considerada en esta consulta. Este
-			parámetro debe de ser usado conjuntamente con "division"
+		if convertidas is not None:
+			self.__log.info('Activada la compactación incremental de la base'\
+							' de datos: %d páginas liberadas', convertidas)
+			paginas = convertidas
+		else:
+			paginas = 0
+			liberadas = paginas_paso
+
+			#	Cada paso libera como mucho "paginas_paso" páginas
+			while liberadas >= paginas_paso:
+				liberadas = self.__submit_write(paso,
+											en_transaccion=False).result()
+				paginas += liberadas
 
+		def finalizar(cursor):
+			#	En modo WAL, el fichero se trunca al trasladar los cambios
+			#	del registro a la base de datos
+			if not self.__memoria:
+				cursor.execute('PRAGMA wal_checkpoint(PASSIVE);').fetchall()
+
+			return tamano(cursor)[1]
+
+		tam_pagina = self.__submit_write(finalizar,
+											en_transaccion=False).result()
+
+		self.__log.debug('Finalizada función "incrementalVacuum" de '\
+															'"BotServerDAO"')
+		return {
+					'paginas': paginas,
+					'bytes': paginas*tam_pagina,
+					'convertida': convertidas is not None,
+					'duracion': time.perf_counter() - inicio
+				}
+
+	def listRutasArchivos(self) -> set:
+
+		"""Permite obtener las rutas de todos los archivos multimedia
+			referenciados por los datos de la base de datos principal y de
+			los ficheros de archivo, de forma que el resto de archivos de los
+			directorios multimedia pueden eliminarse
 
 		Devuelve:
-			OrderedDict: Diccionario ordenado que consta del par:
-			id_mensaje (int) - datos_mensaje (dict)
+		---------
+			set de str: Rutas de los archivos tal y como fueron almacenadas
+		"""
 
-			Por su parte, datos_mensaje se halla compuesto por los siguientes
-			parámetros:
-			- nombre_usuario: str
-				Nombre del usuario que envió el mensaje
+		self.__log.debug('Iniciada función "listRutasArchivos" de "BotServerDAO"')
 
-			- tipo_usuario: str
-				Indica el tipo de usuario que envió el mensaje: docente y alumno
-				None si el mensaje es del asistente
+		cursor = self.__read_connection().cursor()
 
-			- fecha: datetime.datetime
-				Fecha en la que se envió o reibió el mensaje
+		rutas = {fila[0] for fila in cursor.execute('''SELECT ruta_archivo
+										FROM DatoArchivo
+										WHERE ruta_archivo IS NOT NULL;''')}
 
-			- academico: bool
-				Indica si el mensaje es académico o no. Sólo tiene sentido
-				para los mensajes recibidos en foros docentes
+		periodos = cursor.execute('SELECT periodo, fichero FROM ArchivoMensajes;'
+																).fetchall()
 
-			- tipo_evento: str
-				Tipo del evento acontecido en el chat grupal
+		for periodo, fichero in periodos:
+			esquema = self.__attach_archivo(periodo, fichero)
 
-			Para los mensajes, se incluyen los campos nombre_usuario,
-				tipo_usuario, fecha y academico, mientras que para los Eventos
-				se incluyen los campos nombre_usuario, tipo_usuario, fecha y
-				tipo_evento
+			#	Sin el fichero de archivo no se conocen sus referencias
+			if esquema is None:
+				cursor.close()
+				raise FileNotFoundError('No se encuentra el fichero de '\
+								'archivo "%s" del periodo %s' % (fichero, periodo))
 
-			- datos: dict
-				Almacena los datos que incluye el mensaje
+			rutas.update(fila[0] for fila in cursor.execute('''SELECT ruta_archivo
+										FROM %s.DatoArchivo
+										WHERE ruta_archivo IS NOT NULL;''' % esquema))
 
-			En concreto, datos puede presentar los siguientes formatos
+		cursor.close()
 
-			Para tipo texto:
+		self.__log.debug('Finalizada función "listRutasArchivos" de '\
+															'"BotServerDAO"')
+		return rutas
 
-			·tipo_dato: 'texto'
-			·contenido: str o list str
-			 	Texto o textos a almacenar
+	def listDatosArchivoPendientes(self, sufijo: str) -> list:
 
-			Para tipo Multimedia con Archivo:
+		"""Permite obtener los datos multimedia de la base de datos principal
+			cuya ruta de archivo termina en el sufijo indicado y que conservan
+			el file_id de su archivo, de forma que puede volver a programarse
+			la descarga de los archivos que no llegaron a descargarse
 
-			·tipo_dato: str
-				Tipo de Dato Multimedia almacenado: Puede adoptar los valores
-				'imagen', 'audio', 'video'. 'nota_voz', 'nota_video',
-				'documento','animacion' y 'sticker'
+		Parámetros:
+		-----------
+		sufijo: str
+			Sufijo de las rutas de los archivos cuya descarga no ha
+			finalizado
 
-			·contenido: str o None
-				Ruta en el sistema de ficheros en la que el servidor ha
-				almacenado el Archivo.
+		Devuelve:
+		---------
+			list de dict: Con el identificador del dato ("id_dato"), la ruta
+				del archivo ("contenido") y su file_id ("file_id")
+		"""
 
-			·mime type: str o None
-				Valor del encabezado Mime asociado al archivo
+		self.__log.debug('Iniciada función "listDatosArchivoPendientes" de '\
+															'"BotServerDAO"')
 
-			·file id: int o None
-				Identificador de archivo asociado por la plataforma de
-				mensajerı́a a dicho Archivo.
+		#	Comprobar los datos de entrada
+		if not isinstance(sufijo, str) or not sufijo:
+			raise ValueError('"sufijo" debe de ser str no vacío')
 
-			·sticker_emoji: str o None
-				emoji asociado al Sticker. Sólo para stickers
-				Parámetro opcional
+		cursor = self.__read_connection().cursor()
 
-			·sticker_conjunto: str o None
-				Nombre del conjunto al que pertenece el Sticker.
-				Sólo para stickers
-				Parámetro opcional
+		datos = [{'id_dato': id_dato, 'contenido': ruta_archivo,
+					'file_id': file_id}
+					for id_dato, ruta_archivo, file_id in cursor.execute(
+									'''SELECT id, ruta_archivo, file_id
+									FROM DatoArchivo
+									WHERE substr(ruta_archivo, -?)=? AND
+										file_id IS NOT NULL;''',
+									(len(sufijo), sufijo))]
 
-			·sticker_tipo: str o None
-				Tipo de sticker, puede adoptar dos valores: normal o animado.
-				Sólo para stickers.
-				Parámetro opcional
-				NOTA: Actualmente en desuso
+		cursor.close()
 
-			Para tipo Contacto:
+		self.__log.debug('Finalizada función "listDatosArchivoPendientes" de '\
+															'"BotServerDAO"')
+		return datos
 
-			·tipo_dato: 'contacto'
+	def backup(self, filename: str, paginas_paso: int=None,
+											pausa: float=None) -> dict:
 
-			·nombre: str
-				Nombre o primer nombre asociado al Contacto.
+		"""Realiza una copia de seguridad de la base de datos principal sin
+			detener el funcionamiento del sistema. La copia se realiza
+			mediante la API de copias de SQLite en pasos de pocas páginas con
+			una pausa entre ellos, sobre una instantánea de lectura de la base
+			de datos, de forma que las escrituras concurrentes no la
+			reinician ni quedan bloqueadas. La copia se escribe en un fichero
+			temporal que sólo reemplaza a "filename" una vez completada. Los
+			ficheros de archivo no se incluyen en la copia
 
-			·apellidos: str o None
-				Nombre o segundo nombre asociado al Contacto.
-				Parámetro opcional
+			Si la base de datos se mantiene en memoria, la copia se realiza
+			en un solo paso entre dos transacciones del hilo escritor
 
-			·telefono: str
-				Número de teléfono asociado al Contacto.
+		Parámetros:
+		-----------
+		filename: str
+			Ruta del fichero de la copia de seguridad
 
-			·vcard: str o None
-				Datos recogidos en la vcard asociada al Contacto.
-				Parámetro opcional
+		paginas_paso: int o None
+			Número de páginas copiadas en cada paso. Por defecto 256
 
-			·id_usuario: int o None
-				Identificador de usuario asociado por la plataforma de
-				mensajerı́a al usuario asociado al Contacto.
-				Parámetro opcional
+		pausa: float o None
+			Segundos de espera entre dos pasos consecutivos. Por defecto 0.01
 
-			Para tipo Localizacion y Avenida:
+		Devuelve:
+		---------
+			dict: Con las métricas de la copia realizada:
+				- fichero: str
+					Ruta del fichero de la copia
+				- duracion: float
+					Segundos empleados en la copia
+				- tamano: int
+					Tamaño en bytes del fichero de la copia
+				- paginas: int
+					Número de páginas copiadas
+				- pasos: int
+					Número de pasos empleados en la copia
+		"""
+
+		self.__log.debug('Iniciada función "backup" de "BotServerDAO"')
 
-			·tipo_dato: 'localizacion'
+		if paginas_paso is None:
+			paginas_paso = BotServerDAO.__PAGINAS_PASO_COPIA
 
-			·latitud: int
-				Latitud geográfica de la Localizacion o Avenida.
+		if pausa is None:
+			pausa = BotServerDAO.__PAUSA_PASO_COPIA
 
-			·longitud: int
-				Longitud geográfica de la Localizacion o Avenida
+		#	Comprobar los datos de entrada
+		if not isinstance(filename, str):
+			raise ValueError('"filename" debe de ser str')
 
-			·titulo: str o None
-				Tı́tulo que recibe la Avenida localizada en la Localizacion.
-				Parámetro opcional
+		if not isinstance(paginas_paso, int) or paginas_paso < 1:
+			raise ValueError('"paginas_paso" debe de ser int mayor que 0')
 
-			·direccion: str o None
-				Direccion de la avenida localizada en la Localizacion.
-				Parámetro opcional
+		if not isinstance(pausa, (int, float)) or pausa < 0:
+			raise ValueError('"pausa" debe de ser float no negativo')
 
-			·id cuadrante: int o None
-				Identificador del cuadrante asociado a la avenida localizada en
-				la Localizacion. Parámetro opcional
+		fichero_temporal = filename + '.tmp'
+		metricas = {'paginas': 0, 'pasos': 0}
 
-			·tipo cuadrante: str o None
-				Tipo de cuadrante asociado a la avenida localizada en la
-				Localizacion.
-				Parámetro opcional
+		#	La pausa entre pasos se realiza tras cada paso, ya que la API sólo
+		#	espera cuando la base de datos se encuentra bloqueada
+		def progreso(estado, restantes, total):
+			metricas['paginas'] = total
+			metricas['pasos'] += 1
 
-		"""
+			if restantes:
+				time.sleep(pausa)
 
-		self.__log.debug('Iniciada función "getMessagesForo" de "BotServerDAO"')
+		#	En memoria, la copia se realiza de una vez desde la conexión de
+		#	escritura entre dos transacciones, ya que una lectura prolongada
+		#	desde otra conexión impediría confirmar las escrituras. Las
+		#	escrituras esperan mientras dura la copia
+		def operacion(cursor):
+			copia = sqlite3.connect(fichero_temporal)
 
-		#	Comprobar los datos de entrada
-		if not isinstance(id_chat, int):
-			raise ValueError('"id_chat" debe ser int')
+			try:
+				cursor.connection.backup(copia, progress=progreso)
+			finally:
+				copia.close()
 
-		if not isinstance(fecha_inicio, datetime.datetime):
-			raise ValueError('"fecha_inicio" debe ser de tipo datetime.datetime')
+		inicio = time.perf_counter()
 
-		if not isinstance(fecha_fin, datetime.datetime):
-			raise ValueError('"fecha_fin" debe ser de tipo datetime.datetime')
+		try:
+			if self.__memoria:
+				self.__submit_write(operacion, en_transaccion=False).result()
 
-		if bool(not division) ^ bool(particion is None):
-			raise ValueError('"division" y "particion" deben de presentar '\
-								'ambos valores enteros o None')
-		else:
-			if not isinstance(division, int):
-				raise ValueError('"division" debe de ser int')
+			else:
+				#	Mantener abierta una transacción de lectura durante toda
+				#	la copia: en modo WAL fija la instantánea copiada y evita
+				#	que cada escritura del hilo escritor reinicie la copia
+				#	desde el principio
+				con = sqlite3.connect(self.__bd_file, isolation_level=None)
+				copia = sqlite3.connect(fichero_temporal)
 
-			if not isinstance(particion, int):
-				raise ValueError('"particion" debe de ser int')
+				try:
+					con.execute('BEGIN;')
+					con.execute('SELECT COUNT(*) FROM sqlite_master;').fetchone()
 
-		#	Establecer el límite de la particion
-		limite = (('LIMIT '+str(division*particion)+', '+
-											str(division)) if division else '')
+					con.backup(copia, pages=paginas_paso, progress=progreso,
+																	sleep=pausa)
+					con.execute('COMMIT;')
 
-		#	Tomar el cursor y preparar semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
+				finally:
+					copia.close()
+					con.close()
 
-		#	Realizar consulta
-		self.__log.debug('Realizando consulta en foro con id=%d, '\
-						'desde %s a %s' % (id_chat, fecha_inicio, fecha_fin))
-		mutex.acquire()
+		except:
+			if os.path.exists(fichero_temporal):
+				os.remove(fichero_temporal)
 
-		mensaje = OrderedDict()
-		consulta = cursor.execute(
-'''SELECT MensajePublico.id AS id_mensaje,
-MensajePublico.nombre_usuario AS nombre_usuario,
-MensajePublico.tipo_usuario
-			AS "tipo_usuario [TIPO_USUARIO]",
-MensajePublico.fecha AS fecha,
-MensajePublico.academico AS academico,
-NULL AS evento_mensaje,
-DatoTextoMultimedia.id AS id_dato,
-DatoTextoMultimedia.tipo AS
-			"tipo_dato [TIPO_DATOARCHIVO]",
-DatoTextoMultimedia.contenido AS contenido,
-DatoTextoMultimedia.file_id AS file_id,
-DatoTextoMultimedia.mime_type AS mime_type,
-DatoTextoMultimedia.sticker_emoji AS sticker_emoji,
-DatoTextoMultimedia.conjunto AS sticker_conjunto,
-DatoTextoMultimedia.tipo_sticker
-			AS "tipo_sticker [TIPO_STICKER]",
-DatoTextoMultimedia.telefono AS telefono,
-DatoTextoMultimedia.nombre AS nombre,
-DatoTextoMultimedia.apellidos AS apellidos,
-DatoTextoMultimedia.id_usuario AS id_usuario,
-DatoTextoMultimedia.vcard AS vcard,
-DatoTextoMultimedia.longitud AS longitud,
-DatoTextoMultimedia.latitud AS latitud,
-DatoTextoMultimedia.titulo AS titulo,
-DatoTextoMultimedia.direccion AS direccion,
-DatoTextoMultimedia.id_cuadrante AS id_cuadrante,
-DatoTextoMultimedia.tipo_cuadrante AS tipo_cuadrante
-FROM
-(SELECT MensajeRecibidoPublico.id, fecha,
-	academico,
-	CASE WHEN Usuario.apellidos IS NULL
-		THEN Usuario.nombre
-	ELSE Usuario.nombre||" "||Usuario.apellidos
-	END AS nombre_usuario,
-	Usuario.tipo AS tipo_usuario, id_chat_foro,
-	NULL AS evento_mensaje
-FROM MensajeRecibidoPublico, Evento, Mensaje, Usuario
-WHERE Mensaje.id=MensajeRecibidoPublico.id AND
-	Evento.id=Mensaje.id AND MensajeRecibidoPublico.id_usuario_emisor=Usuario.id
-	AND existente=1
-UNION
-SELECT MensajeEnviadoPublico.id,
-	fecha, 1 AS academico,
-	"Bot" AS nombre_usuario,
-	NULL AS tipo_usuario,
-	id_chat_foro_destino AS id_chat_foro,
-	NULL AS evento_mensaje
-FROM MensajeEnviadoPublico, Evento, Mensaje
-WHERE Mensaje.id=MensajeEnviadoPublico.id
-	AND Mensaje.id=Evento.id
-AND existente=1
-%s) MensajePublico,
-Dato_Mensaje,
-(SELECT id, tipo, ruta_archivo AS contenido,
-	file_id, mime_type, NULL AS sticker_emoji,
-	NULL AS conjunto, NULL AS tipo_sticker,
-	NULL AS telefono, NULL AS nombre,
-	NULL AS apellidos,
-	NULL AS id_usuario, NULL AS vcard,
-	NULL AS longitud, NULL AS latitud,
-	NULL AS titulo, NULL AS direccion,
-	NULL AS id_cuadrante, NULL AS tipo_cuadrante
-	FROM DatoArchivo WHERE tipo <> %d
-UNION
-SELECT DatoArchivo.id, DatoArchivo.tipo,
-	ruta_archivo AS contenido,
-	file_id, mime_type, emoji AS sticker_emoji,
-	conjunto,
-	DatoArchivoSticker.tipo AS tipo_sticker,
-	NULL AS telefono, NULL AS nombre,
-	NULL AS apellidos,
-	NULL AS id_usuario, NULL AS vcard,
-	NULL AS longitud, NULL AS latitud,
-	NULL AS titulo, NULL AS direccion,
-	NULL AS id_cuadrante, NULL AS tipo_cuadrante
-	FROM DatoArchivo, DatoArchivoSticker
-	WHERE
-	DatoArchivo.id = DatoArchivoSticker.id
-UNION
-SELECT id, \'texto\' as tipo,
-	texto AS contenido,
-	NULL AS file_id, NULL AS mime_type,
-	NULL AS sticker_emoji, NULL AS conjunto,
-	NULL AS tipo_sticker,
-	NULL AS telefono, NULL AS nombre,
-	NULL AS apellidos,
-	NULL AS id_usuario, NULL AS vcard,
-	NULL AS longitud, NULL AS latitud,
-	NULL AS titulo, NULL AS direccion,
-	NULL AS id_cuadrante, NULL AS tipo_cuadrante
-FROM DatoTexto
-UNION
-SELECT id, \'contacto\' as tipo,
-	NULL AS contenido,
-	NULL AS file_id, NULL AS mime_type,
-	NULL AS sticker_emoji, NULL AS conjunto,
-	NULL AS tipo_sticker,
-	telefono, nombre, apellidos,
-	id_usuario, vcard,
-	NULL AS longitud, NULL AS latitud,
-	NULL AS titulo, NULL AS direccion,
-	NULL AS id_cuadrante, NULL AS tipo_cuadrante
-FROM DatoContacto
-UNION
-SELECT id, \'localizacion\' as tipo,
-	NULL AS contenido,
-	NULL AS file_id, NULL AS mime_type,
-	NULL AS sticker_emoji, NULL AS conjunto,
-	NULL AS tipo_sticker,
-	NULL AS telefono, NULL AS nombre,
-	NULL AS apellidos,
-	NULL AS id_usuario, NULL AS vcard,
-	longitud, latitud,
-	titulo, direccion,
-	id_cuadrante, tipo_cuadrante
-FROM DatoLocalizacion)
-	DatoTextoMultimedia
-WHERE MensajePublico.id=Dato_Mensaje.id_mensaje
-AND Dato_Mensaje.id_dato=DatoTextoMultimedia.id
-AND MensajePublico.id_chat_foro=?
-AND MensajePublico.fecha BETWEEN ? AND ?
-UNION
-SELECT EventoChatGrupal.id,
-CASE WHEN Usuario.apellidos IS NULL
-	THEN Usuario.nombre
-	ELSE Usuario.nombre||" "||Usuario.apellidos
-END AS nombre_usuario,
-NULL AS tipo_usuario,
-fecha,
-1 AS academico,
-CASE EventoChatGrupal.tipo
-WHEN 0
-	THEN Usuario.nombre||" entró en el grupo"
-WHEN 1
-	THEN Usuario.nombre||" salió del grupo"
-WHEN 2
-	THEN Usuario.nombre||" fue registrad@"
-WHEN 3
-	THEN Usuario.nombre||" salió del grupo"
-WHEN 4
-	THEN Usuario.nombre||" fue banead@ del grupo"
-WHEN 5
-	THEN Usuario.nombre||" fue expulsad@ del grupo"
-ELSE NULL
-END AS evento_mensaje,
-NULL AS id_dato,
-NULL AS
-	"tipo_dato [TIPO_DATOARCHIVO]",
-NULL AS contenido,
-NULL AS file_id,
-NULL AS mime_type,
-NULL AS sticker_emoji,
-NULL AS conjunto,
-NULL
-	AS "tipo_sticker [TIPO_STICKER]",
-NULL AS telefono,
-NULL AS nombre,
-NULL AS apellidos,
-NULL AS id_usuario,
-NULL AS vcard,
-NULL AS longitud,
-NULL AS latitud,
-NULL AS titulo,
-NULL AS direccion,
-NULL AS id_cuadrante,
-NULL AS tipo_cuadrante
-FROM Evento, EventoChatGrupal, Usuario
-WHERE Evento.id=EventoChatGrupal.id
-	AND EventoChatGrupal.id_usuario=Usuario.id
-AND id_chat_foro=?
-AND fecha BETWEEN ? AND ?
-ORDER BY fecha;''' % (limite,
-BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
-(id_chat, fecha_inicio, fecha_fin)*2)
-
-		#if not consulta:
-		#	return None
+			raise
 
-		#	Introducir cada dato extraído en en la lista de mensajes organizados
-		for m in consulta:
+		os.replace(fichero_temporal, filename)
 
-			if not mensaje or m[0] not in mensaje:
+		metricas['fichero'] = filename
+		metricas['duracion'] = time.perf_counter() - inicio
+		metricas['tamano'] = os.path.getsize(filename)
 
-				#	Registrar el mensaje
-				mensaje[m[0]] = dict(zip(m.keys()[1:5], m[1:5]))
+		self.__log.debug('Finalizada función "backup" de "BotServerDAO"')
+		return metricas
 
-				#	Mapear el tipo de usuario manualmente ya que la consulta
-				#	no lo mapea de forma automática
-				(mensaje[m[0]]
-				['tipo_usuario']) = BotServerDAO.__tipo_usuario_converter(
-									mensaje[m[0]]['tipo_usuario'])
+	def snapshot(self) -> dict:
 
-				if m[5]:
-					#	El mensaje contiene un evento y se añade
-					mensaje[m[0]]['evento'] = m[5]
-					mensaje[m[0]].pop('tipo_usuario')
-					mensaje[m[0]].pop('academico')
+		"""Vuelca la base de datos en memoria a su fichero "bd_file", a
+			partir del cual se restaura al iniciarse. Sólo puede usarse si
+			la base de datos se mantiene en memoria
 
-					continue
-				else:
-					#	El mensaje contiene otro tipo de datos
-					mensaje[m[0]]['datos'] = OrderedDict()
-
-			#	Registrar los datos contenidos almacenando SOLO los campos
-			#	que correspondan
-			if m[7] == 'texto':
-				#	El dato es texto o un evento
-				mensaje[m[0]]['datos'][m[6]] = dict(zip(m.keys()[7:9], m[7:9]))
-			elif (m[7] in BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO'] and
-															m[7] != 'sticker'):
-				#	El dato es multimedia diferente de sticker
-				mensaje[m[0]]['datos'][m[6]] = dict(zip(m.keys()[7:11],
-																	m[7:11]))
-			elif m[7] == 'sticker':
-				#	El dato es multimedia sticker
-				mensaje[m[0]]['datos'][m[6]] = dict(zip(m.keys()[7:14],
-																	m[7:14]))
-			elif m[7] == 'contacto':
-				#	El dato es contacto
-				mensaje[m[0]]['datos'][m[6]] = {m.keys()[7]: m[7]}
-				mensaje[m[0]]['datos'][m[6]].update(dict(zip(m.keys()[14:19],
-																	m[14:19])))
-			else:
-				#	El dato es una localización
-				mensaje[m[0]]['datos'][m[6]] = {m.keys()[7]: m[7]}
-				mensaje[m[0]]['datos'][m[6]].update(dict(zip(m.keys()[19:],
-																	m[19:])))
+		Devuelve:
+		---------
+			dict: Con las métricas de la copia realizada, las mismas que
+				devuelve la función backup
+		"""
 
-		#	Cerrar cursor y semáforo
-		cursor.close()
-		mutex.release()
+		if not self.__memoria:
+			raise ValueError('La base de datos no se mantiene en memoria')
 
-		self.__log.debug('Finalizada función "getMessagesForo" de "BotServerDAO"')
-		return mensaje
+		return self.backup(self.__bd_file)
 
 	def addConcepto(self, concepto: str, resumen_concepto: str,
 								tipo: str or None, id_concepto=None) -> int:
@@ -2992,43 +5578,36 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 
 		# Modificar la base de datos para meter todos estos campos TODO
 
-		#	Tomar el cursor y preparar semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
-
 		#	Realizar consulta
-		self.__log.debug('Realizando inserciones con valores concepto={}, '\
-						'resumen_concepto={} y tipo={}'.format(concepto,
-														resumen_concepto, tipo))
-		mutex.acquire()
-
-		if not id_concepto:
-			cursor.execute('INSERT INTO Concepto DEFAULT VALUES;')
-			id_concepto = cursor.execute(
+		self.__log.debug('Realizando inserciones con valores concepto=%s, '\
+						'resumen_concepto=%s y tipo=%s', concepto,
+														resumen_concepto, tipo)
+
+		def operacion(cursor, id_concepto=id_concepto):
+			if not id_concepto:
+				cursor.execute('INSERT INTO Concepto DEFAULT VALUES;')
+				id_concepto = cursor.execute(
 									'SELECT last_insert_rowid();').fetchone()[0]
 
-		#	Insertar pregunta si no había una igual
-		cursor.execute('''INSERT INTO ConceptoPregunta
-										SELECT ?, ?, ?, ? WHERE NOT EXISTS
-											(SELECT id
-											FROM ConceptoPregunta
-											WHERE resumen_pregunta=?
-												AND tipo IS ?);''',
-						(concepto, resumen_concepto, tipo, id_concepto,
-												resumen_concepto, tipo))
-
-		#	Advertir si ya existía una pregunta con un resumen_concepto y
-		#	tipo coincidentes
-		if not cursor.execute('SELECT last_insert_rowid();').fetchone():
-			self.__log.warning('Ya existe una pregunta similar a "%s" y no se'\
-									' va a volver a insertar' % concepto)
-
-		#	Realizar el commit
-		self.__con_bd.commit()
-
-		#	Cerrar cursor y liberar semáforo
-		mutex.release()
-		cursor.close()
+			#	Insertar pregunta si no había una igual
+			cursor.execute('''INSERT INTO ConceptoPregunta
+											SELECT ?, ?, ?, ? WHERE NOT EXISTS
+												(SELECT id
+												FROM ConceptoPregunta
+												WHERE resumen_pregunta=?
+													AND tipo IS ?);''',
+							(concepto, resumen_concepto, tipo, id_concepto,
+													resumen_concepto, tipo))
+
+			#	Advertir si ya existía una pregunta con un resumen_concepto y
+			#	tipo coincidentes
+			if not cursor.execute('SELECT last_insert_rowid();').fetchone():
+				self.__log.warning('Ya existe una pregunta similar a "%s" y no se'\
+										' va a volver a insertar' % concepto)
+
+			return id_concepto
+
+		id_concepto = self.__write(operacion)
 
 		self.__log.debug('Finalizada función "addConcepto" de "BotServerDAO"')
 		return id_concepto
@@ -3059,50 +5638,53 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 		if id_concepto is not None and not isinstance(id_concepto, int):
 			raise ValueError('"id_concepto" debe de ser int')
 
-		if not (bool(pregunta) ^ bool(id_concepto is None)):
+		if not (bool(pregunta) ^ (id_concepto is not None)):
 			raise ValueError('Se debe de proporcionar "pregunta" o '\
 															'"id_concepto"')
 
-		#	Tomar cursor y preparar semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
-
 		#	Realizar operaciones
-		self.__log('Borando información con pregunta={} o '\
-								'id_concepto={}'.format(pregunta, id_concepto))
-		mutex.acquire()
-
-		if not id_concepto:
-			cursor.execute('SELECT id FROM ConceptoPregunta WHERE pregunta=?',
-							(pregunta,))
-			id_concepto = cursor.fetchone()[0]
-
-		datos_borrados = cursor.execute('''SELECT id_dato
-											FROM Dato_Concepto
-											WHERE id_concepto=?);''').fetchall()
-
-		datos_borrados = BotServerDAO.__to_sql_tuple(datos_borrados)
-
-		cursor.execute('''DELETE FROM
-							DatoTexto
-							WHERE id IN %s;''' % datos_borrados)
-
-		cursor.execute('''DELETE FROM
-							Dato
-							WHERE id IN %s;''' % datos_borrados)
-
-		cursor.execute('DELETE FROM ConceptoPregunta WHERE id=?;',
-						(id_concepto,))
-		cursor.execute('DELETE FROM Concepto WHERE id=?;',
-						(id_concepto,))
-
-
-		#	Realizar el commit
-		self.__con_bd.commit()
-
-		#	Liberar semáforo y cerrar cursor
-		mutex.release()
-		cursor.close()
+		self.__log.debug('Borando información con pregunta=%s o '\
+								'id_concepto=%s', pregunta, id_concepto)
+
+		def operacion(cursor, id_concepto=id_concepto):
+			if not id_concepto:
+				cursor.execute('SELECT id FROM ConceptoPregunta WHERE pregunta=?',
+								(pregunta,))
+				id_concepto = cursor.fetchone()[0]
+
+			datos_borrados = cursor.execute('''SELECT id_dato
+												FROM Dato_Concepto
+												WHERE id_concepto=?;''',
+												(id_concepto,)).fetchall()
+
+			datos_borrados = BotServerDAO.__to_json_array(datos_borrados)
+
+			#	Desvincular los datos antes de eliminarlos para que su
+			#	borrado no recalcule la respuesta del concepto
+			cursor.execute('''DELETE FROM
+								Dato_Concepto
+								WHERE id_concepto=?;''', (id_concepto,))
+
+			cursor.execute('''DELETE FROM
+								DatoTexto
+								WHERE id IN
+								(SELECT value FROM json_each(?));''',
+								(datos_borrados,))
+
+			cursor.execute('''DELETE FROM
+								Dato
+								WHERE id IN
+								(SELECT value FROM json_each(?));''',
+								(datos_borrados,))
+
+			cursor.execute('DELETE FROM RespuestaConcepto WHERE id_concepto=?;',
+							(id_concepto,))
+			cursor.execute('DELETE FROM ConceptoPregunta WHERE id=?;',
+							(id_concepto,))
+			cursor.execute('DELETE FROM Concepto WHERE id=?;',
+							(id_concepto,))
+
+		self.__write(operacion)
 
 		self.__log.debug('Finalizada función "removeConcepto" de "BotServerDAO"')
 
@@ -3120,16 +5702,25 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 		self.__log.debug('Iniciada función "removeAllConceptos" de '\
 															'"BotServerDAO"')
 
-		#	Preparar el semáforo
-		mutex = Lock()
-
-		#	Tomar cursor y semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
-
 		#	Realizar operaciones
 		self.__log.debug('Realizando borrado')
-		mutex.acquire()
+
+		arch_borr = self.__write(BotServerDAO.__delete_conceptos)
+
+		self.__log.debug('Finalizada función "removeAllConceptos" de '\
+															'"BotServerDAO"')
+		return arch_borr
+
+	def __delete_conceptos(cursor):
+
+		"""Elimina todos los Conceptos Teóricos y sus datos con el cursor de
+		escritura indicado
+
+		Devuelve:
+		---------
+			list de str: Rutas de los archivos de los datos eliminados o None
+				si no había ninguno
+		"""
 
 		#	Obtener lista de archivos que deben ser borrados
 		consulta = cursor.execute('''SELECT ruta_archivo
@@ -3143,27 +5734,149 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 		id_dato = [fila[0] for fila in consulta]
 
 		if id_dato:
-			id_dato = BotServerDAO.__to_sql_tuple(id_dato)
+			id_dato = BotServerDAO.__to_json_array(id_dato)
+
+			#	Desvincular los datos antes de eliminarlos para que su
+			#	borrado no recalcule las respuestas de los conceptos
+			cursor.execute('''DELETE FROM Dato_Concepto WHERE id_dato IN
+							(SELECT value FROM json_each(?));''', (id_dato,))
 
-			cursor.execute('DELETE FROM DatoArchivoSticker WHERE id IN %s;' % id_dato)
-			cursor.execute('DELETE FROM DatoArchivo WHERE id IN %s;' % id_dato)
-			cursor.execute('DELETE FROM DatoTexto WHERE id IN %s;' % id_dato)
-			cursor.execute('DELETE FROM Dato_Concepto WHERE id_dato IN %s;' % id_dato)
-			cursor.execute('DELETE FROM Dato WHERE id IN %s;' % id_dato)
+			for tabla in ('DatoArchivoSticker', 'DatoArchivo', 'DatoTexto'):
+				cursor.execute('''DELETE FROM %s WHERE id IN
+								(SELECT value FROM json_each(?));''' % tabla,
+								(id_dato,))
 
+			cursor.execute('''DELETE FROM Dato WHERE id IN
+							(SELECT value FROM json_each(?));''', (id_dato,))
+
+		cursor.execute('DELETE FROM RespuestaConcepto;')
 		cursor.execute('DELETE FROM ConceptoPregunta;')
 		cursor.execute('DELETE FROM Concepto;')
 
-		#	Realizar el commit
-		self.__con_bd.commit()
+		return arch_borr if arch_borr else None
 
-		#	Cerrar cursor y liberar semáforo
-		mutex.release()
-		cursor.close()
+	def __rebuild_respuestas(cursor, ids_conceptos: str):
 
-		self.__log.debug('Finalizada función "removeAllConceptos" de '\
+		"""Recalcula las respuestas precalculadas de los conceptos del array
+		JSON "ids_conceptos" con el cursor de escritura indicado. Debe de
+		llamarse una única vez tras vincular todos los datos de los conceptos
+		"""
+
+		if not ids_conceptos:
+			return
+
+		filtro = 'SELECT value FROM json_each(?)'
+
+		cursor.execute('DELETE FROM RespuestaConcepto WHERE id_concepto IN (%s);'
+								% filtro, (ids_conceptos,))
+		cursor.execute(BotServerDAO.__INSERTAR_RESPUESTAS % {'conceptos': filtro},
+								(ids_conceptos, ids_conceptos))
+
+	def replaceAllConceptos(self, conceptos: list):
+
+		"""Permite reemplazar todos los Conceptos Teóricos y sus textos
+			almacenados en la base de información por los indicados. El
+			reemplazo se realiza en una única transacción, de modo que las
+			consultas de los conceptos ven los conceptos anteriores hasta que
+			se confirma y los nuevos a partir de entonces, sin esperar a que
+			finalice
+
+		Parámetros:
+		-----------
+		conceptos: list de tuple
+			Conceptos Teóricos formados por la lista de preguntas, como
+			tuplas (pregunta, resumen de la pregunta, tipo), y la lista de
+			textos de la respuesta. Las preguntas ya insertadas o con un
+			resumen y un tipo iguales a los de una pregunta ya insertada se
+			omiten, así como los conceptos sin ninguna pregunta insertada
+
+		Devuelve:
+		---------
+			list de str: Rutas de los archivos de los datos de los conceptos
+				eliminados o None si no había ninguno
+		"""
+
+		self.__log.debug('Iniciada función "replaceAllConceptos" de '\
 															'"BotServerDAO"')
-		return arch_borr if arch_borr else None
+
+		#	Comprobar los datos de entrada
+		if not isinstance(conceptos, list):
+			raise ValueError('"conceptos" debe de ser list')
+
+		for preguntas, respuestas in conceptos:
+			for pregunta, resumen_concepto, tipo in preguntas:
+				if (not isinstance(pregunta, str) or
+										not isinstance(resumen_concepto, str)):
+					raise ValueError('"pregunta" y "resumen_concepto" deben de'\
+																' ser str')
+
+				if not (isinstance(tipo, str) or tipo is None):
+					raise ValueError('"tipo" debe de ser str o None')
+
+			for texto in respuestas:
+				if not isinstance(texto, str):
+					raise ValueError('"respuestas" debe de ser list de str')
+
+		fecha_creacion = datetime.datetime.now()
+
+		def operacion(cursor):
+			arch_borr = BotServerDAO.__delete_conceptos(cursor)
+			ids_conceptos = []
+
+			for preguntas, respuestas in conceptos:
+
+				id_concepto = None
+
+				for pregunta, resumen_concepto, tipo in preguntas:
+
+					#	Si se introdujo la misma pregunta o una similar, se
+					#	salta
+					if cursor.execute('''SELECT id FROM ConceptoPregunta
+											WHERE pregunta=? OR
+												(resumen_pregunta=? AND
+												tipo IS ?);''',
+										(pregunta, resumen_concepto,
+														tipo)).fetchone():
+						continue
+
+					if id_concepto is None:
+						cursor.execute('INSERT INTO Concepto DEFAULT VALUES;')
+						id_concepto = cursor.lastrowid
+
+					cursor.execute('INSERT INTO ConceptoPregunta VALUES '\
+															'(?,?,?,?);',
+									(pregunta, resumen_concepto, tipo,
+																id_concepto))
+
+				if id_concepto is None:
+					continue
+
+				ids_conceptos.append(id_concepto)
+
+				#	Añadir los textos que constituyen la respuesta
+				for texto in respuestas:
+					cursor.execute('INSERT INTO Dato(fecha_creacion) '\
+													'VALUES(?);',
+									(fecha_creacion,))
+					id_dato = cursor.lastrowid
+
+					cursor.execute('INSERT INTO DatoTexto VALUES (?,?);',
+									(id_dato, texto))
+					cursor.execute('INSERT INTO Dato_Concepto VALUES(?,?);',
+									(id_dato, id_concepto))
+
+			#	Calcular las respuestas de todos los conceptos una vez
+			#	insertados sus datos
+			BotServerDAO.__rebuild_respuestas(cursor,
+									BotServerDAO.__to_json_array(ids_conceptos))
+
+			return arch_borr
+
+		arch_borr = self.__write(operacion)
+
+		self.__log.debug('Finalizada función "replaceAllConceptos" de '\
+															'"BotServerDAO"')
+		return arch_borr
 
 	def existsConcepto(self, res_preg: str, tipo: str):
 
@@ -3198,15 +5911,12 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 			raise ValueError('"tipo" debe de ser str o None')
 
 
-		#	Tomar cursor y preparar semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
+		#	Tomar cursor
+		cursor = self.__read_connection().cursor()
 
 		#	Ejecutar consulta
 		self.__log.debug('Realizando búsqueda con resumen_pregunta=%s y '\
-												'tipo=%s' % (
-													res_preg, tipo))
-		mutex.acquire()
+												'tipo=%s', res_preg, tipo)
 
 		consulta = cursor.execute('''SELECT id FROM ConceptoPregunta
 										WHERE resumen_pregunta=? AND
@@ -3214,9 +5924,8 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 
 		resultado = bool(consulta.fetchone())
 
-		#	Cerrar cursor y liberar semáforo
+		#	Cerrar cursor
 		cursor.close()
-		mutex.release()
 
 		self.__log.debug('Finalizada función "existsConcepto" de "BotServerDAO"')
 
@@ -3297,15 +6006,13 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 		else:
 			tipo = [tipo]
 
-		#	Tomar cursor y preparar semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
+		#	Tomar cursor
+		cursor = self.__read_connection().cursor()
 
 		#	Ejecutar consulta
 		self.__log.debug('Realizando búsqueda con resumen_pregunta=%s y '\
-												'tipo=%s y porc_comp=%f' % (
-													res_preg, tipo, porc_comp))
-		mutex.acquire()
+												'tipo=%s y porc_comp=%f',
+													res_preg, tipo, porc_comp)
 
 		#	Respuestas a devolver
 		respuestas = OrderedDict()
@@ -3336,44 +6043,40 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 							compare_words(ConceptoPregunta.resumen_pregunta,?)
 											AS score
 						FROM Concepto, ConceptoPregunta
-						WHERE ConceptoPregunta.tipo IN %s AND
+						WHERE ConceptoPregunta.tipo IN
+								(SELECT value FROM json_each(?)) AND
 							ConceptoPregunta.id=Concepto.id AND
 							score=(SELECT MIN(compare_words(resumen_pregunta,?))
 										FROM ConceptoPregunta
-										WHERE tipo IN %s) AND
-							score <= ?);'''%((BotServerDAO.__to_sql_tuple(t),)*2),#(tuple(['"'+x+'"' for x in t])*2)
-						(res_preg, res_preg, amplitud))
+										WHERE tipo IN
+										(SELECT value FROM json_each(?))) AND
+							score <= ?);''',
+						(res_preg, BotServerDAO.__to_json_array(t), res_preg,
+							BotServerDAO.__to_json_array(t), amplitud))
 
-			id_conceptos = BotServerDAO.__to_sql_tuple(consulta.fetchall())
+			id_conceptos = BotServerDAO.__to_json_array(consulta.fetchall())
 
 			#	Si no hay conceptos, se salta
 			if not id_conceptos:
 				continue
 
+			#	Tomar las respuestas precalculadas de los conceptos
 			consulta = cursor.execute(
-				'''SELECT id, tipo_dato AS "tipo_dato [TIPO_DATOARCHIVO]",
-						contenido
-					FROM
-						(SELECT DatoTexto.id AS id, \'texto\' AS tipo_dato,
-							texto AS contenido,
-							Dato_Concepto.id_concepto AS id_concepto
-						FROM DatoTexto, Dato_Concepto
-						WHERE Dato_Concepto.id_concepto IN %s AND
-							DatoTexto.id=Dato_Concepto.id_dato
-						UNION
-						SELECT DatoArchivo.id AS id,
-							DatoArchivo.tipo AS tipo_dato,
-							ruta_archivo AS contenido,
-							Dato_Concepto.id_concepto AS id_concepto
-						FROM DatoArchivo, Dato_Concepto, Concepto,
-							ConceptoPregunta
-						WHERE Dato_Concepto.id_concepto IN %s AND
-							DatoArchivo.id=Dato_Concepto.id_dato)
-						ORDER BY id;''' % ((id_conceptos,)*2) )
+				'''SELECT respuesta
+					FROM RespuestaConcepto
+					WHERE id_concepto IN (SELECT value FROM json_each(?));''',
+					(id_conceptos,))
+
+			datos = sorted(dato for fila in consulta
+											for dato in json.loads(fila[0]))
 
 			#	Meter los datos en un diccionario
-			for fila in consulta:
-				respuestas[fila[0]] = dict(zip(fila.keys()[1:], fila[1:]))
+			for id_dato, tipo_dato, contenido in datos:
+				respuestas[id_dato] = {
+					'tipo_dato': (tipo_dato if tipo_dato == 'texto' else
+						BotServerDAO.__NOMBRES_TIPO_DATOARCHIVO[tipo_dato]),
+					'contenido': contenido
+				}
 
 
 			#	Llegados a este punto, si no se ha encontrado ninguna respuesta,
@@ -3383,9 +6086,8 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 				break
 
 
-		#	Cerrar cursor y liberar semáforo
+		#	Cerrar cursor
 		cursor.close()
-		mutex.release()
 
 		self.__log.debug('Finalizada función "searchConcepto" de "BotServerDAO"')
 		return respuestas if respuestas else None
@@ -3402,21 +6104,18 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 
 		self.__log.debug('Iniciada función "listAllConcepts" de "BotServerDAO"')
 
-		#	Tomar el cursor y preparar semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
+		#	Tomar el cursor
+		cursor = self.__read_connection().cursor()
 
 		#	Ejecutar consulta
 		self.__log.debug('Ejecutando consulta')
-		mutex.acquire()
 
 		consulta = cursor.execute('SELECT pregunta FROM ConceptoPregunta;')
 
 		resultado = [fila[0] for fila in consulta]
 
-		#	Cerrar el cursor y liberar semáforo
+		#	Cerrar el cursor
 		cursor.close()
-		mutex.release()
 
 		self.__log.debug('Finalizada función "listAllConcepts" de '\
 															'"BotServerDAO"')
@@ -3435,13 +6134,11 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 		self.__log.debug('Iniciada función "listAllConceptsTextAnswers" de '\
 															'"BotServerDAO"')
 
-		#	Tomar el cursor y preparar semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
+		#	Tomar el cursor
+		cursor = self.__read_connection().cursor()
 
 		#	Ejecutar consulta
 		self.__log.debug('Ejecutando consulta')
-		mutex.acquire()
 
 		consulta = cursor.execute('''SELECT texto
 										FROM DatoTexto
@@ -3451,9 +6148,8 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 
 		resultado = [fila[0] for fila in consulta]
 
-		#	Cerrar el cursor y liberar semáforo
+		#	Cerrar el cursor
 		cursor.close()
-		mutex.release()
 
 		self.__log.debug('Finalizada función "listAllConceptsTextAnswers" de '\
 															'"BotServerDAO"')
@@ -3464,13 +6160,11 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 		self.__log.debug('Iniciada función "listAllConceptosMultimediaFiles" '\
 															'de "BotServerDAO"')
 
-		#	Tomar cursor y preparar semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
+		#	Tomar cursor
+		cursor = self.__read_connection().cursor()
 
 		#	Ejecutar la consulta
 		self.__log.debug('Realizando consulta')
-		mutex.acquire()
 
 		consulta = cursor.execute('''SELECT ruta_archivo
 										FROM DatoArchivo
@@ -3479,9 +6173,8 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 
 		resultado = consulta.fetchall()
 
-		#	Cerrar cursor y liberar semáforo
+		#	Cerrar cursor
 		cursor.close()
-		mutex.release()
 
 		self.__log.debug('Finalizada función "listAllConceptosMultimediaFiles"'\
 														' de "BotServerDAO"')
@@ -3677,7 +6370,7 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 
 	def addDatoTexto(self, fecha_creacion: datetime.datetime, texto: list or str,
 						id_mensaje: int=None, id_comunicado: int=None,
-						id_concepto: int=None, use_mutex=True) -> int or list:
+						id_concepto: int=None) -> int or list:
 
 		"""Permite registrar uno o más Datos de tipo texto contenido por un
 			mensaje, un Comunicado o un Concepto. Sólo se debe de especificar
@@ -3739,47 +6432,44 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 		else:
 			raise ValueError('"texto" debe de ser str o lista de strs')
 
-		#	Tomar cursor y preparar semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock() if use_mutex else None
-
 		#	Realizar inserciones
 		self.__log.debug('Ejecutando inserciones con valores: '\
-						'fecha_creacion={}, texto={}, id_mensaje={}, '\
-						'id_comunicado={} e id_concepto={}'.format(
+						'fecha_creacion=%s, texto=%s, id_mensaje=%s, '\
+						'id_comunicado=%s e id_concepto=%s',
 						fecha_creacion, texto, id_mensaje, id_comunicado,
-																id_concepto))
-		if use_mutex: mutex.acquire()
+																id_concepto)
+
+		def operacion(cursor):
+			ids_dato = [] #	Lista de índices de los datos
+			for t in texto:
 
-		ids_dato = [] #	Lista de índices de los datos
-		for t in texto:
+				cursor.execute('INSERT INTO Dato(fecha_creacion) VALUES(?);',
+								(fecha_creacion,))
+				id_dato = cursor.execute('SELECT last_insert_rowid();').fetchone()[0]
+				ids_dato.append(id_dato)
 
-			cursor.execute('INSERT INTO Dato(fecha_creacion) VALUES(?);',
-							(fecha_creacion,))
-			id_dato = cursor.execute('SELECT last_insert_rowid();').fetchone()[0]
-			ids_dato.append(id_dato)
+				cursor.execute('INSERT INTO DatoTexto VALUES (?,?);', (id_dato, t))
 
-			cursor.execute('INSERT INTO DatoTexto VALUES (?,?);', (id_dato, t))
+				if id_mensaje:
+					cursor.execute('INSERT INTO Dato_Mensaje VALUES(?,?);',
+									(id_dato, id_mensaje))
+				elif id_comunicado:
+					cursor.execute('INSERT INTO Dato_Comunicado VALUES(?,?);',
+									(id_dato, id_comunicado))
+				else:
+					cursor.execute('INSERT INTO Dato_Concepto VALUES(?,?);',
+									(id_dato, id_concepto))
 
-			if id_mensaje:
-				cursor.execute('INSERT INTO Dato_Mensaje VALUES(?,?);',
-								(id_dato, id_mensaje))
-			elif id_comunicado:
-				cursor.execute('INSERT INTO Dato_Comunicado VALUES(?,?);',
-								(id_dato, id_comunicado))
-			else:
-				cursor.execute('INSERT INTO Dato_Concepto VALUES(?,?);',
-								(id_dato, id_concepto))
+			if id_concepto and not (id_mensaje or id_comunicado):
+				BotServerDAO.__rebuild_respuestas(cursor,
+										BotServerDAO.__to_json_array([id_concepto]))
 
-		#	Realizar el commit
-		self.__con_bd.commit()
+			return ids_dato if len(ids_dato) > 1 else ids_dato[0]
 
-		#	Cerrar el cursor y liberar semáforo
-		cursor.close()
-		if use_mutex: mutex.release()
+		ids_dato = self.__write(operacion)
 
 		self.__log.debug('Finalizada función "addDatoTexto" de "BotServerDAO"')
-		return ids_dato if len(ids_dato) > 1 else ids_dato[0]
+		return ids_dato
 
 	def addDatoArchivo(self, fecha_creacion: datetime.datetime,
 									tipo: str,
@@ -3791,8 +6481,7 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 									sticker_tipo=None,
 									id_mensaje=None,
 									id_comunicado=None,
-									id_concepto=None,
-									use_mutex=True) -> int:
+									id_concepto=None) -> int:
 
 		"""Permite registrar un Dato de tipo multimedia con un archivo
 			asociado contenido por un mensaje, un Comunicado o un Concepto.
@@ -3849,10 +6538,6 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 		id_concepto: int
 			Identificador del Concepto Teórico al cual se añade el Mensaje
 
-		use_mutex: bool por efecto True
-			Indica si se desean usar mutex para proteger las operaciones de
-			inserción en la base de datos
-
 		Devuelve:
 			int: Identificador dado al dato almacenado
 		"""
@@ -3914,54 +6599,49 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 			raise ValueError('Se debe proporcionar alguno/s de los valores:'\
 													' ruta_archivo y/o file_id')
 
-		#	Tomar cursor y semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock() if use_mutex else None
-
 		#	Realizar inserciones
-		self.__log.debug('Insertando valores: fecha_creacion={}, tipo={}, '\
-							'ruta_archivo={}, file_id={}, mime_type={}, '\
-							'sticker_emoji={}, sticker_conjunto={}, '\
-							'sticker_tipo={}, id_mensaje={}, id_comunicado={},'\
-							' id_concepto={}'.format(fecha_creacion, tipo,
+		self.__log.debug('Insertando valores: fecha_creacion=%s, tipo=%s, '\
+							'ruta_archivo=%s, file_id=%s, mime_type=%s, '\
+							'sticker_emoji=%s, sticker_conjunto=%s, '\
+							'sticker_tipo=%s, id_mensaje=%s, id_comunicado=%s,'\
+							' id_concepto=%s', fecha_creacion, tipo,
 							ruta_archivo, file_id, mime_type, sticker_emoji,
 							sticker_conjunto, sticker_tipo, id_mensaje,
-							id_comunicado, id_concepto))
-		if use_mutex: mutex.acquire()
-
-		cursor.execute('INSERT INTO Dato(fecha_creacion) VALUES(?);',
-						(fecha_creacion,))
-		id_dato = cursor.execute('SELECT last_insert_rowid();').fetchone()[0]
-
-		cursor.execute('INSERT INTO DatoArchivo VALUES (?,?,?,?,?);',
-						(id_dato, tipo, ruta_archivo, file_id, mime_type))
-		if id_mensaje:
-			cursor.execute('INSERT INTO Dato_Mensaje VALUES(?,?);',
-							(id_dato, id_mensaje))
-		elif id_comunicado:
-			cursor.execute('INSERT INTO Dato_Comunicado VALUES(?,?);',
-							(id_dato, id_comunicado))
-		else:
-			cursor.execute('INSERT INTO Dato_Concepto VALUES(?,?);',
-							(id_dato, id_concepto))
-
-		if tipo == BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']:
-			if sticker_tipo:
-				cursor.execute('''INSERT INTO DatoArchivoSticker
-									VALUES(?,?,?,?);''',
-					(id_dato, sticker_emoji, sticker_conjunto, sticker_tipo))
+							id_comunicado, id_concepto)
+
+		def operacion(cursor):
+			cursor.execute('INSERT INTO Dato(fecha_creacion) VALUES(?);',
+							(fecha_creacion,))
+			id_dato = cursor.execute('SELECT last_insert_rowid();').fetchone()[0]
+
+			cursor.execute('INSERT INTO DatoArchivo VALUES (?,?,?,?,?);',
+							(id_dato, tipo, ruta_archivo, file_id, mime_type))
+			if id_mensaje:
+				cursor.execute('INSERT INTO Dato_Mensaje VALUES(?,?);',
+								(id_dato, id_mensaje))
+			elif id_comunicado:
+				cursor.execute('INSERT INTO Dato_Comunicado VALUES(?,?);',
+								(id_dato, id_comunicado))
 			else:
-				cursor.execute('''INSERT INTO
-									DatoArchivoSticker(id, emoji, conjunto)
-									VALUES(?,?,?);''',
-						(id_dato, sticker_emoji, sticker_conjunto))
+				cursor.execute('INSERT INTO Dato_Concepto VALUES(?,?);',
+								(id_dato, id_concepto))
+				BotServerDAO.__rebuild_respuestas(cursor,
+										BotServerDAO.__to_json_array([id_concepto]))
+
+			if tipo == BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']:
+				if sticker_tipo:
+					cursor.execute('''INSERT INTO DatoArchivoSticker
+										VALUES(?,?,?,?);''',
+						(id_dato, sticker_emoji, sticker_conjunto, sticker_tipo))
+				else:
+					cursor.execute('''INSERT INTO
+										DatoArchivoSticker(id, emoji, conjunto)
+										VALUES(?,?,?);''',
+							(id_dato, sticker_emoji, sticker_conjunto))
 
-		#	Realizar el commit
-		self.__con_bd.commit()
+			return id_dato
 
-		#	Liberar semáforo y cerrar el cursor
-		if use_mutex: mutex.release()
-		cursor.close()
+		id_dato = self.__write(operacion)
 
 		self.__log.debug('Finalizada función "addDatoArchivo" de '\
 															'"BotServerDAO"')
@@ -3975,8 +6655,7 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 									vcard: str=None,
 									id_mensaje: int=None,
 									id_comunicado: int=None,
-									id_concepto: int=None,
-									use_mutex=True) -> int:
+									id_concepto: int=None) -> int:
 
 		"""Permite registrar uno o más Datos de tipo Contacto contenido por un
 			mensaje, un Comunicado o un Concepto. Sólo se debe de especificar
@@ -4020,21 +6699,12 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 		id_concepto: int
 			Identificador del Concepto Teórico al cual se añade el Mensaje
 
-		use_mutex: bool por efecto True
-			Indica si se desean usar mutex para proteger las operaciones de
-			inserción en la base de datos
-
 		Devuelve:
 			int: Identificador dado al dato almacenado
 		"""
 
 		self.__log.debug('Iniciada función "addDatoContacto" de "BotServerDAO"')
 
-		#	Comprobar y procesar los parámetros de entrada
-		nombres_campos = []
-		campos = []
-		datos = []
-
 		#	Comprobar y procesar los parámetros de entrada
 		if id_mensaje is not None and not isinstance(id_mensaje, int):
 			raise ValueError('"id_mensaje" no es int')
@@ -4051,41 +6721,21 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 
 		if not isinstance(telefono, str):
 			raise ValueError('"telefono" no es str')
-		else:
-			nombres_campos.append('telefono')
-			datos.append(telefono)
-			campos.append('?')
 
 		if not isinstance(nombre, str):
 			raise ValueError('"nombre" no es str')
-		else:
-			datos.append(nombre)
-			campos.append('?')
-			nombres_campos.append('nombre')
 
 		if apellidos:
 			if not isinstance(apellidos, str):
 				raise ValueError('"apellidos" no es str')
-			else:
-				datos.append(apellidos)
-				campos.append('?')
-				nombres_campos.append('apellidos')
 
 		if id_usuario:
 			if not isinstance(id_usuario, int):
 				raise ValueError('"id_usuario" no es int')
-			else:
-				datos.append(id_usuario)
-				campos.append('?')
-				nombres_campos.append('id_usuario')
 
 		if vcard:
 			if not isinstance(vcard, str):
 				raise ValueError('"vcard" no es str')
-			else:
-				datos.append(vcard)
-				campos.append('?')
-				nombres_campos.append('vcard')
 
 		if ((id_mensaje is not None and id_comunicado is not None) or
 			(id_mensaje is not None and id_concepto is not None) or
@@ -4093,49 +6743,38 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 			raise ValueError('Sólo se debe de proporcionar uno de los tres:'\
 							' "id_mensaje", "id_comunicado" o "id_concepto"')
 
-		#	Tomar cursor y semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock() if use_mutex else None
-
 		#	Realizar inserciones
-		self.__log.debug('Insertando valores: fecha_creacion={}, telefono={},'\
-						' nombre={}, apellidos={}, id_usuario={}, vcard={}, '\
-					'id_mensaje={}, id_comunicado={}, id_concepto={}'.format(
+		self.__log.debug('Insertando valores: fecha_creacion=%s, telefono=%s,'\
+						' nombre=%s, apellidos=%s, id_usuario=%s, vcard=%s, '\
+					'id_mensaje=%s, id_comunicado=%s, id_concepto=%s',
 							fecha_creacion, telefono, nombre,
 							apellidos, id_usuario, vcard, id_mensaje,
-							id_comunicado, id_concepto))
-
-		if use_mutex: mutex.acquire()
+							id_comunicado, id_concepto)
 
-		cursor.execute('INSERT INTO Dato(fecha_creacion) VALUES(?);',
-						(fecha_creacion,))
-		id_dato = cursor.execute('SELECT last_insert_rowid();').fetchone()[0]
-
-		#	Añadir el id
-		nombres_campos.insert(0, 'id')
-		campos.append('?')
-		datos.insert(0, id_dato)
+		def operacion(cursor):
+			cursor.execute('INSERT INTO Dato(fecha_creacion) VALUES(?);',
+							(fecha_creacion,))
+			id_dato = cursor.execute('SELECT last_insert_rowid();').fetchone()[0]
 
-		cursor.execute('INSERT INTO DatoContacto(%s) VALUES (%s);'%
-									(','.join(nombres_campos), ','.join(campos)),
-									tuple(datos))
+			cursor.execute('INSERT INTO DatoContacto VALUES(?,?,?,?,?,?);',
+							(id_dato, telefono, nombre, apellidos or None,
+							id_usuario or None, vcard or None))
 
-		if id_mensaje is not None:
-			cursor.execute('INSERT INTO Dato_Mensaje VALUES(?,?);',
-							(id_dato, id_mensaje))
-		elif id_comunicado is not None:
-			cursor.execute('INSERT INTO Dato_Comunicado VALUES(?,?);',
-							(id_dato, id_comunicado))
-		else:
-			cursor.execute('INSERT INTO Dato_Concepto VALUES(?,?);',
-							(id_dato, id_concepto))
+			if id_mensaje is not None:
+				cursor.execute('INSERT INTO Dato_Mensaje VALUES(?,?);',
+								(id_dato, id_mensaje))
+			elif id_comunicado is not None:
+				cursor.execute('INSERT INTO Dato_Comunicado VALUES(?,?);',
+								(id_dato, id_comunicado))
+			else:
+				cursor.execute('INSERT INTO Dato_Concepto VALUES(?,?);',
+								(id_dato, id_concepto))
+				BotServerDAO.__rebuild_respuestas(cursor,
+										BotServerDAO.__to_json_array([id_concepto]))
 
-		#	Realizar el commit
-		self.__con_bd.commit()
+			return id_dato
 
-		#	Liberar semáforo y cerrar el cursor
-		if use_mutex: mutex.release()
-		cursor.close()
+		id_dato = self.__write(operacion)
 
 		self.__log.debug('Finalizada función "addDatoContacto" de'\
 															' "BotServerDAO"')
@@ -4150,8 +6789,7 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 									tipo_cuadrante=None,
 									id_mensaje=None,
 									id_comunicado=None,
-									id_concepto=None,
-									use_mutex=True) -> int:
+									id_concepto=None) -> int:
 
 		"""Permite registrar uno o más Datos de tipo Localizacion, que se
 			correesponden con Localizaciones y Avenidas enviadas por medio de
@@ -4201,10 +6839,6 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 		id_concepto: int
 			Identificador del Concepto Teórico al cual se añade el Mensaje
 
-		use_mutex: bool por efecto True
-			Indica si se desean usar mutex para proteger las operaciones de
-			inserción en la base de datos
-
 		Devuelve:
 			int: Identificador dado al dato almacenado
 		"""
@@ -4212,11 +6846,6 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 		self.__log.debug('Iniciada función "addDatoLocalizacion" de'\
 															' "BotServerDAO"')
 
-		#	Comprobar y procesar los parámetros de entrada
-		nombres_campos = []
-		campos = []
-		datos = []
-
 		#	Comprobar y procesar los parámetros de entrada
 		if id_mensaje is not None and not isinstance(id_mensaje, int):
 			raise ValueError('"id_mensaje" no es int')
@@ -4233,49 +6862,25 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 
 		if not isinstance(longitud, float):
 			raise ValueError('"longitud" no es float')
-		else:
-			datos.append(longitud)
-			nombres_campos.append('longitud')
-			campos.append('?')
 
 		if not isinstance(latitud, float):
 			raise ValueError('"latitud" no es float')
-		else:
-			datos.append(latitud)
-			nombres_campos.append('latitud')
-			campos.append('?')
 
 		if titulo:
 			if not isinstance(titulo, str):
 				raise ValueError('"titulo" no es str')
-			else:
-				datos.append(titulo)
-				nombres_campos.append('titulo')
-				campos.append('?')
 
 		if direccion:
 			if not isinstance(direccion, str):
 				raise ValueError('"direccion" no es str')
-			else:
-				datos.append(direccion)
-				nombres_campos.append('direccion')
-				campos.append('?')
 
 		if id_cuadrante:
 			if not isinstance(id_cuadrante, str):
 				raise ValueError('"id_cuadrante" no es str')
-			else:
-				datos.append(id_cuadrante)
-				nombres_campos.append('id_cuadrante')
-				campos.append('?')
 
 		if tipo_cuadrante:
 			if not isinstance(tipo_cuadrante, str):
 				raise ValueError('"tipo_cuadrante" no es str')
-			else:
-				datos.append(tipo_cuadrante)
-				nombres_campos.append('tipo_cuadrante')
-				campos.append('?')
 
 		if ((id_mensaje is not None and id_comunicado is not None) or
 			(id_mensaje is not None and id_concepto is not None) or
@@ -4283,50 +6888,40 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 			raise ValueError('Sólo se debe de proporcionar uno de los tres:'\
 							' "id_mensaje", "id_comunicado" o "id_concepto"')
 
-		#	Tomar cursor y semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock() if use_mutex else None
-
 		#	Realizar inserciones
-		self.__log.debug('Insertando valores: fecha_creacion={}, longitud={},'\
-						' latitud={}, titulo={}, direccion={}, '\
-						'id_cuadrante={}, tipo_cuadrante={}, id_mensaje={},'\
-						' id_comunicado={}, id_concepto={}'.format(
+		self.__log.debug('Insertando valores: fecha_creacion=%s, longitud=%s,'\
+						' latitud=%s, titulo=%s, direccion=%s, '\
+						'id_cuadrante=%s, tipo_cuadrante=%s, id_mensaje=%s,'\
+						' id_comunicado=%s, id_concepto=%s',
 						fecha_creacion, longitud, latitud, titulo, direccion,
 						id_cuadrante, tipo_cuadrante, id_mensaje,
-						id_comunicado, id_concepto))
-
-		if use_mutex: mutex.acquire()
+						id_comunicado, id_concepto)
 
-		cursor.execute('INSERT INTO Dato(fecha_creacion) VALUES(?);',
-						(fecha_creacion,))
-		id_dato = cursor.execute('SELECT last_insert_rowid();').fetchone()[0]
-
-		#	Añadir el id
-		nombres_campos.insert(0, 'id')
-		campos.append('?')
-		datos.insert(0, id_dato)
+		def operacion(cursor):
+			cursor.execute('INSERT INTO Dato(fecha_creacion) VALUES(?);',
+							(fecha_creacion,))
+			id_dato = cursor.execute('SELECT last_insert_rowid();').fetchone()[0]
 
-		cursor.execute(('INSERT INTO DatoLocalizacion(%s) VALUES(%s);' %
-							(','.join(nombres_campos), ','.join(campos))),
-							tuple(datos))
+			cursor.execute('INSERT INTO DatoLocalizacion VALUES(?,?,?,?,?,?,?);',
+							(id_dato, longitud, latitud, titulo or None,
+							direccion or None, id_cuadrante or None,
+							tipo_cuadrante or None))
 
-		if id_mensaje is not None:
-			cursor.execute('INSERT INTO Dato_Mensaje VALUES(?,?);',
-							(id_dato, id_mensaje))
-		elif id_comunicado is not None:
-			cursor.execute('INSERT INTO Dato_Comunicado VALUES(?,?);',
-							(id_dato, id_comunicado))
-		else:
-			cursor.execute('INSERT INTO Dato_Concepto VALUES(?,?);',
-							(id_dato, id_concepto))
+			if id_mensaje is not None:
+				cursor.execute('INSERT INTO Dato_Mensaje VALUES(?,?);',
+								(id_dato, id_mensaje))
+			elif id_comunicado is not None:
+				cursor.execute('INSERT INTO Dato_Comunicado VALUES(?,?);',
+								(id_dato, id_comunicado))
+			else:
+				cursor.execute('INSERT INTO Dato_Concepto VALUES(?,?);',
+								(id_dato, id_concepto))
+				BotServerDAO.__rebuild_respuestas(cursor,
+										BotServerDAO.__to_json_array([id_concepto]))
 
-		#	Realizar el commit
-		self.__con_bd.commit()
+			return id_dato
 
-		#	Liberar semáforo y cerrar el cursor
-		if use_mutex: mutex.release()
-		cursor.close()
+		id_dato = self.__write(operacion)
 
 		self.__log.debug('Finalizada función "addDatoLocalizacion" de'\
 															' "BotServerDAO"')
@@ -4335,7 +6930,7 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 	def editDatoArchivo(self, id_dato: int,
 									fecha_creacion: datetime.datetime=None,
 									ruta_archivo: str=None,
-									file_id: int=None,
+									file_id: str=None,
 									mime_type: str=None,
 									sticker_emoji: str=None,
 									sticker_conjunto: str=None,
@@ -4389,10 +6984,6 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 		id_concepto: int
 			Identificador del Concepto Teórico al cual se añade el Mensaje
 
-		use_mutex: bool por defecto True
-			Indica si se desean usar mutex para proteger las operaciones de
-			inserción en la base de datos
-
 		Devuelve:
 			int: Identificador dado al dato almacenado
 		"""
@@ -4430,8 +7021,8 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 				campos += 'mime_type=?,'
 
 		if file_id is not None:
-			if not isinstance(file_id, int):
-				raise ValueError('"file_id" no es int')
+			if not isinstance(file_id, str):
+				raise ValueError('"file_id" no es str')
 			else:
 				datos.append(file_id)
 				campos += 'file_id=?,'
@@ -4442,37 +7033,25 @@ BotServerDAO.__BD_TIPOS['TIPO_DATOARCHIVO']['sticker']),
 		else:
 			raise ValueError('Al menos un parámetro se debe proporcionar')
 
-		#	Tomar cursor y semáforo
-		cursor = self.__con_bd.cursor()
-		mutex = Lock()
-
 		#	Realizar modificaciones
-		self.__log.debug('Editando Dato Multimedia con id={} con los '\
-							'siguientes valores: fecha_creacion={}, tipo={},'\
-							' ruta_archivo={}, file_id={}, mime_type={},'\
-							' sticker_emoji={}, sticker_tipo={} y'\
-							' sticker_conjunto={}'.format(id_dato,
-							fecha_creacion, tipo, ruta_archivo, file_id,
+		self.__log.debug('Editando Dato Multimedia con id=%s con los '\
+							'siguientes valores: fecha_creacion=%s,'\
+							' ruta_archivo=%s, file_id=%s, mime_type=%s,'\
+							' sticker_emoji=%s, sticker_tipo=%s y'\
+							' sticker_conjunto=%s', id_dato,
+							fecha_creacion, ruta_archivo, file_id,
 							mime_type, sticker_emoji, sticker_tipo,
-							sticker_conjunto))
-		mutex.acquire()
-
-		cursor.execute('UPDATE DatoArchivo SET %s WHERE id_dato=? ' % campos,
-						tuple(datos))
+							sticker_conjunto)
 
-		#	Realizar commit
-		self.__con_bd.commit()
+		def operacion(cursor):
+			cursor.execute('UPDATE DatoArchivo SET %s WHERE id=? ' % campos,
+							tuple(datos))
 
-		#	Liberar semáforo y cerrar cursor
-		cursor.close()
-		mutex.release()
+		self.__write(operacion)
 
 		self.__log.debug('Finalizada función "editDatoArchivo" de'\
 															' "BotServerDAO"')
 
 	def __del__(self):
 		#	Cerrar la conexión con la BD y destruirlo
-		if self.__con_bd:
-			self.__con_bd.rollback()
-			self.__con_bd.close()
-			del self.__con_bd
+		self.close()
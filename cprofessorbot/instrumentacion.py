@@ -0,0 +1,400 @@
+# -*- coding: utf-8 -*-
+################################################################################
+# Descripción: Módulo que contiene la definición e implementación de la
+#				instrumentación opcional de BotServerDAO, que mide el número de
+#				llamadas, las filas devueltas y la latencia de cada función y
+#				de cada sentencia SQL
+# Autor: Nicolás Cubero Torres
+################################################################################
+
+#	Módulos importados
+import sqlite3
+import time
+import json
+import bisect
+import functools
+import inspect
+from threading import Lock
+
+class Instrumentacion:
+
+	"""
+	Registro de las métricas de uso de las funciones de BotServerDAO y de las
+	sentencias SQL ejecutadas. Por cada función y sentencia se almacena el
+	número de llamadas, el número de filas devueltas, el tiempo total y
+	máximo y un histograma de latencias de escala logarítmica
+	"""
+
+	###	Constantes ###
+
+	#	Límites superiores en segundos de los intervalos del histograma de
+	#	latencias. El último intervalo recoge las latencias superiores
+	LIMITES_HISTOGRAMA = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+							0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+	#	Percentiles calculados a partir de los histogramas
+	__PERCENTILES = (50, 95, 99)
+
+	def __init__(self):
+
+		#	Métricas de las funciones y de las sentencias: nombre -
+		#	[llamadas, filas, tiempo total, tiempo máximo, histograma]
+		self.__funciones = {}
+		self.__sentencias = {}
+		self.__mutex = Lock()
+
+		#	Texto normalizado de cada sentencia ejecutada
+		self.__textos_sentencias = {}
+
+	def __registrar(self, metricas: dict, nombre: str, duracion: float,
+																filas: int):
+
+		intervalo = bisect.bisect_left(Instrumentacion.LIMITES_HISTOGRAMA,
+																	duracion)
+
+		with self.__mutex:
+			registro = metricas.get(nombre)
+
+			if registro is None:
+				registro = [0, 0, 0.0, 0.0,
+							[0]*(len(Instrumentacion.LIMITES_HISTOGRAMA)+1)]
+				metricas[nombre] = registro
+
+			registro[0] += 1
+			registro[1] += filas
+			registro[2] += duracion
+
+			if duracion > registro[3]:
+				registro[3] = duracion
+
+			registro[4][intervalo] += 1
+
+	def registrarFuncion(self, nombre: str, duracion: float, filas: int):
+
+		"""Registra una llamada a la función "nombre" que ha durado
+		"duracion" segundos y ha devuelto "filas" filas
+		"""
+
+		self.__registrar(self.__funciones, nombre, duracion, filas)
+
+	def registrarSentencia(self, sentencia: str, duracion: float, filas: int):
+
+		"""Registra una ejecución de la sentencia SQL "sentencia" que ha
+		durado "duracion" segundos y ha devuelto o modificado "filas" filas.
+		Las sentencias se agrupan por su texto sin espacios redundantes
+		"""
+
+		with self.__mutex:
+			texto = self.__textos_sentencias.get(sentencia)
+
+			if texto is None:
+				texto = ' '.join(sentencia.split())
+				self.__textos_sentencias[sentencia] = texto
+
+		self.__registrar(self.__sentencias, texto, duracion, filas)
+
+	def __contar_filas(resultado):
+
+		"""Estima el número de filas devueltas por una función a partir de
+		su resultado: el número de elementos de las colecciones, ninguna para
+		None y False y una para el resto de valores. Los diccionarios se
+		consideran colecciones si sus valores son a su vez registros y un
+		único registro en caso contrario
+		"""
+
+		if isinstance(resultado, dict):
+			if not resultado:
+				return 0
+
+			return (len(resultado) if hasattr(next(iter(resultado.values())),
+															'keys') else 1)
+
+		if isinstance(resultado, (list, tuple, set)):
+			return len(resultado)
+
+		if resultado is None or resultado is False:
+			return 0
+
+		return 1
+
+	def envolver(self, nombre: str, funcion):
+
+		"""Devuelve una función equivalente a "funcion" que registra cada
+		una de sus llamadas bajo el nombre "nombre". En las funciones
+		generadoras, el tiempo registrado es el empleado en producir todos
+		los elementos consumidos y las filas el número de elementos
+		"""
+
+		if inspect.isgeneratorfunction(funcion):
+
+			@functools.wraps(funcion)
+			def generador_instrumentado(*args, **kwargs):
+
+				inicio = time.perf_counter()
+				generador = funcion(*args, **kwargs)
+				duracion = time.perf_counter() - inicio
+				filas = 0
+
+				try:
+					while True:
+						inicio = time.perf_counter()
+
+						try:
+							elemento = next(generador)
+						except StopIteration:
+							break
+						finally:
+							duracion += time.perf_counter() - inicio
+
+						filas += 1
+						yield elemento
+
+				finally:
+					generador.close()
+					self.registrarFuncion(nombre, duracion, filas)
+
+			return generador_instrumentado
+
+		@functools.wraps(funcion)
+		def funcion_instrumentada(*args, **kwargs):
+
+			inicio = time.perf_counter()
+			filas = 0
+
+			try:
+				resultado = funcion(*args, **kwargs)
+				filas = Instrumentacion.__contar_filas(resultado)
+				return resultado
+
+			finally:
+				self.registrarFuncion(nombre, time.perf_counter() - inicio,
+																	filas)
+
+		return funcion_instrumentada
+
+	def __resumir(metricas: dict):
+
+		"""Construye el resumen de las métricas de cada función o sentencia
+		"""
+
+		resumen = {}
+
+		for nombre, (llamadas, filas, total, maximo,
+										histograma) in metricas.items():
+
+			datos = {
+						'llamadas': llamadas,
+						'filas': filas,
+						'tiempo_total': total,
+						'tiempo_medio': total/llamadas,
+						'tiempo_maximo': maximo,
+						'histograma': list(zip(
+									Instrumentacion.LIMITES_HISTOGRAMA+(None,),
+									histograma))
+					}
+
+			#	Los percentiles se aproximan por el límite superior del
+			#	intervalo del histograma que los contiene
+			for percentil in Instrumentacion.__PERCENTILES:
+				objetivo = llamadas*percentil/100
+				acumulado = 0
+
+				for limite, n in datos['histograma']:
+					acumulado += n
+
+					if acumulado >= objetivo:
+						datos['p%d' % percentil] = (limite if limite is not None
+																	else maximo)
+						break
+
+			resumen[nombre] = datos
+
+		return resumen
+
+	def getEstadisticas(self):
+
+		"""Permite obtener las métricas registradas
+
+		Devuelve:
+		---------
+			dict: Con las métricas de las funciones ("funciones") y de las
+				sentencias SQL ("sentencias"), cada una formada por el par
+				nombre (str) - métricas (dict) con los siguientes campos:
+				- llamadas: int
+					Número de llamadas o ejecuciones
+				- filas: int
+					Número total de filas devueltas o modificadas
+				- tiempo_total, tiempo_medio, tiempo_maximo: float
+					Tiempos total, medio y máximo en segundos
+				- p50, p95, p99: float
+					Percentiles de la latencia en segundos, aproximados por
+					los límites del histograma
+				- histograma: list de tuple
+					Pares límite superior en segundos (None para el último
+					intervalo) - número de llamadas
+		"""
+
+		with self.__mutex:
+			funciones = {nombre: registro[:4] + [list(registro[4])]
+							for nombre, registro in self.__funciones.items()}
+			sentencias = {nombre: registro[:4] + [list(registro[4])]
+							for nombre, registro in self.__sentencias.items()}
+
+		return {
+					'funciones': Instrumentacion.__resumir(funciones),
+					'sentencias': Instrumentacion.__resumir(sentencias)
+				}
+
+	def export(self, filename: str):
+
+		"""Almacena las métricas registradas en un fichero JSON con el
+		formato devuelto por getEstadisticas
+		"""
+
+		with open(filename, 'w') as fichero:
+			json.dump(self.getEstadisticas(), fichero, indent=2,
+														ensure_ascii=False)
+
+	def reset(self):
+
+		"""Descarta todas las métricas registradas"""
+
+		with self.__mutex:
+			self.__funciones.clear()
+			self.__sentencias.clear()
+
+class CursorInstrumentado(sqlite3.Cursor):
+
+	"""
+	Cursor que registra en la Instrumentacion de su conexión cada sentencia
+	ejecutada. Las sentencias que no devuelven filas se registran al
+	ejecutarse, con el número de filas modificadas, y las consultas al
+	agotarse, cerrarse o ejecutar otra sentencia en el cursor, con el tiempo
+	empleado en la ejecución y en la lectura de sus filas
+	"""
+
+	def __init__(self, con):
+
+		super().__init__(con)
+
+		self.__sentencia = None
+		self.__duracion = 0.0
+		self.__filas = 0
+
+	def __finalizar(self):
+
+		if self.__sentencia is not None:
+			self.connection.instrumentacion.registrarSentencia(
+								self.__sentencia, self.__duracion, self.__filas)
+			self.__sentencia = None
+
+	def __ejecutar(self, ejecucion, sentencia: str, parametros):
+
+		self.__finalizar()
+
+		inicio = time.perf_counter()
+		ejecucion(sentencia, parametros)
+
+		self.__sentencia = sentencia
+		self.__duracion = time.perf_counter() - inicio
+		self.__filas = 0
+
+		if self.description is None:
+			self.__filas = max(self.rowcount, 0)
+			self.__finalizar()
+
+		return self
+
+	def execute(self, sentencia: str, parametros=()):
+
+		return self.__ejecutar(super().execute, sentencia, parametros)
+
+	def executemany(self, sentencia: str, parametros):
+
+		return self.__ejecutar(super().executemany, sentencia, parametros)
+
+	def __next__(self):
+
+		inicio = time.perf_counter()
+
+		try:
+			fila = super().__next__()
+
+		except StopIteration:
+			self.__duracion += time.perf_counter() - inicio
+			self.__finalizar()
+			raise
+
+		self.__duracion += time.perf_counter() - inicio
+		self.__filas += 1
+
+		return fila
+
+	def fetchone(self):
+
+		inicio = time.perf_counter()
+		fila = super().fetchone()
+		self.__duracion += time.perf_counter() - inicio
+
+		if fila is None:
+			self.__finalizar()
+		else:
+			self.__filas += 1
+
+		return fila
+
+	def fetchmany(self, size: int=None):
+
+		if size is None:
+			size = self.arraysize
+
+		inicio = time.perf_counter()
+		filas = super().fetchmany(size)
+		self.__duracion += time.perf_counter() - inicio
+		self.__filas += len(filas)
+
+		if len(filas) < size:
+			self.__finalizar()
+
+		return filas
+
+	def fetchall(self):
+
+		inicio = time.perf_counter()
+		filas = super().fetchall()
+		self.__duracion += time.perf_counter() - inicio
+		self.__filas += len(filas)
+
+		self.__finalizar()
+
+		return filas
+
+	def close(self):
+
+		self.__finalizar()
+		super().close()
+
+	def __del__(self):
+
+		self.__finalizar()
+
+class ConexionInstrumentada(sqlite3.Connection):
+
+	"""
+	Conexión cuyos cursores, incluidos los creados por execute y
+	executemany, son de tipo CursorInstrumentado. La Instrumentacion en la
+	que se registran las sentencias se asigna al atributo "instrumentacion"
+	tras crear la conexión
+	"""
+
+	def cursor(self, factory=CursorInstrumentado):
+
+		return super().cursor(factory)
+
+	def execute(self, sentencia: str, parametros=()):
+
+		return self.cursor().execute(sentencia, parametros)
+
+	def executemany(self, sentencia: str, parametros):
+
+		return self.cursor().executemany(sentencia, parametros)
@@ -11,10 +11,11 @@
 
 #	Módulos importados
 import re
+import hashlib
 import requests
 from cprofessorbot.utils import HTMLTelegramFormatter
 from cprofessorbot.nlu import processRequest
-from cprofessorbot.utils import percentile
+from cprofessorbot.utils import countingPercentile
 #  pip install requests
 
 class QuestionParser:
@@ -23,6 +24,67 @@ class QuestionParser:
 		todos los Conceptos Teóricos presentes en el mismo.
 	"""
 
+	###	Constantes ###
+
+	#	Patrones compilados una única vez para la puntuación de los textos,
+	#	la extracción de preguntas y la eliminación de etiquetas
+	__PATRON_PUNTUACION = re.compile(
+		r'^[ \n\t\r]*([0-9\.\)]+[0-9\.\)]*)? *((<(b|strong)>).+(<\/\4>)(.*)|.+)')
+
+	__PATRON_EXTRACCION = re.compile(
+		r'^[ \n\t\r]*([0-9\.\)]+[0-9\.\)]*)? *((<([a-zA-Z0-9]+)>)(.+)'\
+		r'(<\/\4>[\.:]*)(.*)|(.+[^ ])[\.:\?\!]*(.*))')
+
+	__PATRON_ETIQUETA = re.compile(r'<\/?[a-zA-Z0-9]+>')
+
+	__PATRON_HTTP = re.compile(r'^https?:')
+
+	__PATRON_PROTOCOLO = re.compile(r'^[a-zA-Z]+:')
+
+	#	Nombres de documento que se consideran equivalentes al directorio
+	#	que los contiene
+	__PAGINAS_INDICE = ('index.html', 'index.htm', 'index.php')
+
+	def __canonical_url(url: str):
+
+		"""Obtiene la forma canónica de una url con el fin de identificar
+		las urls que hacen referencia a la misma página: elimina el fragmento
+		y la cadena de consulta, los segmentos "./", el nombre de la página
+		índice del directorio y la barra final
+		"""
+
+		#	Eliminar fragmento y cadena de consulta
+		for sep in ('#', '?'):
+			pos = url.find(sep)
+
+			if pos != -1:
+				url = url[:pos]
+
+		#	Separar el protocolo y el dominio de la ruta
+		prot = url.find('://')
+		inicio = url.find('/', prot+3 if prot != -1 else 0)
+
+		if inicio == -1:
+			return url.lower()
+
+		dominio = url[:inicio].lower()
+		segmentos = [seg for seg in url[inicio:].split('/')
+												if seg not in ('', '.')]
+
+		if segmentos and segmentos[-1].lower() in (
+										QuestionParser.__PAGINAS_INDICE):
+			segmentos.pop()
+
+		return dominio + '/' + '/'.join(segmentos) if segmentos else dominio
+
+	def __fingerprint(content: bytes):
+
+		"""Calcula la huella del contenido de una página para detectar
+		páginas con idéntico contenido servidas desde urls diferentes
+		"""
+
+		return hashlib.blake2b(content, digest_size=16).digest()
+
 	def __evaluate_questions_answers(text: list):
 
 		if type(text) is not list:
@@ -45,9 +107,7 @@ class QuestionParser:
 			#	y se puntúa positivamente con el fin de identificar el formato
 			#	de las preguntas de la urlproporcionada
 
-			m = re.search(
-	r'^[ \n\t\r]*([0-9\.\)]+[0-9\.\)]*)? *((<(b|strong)>).+(<\/\4>)(.*)|.+)',
-																		text[i])
+			m = QuestionParser.__PATRON_PUNTUACION.search(text[i])
 
 			if m:
 				#	Evaluar las características del texto
@@ -72,7 +132,8 @@ class QuestionParser:
 
 		return line_score
 
-	def extract_questions_from_url(url: str, log=None, visited_url=None):
+	def extract_questions_from_url(url: str, log=None, visited_url=None,
+														visited_content=None):
 
 		"""Se encarga de ejecutar el algoritmo para la extracción de Conceptos
 		Teóricos a partir del sitio web de la url pasada como parámetro
@@ -88,12 +149,24 @@ class QuestionParser:
 			que se realizan. Es opcional
 
 		visited_url: set o None
-			Listado de urls ya visitadas. Dejar en None
+			Listado de urls ya visitadas en su forma canónica. Dejar en None
+
+		visited_content: dict o None
+			Huellas del contenido de las páginas ya descargadas junto con el
+			número de veces que han sido descargadas. Dejar en None
 		"""
 
+		#	La primera llamada es la que informa del ratio de duplicados
+		inicial = visited_content is None
+
 		if visited_url is None:
 			visited_url = set()
 
+		if visited_content is None:
+			visited_content = {}
+
+		visited_url.add(QuestionParser.__canonical_url(url))
+
 		html_parser = HTMLTelegramFormatter(log)
 		preguntas = []
 
@@ -112,6 +185,19 @@ class QuestionParser:
 			if log is not None: log.info('Ejecutado GET con código de '\
 									'operación: "%d"' % response.status_code)
 
+		#	Descartar la página si su contenido ya ha sido analizado desde
+		#	otra url, antes de parsearla
+		huella = QuestionParser.__fingerprint(response.content)
+
+		if huella in visited_content:
+			visited_content[huella] += 1
+
+			if log is not None: log.info('Contenido de url: "%s" ya analizado'\
+												', se descarta' % url)
+			return []
+
+		visited_content[huella] = 1
+
 		html = response.text
 
 		#	Parsear la página
@@ -123,7 +209,9 @@ class QuestionParser:
 		#	Puntuar cada texto en función de la posibilidad de ser pregunta o no
 		line_score = QuestionParser.__evaluate_questions_answers(
 															html_parser.data)
-		max_score = percentile(line_score, 90)
+		#	Las puntuaciones son enteros pequeños (entre 0 y 3), por lo que
+		#	el percentil se obtiene por conteo sin ordenar la lista
+		max_score = countingPercentile(line_score, 90)
 
 		if max_score == 0 and sum(line_score)==0:
 			return []	#	Devolver lista vacía
@@ -134,13 +222,14 @@ class QuestionParser:
 			if line_score[i] >= max_score:
 
 				#	Se ha encontrado alguna pregunta y se extrae
-				m = re.search(r'^[ \n\t\r]*([0-9\.\)]+[0-9\.\)]*)? *((<([a-zA-Z0-9]+)>)(.+)(<\/\4>[\.:]*)(.*)|(.+[^ ])[\.:\?\!]*(.*))', html_parser.data[i]) #or re.search(r'^[ \n\t\r]*((<([a-zA-Z0-9]+)>) ?(<li>|[0-9\.\)]+)? ?(.+)(<\/\4>)(.*)|(.+[^ ])[\.:\?\!](.*))', html_parser.data[i])
+				m = QuestionParser.__PATRON_EXTRACCION.search(
+														html_parser.data[i])
 
 				if m:
 
 					#	Eliminar todas las etiquetas de la pregunta
 					pr = m.group(5) if m.group(3) else m.group(8)
-					pr = re.sub('<\/?[a-zA-Z0-9]+>', '', pr)
+					pr = QuestionParser.__PATRON_ETIQUETA.sub('', pr)
 
 					new_pre = {
 								'pregunta': pr,
@@ -188,7 +277,7 @@ class QuestionParser:
 			if '#' in link:
 				continue	# Salto dentro de la misma página, se ignora
 
-			elif (re.match('^https?:', link) and not link.startswith(
+			elif (QuestionParser.__PATRON_HTTP.match(link) and not link.startswith(
 															folder_url)):
 				#	El enlace lleva a otra web diferente y se ignora
 				continue
@@ -200,13 +289,11 @@ class QuestionParser:
 			elif link[0] == '.' and len(link) > 1:
 				new_url = folder_url + link[1:]
 
-				if new_url in visited_url:
+				if QuestionParser.__canonical_url(new_url) in visited_url:
 					continue
-				else:
-					visited_url.add(new_url)
 
 				preguntas += (QuestionParser.extract_questions_from_url(
-								new_url, log, visited_url))
+								new_url, log, visited_url, visited_content))
 
 			elif (link[0] == '/' and len(link) > 1):
 				if folder_url.endswith('/'):
@@ -214,16 +301,14 @@ class QuestionParser:
 
 				new_url = folder_url + link
 
-				if new_url in visited_url:
+				if QuestionParser.__canonical_url(new_url) in visited_url:
 					continue
-				else:
-					visited_url.add(new_url)
 
 				preguntas += QuestionParser.extract_questions_from_url(
-								new_url, log, visited_url)
+								new_url, log, visited_url, visited_content)
 
-			elif (re.match('^[a-zA-Z]+:', link) and
-											not re.match('^https?:', link)):
+			elif (QuestionParser.__PATRON_PROTOCOLO.match(link) and
+									not QuestionParser.__PATRON_HTTP.match(link)):
 				#	El enlace emplea otro protocolo diferente a http
 				#	o https como ftp, mailto, etc
 				continue
@@ -234,12 +319,17 @@ class QuestionParser:
 				else:
 					new_url = folder_url + link
 
-				if new_url in visited_url:
+				if QuestionParser.__canonical_url(new_url) in visited_url:
 					continue
-				else:
-					visited_url.add(new_url)
 
 				preguntas += QuestionParser.extract_questions_from_url(
-							new_url, log, visited_url)
+							new_url, log, visited_url, visited_content)
+
+		if inicial and log is not None:
+			descargas = sum(visited_content.values())
+			log.info('Finalizada extracción de "%s": %d páginas descargadas, '\
+						'%d duplicadas (ratio de duplicados: %.2f)' % (url,
+						descargas, descargas - len(visited_content),
+						1 - len(visited_content)/descargas))
 
 		return preguntas
@@ -11,7 +11,7 @@ import json
 import re
 from cprofessorbot.nlu import processRequest, QuestionParser
 from cprofessorbot.botServerDAO import BotServerDAO
-import logging
+from cprofessorbot.utils import Bitacora
 
 class QuestionManager:
 
@@ -35,26 +35,20 @@ class QuestionManager:
 		self.__base_directory = base_directory	#	Directorio base del servidor
 
 		#	Configurar el logging del sistema
-		self.__log = logging.getLogger('cprofessorbot_log')
+		self.__log = Bitacora()
 
-	def addQuestion(self, quest: dict):
-
-		"""Permite añadir un nuevo Concepto Teórico a la base de datos
+	def __prepare_question(self, quest: dict):
 
-		Parámetros:
-		-----------
-
-		quest: dict
-			Diccionario que contiene las siguientes claves:
-			pregunta y respuesta
+		"""Aplica todo el preprocesamiento requerido por un Concepto Teórico
+		antes de almacenarlo en la base de datos: obtiene el resumen y la
+		categoría semántica de cada pregunta y adapta el texto de las
+		respuestas
 
-			El valor correspondiente a dichas claves es un str o list str
-			con las preguntas y respuestas
+		Devuelve:
+			tuple con la lista de tuplas (pregunta, resumen, tipo) y la lista
+			de textos de respuesta
 		"""
 
-		self.__log.debug('Iniciada la función "addQuestion" de'\
-														' "QuestionManager"')
-
 		#   Comprobar que todos los campos existen
 		if ('pregunta' not in quest or
 								not isinstance(quest['pregunta'], (str, list))):
@@ -73,9 +67,8 @@ class QuestionManager:
 			#	Introducir en una lista
 			quest['respuesta'] = [quest['respuesta']]
 
-
-		#	Introducir cada pregunta en la base de información
-		id_concepto = None
+		preguntas = []
+		respuestas = []
 
 		for p in quest['pregunta']:
 			#	Se obtiene el resumen de la pregunta y la categoría semántica
@@ -85,23 +78,8 @@ class QuestionManager:
 			#	Se toma la categoría semántica principal
 			tipo = tipo[0] if isinstance(tipo, list) else tipo
 
-			#	Si se introdujo una pregunta similar, se salta
-			if self.__bd_interface.existsConcepto(res_preg=resumen_concepto,
-													tipo=tipo):
-				continue
-
-			#	Añadir el concepto procesado a la base de datos
-			id_concepto = self.__bd_interface.addConcepto(concepto=p,
-											resumen_concepto=resumen_concepto,
-											tipo=tipo,
-											id_concepto=id_concepto)
-
-		if id_concepto is None:
-			self.__log.debug('Finalizada la función "addQuestion" de'\
-														' "QuestionManager"')
-			return
+			preguntas.append((p, resumen_concepto, tipo))
 
-		#	Añadir y/o descargar los contenidos que constituyen la respuesta
 		for c in quest['respuesta']:
 
 			#	Comprobar que el dato es válido
@@ -116,11 +94,62 @@ class QuestionManager:
 			c = re.sub('(?<!<b)(?<!<\/b)(?<!<i)(?<!<\/i)(?<!<a)(?<!<\/a)(?<!<code)(?<!<\/code)(?<!<pre)(?<!<\/pre)>', r'&gt;', c)
 			c = re.sub('&(?!(lt;)|(gt;)|(quot;))', r'&amp;', c)
 
+			respuestas.append(c)
+
+		return preguntas, respuestas
+
+	def __store_question(self, preguntas: list, respuestas: list):
+
+		"""Almacena en la base de datos un Concepto Teórico ya preprocesado
+		por la función __prepare_question
+		"""
+
+		#	Introducir cada pregunta en la base de información
+		id_concepto = None
+
+		for p, resumen_concepto, tipo in preguntas:
+
+			#	Si se introdujo una pregunta similar, se salta
+			if self.__bd_interface.existsConcepto(res_preg=resumen_concepto,
+													tipo=tipo):
+				continue
+
+			#	Añadir el concepto procesado a la base de datos
+			id_concepto = self.__bd_interface.addConcepto(concepto=p,
+											resumen_concepto=resumen_concepto,
+											tipo=tipo,
+											id_concepto=id_concepto)
+
+		if id_concepto is None:
+			return
+
+		#	Añadir los contenidos que constituyen la respuesta
+		for c in respuestas:
 			self.__bd_interface.addDatoTexto(
 								id_concepto=id_concepto,
 								fecha_creacion=datetime.datetime.now(),
 								texto=c)
 
+	def addQuestion(self, quest: dict):
+
+		"""Permite añadir un nuevo Concepto Teórico a la base de datos
+
+		Parámetros:
+		-----------
+
+		quest: dict
+			Diccionario que contiene las siguientes claves:
+			pregunta y respuesta
+
+			El valor correspondiente a dichas claves es un str o list str
+			con las preguntas y respuestas
+		"""
+
+		self.__log.debug('Iniciada la función "addQuestion" de'\
+														' "QuestionManager"')
+
+		self.__store_question(*self.__prepare_question(quest))
+
 		self.__log.debug('Finalizada la función "addQuestion" de'\
 														' "QuestionManager"')
 
@@ -178,21 +207,50 @@ class QuestionManager:
 		self.__log.debug('Finalizada la función "removeAllConcepts" de'\
 														' "QuestionManager"')
 
-	def load_from_file(self, filename: str):
-
-		"""Permite cargar los Conceptos Teóricos a partir de un fichero JSON
+	def replaceAllConcepts(self, conceptos: list):
 
-		filename: str
-			Ruta relativa o absoluta al fichero JSON a cargar
+		"""Permite reemplazar todos los Conceptos Teóricos de la base de datos
+		por los conceptos indicados. Los conceptos se preprocesan antes de
+		modificar la base de datos y se reemplazan en una única transacción,
+		de modo que las consultas recibidas durante el reemplazo se responden
+		con los conceptos anteriores, sin esperar, y nunca con un conjunto de
+		Conceptos Teóricos incompleto
 
-			El formato del fichero JSON debe de estar formado por un array
-			de objetos JSON los cuales presenten el formato del atributo "quest"
-			de la función addQuestion
+		Parámetros:
+		-----------
+		conceptos: list de dict
+			Conceptos Teóricos con el formato del atributo "quest" de la
+			función addQuestion
 		"""
 
-		self.__log.debug('Iniciada la función "load_from_file" de'\
+		self.__log.debug('Iniciada la función "replaceAllConcepts" de'\
+														' "QuestionManager"')
+
+		preparados = [self.__prepare_question(c) for c in conceptos]
+
+		archivos = self.__bd_interface.replaceAllConceptos(preparados)
+
+		#	Eliminar los archivos multimedia de los conceptos reemplazados
+		if archivos is not None:
+
+			for a in archivos:
+				os.remove(a)
+
+		self.__log.debug('Finalizada la función "replaceAllConcepts" de'\
 														' "QuestionManager"')
 
+	def read_from_file(self, filename: str):
+
+		"""Permite leer los Conceptos Teóricos de un fichero JSON sin
+		almacenarlos en la base de datos
+
+		filename: str
+			Ruta relativa o absoluta al fichero JSON a leer
+
+		Devuelve:
+			list de dict con el formato del atributo "quest" de la función
+			addQuestion
+		"""
 
 		#	Cargar cada uno de los conceptos almacenados en el fichero JSON
 		try:
@@ -204,6 +262,43 @@ class QuestionManager:
 		conceptos = json.load(f)
 		f.close()
 
+		return conceptos
+
+	def read_from_url(self, url: str):
+
+		"""Permite extraer los Conceptos Teóricos del contenido de una url
+		sin almacenarlos en la base de datos
+
+		Parámetros:
+		-----------
+		url: str
+			Dirección url del sitio web del que se desea extraer los Conceptos
+			Teóricos
+
+		Devuelve:
+			list de dict con el formato del atributo "quest" de la función
+			addQuestion
+		"""
+
+		return QuestionParser.extract_questions_from_url(url, self.__log)
+
+	def load_from_file(self, filename: str):
+
+		"""Permite cargar los Conceptos Teóricos a partir de un fichero JSON
+
+		filename: str
+			Ruta relativa o absoluta al fichero JSON a cargar
+
+			El formato del fichero JSON debe de estar formado por un array
+			de objetos JSON los cuales presenten el formato del atributo "quest"
+			de la función addQuestion
+		"""
+
+		self.__log.debug('Iniciada la función "load_from_file" de'\
+														' "QuestionManager"')
+
+		conceptos = self.read_from_file(filename)
+
 		for concepto in conceptos:
 			self.addQuestion(concepto)
 
@@ -225,7 +320,7 @@ class QuestionManager:
 														' "QuestionManager"')
 
 
-		conceptos = QuestionParser.extract_questions_from_url(url, self.__log)
+		conceptos = self.read_from_url(url)
 
 		for concepto in conceptos:
 			self.addQuestion(concepto)
@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+################################################################################
+# Descripción: Módulo que contiene la definición e implementación de los
+#				registros devueltos por BotServerDAO
+# Autor: Nicolás Cubero Torres
+################################################################################
+
+#	Módulos importados
+import telegram
+
+class Registro:
+
+	"""
+	Clase base de los registros ligeros devueltos por BotServerDAO. Cada
+	registro almacena sus valores en atributos declarados en __slots__, sin
+	diccionario propio, y ofrece la misma interfaz de acceso que un
+	diccionario sobre los campos declarados en CAMPOS. Los campos que no han
+	sido asignados se consideran ausentes
+
+	Salvo que la clase defina su propio constructor, los valores pasados al
+	constructor de forma posicional se asignan en el orden de __slots__
+	"""
+
+	__slots__ = ()
+
+	#	Campos accesibles como claves del registro
+	CAMPOS = ()
+
+	def __init__(self, *valores, **campos):
+
+		for campo, valor in zip(self.__slots__, valores):
+			setattr(self, campo, valor)
+
+		for campo, valor in campos.items():
+			setattr(self, campo, valor)
+
+	def __getitem__(self, campo):
+
+		if campo in self.CAMPOS:
+			try:
+				return getattr(self, campo)
+			except AttributeError:
+				pass
+
+		raise KeyError(campo)
+
+	def __setitem__(self, campo, valor):
+
+		if campo not in self.CAMPOS:
+			raise KeyError('"%s" no es un campo de %s' % (campo,
+														type(self).__name__))
+
+		setattr(self, campo, valor)
+
+	def __delitem__(self, campo):
+
+		if campo not in self:
+			raise KeyError(campo)
+
+		delattr(self, campo)
+
+	def __contains__(self, campo):
+
+		return campo in self.CAMPOS and hasattr(self, campo)
+
+	def __iter__(self):
+
+		return iter(self.keys())
+
+	def __len__(self):
+
+		return len(self.keys())
+
+	def __eq__(self, otro):
+
+		if not hasattr(otro, 'keys'):
+			return NotImplemented
+
+		return dict(self.items()) == {campo: otro[campo] for campo in otro.keys()}
+
+	def __repr__(self):
+
+		return '%s(%s)' % (type(self).__name__, ', '.join('%s=%r' % item
+														for item in self.items()))
+
+	def keys(self):
+
+		return [campo for campo in self.CAMPOS if hasattr(self, campo)]
+
+	def values(self):
+
+		return [self[campo] for campo in self.keys()]
+
+	def items(self):
+
+		return [(campo, self[campo]) for campo in self.keys()]
+
+	def get(self, campo, defecto=None):
+
+		try:
+			return self[campo]
+		except KeyError:
+			return defecto
+
+	def pop(self, campo, *defecto):
+
+		try:
+			valor = self[campo]
+		except KeyError:
+			if defecto:
+				return defecto[0]
+			raise
+
+		delattr(self, campo)
+		return valor
+
+	def update(self, otro=(), **campos):
+
+		if hasattr(otro, 'keys'):
+			otro = [(campo, otro[campo]) for campo in otro.keys()]
+
+		for campo, valor in otro:
+			self[campo] = valor
+
+		for campo, valor in campos.items():
+			self[campo] = valor
+
+	def copy(self):
+
+		"""Devuelve una copia superficial del registro"""
+
+		copia = type(self).__new__(type(self))
+
+		for campo in self.__slots__:
+			if hasattr(self, campo):
+				setattr(copia, campo, getattr(self, campo))
+
+		return copia
+
+class RegistroUsuario(Registro):
+
+	"""
+	Registro de un Usuario y, opcionalmente, de su estado en un Foro. El
+	campo "telegram_user" no se almacena: el objeto telegram.User se
+	construye a partir de los datos del usuario cada vez que es consultado,
+	y al asignarlo se toman sus datos
+
+	Atributos:
+	----------
+	id, nombre, apellidos, username: Datos del usuario en Telegram
+
+	id_chat, fecha_registro, tipo, valido: Datos del registro del usuario
+
+	ban, n_avisos: Estado del usuario en el foro, si procede
+
+	ultima_actualizacion: Fecha de la última actualización de los datos
+		de contexto del usuario, asignada por BotServer
+	"""
+
+	__slots__ = ('id', 'nombre', 'apellidos', 'username', 'id_chat',
+					'fecha_registro', 'tipo', 'valido', 'ban', 'n_avisos',
+					'ultima_actualizacion')
+
+	CAMPOS = ('telegram_user', 'id_chat', 'fecha_registro', 'tipo', 'valido',
+					'ban', 'n_avisos', 'ultima_actualizacion')
+
+	def __init__(self, id, nombre, apellidos, username, id_chat,
+							fecha_registro, tipo, valido, *estado_foro):
+
+		#	Asignación explícita de los campos, ya que los usuarios se
+		#	construyen por cada fila de las consultas de usuarios
+		self.id = id
+		self.nombre = nombre
+		self.apellidos = apellidos
+		self.username = username
+		self.id_chat = id_chat
+		self.fecha_registro = fecha_registro
+		self.tipo = tipo
+		self.valido = valido
+
+		if estado_foro:
+			self.ban, self.n_avisos = estado_foro
+
+	@property
+	def telegram_user(self):
+
+		return telegram.User(id=self.id, first_name=self.nombre, is_bot=False,
+								last_name=self.apellidos, username=self.username)
+
+	@telegram_user.setter
+	def telegram_user(self, usuario):
+
+		self.id = usuario.id
+		self.nombre = usuario.first_name
+		self.apellidos = usuario.last_name
+		self.username = usuario.username
+
+	@telegram_user.deleter
+	def telegram_user(self):
+
+		del self.id
+
+class RegistroEstadoForo(Registro):
+
+	"""
+	Registro del estado de un Usuario en un Foro
+
+	Atributos:
+	----------
+	ban: bool
+		Indica si el usuario está baneado o no
+
+	n_avisos: int
+		Número de avisos acumulados por el usuario
+	"""
+
+	__slots__ = ('ban', 'n_avisos')
+
+	CAMPOS = __slots__
+
+class RegistroMensaje(Registro):
+
+	"""
+	Registro de un mensaje o evento de un Foro. Los mensajes presentan los
+	campos "tipo_usuario", "academico" y "datos" y los eventos el campo
+	"evento"
+	"""
+
+	__slots__ = ('nombre_usuario', 'tipo_usuario', 'fecha', 'academico',
+					'evento', 'datos')
+
+	CAMPOS = __slots__
+
+	def __init__(self, nombre_usuario, fecha, tipo_usuario=None,
+									academico=None, datos=None, evento=None):
+
+		self.nombre_usuario = nombre_usuario
+		self.fecha = fecha
+
+		if evento:
+			self.evento = evento
+		else:
+			self.tipo_usuario = tipo_usuario
+			self.academico = academico
+			self.datos = datos
+
+class RegistroDato(Registro):
+
+	"""
+	Registro de un Dato de un mensaje. Sólo presenta los campos que
+	corresponden a su "tipo_dato": "contenido" en los textos, "file_id" y
+	"mime_type" en los archivos, los campos "sticker_*" y "tipo_sticker" en
+	los stickers y el resto, que se pasan por nombre, en los contactos y las
+	localizaciones
+	"""
+
+	__slots__ = ('tipo_dato', 'contenido', 'file_id', 'mime_type',
+					'sticker_emoji', 'sticker_conjunto', 'tipo_sticker',
+					'telefono', 'nombre', 'apellidos', 'id_usuario', 'vcard',
+					'longitud', 'latitud', 'titulo', 'direccion',
+					'id_cuadrante', 'tipo_cuadrante')
+
+	CAMPOS = __slots__
+
+	def __init__(self, tipo_dato, *archivo, **campos):
+
+		self.tipo_dato = tipo_dato
+
+		if archivo:
+			self.contenido = archivo[0]
+
+			if len(archivo) > 1:
+				self.file_id, self.mime_type = archivo[1:3]
+
+				if len(archivo) > 3:
+					(self.sticker_emoji, self.sticker_conjunto,
+										self.tipo_sticker) = archivo[3:6]
+
+		for campo, valor in campos.items():
+			setattr(self, campo, valor)
+
+class RegistroCoincidencia(Registro):
+
+	"""
+	Registro de un mensaje de un Foro cuyo texto coincide con una búsqueda
+
+	Atributos:
+	----------
+	id_mensaje: int
+		Identificador del mensaje
+
+	id_chat, nombre_foro: Identificador y nombre del Foro
+
+	nombre_usuario, tipo_usuario: Nombre y tipo del usuario que envió el
+		mensaje. "Bot" y None para los mensajes enviados por el sistema
+
+	fecha: datetime.datetime
+		Fecha del mensaje
+
+	texto: str
+		Texto del mensaje que coincide con la búsqueda
+	"""
+
+	__slots__ = ('id_mensaje', 'id_chat', 'nombre_foro', 'nombre_usuario',
+					'tipo_usuario', 'fecha', 'texto')
+
+	CAMPOS = __slots__
@@ -5,5 +5,7 @@ from cprofessorbot.utils.enteringGroupHandler import EnteringGroupHandler
 from cprofessorbot.utils.lefteringGroupHandler import LefteringGroupHandler
 from cprofessorbot.utils.memberEnteringGroupHandler import MemberEnteringGroupHandler
 from cprofessorbot.utils.memberLefteringGroupHandler import MemberLefteringGroupHandler
+from cprofessorbot.utils.identidadBot import IdentidadBot
 from cprofessorbot.utils import emojis
-from cprofessorbot.utils.utils import copyFile, percentile, removeDirectory
+from cprofessorbot.utils.utils import copyFile, percentile, countingPercentile, removeDirectory
+from cprofessorbot.utils.bitacora import Bitacora, Diferido, FormateadorTexto, FormateadorJSON
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+################################################################################
+# Descripción: Módulo que contiene la definición e implementación de la
+#				fachada del log del sistema, con evaluación diferida de los
+#				argumentos y campos estructurados, y de sus formateadores
+# Autor: Nicolás Cubero Torres
+################################################################################
+
+#	Módulos importados
+import logging
+import json
+import datetime
+
+class Bitacora(logging.LoggerAdapter):
+
+	"""
+	Fachada del log del sistema. Los mensajes sólo se construyen si su nivel
+	está activo: los argumentos se pasan por separado del mensaje, al estilo
+	de logging, y sólo se convierten a texto al escribir la entrada. Los
+	argumentos por nombre distintos de los de logging se registran como
+	campos estructurados de la entrada, que los formateadores escriben como
+	pares clave=valor o como campos JSON
+
+	Ejemplo:
+		log.debug('Mensaje recibido en el foro %s', id_chat, id_usuario=5)
+	"""
+
+	#	Argumentos por nombre propios de las funciones de logging
+	__ARGUMENTOS_LOGGING = ('exc_info', 'stack_info', 'stacklevel', 'extra')
+
+	def __init__(self, nombre: str='cprofessorbot_log'):
+
+		"""
+		Parámetros:
+		-----------
+		nombre: str
+			Nombre del logger al que se envían las entradas. Por defecto
+			"cprofessorbot_log"
+		"""
+
+		super().__init__(logging.getLogger(nombre), {})
+
+	def process(self, msg, kwargs):
+
+		#	Sólo es llamada por logging si el nivel de la entrada está activo
+		campos = {clave: kwargs.pop(clave) for clave in list(kwargs)
+							if clave not in Bitacora.__ARGUMENTOS_LOGGING}
+
+		if campos:
+			kwargs['extra'] = dict(kwargs.get('extra') or {}, campos=campos)
+
+		return msg, kwargs
+
+class Diferido:
+
+	"""
+	Valor de un argumento del log que sólo se calcula, llamando a la función
+	indicada, si la entrada llega a escribirse
+
+	Ejemplo:
+		log.debug('Estadísticas: %s', Diferido(dao.getEstadisticasCache))
+	"""
+
+	__slots__ = ('__funcion',)
+
+	def __init__(self, funcion):
+
+		self.__funcion = funcion
+
+	def __str__(self):
+
+		return str(self.__funcion())
+
+	def __repr__(self):
+
+		return repr(self.__funcion())
+
+class FormateadorTexto(logging.Formatter):
+
+	"""
+	Formateador de las entradas del log en texto que añade al final de cada
+	entrada sus campos estructurados como pares clave=valor
+	"""
+
+	def formatMessage(self, record):
+
+		#	Los campos se añaden al mensaje, antes de la traza de la
+		#	excepción si la hubiera
+		texto = super().formatMessage(record)
+		campos = getattr(record, 'campos', None)
+
+		if campos:
+			texto += ' | ' + ' '.join('%s=%s' % campo
+												for campo in campos.items())
+
+		return texto
+
+class FormateadorJSON(logging.Formatter):
+
+	"""
+	Formateador de las entradas del log como objetos JSON de una línea con
+	la fecha ("fecha"), el nivel ("nivel"), el mensaje ("mensaje") y, si los
+	hay, los campos estructurados de la entrada ("campos") y la traza de la
+	excepción ("excepcion"). Los valores no serializables se escriben como
+	texto
+	"""
+
+	def format(self, record):
+
+		entrada = {
+					'fecha': datetime.datetime.fromtimestamp(
+							record.created).isoformat(timespec='milliseconds'),
+					'nivel': record.levelname,
+					'mensaje': record.getMessage()
+				}
+
+		campos = getattr(record, 'campos', None)
+
+		if campos:
+			entrada['campos'] = campos
+
+		if record.exc_info:
+			entrada['excepcion'] = self.formatException(record.exc_info)
+
+		return json.dumps(entrada, ensure_ascii=False, default=str)
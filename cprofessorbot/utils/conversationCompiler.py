@@ -351,6 +351,10 @@ class ConversationCompiler:
 
 		self.__active = True				#	La recopilación está activa o no
 
+		#	Copias ya realizadas de los archivos multimedia: par
+		#	(ruta original, subdirectorio) - ruta de la copia
+		self.__archivos_copiados = {}
+
 		#	Directorio auxiliar en el que se realiza la recopilación
 		#	NOTA: Al tratarse de archivos destinados a enviarse desde el disco
 		#	por medio del protocolo HTTP, sería conveniente codificar los
@@ -383,6 +387,18 @@ class ConversationCompiler:
 			if not os.path.isdir(self.__comp_dir+subdir+'/'):
 				os.mkdir(self.__comp_dir+subdir+'/')
 
+	def __copy_file(self, ruta_archivo: str, subdirectorio: str):
+
+		#	Los archivos multimedia compartidos por varios mensajes se copian
+		#	una única vez en la recopilación
+		clave = (ruta_archivo, subdirectorio)
+
+		if clave not in self.__archivos_copiados:
+			self.__archivos_copiados[clave] = copyFile(ruta_archivo,
+												self.__comp_dir+subdirectorio)
+
+		return self.__archivos_copiados[clave]
+
 	def __write_information_box(self):
 
 		#	Escribir el cuadro
@@ -519,9 +535,11 @@ class ConversationCompiler:
 
 		Parámetros:
 		-----------
-		mensaje: OrderedDict
+		mensaje: OrderedDict o iterable
 			Diccionario ordenado que consta del par:
 			id_mensaje (int) - datos_mensaje (dict)
+			o iterable (por ejemplo, un generador) de tuplas
+			(id_mensaje, datos_mensaje)
 
 			Por su parte, datos_mensaje se halla compuesto por los siguientes
 			parámetros:
@@ -649,76 +667,83 @@ class ConversationCompiler:
 		if not mensajes:
 			return
 
+		#	Se admite tanto el diccionario como cualquier iterable de pares
+		#	(id_mensaje, datos_mensaje), de forma que los mensajes pueden
+		#	añadirse a medida que se leen de la base de datos
+		if isinstance(mensajes, dict):
+			mensajes = mensajes.items()
+
 		#	Se añade cada mensaje a la web
-		for m in mensajes:
+		for m, mensaje in mensajes:
 
 			#	Añadir cuadro de eventos
-			if 'evento' in mensajes[m]:
+			if 'evento' in mensaje:
 				self.__html_file.write('\t\t<div class="parent_evento_box">\n')
 				self.__html_file.write(
 					('\t\t\n<div class="evento_box"><b>%s</b></div>\n' %
-														mensajes[m]['evento']))
+														mensaje['evento']))
 				self.__html_file.write('\t\t</div>\n')
 
 				self.__plain_text_file.write('%s - %s\n' % (
-							mensajes[m]['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
-							mensajes[m]['evento']))
+							mensaje['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
+							mensaje['evento']))
 
 				#	Añadir cierre
 				self.__html_file.write('\t\t</div>\n<div class="space"></div>\n')
 				continue
 
 
-			for c in mensajes[m]['datos']:
+			for c in mensaje['datos']:
 
 				#	Añadir cualquier otra cosa
 				#	Añadir div contenedor adecuado
-				if mensajes[m]['tipo_usuario'] == 'docente':
+				if mensaje['tipo_usuario'] == 'docente':
 					self.__html_file.write(
 									'\t\t<div class="message_box_professor">\n')
-				elif not mensajes[m]['tipo_usuario']:
+				elif not mensaje['tipo_usuario']:
 					self.__html_file.write(
 							'\t\t<div class="message_box_bot" align="right">\n')
-				elif mensajes[m]['academico']:
+				elif mensaje['academico']:
 					self.__html_file.write('\t\t<div class="message_box">\n')
 				else:
 					self.__html_file.write('\t\t<div class="message_box_ban">\n')
 
 				#	Añadir usuario emisor
 				self.__html_file.write(('\t\t\t<div class="name">%s</div>\n' %
-												mensajes[m]['nombre_usuario']))
+												mensaje['nombre_usuario']))
 
 				#	Añadir contenido
-				if mensajes[m]['datos'][c]['tipo_dato'] == 'texto':
+				if mensaje['datos'][c]['tipo_dato'] == 'texto':
 					self.__html_file.write(
 							('\t\t\t<div class="content">%s</div>\n' %
-										mensajes[m]['datos'][c]['contenido']))
+										mensaje['datos'][c]['contenido']))
 
 					#	Añadir dato al fichero texto plano
 					self.__plain_text_file.write('%s - %s %s - %s%s\n' % (
-			mensajes[m]['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
-			mensajes[m]['nombre_usuario'],
-			'[DOCENTE]' if mensajes[m]['tipo_usuario'] == 'docente' else '',
-			mensajes[m]['datos'][c]['contenido'],
-			' - mensaje no permitido' if not mensajes[m]['academico'] else ''))
+			mensaje['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
+			mensaje['nombre_usuario'],
+			'[DOCENTE]' if mensaje['tipo_usuario'] == 'docente' else '',
+			mensaje['datos'][c]['contenido'],
+			' - mensaje no permitido' if not mensaje['academico'] else ''))
 
-				elif mensajes[m]['datos'][c]['tipo_dato'] == 'imagen':
+				elif mensaje['datos'][c]['tipo_dato'] == 'imagen':
 
-					if (not mensajes[m]['datos'][c]['contenido'] or
-					not os.path.isfile(mensajes[m]['datos'][c]['contenido'])):
+					if (not mensaje['datos'][c]['contenido'] or
+					not os.path.isfile(mensaje['datos'][c]['contenido'])):
 						#	Si la imagen no se encuentra almacenada no se adjunta
 						self.__html_file.write('\t\t\t<div>Imagen</div>')
 
 						#	Añadir dato al fichero texto plano
 						self.__plain_text_file.write(
 										'%s - %s - Imagen no encontrada\n' % (
-							mensajes[m]['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
-							mensajes[m]['nombre_usuario'])
+							mensaje['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
+							mensaje['nombre_usuario'])
 						)
 
 					else:
-						new_file = copyFile(mensajes[m]['datos'][c]['contenido'],
-									self.__comp_dir+'imagenes/')
+						new_file = self.__copy_file(
+										mensaje['datos'][c]['contenido'],
+										'imagenes/')
 
 						#	Establecer la ruta de forma relativa
 						new_file = './'+'/'.join( new_file.split('/')[-2:] )
@@ -726,37 +751,37 @@ class ConversationCompiler:
 						#	Añadir la imagen
 						self.__html_file.write(
 									'\t\t\t<img src="%s" alt="%s">' % (new_file,
-									'Imagen de %s' % mensajes[m]['nombre_usuario']
+									'Imagen de %s' % mensaje['nombre_usuario']
 									))
 
 						#	Añadir dato al fichero texto plano
 						self.__plain_text_file.write('%s - %s - Imagen: %s\n'% (
-							mensajes[m]['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
-							mensajes[m]['nombre_usuario'],
+							mensaje['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
+							mensaje['nombre_usuario'],
 							new_file)
 							)
 
-				elif mensajes[m]['datos'][c]['tipo_dato'] in ('video',
+				elif mensaje['datos'][c]['tipo_dato'] in ('video',
 																'nota_video'):
 
-					if (not mensajes[m]['datos'][c]['contenido'] or
-					not os.path.isfile(mensajes[m]['datos'][c]['contenido'])):
+					if (not mensaje['datos'][c]['contenido'] or
+					not os.path.isfile(mensaje['datos'][c]['contenido'])):
 						#	Si el vídeo no se encuentra almacenada no se adjunta
 						self.__html_file.write('\t\t\t<div>Video</div>')
 
 						#	Añadir dato al fichero texto plano
 						self.__plain_text_file.write(
 							'%s - %s - Vídeo no encontrado\n' % (
-							mensajes[m]['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
-							mensajes[m]['nombre_usuario'])
+							mensaje['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
+							mensaje['nombre_usuario'])
 							)
 
 					else:
-						new_file = copyFile(
-										mensajes[m]['datos'][c]['contenido'],
-										self.__comp_dir+'videos/')
+						new_file = self.__copy_file(
+										mensaje['datos'][c]['contenido'],
+										'videos/')
 
-						mimetype = mensajes[m]['datos'][c]['mime_type']
+						mimetype = mensaje['datos'][c]['mime_type']
 
 						#	Establecer la ruta de forma relativa
 						new_file = './'+'/'.join( new_file.split('/')[-2:] )
@@ -768,31 +793,32 @@ class ConversationCompiler:
 						#	Añadir dato al fichero texto plano
 						self.__plain_text_file.write(
 							'%s - %s - Vídeo: %s\n' % (
-							mensajes[m]['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
-							mensajes[m]['nombre_usuario'],
+							mensaje['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
+							mensaje['nombre_usuario'],
 							new_file)
 						)
 
-				elif mensajes[m]['datos'][c]['tipo_dato'] in ('audio',
+				elif mensaje['datos'][c]['tipo_dato'] in ('audio',
 																'nota_voz'):
 
-					if (not mensajes[m]['datos'][c]['contenido'] or
-					not os.path.isfile(mensajes[m]['datos'][c]['contenido'])):
+					if (not mensaje['datos'][c]['contenido'] or
+					not os.path.isfile(mensaje['datos'][c]['contenido'])):
 						#	Si el audio no se encuentra almacenada no se adjunta
 						self.__html_file.write('\t\t\t<div>Audio</div>')
 
 						#	Añadir dato al fichero texto plano
 						self.__plain_text_file.write(
 							'%s - %s - Audio no encontrado\n' % (
-							mensajes[m]['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
-							mensajes[m]['nombre_usuario'])
+							mensaje['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
+							mensaje['nombre_usuario'])
 						)
 
 					else:
-						new_file = copyFile(mensajes[m]['datos'][c]['contenido'],
-									self.__comp_dir+'audios/')
+						new_file = self.__copy_file(
+										mensaje['datos'][c]['contenido'],
+										'audios/')
 
-						mimetype = mensajes[m]['datos'][c]['mime_type']
+						mimetype = mensaje['datos'][c]['mime_type']
 
 						#	Establecer la ruta de forma relativa
 						new_file = './'+'/'.join( new_file.split('/')[-2:] )
@@ -805,34 +831,34 @@ class ConversationCompiler:
 						#	Añadir dato al fichero texto plano
 						self.__plain_text_file.write(
 							'%s - %s - Audio: %s\n' % (
-							mensajes[m]['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
-							mensajes[m]['nombre_usuario'],
+							mensaje['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
+							mensaje['nombre_usuario'],
 							new_file)
 						)
 
-				elif mensajes[m]['datos'][c]['tipo_dato'] == 'contacto':
+				elif mensaje['datos'][c]['tipo_dato'] == 'contacto':
 					#	Añadir el contacto a html
 					self.__html_file.write('\t\t\t<div class="contacto_box">\n')
 					self.__html_file.write('\t\t\t\t<div><b>Contacto</b></div>\n')
 					self.__html_file.write('\t\t\t\t<div><ul style="disc">\n')
 					self.__html_file.write(
 						('\t\t\t\t\t<li><b>Teléfono:</b>%s</li>\n' %
-										mensajes[m]['datos'][c]['telefono']))
+										mensaje['datos'][c]['telefono']))
 					self.__html_file.write(
 						('\t\t\t\t\t<li><b>Nombre:</b>%s</li>\n' %
-											mensajes[m]['datos'][c]['nombre']))
+											mensaje['datos'][c]['nombre']))
 
-					if ('apellidos' in mensajes[m]['datos'][c] and
-										mensajes[m]['datos'][c]['apellidos']):
+					if ('apellidos' in mensaje['datos'][c] and
+										mensaje['datos'][c]['apellidos']):
 						self.__html_file.write(
 							('\t\t\t\t\t<li><b>Apellidos:</b>%s</li>\n' %
-									mensajes[m]['datos'][c]['apellidos']))
+									mensaje['datos'][c]['apellidos']))
 
-					if ('vcard' in mensajes[m]['datos'][c] and
-										mensajes[m]['datos'][c]['vcard']):
+					if ('vcard' in mensaje['datos'][c] and
+										mensaje['datos'][c]['vcard']):
 						self.__html_file.write(
 						('\t\t\t\t\t<li><b>Información de VCard:</b>%s</li>\n' %
-						mensajes[m]['datos'][c]['vcard']))
+						mensaje['datos'][c]['vcard']))
 
 					self.__html_file.write('\t\t\t\t</ul></div>\n')
 					self.__html_file.write('\t\t\t</div>\n')
@@ -841,22 +867,22 @@ class ConversationCompiler:
 
 					#	Obtener copia del diccionario donde no aparezca el
 					#	campo tipo_dato para incluir en el fichero plano
-					dict_aux = dict(mensajes[m]['datos'][c])
+					dict_aux = dict(mensaje['datos'][c])
 					dict_aux.pop('tipo_dato')
 
 					self.__plain_text_file.write(
 							'%s - %s - Contacto: %s\n' % (
-							mensajes[m]['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
-							mensajes[m]['nombre_usuario'],
+							mensaje['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
+							mensaje['nombre_usuario'],
 							dict_aux)
 							)
 
-				elif mensajes[m]['datos'][c]['tipo_dato'] == 'localizacion':
+				elif mensaje['datos'][c]['tipo_dato'] == 'localizacion':
 
 					#	Añadir el contacto a html
 					self.__html_file.write('\t\t\t<div class="contacto_box">\n')
-					if ('titulo' in mensajes[m]['datos'][c] and
-											mensajes[m]['datos'][c]['titulo']):
+					if ('titulo' in mensaje['datos'][c] and
+											mensaje['datos'][c]['titulo']):
 						self.__html_file.write(
 										'\t\t\t\t<div><b>Avenida</b></div>\n')
 					else:
@@ -866,19 +892,19 @@ class ConversationCompiler:
 					self.__html_file.write('\t\t\t\t<div><ul style="disc">\n')
 					self.__html_file.write(
 									('\t\t\t\t\t<li><b>Longitud:</b>%f</li>\n' %
-										mensajes[m]['datos'][c]['longitud']))
+										mensaje['datos'][c]['longitud']))
 					self.__html_file.write(
 									('\t\t\t\t\t<li><b>Latitud:</b>%s</li>\n' %
-									mensajes[m]['datos'][c]['latitud']))
+									mensaje['datos'][c]['latitud']))
 
-					if ('titulo' in mensajes[m]['datos'][c] and
-											mensajes[m]['datos'][c]['titulo']):
+					if ('titulo' in mensaje['datos'][c] and
+											mensaje['datos'][c]['titulo']):
 						self.__html_file.write(
 						('\t\t\t\t\t<li><b>Titulo de la avenida:</b>%s</li>\n' %
-											mensajes[m]['datos'][c]['titulo']))
+											mensaje['datos'][c]['titulo']))
 						self.__html_file.write(
 							('\t\t\t\t\t<li><b>Tipo de Avenida:</b>%s</li>\n' %
-							mensajes[m]['datos'][c]['tipo_cuadrante']))
+							mensaje['datos'][c]['tipo_cuadrante']))
 					self.__html_file.write('\t\t\t\t</ul></div>\n')
 					self.__html_file.write('\t\t\t</div>\n')
 
@@ -886,32 +912,33 @@ class ConversationCompiler:
 
 					#	Obtener copia del diccionario donde no aparezca el
 					#	campo tipo_dato para incluir en el fichero plano
-					dict_aux = dict(mensajes[m]['datos'][c])
+					dict_aux = dict(mensaje['datos'][c])
 					dict_aux.pop('tipo_dato')
 
 					self.__plain_text_file.write(
 							'%s - %s - Localización: %s\n' % (
-							mensajes[m]['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
-							mensajes[m]['nombre_usuario'],
+							mensaje['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
+							mensaje['nombre_usuario'],
 							dict_aux)
 							)
 
-				elif mensajes[m]['datos'][c]['tipo_dato'] == 'sticker':
+				elif mensaje['datos'][c]['tipo_dato'] == 'sticker':
 
 					#	Añadir el sticker
-					if (not mensajes[m]['datos'][c]['contenido'] or
-					not os.path.isfile(mensajes[m]['datos'][c]['contenido'])):
+					if (not mensaje['datos'][c]['contenido'] or
+					not os.path.isfile(mensaje['datos'][c]['contenido'])):
 						self.__html_file.write('\t\t\tSticker no encontrado\n')
 
 						#	Añadir dato al fichero texto plano
 						self.__plain_text_file.write(
 							'%s - %s - Sticker no encontrado\n' % (
-							mensajes[m]['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
-							mensajes[m]['nombre_usuario'])
+							mensaje['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
+							mensaje['nombre_usuario'])
 							)
 					else:
-						new_file = copyFile(mensajes[m]['datos'][c]['contenido'],
-									self.__comp_dir+'stickers/')
+						new_file = self.__copy_file(
+										mensaje['datos'][c]['contenido'],
+										'stickers/')
 
 						#	Establecer la ruta de forma relativa
 						new_file = './'+'/'.join( new_file.split('/')[-2:] )
@@ -923,56 +950,57 @@ class ConversationCompiler:
 						#	Añadir dato al fichero texto plano
 						self.__plain_text_file.write(
 							'%s - %s - Sticker: %s\n' % (
-							mensajes[m]['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
-							mensajes[m]['nombre_usuario'],
+							mensaje['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
+							mensaje['nombre_usuario'],
 							new_file)
 						)
 
-				elif mensajes[m]['datos'][c]['tipo_dato'] == 'animacion':
+				elif mensaje['datos'][c]['tipo_dato'] == 'animacion':
 
 					#	Añadir la animación
-					if (not mensajes[m]['datos'][c]['contenido'] or
-					not os.path.isfile(mensajes[m]['datos'][c]['contenido'])):
+					if (not mensaje['datos'][c]['contenido'] or
+					not os.path.isfile(mensaje['datos'][c]['contenido'])):
 						self.__html_file.write('\t\t\tAnimación no encontrada\n')
 
 						#	Añadir dato al fichero texto plano
 						self.__plain_text_file.write(
 							'%s - %s - Animación no encontrada\n' % (
-							mensajes[m]['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
-							mensajes[m]['nombre_usuario'])
+							mensaje['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
+							mensaje['nombre_usuario'])
 						)
 					else:
-						new_file = copyFile(mensajes[m]['datos'][c]['contenido'],
-									self.__comp_dir+'animaciones/')
+						new_file = self.__copy_file(
+										mensaje['datos'][c]['contenido'],
+										'animaciones/')
 
 						#	Establecer la ruta de forma relativa
 						new_file = './'+'/'.join( new_file.split('/')[-2:] )
 
 						#	Determinar si es un gif o vídeo e insertarla
-						tipo = mensajes[m]['datos'][c]['mime_type'].split('/')[0]
+						tipo = mensaje['datos'][c]['mime_type'].split('/')[0]
 
-						mimetype = mensajes[m]['datos'][c]['mime_type']
+						mimetype = mensaje['datos'][c]['mime_type']
 
 						if tipo == 'image':
 							self.__html_file.write(
 							'\t\t\t<img src="%s" alt="%s">\n' % (
 							new_file,
-							'Animación de: %s' % mensajes[m]['nombre_usuario']))
+							'Animación de: %s' % mensaje['nombre_usuario']))
 						elif tipo == 'video':
 							self.__html_file.write('\t\t\t<video controls>\n\t\t\t\t<source src="%s" type="%s">\n\t\t\t</video>\n' % (new_file, mimetype))
 
 						#	Añadir dato al fichero texto plano
 						self.__plain_text_file.write(
 							'%s - %s - Animación: %s\n' % (
-							mensajes[m]['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
-							mensajes[m]['nombre_usuario'],
+							mensaje['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
+							mensaje['nombre_usuario'],
 							new_file)
 						)
 
 				else:
 
-					if (not mensajes[m]['datos'][c]['contenido'] or
-					not os.path.isfile(mensajes[m]['datos'][c]['contenido'])):
+					if (not mensaje['datos'][c]['contenido'] or
+					not os.path.isfile(mensaje['datos'][c]['contenido'])):
 						#	Si el documento no se encuentra almacenada
 						#	no se adjunta
 						self.__html_file.write(
@@ -981,13 +1009,14 @@ class ConversationCompiler:
 						#	Añadir dato al fichero texto plano
 						self.__plain_text_file.write(
 							'%s - %s - Documento no encontrado\n' % (
-							mensajes[m]['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
-							mensajes[m]['nombre_usuario'])
+							mensaje['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
+							mensaje['nombre_usuario'])
 						)
 
 					else:
-						new_file = copyFile(mensajes[m]['datos'][c]['contenido'],
-									self.__comp_dir+'documentos/')
+						new_file = self.__copy_file(
+										mensaje['datos'][c]['contenido'],
+										'documentos/')
 
 						#	Establecer la ruta de forma relativa
 						new_file = './'+'/'.join( new_file.split('/')[-2:] )
@@ -999,15 +1028,15 @@ class ConversationCompiler:
 						#	Añadir dato al fichero texto plano
 						self.__plain_text_file.write(
 								'%s - %s - Documento: %s\n' % (
-								mensajes[m]['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
-								mensajes[m]['nombre_usuario'],
+								mensaje['fecha'].strftime('%d/%m/%Y %H:%M:%S'),
+								mensaje['nombre_usuario'],
 								new_file)
 							)
 
 				#	Añadir fecha
 				self.__html_file.write(
 						('\t\t\t<div class="date" align="right">%s</div>' %
-							mensajes[m]['fecha'].strftime('%d/%m/%Y %H:%M')))
+							mensaje['fecha'].strftime('%d/%m/%Y %H:%M')))
 
 				#	Añadir cierre
 				self.__html_file.write('\t\t</div>\n<div class="space"></div>\n')
@@ -32,3 +32,4 @@ ENLACE = '\U0001F517'
 LLAVE_INGLESA = '\U0001F527'
 CANDADO_CERRADO = '\U0001F512'
 CANDADO_ABIERTO = '\U0001F513'
+LUPA = '\U0001F50D'
@@ -16,8 +16,9 @@ class EnteringGroupHandler(Handler):
 
 	"""
 
-	def __init__(self, callback, pass_update_queue=False, pass_job_queue=False,
-				 pass_user_data=False, pass_chat_data=False):
+	def __init__(self, callback, identidad_bot, pass_update_queue=False,
+				pass_job_queue=False, pass_user_data=False,
+				pass_chat_data=False):
 
 		#	Contructor de la clase base
 		super(EnteringGroupHandler, self).__init__(
@@ -27,6 +28,9 @@ class EnteringGroupHandler(Handler):
 			pass_user_data=pass_user_data,
 			pass_chat_data=pass_chat_data)
 
+		#	Identidad del bot, obtenida una única vez al iniciar el sistema
+		self.__identidad_bot = identidad_bot
+
 
 	def check_update(self, update):
 
@@ -48,12 +52,9 @@ class EnteringGroupHandler(Handler):
 
 			mensaje = update.message or update.edited_message
 
-			#	Se comprueba que el bot haya sido agregado a un nuevo grupo
-			bot = mensaje.bot
-
 			#	El bot ha sido agregado a un nuevo grupo
 			if (hasattr(mensaje, 'new_chat_members') and
-									bot.get_me() in mensaje.new_chat_members):
+						self.__identidad_bot.usuario in mensaje.new_chat_members):
 				return True
 
 		return False
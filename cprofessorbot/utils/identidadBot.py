@@ -0,0 +1,67 @@
+###############################################################################
+# Descripción: Clase que almacena la identidad del bot Telegram, obtenida una
+#				única vez al iniciar el sistema
+# Autor: Nicolás Cubero Torres
+###############################################################################
+
+#	Módulos importados
+import re
+
+class IdentidadBot:
+
+	"""
+	Identidad del bot Telegram gestionado por el sistema. El usuario del bot
+	se consulta a Telegram una única vez, al construir la instancia, y sus
+	datos y la expresión regular con la que los usuarios llaman al profesor
+	quedan disponibles para todos los manejadores sin nuevas consultas
+
+	Atributos:
+	----------
+	usuario: telegram.User
+		Usuario Telegram del bot
+
+	id, username, first_name: Datos del usuario del bot
+
+	patron_mencion: re.Pattern
+		Expresión regular precompilada que empareja los mensajes que llaman
+		al profesor ("profe", "profesor" o la mención del bot) y cuyo cuarto
+		grupo es el texto que sigue a la llamada
+	"""
+
+	def __init__(self, bot):
+
+		"""
+		Parámetros:
+		-----------
+		bot: telegram.Bot
+			Interfaz del bot cuya identidad se consulta
+		"""
+
+		self.__usuario = bot.get_me()
+		self.__patron_mencion = re.compile('^(profe(s{1,2}or)?|@%s),?( )*(.*)' %
+											re.escape(self.__usuario.username))
+
+	@property
+	def usuario(self):
+
+		return self.__usuario
+
+	@property
+	def id(self):
+
+		return self.__usuario.id
+
+	@property
+	def username(self):
+
+		return self.__usuario.username
+
+	@property
+	def first_name(self):
+
+		return self.__usuario.first_name
+
+	@property
+	def patron_mencion(self):
+
+		return self.__patron_mencion
@@ -18,8 +18,9 @@ class MemberLefteringGroupHandler(Handler):
 	----------
 	"""
 
-	def __init__(self, callback, pass_update_queue=False, pass_job_queue=False,
-				 pass_user_data=False, pass_chat_data=False):
+	def __init__(self, callback, identidad_bot, pass_update_queue=False,
+				pass_job_queue=False, pass_user_data=False,
+				pass_chat_data=False):
 
 		#	Contructor de la clase base
 		super(MemberLefteringGroupHandler, self).__init__(
@@ -29,6 +30,9 @@ class MemberLefteringGroupHandler(Handler):
 			pass_user_data=pass_user_data,
 			pass_chat_data=pass_chat_data)
 
+		#	Identidad del bot, obtenida una única vez al iniciar el sistema
+		self.__identidad_bot = identidad_bot
+
 
 	def check_update(self, update):
 
@@ -51,15 +55,11 @@ class MemberLefteringGroupHandler(Handler):
 			#	Se comprueba que algún usuario haya salido de un grupo
 			mensaje = update.message or update.edited_message
 
-			if not hasattr(mensaje, 'bot'):
-				return False
-
-			#	Se comprueba que el bot haya sido expulsado de un foro
-			bot = mensaje.bot
-
+			#	Se comprueba que el usuario que sale no sea el propio bot
 			return (hasattr(mensaje, 'left_chat_member') and
 						mensaje.left_chat_member and
-							bot.get_me() != mensaje.left_chat_member)
+							self.__identidad_bot.usuario !=
+													mensaje.left_chat_member)
 
 		return False
 
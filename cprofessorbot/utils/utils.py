@@ -81,6 +81,55 @@ def percentile(data: list, perc: int):
 
 	return data[index]
 
+def countingPercentile(data: list, perc: int):
+
+	"""Permite calcular el percentil de un conjunto de datos enteros no
+		negativos y de rango reducido mediante conteo, sin necesidad de
+		ordenar los datos. Devuelve el mismo valor que "percentile"
+
+	Parámetros:
+	-----------
+	data: list de int
+		Conjunto de valores enteros no negativos al cual se aplica el
+		cálculo del percentil
+
+	perc: int
+		Percentil que se desea calcular
+		Debe de contener un valor en el intervalo [0, 100]
+
+	"""
+
+	if type(data) is not list:
+		raise ValueError('"data" debe de ser una lista')
+
+	if type(perc) is not int:
+		raise ValueError('"perc" debe de ser int')
+	elif perc < 0 or perc > 100:
+		raise ValueError('"perc" debe de estar comprendido entre 0 y 100')
+
+	for value in data:
+		if type(value) is not int or value < 0:
+			raise ValueError('"data" debe de contener enteros no negativos')
+
+	#	Contar las apariciones de cada valor
+	counts = [0]*(max(data)+1 if data else 0)
+
+	for value in data:
+		counts[value] += 1
+
+	#	Calcular el índice a tomar y buscar el valor que ocupa dicha
+	#	posición en la lista ordenada
+	index = int(len(data)*perc//100)
+	acum = 0
+
+	for value in range(len(counts)):
+		acum += counts[value]
+
+		if acum > index:
+			return value
+
+	raise IndexError('list index out of range')
+
 def removeDirectory(path: str):
 
 	"""
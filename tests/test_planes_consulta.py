@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+################################################################################
+# Descripción: Pruebas que comprueban que las consultas de recopilación y
+#				recuento de mensajes de un foro y las búsquedas de los mensajes
+#				respondidos y editados se resuelven mediante índices sobre una
+#				base de datos migrada a la última versión del esquema
+# Autor: Nicolás Cubero Torres
+################################################################################
+
+#	Módulos importados
+import os
+import re
+import sqlite3
+import datetime
+import tempfile
+import unittest
+
+from cprofessorbot.botServerDAO import BotServerDAO
+
+#	Consultas de BotServerDAO comprobadas
+CONSULTAS_CABECERAS_FORO = BotServerDAO._BotServerDAO__CONSULTAS_CABECERAS_FORO
+CONSULTAS_RECUENTO_FORO = BotServerDAO._BotServerDAO__CONSULTAS_RECUENTO_FORO
+CONSULTA_MENSAJE_CHAT = BotServerDAO._BotServerDAO__CONSULTA_MENSAJE_CHAT
+
+#	Paso del plan que accede a una tabla a través de un índice o de su clave
+#	primaria
+BUSQUEDA_INDEXADA = re.compile(r'^SEARCH \S+ USING (COVERING INDEX|INDEX|'\
+										r'INTEGER PRIMARY KEY|PRIMARY KEY)\b')
+
+#	Paso del plan que accede a una tabla a través de un índice secundario
+BUSQUEDA_INDICE = re.compile(r'^SEARCH \S+ USING (COVERING )?INDEX\b')
+
+class TestPlanesConsulta(unittest.TestCase):
+
+	"""
+	Comprueba con EXPLAIN QUERY PLAN que las consultas de los foros y de la
+	tabla Mensaje_Chat no recorren tablas completas ni ordenan resultados
+	intermedios
+	"""
+
+	@classmethod
+	def setUpClass(cls):
+
+		cls.directorio = tempfile.TemporaryDirectory()
+		bd_file = os.path.join(cls.directorio.name, 'cprofessorbot.db')
+
+		#	Crear y migrar la base de datos y registrar varios foros con sus
+		#	mensajes, respuestas, ediciones y eventos
+		bd = BotServerDAO(bd_file)
+		fecha = datetime.datetime(2023, 1, 1)
+
+		for i in range(20):
+			bd.addUsuario(i+1, 'Usuario%d' % i, 'Apellido', None, 100+i,
+														fecha, 'alumno')
+
+		for i in range(10):
+			bd.addForo(-10-i, 'Foro%d' % i, 'group', True, fecha)
+
+		with bd.asynchronous():
+			for i in range(3000):
+				bd.addMensaje(i % 4 != 0, i,
+							id_usuario_emisor_receptor=1+i % 20,
+							id_chat=-10-i % 10,
+							texto='Mensaje %d' % i,
+							editado=(i % 50 == 0),
+							id_mensaje_chat_respondido=(i-10 if i % 5 == 0
+																else None),
+							fecha=fecha+datetime.timedelta(minutes=7*i))
+
+			for i in range(200):
+				bd.addEventoChatGrupal('entrada', 1+i % 20, -10-i % 10,
+							fecha+datetime.timedelta(minutes=100*i+3))
+
+		bd.close()
+
+		cls.con = sqlite3.connect(bd_file)
+
+		#	El planificador debe de usar los índices también con estadísticas
+		cls.con.execute('ANALYZE;')
+
+	@classmethod
+	def tearDownClass(cls):
+
+		cls.con.close()
+		cls.directorio.cleanup()
+
+	def plan(self, consulta: str, parametros: tuple):
+
+		"""Devuelve los pasos del plan de ejecución de una consulta"""
+
+		return [fila[3] for fila in self.con.execute(
+								'EXPLAIN QUERY PLAN ' + consulta, parametros)]
+
+	def assertIndexada(self, consulta: str, parametros: tuple):
+
+		"""Comprueba que todos los pasos del plan de una consulta acceden a
+		sus tablas mediante índices y que el primero de ellos usa un índice
+		secundario
+		"""
+
+		plan = self.plan(consulta, parametros)
+
+		for paso in plan:
+			self.assertNotRegex(paso, r'^SCAN\b', plan)
+			self.assertNotIn('TEMP B-TREE', paso, plan)
+
+			if paso.startswith('SEARCH'):
+				self.assertRegex(paso, BUSQUEDA_INDEXADA, plan)
+
+		self.assertRegex(plan[0], BUSQUEDA_INDICE, plan)
+
+	def test_cabeceras_foro(self):
+
+		for i, consulta in enumerate(CONSULTAS_CABECERAS_FORO):
+			with self.subTest(consulta=i):
+				self.assertIndexada(consulta.format(bd='main'),
+										(-10, 0.0, 0, 1e10, 0, 100))
+
+	def test_recuento_foro(self):
+
+		for i, consulta in enumerate(CONSULTAS_RECUENTO_FORO):
+			for op_fin in ('<', '<='):
+				with self.subTest(consulta=i, op_fin=op_fin):
+					self.assertIndexada(consulta.format(bd='main',
+											op_fin=op_fin), (-10, 0.0, 1e10))
+
+	def test_tablas_foro(self):
+
+		#	Las consultas de los foros deben de partir de la tabla del foro a
+		#	través de su índice (foro, fecha) y no de la tabla Evento
+		consultas = ([c.format(bd='main') for c in CONSULTAS_CABECERAS_FORO] +
+						[c.format(bd='main', op_fin='<')
+										for c in CONSULTAS_RECUENTO_FORO])
+
+		for i, consulta in enumerate(consultas):
+			with self.subTest(consulta=i):
+				plan = self.plan(consulta, (-10, 0.0, 0, 1e10, 0, 100)
+								if i < len(CONSULTAS_CABECERAS_FORO)
+								else (-10, 0.0, 1e10))
+
+				self.assertRegex(plan[0], r'^SEARCH main\.(MensajeRecibido'\
+									r'Publico|MensajeEnviadoPublico|Evento'\
+									r'ChatGrupal) USING (COVERING )?INDEX '\
+									r'\w+_fecha \(id_chat_foro(_destino)?=\? '\
+									r'AND fecha>\? AND fecha<\?\)', plan)
+
+				for paso in plan:
+					self.assertNotRegex(paso, r'^SEARCH (main\.)?Evento ',
+																		plan)
+
+	def test_mensaje_chat(self):
+
+		#	Búsqueda de los mensajes respondidos y editados en addMensaje
+		plan = self.plan(CONSULTA_MENSAJE_CHAT, (-10, 5))
+
+		self.assertEqual(len(plan), 1, plan)
+		self.assertRegex(plan[0], r'^SEARCH Mensaje_Chat USING (COVERING '\
+								r'INDEX|INDEX|PRIMARY KEY) \(id_chat=\? AND '\
+								r'id_mensaje_chat=\?\)')
+
+if __name__ == '__main__':
+	unittest.main()